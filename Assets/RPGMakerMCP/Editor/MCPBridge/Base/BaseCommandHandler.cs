@@ -2,6 +2,7 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using MCP.Editor.Interfaces;
+using MCP.Editor.Services;
 using UnityEditor;
 using UnityEngine;
 
@@ -98,8 +99,12 @@ namespace MCP.Editor.Base
                     );
                 }
                 
-                // 4. 操作の実行
-                var result = ExecuteOperation(operation, payload);
+                // 4. 操作の実行（"patchFormat": "merge" の更新は RFC 7386 マージパッチとして適用）
+                object result;
+                using (DataModelMapper.UseMergePatch(GetString(payload, "patchFormat") == "merge"))
+                {
+                    result = ExecuteOperation(operation, payload);
+                }
                 
                 // 5. 操作後のコンパイル待機（必要な場合）
                 Dictionary<string, object> compilationWaitInfo = null;
@@ -64,6 +64,8 @@ namespace MCP.Editor.Base
         {
             CommandHandlerFactory.Register("ping", new PingHandler());
             CommandHandlerFactory.Register("compilationAwait", new CompilationAwaitHandler());
+            CommandHandlerFactory.Register("contextRequest", new ContextRequestHandler());
+            CommandHandlerFactory.Register("transaction", new TransactionHandler());
         }
 
         /// <summary>
@@ -0,0 +1,78 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using MCP.Editor.Base;
+using UnityEngine;
+
+namespace MCP.Editor.Handlers
+{
+    /// <summary>
+    /// Handles context:request pulls from the MCP server.
+    /// Builds only the requested context sections (scene, hierarchy subtree, selection,
+    /// asset page, git status) instead of the full payload pushed by McpBridgeService.
+    /// When the caller's cached generation is still current nothing is rebuilt.
+    /// </summary>
+    public class ContextRequestHandler : BaseCommandHandler
+    {
+        private const int DefaultAssetLimit = 50;
+        private const int MaxHierarchyDepth = 8;
+
+        private static readonly string[] DefaultSections = { "scene", "hierarchy", "selection" };
+
+        public override string Category => "contextRequest";
+
+        public override IEnumerable<string> SupportedOperations => new[]
+        {
+            "request"
+        };
+
+        protected override bool RequiresCompilationWait(string operation)
+        {
+            // Context requests are read-only
+            return false;
+        }
+
+        protected override object ExecuteOperation(string operation, Dictionary<string, object> payload)
+        {
+            var generation = McpBridgeService.ContextGeneration;
+            if (payload.TryGetValue("ifGeneration", out var known) && known != null &&
+                Convert.ToInt64(known) == generation)
+            {
+                return new Dictionary<string, object>
+                {
+                    ["success"] = true,
+                    ["generation"] = generation,
+                    ["unchanged"] = true,
+                };
+            }
+
+            var sections = payload.TryGetValue("sections", out var sectionsObj) && sectionsObj is List<object> list
+                ? list.Select(item => item?.ToString()).Where(item => !string.IsNullOrEmpty(item)).ToList()
+                : DefaultSections.ToList();
+
+            GameObject hierarchyRoot = null;
+            var hierarchyPath = GetString(payload, "hierarchyPath");
+            if (!string.IsNullOrEmpty(hierarchyPath))
+            {
+                hierarchyRoot = GameObjectResolver.ResolveByHierarchyPath(hierarchyPath);
+                if (hierarchyRoot == null)
+                {
+                    throw new InvalidOperationException($"GameObject not found at hierarchy path: {hierarchyPath}");
+                }
+            }
+
+            var depth = Mathf.Clamp(GetInt(payload, "depth", 0), 0, MaxHierarchyDepth);
+            var assetOffset = GetInt(payload, "assetOffset", 0);
+            var assetLimit = GetInt(payload, "assetLimit", DefaultAssetLimit);
+
+            return new Dictionary<string, object>
+            {
+                ["success"] = true,
+                ["generation"] = generation,
+                ["unchanged"] = false,
+                ["sections"] = McpContextCollector.BuildContextSections(
+                    sections, hierarchyRoot, depth, assetOffset, assetLimit),
+            };
+        }
+    }
+}
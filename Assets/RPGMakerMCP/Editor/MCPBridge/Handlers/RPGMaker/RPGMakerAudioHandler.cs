@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using MCP.Editor.Base;
+using MCP.Editor.Services;
 using RPGMaker.Codebase.Editor.Hierarchy;
 using Region = RPGMaker.Codebase.Editor.Hierarchy.Enum.Region;
 using UnityEditor;
@@ -453,8 +454,9 @@ namespace MCP.Editor.Handlers.RPGMaker
             var volumes = audioSettings["volumes"] as Dictionary<string, object>;
             volumes[category.ToLower()] = volume;
 
+            McpTransaction.RecordWrite(audioSettingsPath);
             File.WriteAllText(audioSettingsPath, MiniJson.Serialize(audioSettings));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", $"{category} volume set to {volume}."));
@@ -500,8 +502,9 @@ namespace MCP.Editor.Handlers.RPGMaker
             var audioSettingsPath = Path.Combine(Application.dataPath, "RPGMaker", "Storage", "System", "audiosettings.json");
             Directory.CreateDirectory(Path.GetDirectoryName(audioSettingsPath));
 
+            McpTransaction.RecordWrite(audioSettingsPath);
             File.WriteAllText(audioSettingsPath, MiniJson.Serialize(settingsData));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", "Audio settings updated successfully."));
@@ -541,9 +544,10 @@ namespace MCP.Editor.Handlers.RPGMaker
             Directory.CreateDirectory(targetDir);
 
             var targetPath = Path.Combine(targetDir, filename);
+            McpTransaction.RecordWrite(targetPath);
             File.Copy(sourcePath, targetPath, true);
 
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(
@@ -614,8 +618,9 @@ namespace MCP.Editor.Handlers.RPGMaker
                 throw new InvalidOperationException($"Audio file not found: {filename}");
             }
 
+            McpTransaction.RecordWrite(audioPath);
             File.Delete(audioPath);
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", $"Audio file '{filename}' deleted successfully."));
@@ -668,8 +673,9 @@ namespace MCP.Editor.Handlers.RPGMaker
         {
             var audioStatePath = Path.Combine(Application.dataPath, "RPGMaker", "Storage", "SaveData", "audiostate.json");
             Directory.CreateDirectory(Path.GetDirectoryName(audioStatePath));
+            McpTransaction.RecordWrite(audioStatePath);
             File.WriteAllText(audioStatePath, MiniJson.Serialize(audioState));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
         }
 
         private T GetPayloadValue<T>(Dictionary<string, object> payload, string key) where T : class
@@ -695,6 +701,11 @@ namespace MCP.Editor.Handlers.RPGMaker
 
         private void RefreshHierarchy()
         {
+            if (McpTransaction.DeferRefresh("hierarchy:Sound", RefreshHierarchy))
+            {
+                return;
+            }
+
             try
             {
                 if (Hierarchy.IsInitialized)
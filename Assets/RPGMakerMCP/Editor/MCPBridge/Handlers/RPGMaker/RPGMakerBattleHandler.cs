@@ -47,7 +47,13 @@ namespace MCP.Editor.Handlers.RPGMaker
             "updateSkill",
             "deleteSkill",
             "getBattleAnimations",
-            "updateBattleAnimation"
+            "updateBattleAnimation",
+            "bulkUpsertEnemies",
+            "bulkDeleteEnemies",
+            "bulkUpsertTroops",
+            "bulkDeleteTroops",
+            "bulkUpsertSkills",
+            "bulkDeleteSkills"
         };
 
         protected override object ExecuteOperation(string operation, Dictionary<string, object> payload)
@@ -74,6 +80,12 @@ namespace MCP.Editor.Handlers.RPGMaker
                 "createSkill" => CreateSkill(payload),
                 "updateSkill" => UpdateSkill(payload),
                 "deleteSkill" => DeleteSkill(payload),
+                "bulkUpsertEnemies" => BulkUpsert(payload, DataService.BulkUpsertEnemies),
+                "bulkDeleteEnemies" => BulkDelete(payload, DataService.BulkDeleteEnemies),
+                "bulkUpsertTroops" => BulkUpsert(payload, DataService.BulkUpsertTroops),
+                "bulkDeleteTroops" => BulkDelete(payload, DataService.BulkDeleteTroops),
+                "bulkUpsertSkills" => BulkUpsert(payload, DataService.BulkUpsertSkills),
+                "bulkDeleteSkills" => BulkDelete(payload, DataService.BulkDeleteSkills),
                 "getBattleAnimations" => GetBattleAnimations(payload),
                 "updateBattleAnimation" => UpdateBattleAnimation(payload),
                 _ => throw new InvalidOperationException($"Unknown operation: {operation}")
@@ -531,6 +543,30 @@ namespace MCP.Editor.Handlers.RPGMaker
 
         #endregion
 
+        #region Bulk Operations
+
+        private object BulkUpsert(
+            Dictionary<string, object> payload,
+            Func<IList<(string id, Dictionary<string, object> data)>, List<Dictionary<string, object>>> upsert)
+        {
+            return CreateBulkResponse(upsert(DataModelMapper.ReadBulkRecords(payload)));
+        }
+
+        private object BulkDelete(Dictionary<string, object> payload, Func<IList<string>, List<Dictionary<string, object>>> delete)
+        {
+            return CreateBulkResponse(delete(DataModelMapper.ReadBulkIds(payload)));
+        }
+
+        private object CreateBulkResponse(List<Dictionary<string, object>> results)
+        {
+            return CreateSuccessResponse(
+                ("results", results),
+                ("errorCount", results.Count(r => (string)r["status"] == "error"))
+            );
+        }
+
+        #endregion
+
         #region Battle Animations
 
         private object GetBattleAnimations(Dictionary<string, object> payload)
@@ -50,6 +50,13 @@ namespace MCP.Editor.Handlers.RPGMaker
             "createAnimation",
             "updateAnimation",
             "deleteAnimation",
+            // Bulk operations
+            "bulkUpsertCharacters",
+            "bulkDeleteCharacters",
+            "bulkUpsertItems",
+            "bulkDeleteItems",
+            "bulkUpsertAnimations",
+            "bulkDeleteAnimations",
             // System operations
             "getSystemSettings",
             "updateSystemSettings",
@@ -85,6 +92,13 @@ namespace MCP.Editor.Handlers.RPGMaker
                 "createAnimation" => CreateAnimation(payload),
                 "updateAnimation" => UpdateAnimation(payload),
                 "deleteAnimation" => DeleteAnimation(payload),
+                // Bulk operations
+                "bulkUpsertCharacters" => BulkUpsert(payload, DataService.BulkUpsertCharacters),
+                "bulkDeleteCharacters" => BulkDelete(payload, DataService.BulkDeleteCharacters),
+                "bulkUpsertItems" => BulkUpsert(payload, DataService.BulkUpsertItems),
+                "bulkDeleteItems" => BulkDelete(payload, DataService.BulkDeleteItems),
+                "bulkUpsertAnimations" => BulkUpsert(payload, DataService.BulkUpsertAnimations),
+                "bulkDeleteAnimations" => BulkDelete(payload, DataService.BulkDeleteAnimations),
                 // System operations
                 "getSystemSettings" => GetSystemSettings(),
                 "updateSystemSettings" => UpdateSystemSettings(payload),
@@ -543,6 +557,30 @@ namespace MCP.Editor.Handlers.RPGMaker
 
         #endregion
 
+        #region Bulk Operations
+
+        private object BulkUpsert(
+            Dictionary<string, object> payload,
+            Func<IList<(string id, Dictionary<string, object> data)>, List<Dictionary<string, object>>> upsert)
+        {
+            return CreateBulkResponse(upsert(DataModelMapper.ReadBulkRecords(payload)));
+        }
+
+        private object BulkDelete(Dictionary<string, object> payload, Func<IList<string>, List<Dictionary<string, object>>> delete)
+        {
+            return CreateBulkResponse(delete(DataModelMapper.ReadBulkIds(payload)));
+        }
+
+        private object CreateBulkResponse(List<Dictionary<string, object>> results)
+        {
+            return CreateSuccessResponse(
+                ("results", results),
+                ("errorCount", results.Count(r => (string)r["status"] == "error"))
+            );
+        }
+
+        #endregion
+
         #region System Settings
 
         private object GetSystemSettings()
@@ -644,7 +682,7 @@ namespace MCP.Editor.Handlers.RPGMaker
             }
 
             CopyDirectory(importPath, targetPath);
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(
@@ -713,7 +751,7 @@ namespace MCP.Editor.Handlers.RPGMaker
             }
 
             CopyDirectory(backupPath, targetPath);
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(
@@ -777,6 +815,7 @@ namespace MCP.Editor.Handlers.RPGMaker
         private void WriteJsonFile(string filePath, JToken data)
         {
             var json = data.ToString(Formatting.Indented);
+            McpTransaction.RecordWrite(filePath);
             File.WriteAllText(filePath, json);
         }
 
@@ -806,6 +845,7 @@ namespace MCP.Editor.Handlers.RPGMaker
             foreach (var file in Directory.GetFiles(sourceDir))
             {
                 var targetFile = Path.Combine(targetDir, Path.GetFileName(file));
+                McpTransaction.RecordWrite(targetFile);
                 File.Copy(file, targetFile, true);
             }
 
@@ -818,6 +858,11 @@ namespace MCP.Editor.Handlers.RPGMaker
 
         private void RefreshHierarchy()
         {
+            if (McpTransaction.DeferRefresh("hierarchy:All", RefreshHierarchy))
+            {
+                return;
+            }
+
             // Attempt to refresh RPGMaker hierarchy if available
             try
             {
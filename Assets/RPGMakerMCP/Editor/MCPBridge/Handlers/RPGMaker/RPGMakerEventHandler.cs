@@ -37,6 +37,7 @@ namespace MCP.Editor.Handlers.RPGMaker
             "createEventCommand",
             "updateEventCommand",
             "deleteEventCommand",
+            "applyEventCommandPatch",
             // Event page operations
             "getEventPages",
             "createEventPage",
@@ -64,6 +65,7 @@ namespace MCP.Editor.Handlers.RPGMaker
                 "createEventCommand" => CreateEventCommand(payload),
                 "updateEventCommand" => UpdateEventCommand(payload),
                 "deleteEventCommand" => DeleteEventCommand(payload),
+                "applyEventCommandPatch" => ApplyEventCommandPatch(payload),
                 // Event page operations
                 "getEventPages" => GetEventPages(payload),
                 "createEventPage" => CreateEventPage(payload),
@@ -408,6 +410,116 @@ namespace MCP.Editor.Handlers.RPGMaker
             );
         }
 
+        /// <summary>
+        /// Applies an ordered list of insert/replace/delete/move edits with a single save.
+        /// Every index refers to the command list as it was before the patch, so edits
+        /// do not shift each other. The patch is checked completely before anything changes.
+        /// </summary>
+        private object ApplyEventCommandPatch(Dictionary<string, object> payload)
+        {
+            var id = GetString(payload, "uuId") ?? GetString(payload, "id");
+            var baseCount = GetInt(payload, "baseCount", -1);
+
+            if (string.IsNullOrEmpty(id))
+            {
+                throw new InvalidOperationException("ID (uuId) is required.");
+            }
+
+            if (!payload.TryGetValue("edits", out var editsObj) || !(editsObj is IEnumerable<object> editList))
+            {
+                throw new InvalidOperationException("Edits are required.");
+            }
+
+            var edits = editList.Select((e, n) => e as Dictionary<string, object>
+                ?? throw new InvalidOperationException($"Edit {n} must be an object.")).ToList();
+            var resultCount = 0;
+
+            DataService.UpdateEvent(id, eventData =>
+            {
+                var original = eventData.eventCommands ?? new List<EventDataModel.EventCommand>();
+                var count = original.Count;
+
+                if (baseCount >= 0 && baseCount != count)
+                {
+                    throw new InvalidOperationException(
+                        $"Event has {count} commands but the patch was made for {baseCount}. Fetch the commands and diff again.");
+                }
+
+                // Commands placed before original index i (i == count appends), in edit order
+                var before = Enumerable.Range(0, count + 1).Select(_ => new List<EventDataModel.EventCommand>()).ToList();
+                var current = original.ToList();
+                var touched = new bool[count];
+
+                for (var n = 0; n < edits.Count; n++)
+                {
+                    var edit = edits[n];
+                    var op = GetString(edit, "op");
+                    var index = GetInt(edit, "index", -1);
+                    var maxIndex = op == "insert" ? count : count - 1;
+
+                    if (index < 0 || index > maxIndex)
+                    {
+                        throw new InvalidOperationException($"Edit {n} ({op}): index {index} is out of range 0-{maxIndex}.");
+                    }
+
+                    if (op != "insert")
+                    {
+                        if (touched[index])
+                        {
+                            throw new InvalidOperationException($"Edit {n} ({op}): command {index} is already replaced, deleted or moved.");
+                        }
+                        touched[index] = true;
+                    }
+
+                    switch (op)
+                    {
+                        case "insert":
+                        case "replace":
+                            var commandData = GetPayloadValue<Dictionary<string, object>>(edit, "command")
+                                ?? throw new InvalidOperationException($"Edit {n} ({op}): command is required.");
+                            var command = CreateEventCommandFromDict(commandData);
+                            if (op == "insert")
+                                before[index].Add(command);
+                            else
+                                current[index] = command;
+                            break;
+                        case "delete":
+                            current[index] = null;
+                            break;
+                        case "move":
+                            var to = GetInt(edit, "to", -1);
+                            if (to < 0 || to > count)
+                            {
+                                throw new InvalidOperationException($"Edit {n} (move): target {to} is out of range 0-{count}.");
+                            }
+                            before[to].Add(original[index]);
+                            current[index] = null;
+                            break;
+                        default:
+                            throw new InvalidOperationException($"Edit {n}: unknown op '{op}'. Use insert, replace, delete or move.");
+                    }
+                }
+
+                var patched = new List<EventDataModel.EventCommand>(count + edits.Count);
+                for (var i = 0; i <= count; i++)
+                {
+                    patched.AddRange(before[i]);
+                    if (i < count && current[i] != null)
+                        patched.Add(current[i]);
+                }
+
+                eventData.eventCommands = patched;
+                resultCount = patched.Count;
+            });
+
+            return CreateSuccessResponse(
+                ("id", id),
+                ("editCount", edits.Count),
+                ("commandCount", resultCount),
+                ("message", $"Applied {edits.Count} edits to event commands.")
+            );
+        }
+
         #endregion
 
         #region Event Page Operations
@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using MCP.Editor.Base;
+using MCP.Editor.Services;
 using RPGMaker.Codebase.Editor.Hierarchy;
 using Region = RPGMaker.Codebase.Editor.Hierarchy.Enum.Region;
 using UnityEditor;
@@ -98,8 +99,9 @@ namespace MCP.Editor.Handlers.RPGMaker
             var gameStatePath = Path.Combine(Application.dataPath, "RPGMaker", "Storage", "SaveData", "gamestate.json");
             Directory.CreateDirectory(Path.GetDirectoryName(gameStatePath));
 
+            McpTransaction.RecordWrite(gameStatePath);
             File.WriteAllText(gameStatePath, MiniJson.Serialize(gameStateData));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", "Game state updated successfully."));
@@ -136,8 +138,9 @@ namespace MCP.Editor.Handlers.RPGMaker
             var playerDataPath = Path.Combine(Application.dataPath, "RPGMaker", "Storage", "SaveData", "player.json");
             Directory.CreateDirectory(Path.GetDirectoryName(playerDataPath));
 
+            McpTransaction.RecordWrite(playerDataPath);
             File.WriteAllText(playerDataPath, MiniJson.Serialize(playerData));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", "Player data updated successfully."));
@@ -174,8 +177,9 @@ namespace MCP.Editor.Handlers.RPGMaker
             var partyDataPath = Path.Combine(Application.dataPath, "RPGMaker", "Storage", "SaveData", "party.json");
             Directory.CreateDirectory(Path.GetDirectoryName(partyDataPath));
 
+            McpTransaction.RecordWrite(partyDataPath);
             File.WriteAllText(partyDataPath, MiniJson.Serialize(partyData));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", "Party data updated successfully."));
@@ -212,8 +216,9 @@ namespace MCP.Editor.Handlers.RPGMaker
             var inventoryPath = Path.Combine(Application.dataPath, "RPGMaker", "Storage", "SaveData", "inventory.json");
             Directory.CreateDirectory(Path.GetDirectoryName(inventoryPath));
 
+            McpTransaction.RecordWrite(inventoryPath);
             File.WriteAllText(inventoryPath, MiniJson.Serialize(inventoryData));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", "Inventory updated successfully."));
@@ -253,8 +258,9 @@ namespace MCP.Editor.Handlers.RPGMaker
                 inventory[itemId] = quantity;
             }
 
+            McpTransaction.RecordWrite(inventoryPath);
             File.WriteAllText(inventoryPath, MiniJson.Serialize(inventory));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", $"Added {quantity} of item '{itemId}' to inventory."));
@@ -297,8 +303,9 @@ namespace MCP.Editor.Handlers.RPGMaker
                 inventory[itemId] = newQuantity;
             }
 
+            McpTransaction.RecordWrite(inventoryPath);
             File.WriteAllText(inventoryPath, MiniJson.Serialize(inventory));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", $"Removed {quantity} of item '{itemId}' from inventory."));
@@ -370,9 +377,10 @@ namespace MCP.Editor.Handlers.RPGMaker
             }
 
             flags[flagId] = value;
+            McpTransaction.RecordWrite(flagPath);
             File.WriteAllText(flagPath, MiniJson.Serialize(flags));
 
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", $"Progress flag '{flagId}' set successfully."));
@@ -415,8 +423,9 @@ namespace MCP.Editor.Handlers.RPGMaker
             var currentMapPath = Path.Combine(Application.dataPath, "RPGMaker", "Storage", "SaveData", "currentmap.json");
             Directory.CreateDirectory(Path.GetDirectoryName(currentMapPath));
 
+            McpTransaction.RecordWrite(currentMapPath);
             File.WriteAllText(currentMapPath, MiniJson.Serialize(currentMapData));
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", $"Current map set to '{mapId}'."));
@@ -467,9 +476,10 @@ namespace MCP.Editor.Handlers.RPGMaker
             }
 
             playerData["position"] = teleportData;
+            McpTransaction.RecordWrite(playerDataPath);
             File.WriteAllText(playerDataPath, MiniJson.Serialize(playerData));
 
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", $"Player teleported to map '{mapId}' at position ({x}, {y})."));
@@ -494,10 +504,11 @@ namespace MCP.Editor.Handlers.RPGMaker
                     File.Copy(file, backupFile, true);
                 }
 
+                McpTransaction.RecordDirectory(saveDataPath);
                 Directory.Delete(saveDataPath, true);
             }
 
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
             RefreshHierarchy();
 
             return CreateSuccessResponse(("message", "Game state reset successfully. Backup created."));
@@ -530,6 +541,11 @@ namespace MCP.Editor.Handlers.RPGMaker
 
         private void RefreshHierarchy()
         {
+            if (McpTransaction.DeferRefresh("hierarchy:All", RefreshHierarchy))
+            {
+                return;
+            }
+
             try
             {
                 if (Hierarchy.IsInitialized)
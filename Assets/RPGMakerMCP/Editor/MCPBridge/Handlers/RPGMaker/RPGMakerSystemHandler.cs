@@ -343,9 +343,10 @@ namespace MCP.Editor.Handlers.RPGMaker
 
             var filePath = Path.Combine(saveDataPath, $"save_{slotId}.json");
             var json = Newtonsoft.Json.JsonConvert.SerializeObject(saveData, Newtonsoft.Json.Formatting.Indented);
+            McpTransaction.RecordWrite(filePath);
             File.WriteAllText(filePath, json);
 
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
 
             return CreateSuccessResponse(("message", $"Save data for slot '{slotId}' created successfully."));
         }
@@ -394,8 +395,9 @@ namespace MCP.Editor.Handlers.RPGMaker
                 throw new InvalidOperationException($"Save data for slot '{slotId}' not found.");
             }
 
+            McpTransaction.RecordWrite(filePath);
             File.Delete(filePath);
-            AssetDatabase.Refresh();
+            McpTransaction.RefreshAssets();
 
             return CreateSuccessResponse(("message", $"Save data for slot '{slotId}' deleted successfully."));
         }
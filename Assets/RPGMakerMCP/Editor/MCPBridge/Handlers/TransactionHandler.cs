@@ -0,0 +1,71 @@
+using System;
+using System.Collections.Generic;
+using MCP.Editor.Base;
+using MCP.Editor.Services;
+
+namespace MCP.Editor.Handlers
+{
+    /// <summary>
+    /// ブリッジトランザクションのコマンドハンドラー。
+    /// トランザクション中の書き込みは AssetDatabase / Hierarchy のリフレッシュを遅延し、
+    /// commit 時に一度だけリフレッシュします。rollback はハンドラーが直接書き込んだファイルを復元します。
+    /// </summary>
+    public class TransactionHandler : BaseCommandHandler
+    {
+        public override string Category => "transaction";
+
+        public override IEnumerable<string> SupportedOperations => new[]
+        {
+            "beginTransaction",
+            "commit",
+            "rollback",
+        };
+
+        public TransactionHandler() : base()
+        {
+        }
+
+        protected override object ExecuteOperation(string operation, Dictionary<string, object> payload)
+        {
+            return operation switch
+            {
+                "beginTransaction" => BeginTransaction(),
+                "commit" => Finish(payload, McpTransaction.Commit),
+                "rollback" => Finish(payload, McpTransaction.Rollback),
+                _ => throw new InvalidOperationException($"Unknown operation: {operation}")
+            };
+        }
+
+        protected override bool RequiresCompilationWait(string operation)
+        {
+            return false;
+        }
+
+        #region Operations
+
+        private object BeginTransaction()
+        {
+            return new Dictionary<string, object>
+            {
+                ["success"] = true,
+                ["transactionId"] = McpTransaction.Begin(),
+            };
+        }
+
+        private object Finish(Dictionary<string, object> payload, Func<Dictionary<string, object>> close)
+        {
+            var transactionId = GetString(payload, "transactionId");
+            if (!string.IsNullOrEmpty(transactionId) && McpTransaction.IsActive && transactionId != McpTransaction.Id)
+            {
+                throw new InvalidOperationException(
+                    $"Transaction {transactionId} is not open (open transaction: {McpTransaction.Id})");
+            }
+
+            var result = close();
+            result["success"] = true;
+            return result;
+        }
+
+        #endregion
+    }
+}
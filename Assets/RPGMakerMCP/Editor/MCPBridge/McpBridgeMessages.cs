@@ -27,15 +27,28 @@ namespace MCP.Editor
             };
         }
 
-        public static Dictionary<string, object> CreateContextUpdate(Dictionary<string, object> payload)
+        public static Dictionary<string, object> CreateContextUpdate(Dictionary<string, object> payload, long version)
         {
             return new Dictionary<string, object>
             {
                 ["type"] = "context:update",
+                ["version"] = version,
                 ["payload"] = payload,
             };
         }
 
+        public static Dictionary<string, object> CreateContextPatch(long baseVersion, long version, List<object> ops, int fullSize)
+        {
+            return new Dictionary<string, object>
+            {
+                ["type"] = "context:patch",
+                ["baseVersion"] = baseVersion,
+                ["version"] = version,
+                ["ops"] = ops,
+                ["fullSize"] = fullSize,
+            };
+        }
+
         public static Dictionary<string, object> CreateCommandResult(string commandId, bool ok, object result, string errorMessage = null)
         {
             return new Dictionary<string, object>
@@ -10,6 +10,7 @@ using System.Security.Cryptography;
 using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
+using MCP.Editor.Services;
 using UnityEditor;
 using UnityEditor.Compilation;
 using UnityEngine;
@@ -48,6 +49,7 @@ namespace MCP.Editor
         private const string BridgePath = "/bridge";
         private const int MaxHandshakeHeaderSize = 16 * 1024;
         private const int MaxMessageBytes = 2 * 1024 * 1024;
+        private const int MaxReassembledMessageChars = 64 * 1024 * 1024;
         private const int HttpReadBufferSize = 4096;
         private const int MaxSendRetries = 3;
         private const int SendRetryDelayMs = 100;
@@ -69,6 +71,10 @@ namespace MCP.Editor
         private static readonly Queue<Action> MainThreadActions = new();
         private static readonly object SendLock = new();
 
+        // Main-thread only: frame:chunk reassembly and cancelled command ids
+        private static readonly Dictionary<string, ChunkedFrame> PendingChunkedFrames = new();
+        private static readonly HashSet<string> CancelledCommandIds = new();
+
         // Thread-safe flags
         private static volatile bool _isCompiling;
         private static volatile bool _contextDirty = true;
@@ -94,6 +100,13 @@ namespace MCP.Editor
         private static DateTime _lastHeartbeatReceived = DateTime.MinValue;
         private static DateTime _lastContextSent = DateTime.MinValue;
 
+        // Context delta baseline; null forces the next push to be a full context:update
+        private static Dictionary<string, object> _lastContextPayload;
+        private static long _contextVersion;
+
+        // Incremented on every selection/hierarchy/project change; lets pulled context be cached
+        private static long _contextGeneration;
+
         #endregion
 
         #region Nested Types
@@ -108,6 +121,16 @@ namespace MCP.Editor
             public DateTime EnqueuedAt { get; set; }
         }
 
+        /// <summary>
+        /// Large server message received as a series of frame:chunk messages.
+        /// </summary>
+        private sealed class ChunkedFrame
+        {
+            public string[] Parts { get; set; }
+            public int Received { get; set; }
+            public int TotalChars { get; set; }
+        }
+
         /// <summary>
         /// Parsed HTTP request data for WebSocket handshake.
         /// </summary>
@@ -211,6 +234,8 @@ namespace MCP.Editor
 
             CloseSocket();
 
+            PendingChunkedFrames.Clear();
+            CancelledCommandIds.Clear();
             _clientInfo = null;
             _state = McpConnectionState.Disconnected;
             StateChanged?.Invoke(_state);
@@ -571,8 +596,13 @@ namespace MCP.Editor
                         }
                     }
 
+                    _lastContextPayload = null;
                     MarkContextDirty();
-                    PushContext();
+                    if (McpBridgeSettings.Instance.PushContextUpdates)
+                    {
+                        PushContext();
+                    }
+
                     Debug.Log("MCP Bridge: Client connected successfully.");
                 });
             }
@@ -676,6 +706,14 @@ namespace MCP.Editor
                 {
                     _contextDirty = true;
                     _state = _listener != null ? McpConnectionState.Connecting : McpConnectionState.Disconnected;
+
+                    if (McpTransaction.IsActive)
+                    {
+                        // Keep what the client wrote and run the refreshes it deferred
+                        Debug.LogWarning($"MCP Bridge: Client disconnected with transaction {McpTransaction.Id} open. Committing.");
+                        McpTransaction.Commit();
+                    }
+
                     StateChanged?.Invoke(_state);
 
                     if (_listener != null && !_isCompilingOrReloading)
@@ -1096,12 +1134,44 @@ namespace MCP.Editor
                 _lastHeartbeatReceived = DateTime.UtcNow;
 
                 var payload = MiniJson.Deserialize(json);
+                var messageType = payload is Dictionary<string, object> typed &&
+                                  typed.TryGetValue("type", out var typeObj)
+                    ? typeObj as string
+                    : null;
 
-                if (payload is Dictionary<string, object> dict &&
-                    dict.TryGetValue("type", out var typeObj) &&
-                    typeObj as string == "server:info")
+                if (messageType == "frame:chunk")
                 {
-                    HandleServerInfoMessage(dict);
+                    var assembled = AppendFrameChunk((Dictionary<string, object>)payload);
+                    if (assembled == null)
+                    {
+                        continue;
+                    }
+
+                    payload = MiniJson.Deserialize(assembled);
+                    messageType = payload is Dictionary<string, object> inner &&
+                                  inner.TryGetValue("type", out var innerType)
+                        ? innerType as string
+                        : null;
+                }
+
+                if (messageType == "server:info")
+                {
+                    HandleServerInfoMessage((Dictionary<string, object>)payload);
+                    continue;
+                }
+
+                if (messageType == "command:cancel")
+                {
+                    HandleCommandCancelMessage((Dictionary<string, object>)payload);
+                    continue;
+                }
+
+                if (messageType == "context:resync")
+                {
+                    // The server's replica missed a patch; send the full context next
+                    _lastContextPayload = null;
+                    MarkContextDirty();
+                    PushContext();
                     continue;
                 }
 
@@ -1115,6 +1185,71 @@ namespace MCP.Editor
             }
         }
 
+        /// <summary>
+        /// Stores one frame:chunk message and returns the reassembled JSON once all
+        /// chunks of the frame have arrived, or null while chunks are still missing.
+        /// </summary>
+        private static string AppendFrameChunk(Dictionary<string, object> message)
+        {
+            var frameId = message.TryGetValue("frameId", out var idObj) ? idObj as string : null;
+            var index = message.TryGetValue("index", out var indexObj) ? Convert.ToInt32(indexObj) : -1;
+            var count = message.TryGetValue("count", out var countObj) ? Convert.ToInt32(countObj) : 0;
+            var data = message.TryGetValue("data", out var dataObj) ? dataObj as string : null;
+
+            if (string.IsNullOrEmpty(frameId) || data == null || count <= 0 || index < 0 || index >= count)
+            {
+                Debug.LogWarning("MCP bridge: ignoring malformed frame:chunk message.");
+                return null;
+            }
+
+            if (!PendingChunkedFrames.TryGetValue(frameId, out var frame))
+            {
+                frame = new ChunkedFrame { Parts = new string[count] };
+                PendingChunkedFrames[frameId] = frame;
+            }
+
+            if (frame.Parts.Length != count || frame.Parts[index] != null)
+            {
+                Debug.LogWarning($"MCP bridge: inconsistent chunk {index}/{count} for frame {frameId}, dropping frame.");
+                PendingChunkedFrames.Remove(frameId);
+                return null;
+            }
+
+            frame.Parts[index] = data;
+            frame.Received++;
+            frame.TotalChars += data.Length;
+
+            if (frame.TotalChars > MaxReassembledMessageChars)
+            {
+                Debug.LogError($"MCP bridge: chunked message exceeds {MaxReassembledMessageChars / (1024 * 1024)}M characters, dropping frame {frameId}.");
+                PendingChunkedFrames.Remove(frameId);
+                return null;
+            }
+
+            if (frame.Received < count)
+            {
+                return null;
+            }
+
+            PendingChunkedFrames.Remove(frameId);
+            return string.Concat(frame.Parts);
+        }
+
+        private static void HandleCommandCancelMessage(Dictionary<string, object> message)
+        {
+            if (message.TryGetValue("commandId", out var idObj) && idObj is string commandId)
+            {
+                // Commands already executing cannot be interrupted; queued ones are skipped.
+                // Ids of commands that already finished are never removed, so keep the set bounded.
+                if (CancelledCommandIds.Count >= 1024)
+                {
+                    CancelledCommandIds.Clear();
+                }
+
+                CancelledCommandIds.Add(commandId);
+            }
+        }
+
         private static void HandleServerInfoMessage(Dictionary<string, object> message)
         {
             if (!message.TryGetValue("clientInfo", out var clientInfoObj) ||
@@ -1145,6 +1280,12 @@ namespace MCP.Editor
 
         private static void ExecuteCommand(McpIncomingCommand command)
         {
+            if (CancelledCommandIds.Remove(command.CommandId))
+            {
+                Debug.Log($"MCP Bridge: Skipping cancelled command {command.CommandId} ({command.ToolName})");
+                return;
+            }
+
             try
             {
                 bool willTriggerCompilation = IsCompilationTriggeringCommand(command);
@@ -1233,9 +1374,14 @@ namespace MCP.Editor
 
         #region Context
 
+        /// <summary>
+        /// Generation counter of the editor context, advanced whenever the context is marked dirty.
+        /// </summary>
+        internal static long ContextGeneration => Interlocked.Read(ref _contextGeneration);
+
         private static void MaybePushContext()
         {
-            if (!IsConnected || !_contextDirty)
+            if (!IsConnected || !_contextDirty || !McpBridgeSettings.Instance.PushContextUpdates)
             {
                 return;
             }
@@ -1260,12 +1406,32 @@ namespace MCP.Editor
             _contextDirty = false;
             _lastContextSent = DateTime.UtcNow;
             var payload = McpContextCollector.BuildContextPayload();
-            Send(McpBridgeMessages.CreateContextUpdate(payload));
+
+            if (_lastContextPayload != null)
+            {
+                var ops = McpContextDiff.Diff(_lastContextPayload, payload);
+                if (!McpContextDiff.HasChanges(ops))
+                {
+                    return;
+                }
+
+                var baseVersion = _contextVersion;
+                _contextVersion++;
+                _lastContextPayload = payload;
+                var fullSize = MiniJson.Serialize(payload).Length;
+                Send(McpBridgeMessages.CreateContextPatch(baseVersion, _contextVersion, ops, fullSize));
+                return;
+            }
+
+            _contextVersion++;
+            _lastContextPayload = payload;
+            Send(McpBridgeMessages.CreateContextUpdate(payload, _contextVersion));
         }
 
         private static void MarkContextDirty()
         {
             _contextDirty = true;
+            Interlocked.Increment(ref _contextGeneration);
         }
 
         #endregion
@@ -17,6 +17,7 @@ namespace MCP.Editor
         [SerializeField] private int serverPort = 7070;
         [SerializeField] private bool autoConnectOnLoad = true;
         [SerializeField] private float contextPushIntervalSeconds = 5f;
+        [SerializeField] private bool pushContextUpdates = true;
         [SerializeField] private string serverInstallPath = string.Empty;
 
         // Cached token loaded from file (thread-safe access via lock)
@@ -275,6 +276,25 @@ namespace MCP.Editor
             }
         }
 
+        /// <summary>
+        /// When false, Unity no longer pushes context updates on its own; the MCP server
+        /// pulls the sections it needs with the contextRequest command instead.
+        /// </summary>
+        public bool PushContextUpdates
+        {
+            get => pushContextUpdates;
+            set
+            {
+                if (pushContextUpdates == value)
+                {
+                    return;
+                }
+
+                pushContextUpdates = value;
+                SaveSettings();
+            }
+        }
+
         public float ContextPushIntervalSeconds
         {
             get => Mathf.Max(1f, contextPushIntervalSeconds);
@@ -210,12 +210,14 @@ namespace MCP.Editor
                 EditorGUI.BeginChangeCheck();
                 var host = EditorGUILayout.TextField("Listen Host", settings.ServerHost);
                 var port = EditorGUILayout.IntField("Listen Port", settings.ServerPort);
+                var pushContext = EditorGUILayout.Toggle("Push Context Updates", settings.PushContextUpdates);
                 var interval = EditorGUILayout.FloatField("Context Interval (s)", settings.ContextPushIntervalSeconds);
                 var autoStart = EditorGUILayout.Toggle("Auto Start on Load", settings.AutoConnectOnLoad);
                 if (EditorGUI.EndChangeCheck())
                 {
                     settings.ServerHost = host;
                     settings.ServerPort = port;
+                    settings.PushContextUpdates = pushContext;
                     settings.ContextPushIntervalSeconds = interval;
                     settings.AutoConnectOnLoad = autoStart;
                 }
@@ -51,6 +51,52 @@ namespace MCP.Editor
             };
         }
 
+        /// <summary>
+        /// Builds only the requested context sections for a context:request pull.
+        /// </summary>
+        /// <param name="sections">Any of scene, hierarchy, selection, assets, git.</param>
+        /// <param name="hierarchyRoot">Hierarchy path of the subtree root; null for the scene roots.</param>
+        /// <param name="depth">Levels of children to expand below the root (0 = child names only).</param>
+        /// <param name="assetOffset">First asset index entry to return.</param>
+        /// <param name="assetLimit">Maximum number of asset index entries to return.</param>
+        public static Dictionary<string, object> BuildContextSections(
+            IEnumerable<string> sections,
+            GameObject hierarchyRoot,
+            int depth,
+            int assetOffset,
+            int assetLimit)
+        {
+            var result = new Dictionary<string, object>();
+            foreach (var section in sections)
+            {
+                switch (section)
+                {
+                    case "scene":
+                        result["scene"] = BuildActiveSceneInfo();
+                        break;
+                    case "hierarchy":
+                        result["hierarchy"] = hierarchyRoot != null
+                            ? BuildHierarchyNode(hierarchyRoot, 0, depth)
+                            : BuildHierarchyTree(depth);
+                        break;
+                    case "selection":
+                        result["selection"] = BuildSelectionInfo();
+                        break;
+                    case "assets":
+                        result["assets"] = BuildAssetPage(assetOffset, assetLimit);
+                        break;
+                    case "git":
+                        result["git"] = TryCaptureGitStatus();
+                        break;
+                    default:
+                        throw new InvalidOperationException(
+                            $"Unknown context section '{section}'. Supported: scene, hierarchy, selection, assets, git");
+                }
+            }
+
+            return result;
+        }
+
         /// <summary>
         /// Invalidates the asset index cache, forcing a refresh on next access.
         /// Call this when assets are added, removed, or modified.
@@ -116,7 +162,21 @@ namespace MCP.Editor
             };
         }
 
-        private static Dictionary<string, object> BuildHierarchyTree()
+        private static Dictionary<string, object> BuildAssetPage(int offset, int limit)
+        {
+            var index = GetAssetIndexCached();
+            var start = Math.Min(Math.Max(0, offset), index.Count);
+            var count = Math.Min(Math.Max(0, limit), index.Count - start);
+
+            return new Dictionary<string, object>
+            {
+                ["total"] = index.Count,
+                ["offset"] = start,
+                ["items"] = index.GetRange(start, count),
+            };
+        }
+
+        private static Dictionary<string, object> BuildHierarchyTree(int depth = 0)
         {
             var scene = SceneManager.GetActiveScene();
             if (!scene.IsValid())
@@ -126,7 +186,7 @@ namespace MCP.Editor
 
             var roots = scene.GetRootGameObjects();
             var rootChildren = roots
-                .Select(go => BuildHierarchyNode(go, 0))
+                .Select(go => BuildHierarchyNode(go, 0, depth))
                 .Where(node => node != null)
                 .ToList();
 
@@ -139,7 +199,7 @@ namespace MCP.Editor
             };
         }
 
-        private static Dictionary<string, object> BuildHierarchyNode(GameObject go, int depth)
+        private static Dictionary<string, object> BuildHierarchyNode(GameObject go, int depth, int maxDepth = 0)
         {
             if (go == null)
             {
@@ -166,7 +226,7 @@ namespace MCP.Editor
                 }
             }
 
-            return new Dictionary<string, object>
+            var node = new Dictionary<string, object>
             {
                 ["id"] = go.GetInstanceID().ToString(),
                 ["name"] = go.name,
@@ -175,6 +235,24 @@ namespace MCP.Editor
                 ["childCount"] = go.transform.childCount,
                 ["childNames"] = childNames,
             };
+
+            // Expand children only when a deeper subtree was requested
+            if (depth < maxDepth)
+            {
+                var children = new List<object>(go.transform.childCount);
+                for (var i = 0; i < go.transform.childCount; i++)
+                {
+                    var child = BuildHierarchyNode(go.transform.GetChild(i).gameObject, depth + 1, maxDepth);
+                    if (child != null)
+                    {
+                        children.Add(child);
+                    }
+                }
+
+                node["children"] = children;
+            }
+
+            return node;
         }
 
         private static string ResolveHierarchyType(GameObject go)
@@ -0,0 +1,125 @@
+using System;
+using System.Collections.Generic;
+
+namespace MCP.Editor
+{
+    /// <summary>
+    /// Computes JSON-patch style deltas between two context payloads.
+    /// Dictionaries are compared key by key and lists of equal length element by element;
+    /// anything else that differs is replaced whole.
+    /// </summary>
+    internal static class McpContextDiff
+    {
+        private const string UpdatedAtPath = "/updatedAt";
+
+        /// <summary>
+        /// Returns the list of add/replace/remove operations that turn previous into current.
+        /// </summary>
+        public static List<object> Diff(Dictionary<string, object> previous, Dictionary<string, object> current)
+        {
+            var ops = new List<object>();
+            DiffObject(previous, current, string.Empty, ops);
+            return ops;
+        }
+
+        /// <summary>
+        /// Returns true when the operations change anything besides the updatedAt timestamp.
+        /// </summary>
+        public static bool HasChanges(List<object> ops)
+        {
+            foreach (var op in ops)
+            {
+                if (op is Dictionary<string, object> dict &&
+                    dict.TryGetValue("path", out var path) &&
+                    path as string != UpdatedAtPath)
+                {
+                    return true;
+                }
+            }
+
+            return false;
+        }
+
+        private static void DiffObject(
+            Dictionary<string, object> previous,
+            Dictionary<string, object> current,
+            string basePath,
+            List<object> ops)
+        {
+            foreach (var key in previous.Keys)
+            {
+                if (!current.ContainsKey(key))
+                {
+                    ops.Add(CreateOp("remove", basePath + "/" + EscapePointer(key)));
+                }
+            }
+
+            foreach (var pair in current)
+            {
+                var path = basePath + "/" + EscapePointer(pair.Key);
+                if (!previous.TryGetValue(pair.Key, out var oldValue))
+                {
+                    ops.Add(CreateOp("add", path, pair.Value));
+                    continue;
+                }
+
+                DiffValue(oldValue, pair.Value, path, ops);
+            }
+        }
+
+        private static void DiffValue(object oldValue, object newValue, string path, List<object> ops)
+        {
+            if (oldValue is Dictionary<string, object> oldDict && newValue is Dictionary<string, object> newDict)
+            {
+                DiffObject(oldDict, newDict, path, ops);
+                return;
+            }
+
+            if (oldValue is List<object> oldList && newValue is List<object> newList && oldList.Count == newList.Count)
+            {
+                for (var i = 0; i < newList.Count; i++)
+                {
+                    DiffValue(oldList[i], newList[i], path + "/" + i, ops);
+                }
+
+                return;
+            }
+
+            if (!ValuesEqual(oldValue, newValue))
+            {
+                ops.Add(CreateOp("replace", path, newValue));
+            }
+        }
+
+        private static bool ValuesEqual(object a, object b)
+        {
+            if (a == null || b == null)
+            {
+                return a == null && b == null;
+            }
+
+            return string.Equals(MiniJson.Serialize(a), MiniJson.Serialize(b), StringComparison.Ordinal);
+        }
+
+        private static Dictionary<string, object> CreateOp(string op, string path)
+        {
+            return new Dictionary<string, object>
+            {
+                ["op"] = op,
+                ["path"] = path,
+            };
+        }
+
+        private static Dictionary<string, object> CreateOp(string op, string path, object value)
+        {
+            var result = CreateOp(op, path);
+            result["value"] = value;
+            return result;
+        }
+
+        private static string EscapePointer(string key)
+        {
+            return key.Replace("~", "~0").Replace("/", "~1");
+        }
+    }
+}
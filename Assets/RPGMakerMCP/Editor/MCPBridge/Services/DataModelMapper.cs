@@ -15,6 +15,36 @@ namespace MCP.Editor.Services
     /// </summary>
     public static class DataModelMapper
     {
+        // True while a payload with "patchFormat": "merge" is executed (see UseMergePatch)
+        [ThreadStatic] private static bool _mergePatch;
+
+        /// <summary>
+        /// Makes <see cref="ApplyPartialUpdate{T}"/> follow RFC 7386 merge patch semantics until the
+        /// returned scope is disposed: null clears a field instead of being ignored. Objects are
+        /// merged field by field and other values replace the field either way.
+        /// </summary>
+        public static IDisposable UseMergePatch(bool enabled)
+        {
+            var scope = new MergePatchScope(_mergePatch);
+            _mergePatch = enabled;
+            return scope;
+        }
+
+        private sealed class MergePatchScope : IDisposable
+        {
+            private readonly bool _previous;
+
+            public MergePatchScope(bool previous)
+            {
+                _previous = previous;
+            }
+
+            public void Dispose()
+            {
+                _mergePatch = _previous;
+            }
+        }
+
         /// <summary>
         /// Apply partial updates from a dictionary to an existing data model.
         /// Uses reflection to update only the fields present in the updates dictionary.
@@ -36,7 +66,15 @@ namespace MCP.Editor.Services
         /// </summary>
         private static void ApplyFieldUpdate(object target, Type type, string fieldName, object value)
         {
-            if (target == null || value == null) return;
+            if (target == null) return;
+            if (value == null)
+            {
+                if (_mergePatch)
+                {
+                    ClearMember(target, type, fieldName);
+                }
+                return;
+            }
 
             // Try to find a field with the given name
             var field = type.GetField(fieldName, BindingFlags.Public | BindingFlags.Instance);
@@ -117,6 +155,30 @@ namespace MCP.Editor.Services
             }
         }
 
+        /// <summary>
+        /// Reset a field or property to its default value (a merge patch null).
+        /// </summary>
+        private static void ClearMember(object target, Type type, string fieldName)
+        {
+            var field = type.GetField(fieldName, BindingFlags.Public | BindingFlags.Instance);
+            if (field != null)
+            {
+                field.SetValue(target, DefaultValue(field.FieldType));
+                return;
+            }
+
+            var property = type.GetProperty(fieldName, BindingFlags.Public | BindingFlags.Instance);
+            if (property != null && property.CanWrite)
+            {
+                property.SetValue(target, DefaultValue(property.PropertyType));
+            }
+        }
+
+        private static object DefaultValue(Type type)
+        {
+            return type.IsValueType ? Activator.CreateInstance(type) : null;
+        }
+
         /// <summary>
         /// Convert a value to the target type.
         /// </summary>
@@ -384,5 +446,48 @@ namespace MCP.Editor.Services
 
             return result;
         }
+
+        /// <summary>
+        /// Read the "records" array of a bulk upsert payload: objects with a "uuId" and a "data" object.
+        /// </summary>
+        public static List<(string id, Dictionary<string, object> data)> ReadBulkRecords(Dictionary<string, object> payload)
+        {
+            if (payload == null || !payload.TryGetValue("records", out var value) || !(value is IEnumerable<object> items))
+            {
+                throw new InvalidOperationException("records array is required.");
+            }
+
+            var records = new List<(string id, Dictionary<string, object> data)>();
+            var n = 0;
+            foreach (var item in items)
+            {
+                var record = item as Dictionary<string, object>;
+                var id = record != null && record.TryGetValue("uuId", out var idObj) ? idObj?.ToString() : null;
+                if (string.IsNullOrEmpty(id)
+                    || !record.TryGetValue("data", out var raw)
+                    || !(raw is Dictionary<string, object> data))
+                {
+                    throw new InvalidOperationException($"Record {n} must be an object with a uuId and a data object.");
+                }
+
+                records.Add((id, data));
+                n++;
+            }
+
+            return records;
+        }
+
+        /// <summary>
+        /// Read the "uuIds" array of a bulk delete payload.
+        /// </summary>
+        public static List<string> ReadBulkIds(Dictionary<string, object> payload)
+        {
+            if (payload == null || !payload.TryGetValue("uuIds", out var value) || !(value is IEnumerable<object> items))
+            {
+                throw new InvalidOperationException("uuIds array is required.");
+            }
+
+            return items.Select(id => id?.ToString()).Where(id => !string.IsNullOrEmpty(id)).ToList();
+        }
     }
 }
@@ -67,7 +67,21 @@ namespace MCP.Editor.Services
         public CharacterActorDataModel CreateCharacter(string name = null, int charaType = 0)
         {
             var characters = DatabaseService.LoadCharacterActor();
+            var newCharacter = NewCharacter(characters, Guid.NewGuid().ToString(), name, charaType);
 
+            characters.Add(newCharacter);
+            DatabaseService.SaveCharacterActor(characters);
+
+            RefreshHierarchy(Region.Character);
+
+            return newCharacter;
+        }
+
+        /// <summary>
+        /// Build a character with editor defaults; the caller adds it to the list and saves.
+        /// </summary>
+        private CharacterActorDataModel NewCharacter(List<CharacterActorDataModel> characters, string uuid, string name, int charaType)
+        {
             // Count existing characters of this type
             var createNum = characters.Count(c => c.charaType == charaType);
 
@@ -76,7 +90,7 @@ namespace MCP.Editor.Services
 
             // Create with defaults using the data model's CreateDefault
             var newCharacter = CharacterActorDataModel.CreateDefault(
-                Guid.NewGuid().ToString(),
+                uuid,
                 defaultName,
                 charaType
             );
@@ -115,11 +129,6 @@ namespace MCP.Editor.Services
                 Debug.LogWarning($"Failed to set default images: {ex.Message}");
             }
 
-            characters.Add(newCharacter);
-            DatabaseService.SaveCharacterActor(characters);
-
-            RefreshHierarchy(Region.Character);
-
             return newCharacter;
         }
 
@@ -159,6 +168,18 @@ namespace MCP.Editor.Services
 
             // Update initial party if needed (similar to CharacterHierarchy logic)
             var system = DatabaseService.LoadSystem();
+            if (UpdateInitialPartyAfterDelete(system, characters, uuid))
+                DatabaseService.SaveSystem(system);
+
+            RefreshHierarchy(Region.Character);
+        }
+
+        /// <summary>
+        /// Fix up the initial party after a character was removed from the list.
+        /// Returns true if the system settings changed and need saving.
+        /// </summary>
+        private static bool UpdateInitialPartyAfterDelete(SystemSettingDataModel system, List<CharacterActorDataModel> characters, string uuid)
+        {
             var actorCharacters = characters.Where(c => c.charaType == (int)ActorTypeEnum.ACTOR).ToList();
 
             if (actorCharacters.Count < system.initialParty.partyMax)
@@ -166,9 +187,10 @@ namespace MCP.Editor.Services
                 // Remove deleted character from party
                 system.initialParty.party.RemoveAll(p => p == uuid);
                 system.initialParty.partyMax = system.initialParty.party.Count;
-                DatabaseService.SaveSystem(system);
+                return true;
             }
-            else if (system.initialParty.party.Contains(uuid))
+
+            if (system.initialParty.party.Contains(uuid))
             {
                 // Find a replacement character
                 var replacement = actorCharacters.FirstOrDefault(c => !system.initialParty.party.Contains(c.uuId));
@@ -182,11 +204,11 @@ namespace MCP.Editor.Services
                             break;
                         }
                     }
-                    DatabaseService.SaveSystem(system);
+                    return true;
                 }
             }
 
-            RefreshHierarchy(Region.Character);
+            return false;
         }
 
         #endregion
@@ -217,10 +239,24 @@ namespace MCP.Editor.Services
         public ItemDataModel CreateItem(string name = null)
         {
             var items = DatabaseService.LoadItem();
+            var newItem = NewItem(items, Guid.NewGuid().ToString(), name);
+
+            items.Add(newItem);
+            DatabaseService.SaveItem(items);
+
+            RefreshHierarchy(Region.Equip);
+
+            return newItem;
+        }
 
+        /// <summary>
+        /// Build an item with editor defaults; the caller adds it to the list and saves.
+        /// </summary>
+        private ItemDataModel NewItem(List<ItemDataModel> items, string uuid, string name)
+        {
             var defaultName = name ?? $"#{(items.Count + 1):D4}　{EditorLocalize.LocalizeText("WORD_1518")}";
 
-            var newItem = ItemDataModel.CreateDefault(Guid.NewGuid().ToString());
+            var newItem = ItemDataModel.CreateDefault(uuid);
             newItem.basic.name = defaultName;
 
             // Set required default values (from EquipHierarchy.CreateItemDataModel)
@@ -230,11 +266,6 @@ namespace MCP.Editor.Services
             newItem.targetEffect.targetTeam = 2;
             newItem.targetEffect.targetRange = 0;
 
-            items.Add(newItem);
-            DatabaseService.SaveItem(items);
-
-            RefreshHierarchy(Region.Equip);
-
             return newItem;
         }
 
@@ -302,10 +333,24 @@ namespace MCP.Editor.Services
         public AnimationDataModel CreateAnimation(string name = null)
         {
             var animations = DatabaseService.LoadAnimation();
+            var newAnimation = NewAnimation(animations, Guid.NewGuid().ToString(), name);
+
+            animations.Add(newAnimation);
+            DatabaseService.SaveAnimation(animations);
+
+            RefreshHierarchy(Region.Animation);
 
+            return newAnimation;
+        }
+
+        /// <summary>
+        /// Build an animation with editor defaults; the caller adds it to the list and saves.
+        /// </summary>
+        private AnimationDataModel NewAnimation(List<AnimationDataModel> animations, string id, string name)
+        {
             var defaultName = name ?? $"#{(animations.Count + 1):D4} {EditorLocalize.LocalizeText("WORD_1518")}";
 
-            var newAnimation = AnimationDataModel.CreateDefault(Guid.NewGuid().ToString());
+            var newAnimation = AnimationDataModel.CreateDefault(id);
             newAnimation.particleName = defaultName;
 
             // Set required default values (from AnimationHierarchy.CreateAnimationDataModel)
@@ -322,11 +367,6 @@ namespace MCP.Editor.Services
             newAnimation.offset = "10;10";
             newAnimation.rotation = "0;0;0";
 
-            animations.Add(newAnimation);
-            DatabaseService.SaveAnimation(animations);
-
-            RefreshHierarchy(Region.Animation);
-
             return newAnimation;
         }
 
@@ -394,10 +434,24 @@ namespace MCP.Editor.Services
         public EnemyDataModel CreateEnemy(string name = null)
         {
             var enemies = DatabaseService.LoadEnemy();
+            var newEnemy = NewEnemy(enemies, Guid.NewGuid().ToString(), name);
 
+            enemies.Add(newEnemy);
+            DatabaseService.SaveEnemy(enemies);
+
+            RefreshHierarchy(Region.Battle);
+
+            return newEnemy;
+        }
+
+        /// <summary>
+        /// Build an enemy with editor defaults; the caller adds it to the list and saves.
+        /// </summary>
+        private EnemyDataModel NewEnemy(List<EnemyDataModel> enemies, string id, string name)
+        {
             var defaultName = name ?? $"#{(enemies.Count + 1):D4}　{EditorLocalize.LocalizeText("WORD_1518")}";
 
-            var newEnemy = EnemyDataModel.CreateDefault(Guid.NewGuid().ToString(), defaultName);
+            var newEnemy = EnemyDataModel.CreateDefault(id, defaultName);
 
             // Set required default values (from BattleHierarchy.CreateEnemyDataModel)
             try
@@ -411,11 +465,6 @@ namespace MCP.Editor.Services
                 Debug.LogWarning($"Failed to set default enemy image: {ex.Message}");
             }
 
-            enemies.Add(newEnemy);
-            DatabaseService.SaveEnemy(enemies);
-
-            RefreshHierarchy(Region.Battle);
-
             return newEnemy;
         }
 
@@ -490,12 +539,29 @@ namespace MCP.Editor.Services
         {
             var troops = DatabaseService.LoadTroop();
             var enemies = DatabaseService.LoadEnemy();
+            var newTroop = NewTroop(troops, enemies, null, name);
+
+            troops.Add(newTroop);
+            DatabaseService.SaveTroop(troops);
 
+            RefreshHierarchy(Region.Battle);
+
+            return newTroop;
+        }
+
+        /// <summary>
+        /// Build a troop with editor defaults; the caller adds it to the list and saves.
+        /// A null id keeps the id generated by TroopDataModel.CreateDefault().
+        /// </summary>
+        private TroopDataModel NewTroop(List<TroopDataModel> troops, List<EnemyDataModel> enemies, string id, string name)
+        {
             var defaultName = name ?? $"#{(troops.Count + 1):D4}　{EditorLocalize.LocalizeText("WORD_1518")}";
 
             // Use TroopDataModel.CreateDefault() for proper initialization
             var newTroop = TroopDataModel.CreateDefault();
             newTroop.name = defaultName;
+            if (id != null)
+                newTroop.id = id;
 
             // Set default enemy in members if enemies exist (from BattleHierarchy.CreateTroopDataModel)
             if (enemies.Count > 0)
@@ -511,11 +577,6 @@ namespace MCP.Editor.Services
                 };
             }
 
-            troops.Add(newTroop);
-            DatabaseService.SaveTroop(troops);
-
-            RefreshHierarchy(Region.Battle);
-
             return newTroop;
         }
 
@@ -584,10 +645,24 @@ namespace MCP.Editor.Services
         {
             var skills = DatabaseService.LoadSkillCustom();
             var system = DatabaseService.LoadSystem();
+            var newSkill = NewSkill(skills, system, Guid.NewGuid().ToString(), name);
+
+            skills.Add(newSkill);
+            DatabaseService.SaveSkillCustom(skills);
+
+            RefreshHierarchy(Region.Skill);
 
+            return newSkill;
+        }
+
+        /// <summary>
+        /// Build a skill with editor defaults; the caller adds it to the list and saves.
+        /// </summary>
+        private SkillCustomDataModel NewSkill(List<SkillCustomDataModel> skills, SystemSettingDataModel system, string id, string name)
+        {
             var defaultName = name ?? $"#{(skills.Count + 1):D4}　{EditorLocalize.LocalizeText("WORD_1518")}";
 
-            var newSkill = SkillCustomDataModel.CreateDefault(Guid.NewGuid().ToString());
+            var newSkill = SkillCustomDataModel.CreateDefault(id);
             newSkill.basic.name = defaultName;
 
             // Set required default values (from SkillHierarchy.CreateSkillCustomDataModel)
@@ -621,11 +696,6 @@ namespace MCP.Editor.Services
                 Debug.LogWarning($"Failed to set default damage formula: {ex.Message}");
             }
 
-            skills.Add(newSkill);
-            DatabaseService.SaveSkillCustom(skills);
-
-            RefreshHierarchy(Region.Skill);
-
             return newSkill;
         }
 
@@ -667,6 +737,264 @@ namespace MCP.Editor.Services
 
         #endregion
 
+        #region Bulk Operations
+
+        /// <summary>
+        /// Create or update many characters with one save and one hierarchy refresh.
+        /// Records whose uuId is not in the database are created with that uuId.
+        /// </summary>
+        public List<Dictionary<string, object>> BulkUpsertCharacters(IList<(string id, Dictionary<string, object> data)> records)
+        {
+            var characters = DatabaseService.LoadCharacterActor();
+            var results = BulkUpsert(characters, c => c.uuId,
+                (id, data) => NewCharacter(characters, id, null, GetCharaType(data)), records);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveCharacterActor(characters);
+                RefreshHierarchy(Region.Character);
+            }
+            return results;
+        }
+
+        /// <summary>
+        /// Delete many characters with one save, fixing up the initial party once.
+        /// </summary>
+        public List<Dictionary<string, object>> BulkDeleteCharacters(IList<string> ids)
+        {
+            var characters = DatabaseService.LoadCharacterActor();
+            var results = BulkDelete(characters, c => c.uuId, ids);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveCharacterActor(characters);
+
+                var system = DatabaseService.LoadSystem();
+                var systemChanged = false;
+                foreach (var result in results.Where(r => (string)r["status"] == "deleted"))
+                {
+                    systemChanged |= UpdateInitialPartyAfterDelete(system, characters, (string)result["uuId"]);
+                }
+                if (systemChanged)
+                    DatabaseService.SaveSystem(system);
+
+                RefreshHierarchy(Region.Character);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkUpsertItems(IList<(string id, Dictionary<string, object> data)> records)
+        {
+            var items = DatabaseService.LoadItem();
+            var results = BulkUpsert(items, i => i.basic.id, (id, data) => NewItem(items, id, null), records);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveItem(items);
+                RefreshHierarchy(Region.Equip);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkDeleteItems(IList<string> ids)
+        {
+            var items = DatabaseService.LoadItem();
+            var results = BulkDelete(items, i => i.basic.id, ids);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveItem(items);
+                RefreshHierarchy(Region.Equip);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkUpsertAnimations(IList<(string id, Dictionary<string, object> data)> records)
+        {
+            var animations = DatabaseService.LoadAnimation();
+            var results = BulkUpsert(animations, a => a.id, (id, data) => NewAnimation(animations, id, null), records);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveAnimation(animations);
+                RefreshHierarchy(Region.Animation);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkDeleteAnimations(IList<string> ids)
+        {
+            var animations = DatabaseService.LoadAnimation();
+            var results = BulkDelete(animations, a => a.id, ids);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveAnimation(animations);
+                RefreshHierarchy(Region.Animation);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkUpsertEnemies(IList<(string id, Dictionary<string, object> data)> records)
+        {
+            var enemies = DatabaseService.LoadEnemy();
+            var results = BulkUpsert(enemies, e => e.id, (id, data) => NewEnemy(enemies, id, null), records);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveEnemy(enemies);
+                RefreshHierarchy(Region.Battle);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkDeleteEnemies(IList<string> ids)
+        {
+            var enemies = DatabaseService.LoadEnemy();
+            var results = BulkDelete(enemies, e => e.id, ids);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveEnemy(enemies);
+                RefreshHierarchy(Region.Battle);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkUpsertTroops(IList<(string id, Dictionary<string, object> data)> records)
+        {
+            var troops = DatabaseService.LoadTroop();
+            var enemies = DatabaseService.LoadEnemy();
+            var results = BulkUpsert(troops, t => t.id, (id, data) => NewTroop(troops, enemies, id, null), records);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveTroop(troops);
+                RefreshHierarchy(Region.Battle);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkDeleteTroops(IList<string> ids)
+        {
+            var troops = DatabaseService.LoadTroop();
+            var results = BulkDelete(troops, t => t.id, ids);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveTroop(troops);
+                RefreshHierarchy(Region.Battle);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkUpsertSkills(IList<(string id, Dictionary<string, object> data)> records)
+        {
+            var skills = DatabaseService.LoadSkillCustom();
+            var system = DatabaseService.LoadSystem();
+            var results = BulkUpsert(skills, s => s.basic.id, (id, data) => NewSkill(skills, system, id, null), records);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveSkillCustom(skills);
+                RefreshHierarchy(Region.Skill);
+            }
+            return results;
+        }
+
+        public List<Dictionary<string, object>> BulkDeleteSkills(IList<string> ids)
+        {
+            var skills = DatabaseService.LoadSkillCustom();
+            var results = BulkDelete(skills, s => s.basic.id, ids);
+            if (AnyApplied(results))
+            {
+                DatabaseService.SaveSkillCustom(skills);
+                RefreshHierarchy(Region.Skill);
+            }
+            return results;
+        }
+
+        /// <summary>
+        /// Apply each record to the loaded list, creating missing ones, and return one status per record
+        /// ("created", "updated" or "error"). A failing record does not stop the others.
+        /// </summary>
+        private static List<Dictionary<string, object>> BulkUpsert<T>(
+            List<T> list,
+            Func<T, string> getId,
+            Func<string, Dictionary<string, object>, T> create,
+            IList<(string id, Dictionary<string, object> data)> records) where T : class
+        {
+            var byId = new Dictionary<string, T>();
+            foreach (var existing in list)
+            {
+                var existingId = getId(existing);
+                if (existingId != null)
+                    byId[existingId] = existing;
+            }
+
+            var results = new List<Dictionary<string, object>>(records.Count);
+            foreach (var (id, data) in records)
+            {
+                try
+                {
+                    var status = "updated";
+                    if (!byId.TryGetValue(id, out var record))
+                    {
+                        record = create(id, data);
+                        list.Add(record);
+                        byId[id] = record;
+                        status = "created";
+                    }
+
+                    DataModelMapper.ApplyPartialUpdate(record, data);
+                    results.Add(BulkStatus(id, status));
+                }
+                catch (Exception ex)
+                {
+                    results.Add(BulkStatus(id, "error", ex.Message));
+                }
+            }
+
+            return results;
+        }
+
+        /// <summary>
+        /// Remove the given ids from the loaded list and return one status per id ("deleted" or "error").
+        /// </summary>
+        private static List<Dictionary<string, object>> BulkDelete<T>(List<T> list, Func<T, string> getId, IList<string> ids)
+        {
+            var existing = new HashSet<string>(list.Select(getId).Where(id => id != null));
+            var removed = new HashSet<string>();
+            var results = new List<Dictionary<string, object>>(ids.Count);
+
+            foreach (var id in ids)
+            {
+                if (removed.Contains(id))
+                    results.Add(BulkStatus(id, "error", "Listed more than once."));
+                else if (!existing.Contains(id))
+                    results.Add(BulkStatus(id, "error", $"Record with UUID '{id}' not found."));
+                else
+                {
+                    removed.Add(id);
+                    results.Add(BulkStatus(id, "deleted"));
+                }
+            }
+
+            list.RemoveAll(item => removed.Contains(getId(item)));
+            return results;
+        }
+
+        private static Dictionary<string, object> BulkStatus(string id, string status, string error = null)
+        {
+            var result = new Dictionary<string, object> { ["uuId"] = id, ["status"] = status };
+            if (error != null)
+                result["error"] = error;
+            return result;
+        }
+
+        private static bool AnyApplied(List<Dictionary<string, object>> results)
+        {
+            return results.Any(r => (string)r["status"] != "error");
+        }
+
+        private static int GetCharaType(Dictionary<string, object> data)
+        {
+            return data.TryGetValue("charaType", out var typeObj) && typeObj != null
+                ? Convert.ToInt32(typeObj)
+                : (int)ActorTypeEnum.ACTOR;
+        }
+
+        #endregion
+
         #region System Settings
 
         /// <summary>
@@ -1223,9 +1551,20 @@ namespace MCP.Editor.Services
         #region Helper Methods
 
         /// <summary>
-        /// Refresh the hierarchy UI for a specific region.
+        /// Refresh the hierarchy UI for a specific region; deferred to commit inside an MCP transaction.
         /// </summary>
         private void RefreshHierarchy(Region region = Region.All)
+        {
+            McpTransaction.RecordServiceWrite();
+            if (!McpTransaction.DeferRefresh($"hierarchy:{region}", () => RefreshHierarchyRegion(region)))
+            {
+                RefreshHierarchyRegion(region);
+            }
+
+            McpTransaction.RefreshAssets();
+        }
+
+        private static void RefreshHierarchyRegion(Region region)
         {
             try
             {
@@ -1238,8 +1577,6 @@ namespace MCP.Editor.Services
             {
                 Debug.LogWarning($"Failed to refresh hierarchy: {ex.Message}");
             }
-
-            AssetDatabase.Refresh();
         }
 
         /// <summary>
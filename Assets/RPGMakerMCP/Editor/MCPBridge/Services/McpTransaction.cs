@@ -0,0 +1,232 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using UnityEditor;
+using Debug = UnityEngine.Debug;
+
+namespace MCP.Editor.Services
+{
+    /// <summary>
+    /// Defers AssetDatabase and hierarchy refreshes while a bridge transaction is open.
+    /// Handlers call <see cref="RefreshAssets"/> and <see cref="DeferRefresh"/> instead of
+    /// refreshing after every write; outside a transaction those refresh immediately, inside
+    /// one they are collected and run once at commit.
+    ///
+    /// Files written directly by the handlers are journaled (<see cref="RecordWrite"/>) so
+    /// rollback can restore them. Writes made through the RPGMaker editor services are saved
+    /// by RPGMaker itself and are only counted; rollback cannot undo them.
+    /// </summary>
+    public static class McpTransaction
+    {
+        private static string _id;
+        private static bool _assetRefreshPending;
+        private static int _deferredRefreshes;
+        private static int _serviceWrites;
+        private static readonly Dictionary<string, Action> DeferredHierarchyRefreshes = new Dictionary<string, Action>();
+        // Original file contents by path; null if the file did not exist
+        private static readonly Dictionary<string, byte[]> Journal = new Dictionary<string, byte[]>();
+
+        public static bool IsActive => _id != null;
+
+        public static string Id => _id;
+
+        public static string Begin()
+        {
+            if (IsActive)
+            {
+                throw new InvalidOperationException($"Transaction {_id} is already open. Commit or roll it back first.");
+            }
+
+            Reset();
+            _id = Guid.NewGuid().ToString("N");
+            return _id;
+        }
+
+        /// <summary>
+        /// Closes the transaction and runs the deferred refreshes once.
+        /// </summary>
+        public static Dictionary<string, object> Commit()
+        {
+            var id = RequireActive();
+            var deferred = _deferredRefreshes;
+            var journaled = Journal.Count;
+            var refreshMs = RunDeferredRefreshes();
+
+            return new Dictionary<string, object>
+            {
+                ["transactionId"] = id,
+                ["deferredRefreshes"] = deferred,
+                ["journaledFiles"] = journaled,
+                ["refreshMs"] = refreshMs,
+            };
+        }
+
+        /// <summary>
+        /// Restores the journaled files, closes the transaction and refreshes what changed.
+        /// </summary>
+        public static Dictionary<string, object> Rollback()
+        {
+            var id = RequireActive();
+            var restored = 0;
+            var failed = new List<string>();
+
+            foreach (var entry in Journal)
+            {
+                try
+                {
+                    if (entry.Value == null)
+                    {
+                        if (File.Exists(entry.Key))
+                            File.Delete(entry.Key);
+                    }
+                    else
+                    {
+                        Directory.CreateDirectory(Path.GetDirectoryName(entry.Key));
+                        File.WriteAllBytes(entry.Key, entry.Value);
+                    }
+                    restored++;
+                }
+                catch (Exception ex)
+                {
+                    failed.Add($"{entry.Key}: {ex.Message}");
+                }
+            }
+
+            var serviceWrites = _serviceWrites;
+            var refreshMs = RunDeferredRefreshes();
+
+            return new Dictionary<string, object>
+            {
+                ["transactionId"] = id,
+                ["restoredFiles"] = restored,
+                ["failedFiles"] = failed,
+                ["keptServiceWrites"] = serviceWrites,
+                ["refreshMs"] = refreshMs,
+            };
+        }
+
+        /// <summary>
+        /// AssetDatabase.Refresh now, or once at the end of the open transaction.
+        /// </summary>
+        public static void RefreshAssets()
+        {
+            if (!IsActive)
+            {
+                AssetDatabase.Refresh();
+                return;
+            }
+
+            _assetRefreshPending = true;
+            _deferredRefreshes++;
+        }
+
+        /// <summary>
+        /// Returns true if a transaction is open and <paramref name="refresh"/> was queued
+        /// to run once at its end under <paramref name="key"/>; the caller then skips its refresh.
+        /// </summary>
+        public static bool DeferRefresh(string key, Action refresh)
+        {
+            if (!IsActive)
+            {
+                return false;
+            }
+
+            DeferredHierarchyRefreshes[key] = refresh;
+            _deferredRefreshes++;
+            return true;
+        }
+
+        /// <summary>
+        /// Journals a file before a handler writes, replaces or deletes it.
+        /// </summary>
+        public static void RecordWrite(string path)
+        {
+            if (!IsActive)
+            {
+                return;
+            }
+
+            var fullPath = Path.GetFullPath(path);
+            if (!Journal.ContainsKey(fullPath))
+            {
+                Journal[fullPath] = File.Exists(fullPath) ? File.ReadAllBytes(fullPath) : null;
+            }
+        }
+
+        /// <summary>
+        /// Journals every file below a directory before it is deleted.
+        /// </summary>
+        public static void RecordDirectory(string path)
+        {
+            if (!IsActive || !Directory.Exists(path))
+            {
+                return;
+            }
+
+            foreach (var file in Directory.GetFiles(path, "*", SearchOption.AllDirectories))
+            {
+                RecordWrite(file);
+            }
+        }
+
+        /// <summary>
+        /// Counts a write saved through the RPGMaker editor services, which rollback cannot undo.
+        /// </summary>
+        public static void RecordServiceWrite()
+        {
+            if (IsActive)
+            {
+                _serviceWrites++;
+            }
+        }
+
+        private static string RequireActive()
+        {
+            if (!IsActive)
+            {
+                throw new InvalidOperationException("No transaction is open.");
+            }
+
+            return _id;
+        }
+
+        private static long RunDeferredRefreshes()
+        {
+            var refreshAssets = _assetRefreshPending;
+            var refreshes = new List<Action>(DeferredHierarchyRefreshes.Values);
+            // Close first so the refresh callbacks run instead of deferring again
+            Reset();
+
+            var stopwatch = Stopwatch.StartNew();
+            if (refreshAssets)
+            {
+                AssetDatabase.Refresh();
+            }
+
+            foreach (var refresh in refreshes)
+            {
+                try
+                {
+                    refresh();
+                }
+                catch (Exception ex)
+                {
+                    Debug.LogWarning($"MCP transaction: deferred refresh failed: {ex.Message}");
+                }
+            }
+
+            return stopwatch.ElapsedMilliseconds;
+        }
+
+        private static void Reset()
+        {
+            _id = null;
+            _assetRefreshPending = false;
+            _deferredRefreshes = 0;
+            _serviceWrites = 0;
+            DeferredHierarchyRefreshes.Clear();
+            Journal.Clear();
+        }
+    }
+}
@@ -4,17 +4,26 @@ import asyncio
 import contextlib
 import json
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeGuard, cast
 from uuid import uuid4
 
 from websockets.asyncio.client import ClientConnection
 from websockets.exceptions import ConnectionClosed
 from websockets.protocol import State as ConnectionState
 
+from bridge.context_replica import ContextReplica, ContextVersionGap
+from bridge.frame_codec import (
+    ResultFormat,
+    frame_codec,
+    peek_command_result_id,
+    render_result,
+)
 from bridge.messages import (
     BridgeCommandResultMessage,
+    BridgeContextPatchMessage,
     BridgeContextUpdateMessage,
     BridgeHeartbeatMessage,
     BridgeHelloMessage,
@@ -25,8 +34,12 @@ from bridge.messages import (
     ServerMessage,
     UnityContextPayload,
 )
+from bridge.send_lanes import Lane, SendLanes
+from config.constants import context as context_config
+from config.constants import network
 from logger import logger
 from utils.client_detector import get_client_info
+from utils.memory import deep_sizeof, intern_strings
 
 
 @dataclass
@@ -34,6 +47,15 @@ class PendingCommand:
     tool_name: str
     future: asyncio.Future[Any]
     timeout_handle: asyncio.TimerHandle
+    result_format: ResultFormat = "object"
+
+
+@dataclass
+class BridgeTransaction:
+    """An open Unity transaction; ``result`` holds Unity's commit or rollback summary once it ends."""
+
+    transaction_id: str
+    result: dict[str, Any] | None = None
 
 
 class BridgeManager:
@@ -42,15 +64,29 @@ class BridgeManager:
         self._session_id: str | None = None
         self._last_heartbeat_at: int | None = None
         self._context: UnityContextPayload | None = None
+        self._context_replica = ContextReplica()
+        self._context_resync_requested = False
+        self._context_request_cache: OrderedDict[
+            tuple[Any, ...], tuple[int, dict[str, Any], int]
+        ] = OrderedDict()
+        self._context_request_cache_bytes = 0
+        self._context_requests = 0
+        self._context_request_hits = 0
         self._pending_commands: dict[str, PendingCommand] = {}
         self._compilation_waiters: list[asyncio.Future[dict[str, Any]]] = []
+        self._compilation_state: dict[str, Any] = {"status": "idle"}
         self._listeners: dict[str, list[Callable[..., None]]] = {
             "connected": [],
             "disconnected": [],
             "contextUpdated": [],
+            "compilationStarted": [],
+            "compilationComplete": [],
         }
         self._receive_task: asyncio.Task[None] | None = None
-        self._send_lock = asyncio.Lock()
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._send_lanes = SendLanes()
+        # Unity allows one open transaction at a time
+        self._transaction_lock = asyncio.Lock()
 
     async def attach(self, socket: ClientConnection) -> None:
         await self._teardown_socket()
@@ -75,6 +111,113 @@ class BridgeManager:
     def get_last_heartbeat(self) -> int | None:
         return self._last_heartbeat_at
 
+    def get_context_stats(self) -> dict[str, Any]:
+        """Return context replica counters, including bytes saved by patches."""
+        stats = self._context_replica.get_stats()
+        stats["pullRequests"] = self._context_requests
+        stats["pullCacheHits"] = self._context_request_hits
+        stats["pullCacheEntries"] = len(self._context_request_cache)
+        stats["pullCacheBytes"] = self._context_request_cache_bytes
+        return stats
+
+    async def request_context(
+        self,
+        sections: list[str] | None = None,
+        hierarchy_path: str | None = None,
+        depth: int = 0,
+        asset_offset: int = 0,
+        asset_limit: int = 50,
+    ) -> dict[str, Any]:
+        """
+        Pull selected context sections from Unity.
+
+        Unity builds only the requested sections (scene, hierarchy, selection,
+        assets, git). Results are cached per scope together with Unity's context
+        generation; when the generation has not moved, Unity answers
+        ``unchanged`` without rebuilding anything and the cached sections are
+        returned.
+
+        Returns:
+            Dictionary with ``generation``, ``sections`` and ``cached``.
+
+        Raises:
+            RuntimeError: If the bridge is not connected or Unity reports an error
+        """
+        key = (tuple(sections or ()), hierarchy_path, depth, asset_offset, asset_limit)
+        cached = self._context_request_cache.get(key)
+
+        payload: dict[str, Any] = {
+            "operation": "request",
+            "depth": depth,
+            "assetOffset": asset_offset,
+            "assetLimit": asset_limit,
+        }
+        if sections:
+            payload["sections"] = list(sections)
+        if hierarchy_path:
+            payload["hierarchyPath"] = hierarchy_path
+        if cached is not None:
+            payload["ifGeneration"] = cached[0]
+
+        self._context_requests += 1
+        result = await self.send_command(
+            "contextRequest", payload, timeout_ms=context_config.REQUEST_TIMEOUT_MS
+        )
+        if not isinstance(result, dict) or result.get("success") is False:
+            error = result.get("error") if isinstance(result, dict) else result
+            raise RuntimeError(f"Context request failed: {error}")
+
+        if result.get("unchanged") and cached is not None:
+            self._context_request_hits += 1
+            self._context_request_cache.move_to_end(key)
+            return {"generation": cached[0], "sections": cached[1], "cached": True}
+
+        generation = int(result.get("generation", 0))
+        sections_result = intern_strings(result.get("sections") or {})
+        self._store_context_request(key, generation, sections_result)
+        return {"generation": generation, "sections": sections_result, "cached": False}
+
+    def _store_context_request(
+        self, key: tuple[Any, ...], generation: int, sections: dict[str, Any]
+    ) -> None:
+        """Cache pulled sections, evicting least recently used entries past the count/byte limits."""
+        size = deep_sizeof(sections)
+        previous = self._context_request_cache.pop(key, None)
+        if previous is not None:
+            self._context_request_cache_bytes -= previous[2]
+        if size > context_config.REQUEST_CACHE_MAX_BYTES:
+            return
+
+        self._context_request_cache[key] = (generation, sections, size)
+        self._context_request_cache_bytes += size
+        while (
+            len(self._context_request_cache) > context_config.REQUEST_CACHE_SIZE
+            or self._context_request_cache_bytes > context_config.REQUEST_CACHE_MAX_BYTES
+        ):
+            _, evicted = self._context_request_cache.popitem(last=False)
+            self._context_request_cache_bytes -= evicted[2]
+
+    def clear_context_request_cache(self) -> None:
+        """Drop all pulled-context results (the next pull of each scope goes to Unity)."""
+        self._context_request_cache.clear()
+        self._context_request_cache_bytes = 0
+
+    def measure_context_memory(self, seen: set[int] | None = None) -> int:
+        """Bytes retained by the context replica."""
+        return self._context_replica.measure_memory(seen)
+
+    def measure_context_request_cache(self, seen: set[int] | None = None) -> int:
+        """Bytes retained by the pulled-context cache (kept incrementally, safe off the loop)."""
+        return self._context_request_cache_bytes
+
+    def get_send_stats(self) -> dict[str, Any]:
+        """Return time spent waiting for the socket, per send lane."""
+        return self._send_lanes.get_stats()
+
+    def get_compilation_state(self) -> dict[str, Any]:
+        """Return the latest known compilation status and result."""
+        return dict(self._compilation_state)
+
     async def await_compilation(self, timeout_seconds: int = 60) -> dict[str, Any]:
         """
         Wait for the next compilation to complete.
@@ -137,7 +280,15 @@ class BridgeManager:
         tool_name: str,
         payload: Any,
         timeout_ms: int = 30_000,
+        result_format: ResultFormat = "object",
     ) -> Any:
+        """Send a command to Unity and await its result.
+
+        ``result_format`` selects what the returned value looks like: the decoded
+        object (default), pretty-printed JSON text ("pretty", string results are
+        returned as-is) or compact JSON text ("json"). The text formats let large
+        results be rendered in a worker instead of on the event loop.
+        """
         socket = self._ensure_socket()
         loop = asyncio.get_running_loop()
 
@@ -152,12 +303,15 @@ class BridgeManager:
                         f'Bridge command "{tool_name}" timed out after {timeout_ms}ms'
                     )
                 )
+                # Let Unity drop the command if it has not started it yet
+                self._track_task(asyncio.create_task(self.send_cancel(command_id)))
 
         timeout_handle = loop.call_later(timeout_ms / 1000, on_timeout)
         self._pending_commands[command_id] = PendingCommand(
             tool_name=tool_name,
             future=future,
             timeout_handle=timeout_handle,
+            result_format=result_format,
         )
 
         message: ServerMessage = {
@@ -167,9 +321,58 @@ class BridgeManager:
             "payload": payload,
         }
 
-        await self._send_json(socket, message)
+        await self._send_json(socket, message, lane="data")
         return await future
 
+    @contextlib.asynccontextmanager
+    async def transaction(
+        self, timeout_ms: int = network.DEFAULT_COMMAND_TIMEOUT_MS
+    ) -> AsyncIterator[BridgeTransaction]:
+        """Defer Unity's asset and hierarchy refreshes until the block ends.
+
+        Writes sent inside the block are applied without refreshing, and Unity
+        runs one refresh when the block commits. If the block raises, the
+        transaction is rolled back: files the handlers wrote directly are
+        restored, while writes saved through RPGMaker's editor services are
+        kept (Unity reports them as ``keptServiceWrites``). Transactions on this
+        manager run one at a time.
+
+        Raises:
+            RuntimeError: If the bridge is not connected or Unity cannot begin or commit
+        """
+        async with self._transaction_lock:
+            begun = await self._send_transaction_command("beginTransaction", None, timeout_ms)
+            transaction = BridgeTransaction(transaction_id=str(begun.get("transactionId")))
+            try:
+                yield transaction
+            except BaseException:
+                try:
+                    transaction.result = await self._send_transaction_command(
+                        "rollback", transaction.transaction_id, timeout_ms
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to roll back bridge transaction %s: %s",
+                        transaction.transaction_id,
+                        exc,
+                    )
+                raise
+            transaction.result = await self._send_transaction_command(
+                "commit", transaction.transaction_id, timeout_ms
+            )
+
+    async def _send_transaction_command(
+        self, operation: str, transaction_id: str | None, timeout_ms: int
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {"operation": operation}
+        if transaction_id is not None:
+            payload["transactionId"] = transaction_id
+        result = await self.send_command("transaction", payload, timeout_ms=timeout_ms)
+        if not isinstance(result, dict) or result.get("success") is False:
+            error = result.get("error") if isinstance(result, dict) else result
+            raise RuntimeError(f"Transaction {operation} failed: {error}")
+        return result
+
     async def send_ping(self) -> None:
         socket = self._socket
         if not _is_socket_open(socket):
@@ -179,12 +382,59 @@ class BridgeManager:
             "type": "ping",
             "timestamp": int(time.time() * 1000),
         }
-        await self._send_json(socket, message)
+        await self._send_json(socket, message, lane="control")
+
+    async def send_cancel(self, command_id: str) -> None:
+        socket = self._socket
+        if socket is None or not _is_socket_open(socket):
+            return
+
+        message: ServerMessage = {
+            "type": "command:cancel",
+            "commandId": command_id,
+        }
+        with contextlib.suppress(RuntimeError):
+            await self._send_json(socket, message, lane="control")
+
+    async def request_context_resync(self) -> None:
+        """Ask Unity for a full context:update, e.g. after a missed patch."""
+        socket = self._socket
+        if socket is None or not _is_socket_open(socket):
+            return
+
+        message: ServerMessage = {"type": "context:resync"}
+        with contextlib.suppress(RuntimeError):
+            await self._send_json(socket, message, lane="control")
+
+    async def _send_json(
+        self,
+        socket: ClientConnection,
+        message: ServerMessage,
+        lane: Lane = "control",
+    ) -> None:
+        text = json.dumps(message)
+        chunk_size = network.MAX_FRAME_CHUNK_CHARS
+        if lane == "control" or len(text) <= chunk_size:
+            await self._send_frame(socket, text, lane)
+            return
+
+        # Each chunk takes the socket separately so control frames can interleave
+        frame_id = uuid4().hex
+        count = -(-len(text) // chunk_size)
+        for index in range(count):
+            chunk: ServerMessage = {
+                "type": "frame:chunk",
+                "frameId": frame_id,
+                "index": index,
+                "count": count,
+                "data": text[index * chunk_size : (index + 1) * chunk_size],
+            }
+            await self._send_frame(socket, json.dumps(chunk), lane)
 
-    async def _send_json(self, socket: ClientConnection, message: ServerMessage) -> None:
-        async with self._send_lock:
+    async def _send_frame(self, socket: ClientConnection, text: str, lane: Lane) -> None:
+        async with self._send_lanes.acquire(lane):
             try:
-                await socket.send(json.dumps(message))
+                await socket.send(text)
             except ConnectionClosed:
                 await self._handle_disconnect(socket)
                 raise RuntimeError("Unity bridge is not connected") from None
@@ -193,8 +443,12 @@ class BridgeManager:
         logger.info("Unity bridge socket listener started")
         try:
             async for raw in socket:
+                if frame_codec.is_large(raw):
+                    await self._handle_large_frame(raw)
+                    continue
+
                 try:
-                    payload = json.loads(raw)
+                    payload = frame_codec.decode_inline(raw)
                 except json.JSONDecodeError as exc:
                     logger.error("Failed to decode bridge message: %s", exc)
                     continue
@@ -211,6 +465,36 @@ class BridgeManager:
         finally:
             await self._handle_disconnect(socket)
 
+    async def _handle_large_frame(self, raw: str | bytes) -> None:
+        command_id = peek_command_result_id(raw)
+        pending = self._pending_commands.get(command_id) if command_id else None
+        if command_id and pending is not None and pending.result_format != "object":
+            # Results are independent of each other, so render without holding
+            # up the heartbeats and small results queued behind this frame
+            task = asyncio.create_task(self._resolve_rendered_result(command_id, raw))
+            self._track_task(task)
+            return
+
+        try:
+            payload = await frame_codec.decode(raw)
+        except json.JSONDecodeError as exc:
+            logger.error("Failed to decode bridge message: %s", exc)
+            return
+        await self._handle_message(payload)
+
+    async def _resolve_rendered_result(self, command_id: str, raw: str | bytes) -> None:
+        pending = self._pending_commands.get(command_id)
+        if pending is None:
+            return
+        try:
+            ok, result, error_message = await frame_codec.render_command_result(
+                raw, pending.result_format
+            )
+        except Exception as exc:
+            logger.error("Failed to decode bridge message: %s", exc)
+            ok, result, error_message = False, None, f"Failed to decode command result: {exc}"
+        self._complete_command(command_id, ok, result, error_message, rendered=True)
+
     async def _handle_message(self, message: BridgeNotificationMessage) -> None:
         message_type = message.get("type")
         if message_type == "hello":
@@ -219,6 +503,8 @@ class BridgeManager:
             self._handle_heartbeat(message)
         elif message_type == "context:update":
             self._handle_context_update(message)
+        elif message_type == "context:patch":
+            self._handle_context_patch(cast(BridgeContextPatchMessage, message))
         elif message_type == "command:result":
             self._handle_command_result(message)
         elif message_type == "compilation:started":
@@ -253,8 +539,44 @@ class BridgeManager:
         payload = message.get("payload")
         if not payload:
             return
-        self._context = payload
-        self._emit("contextUpdated", payload)
+        self._context_resync_requested = False
+        changed = self._context_replica.apply_full(payload, message.get("version"))
+        self._context = self._context_replica.payload
+        if changed:
+            self._emit("contextUpdated", payload)
+
+    def _handle_context_patch(self, message: BridgeContextPatchMessage) -> None:
+        base_version = message.get("baseVersion")
+        version = message.get("version")
+        if not _is_version(base_version) or not _is_version(version):
+            logger.debug(
+                "Discarding context patch without valid versions (%r->%r), requesting resync",
+                base_version,
+                version,
+            )
+            self._schedule_context_resync()
+            return
+
+        try:
+            changed = self._context_replica.apply_patch(
+                base_version,
+                version,
+                message.get("ops") or [],
+                message.get("fullSize"),
+            )
+        except (ContextVersionGap, ValueError, IndexError, TypeError) as exc:
+            logger.debug("Discarding context patch, requesting resync: %s", exc)
+            self._schedule_context_resync()
+            return
+
+        self._context = self._context_replica.payload
+        if changed:
+            self._emit("contextUpdated", self._context)
+
+    def _schedule_context_resync(self) -> None:
+        if not self._context_resync_requested:
+            self._context_resync_requested = True
+            self._track_task(asyncio.create_task(self.request_context_resync()))
 
     def _handle_command_result(self, message: BridgeCommandResultMessage) -> None:
         command_id = message.get("commandId")
@@ -262,20 +584,38 @@ class BridgeManager:
             logger.warning("Received command result without commandId: %s", message)
             return
 
+        self._complete_command(
+            command_id,
+            bool(message.get("ok")),
+            message.get("result"),
+            message.get("errorMessage"),
+        )
+
+    def _complete_command(
+        self,
+        command_id: str,
+        ok: bool,
+        result: Any,
+        error_message: str | None,
+        rendered: bool = False,
+    ) -> None:
         pending = self._pending_commands.pop(command_id, None)
         if not pending:
             logger.warning("Received result for unknown command: %s", command_id)
             return
 
         pending.timeout_handle.cancel()
+        if pending.future.done():
+            return
 
-        if message.get("ok"):
-            pending.future.set_result(message.get("result"))
+        if ok:
+            if not rendered:
+                result = render_result(result, pending.result_format)
+            pending.future.set_result(result)
         else:
             pending.future.set_exception(
                 RuntimeError(
-                    message.get("errorMessage")
-                    or f'Bridge command "{pending.tool_name}" failed without message'
+                    error_message or f'Bridge command "{pending.tool_name}" failed without message'
                 )
             )
 
@@ -283,6 +623,12 @@ class BridgeManager:
         """Handle compilation:started message from Unity bridge."""
         timestamp = message.get("timestamp", 0)
         logger.info("Compilation started at timestamp %d", timestamp)
+        self._compilation_state = {
+            "status": "compiling",
+            "startedAt": timestamp,
+            "lastResult": self._compilation_state.get("lastResult"),
+        }
+        self._emit("compilationStarted", self.get_compilation_state())
 
     def _handle_compilation_progress(self, message: dict[str, Any]) -> None:
         """Handle compilation:progress message from Unity bridge."""
@@ -312,6 +658,7 @@ class BridgeManager:
             result.get("errorCount", 0),
             elapsed,
         )
+        self._record_compilation_result(result, message.get("timestamp"))
 
         # Resolve all pending compilation waiters
         waiters = self._compilation_waiters[:]
@@ -349,6 +696,7 @@ class BridgeManager:
                 "reason": reason,
                 "message": f"Unity bridge restarted due to: {reason}",
             }
+            self._record_compilation_result(result, message.get("timestamp"))
 
             waiters = self._compilation_waiters[:]
             self._compilation_waiters.clear()
@@ -357,6 +705,18 @@ class BridgeManager:
                 if not future.done():
                     future.set_result(result)
 
+    def _record_compilation_result(self, result: dict[str, Any], timestamp: int | None) -> None:
+        self._compilation_state = {
+            "status": "idle",
+            "completedAt": timestamp if timestamp is not None else int(time.time() * 1000),
+            "lastResult": result,
+        }
+        self._emit("compilationComplete", self.get_compilation_state())
+
+    def _track_task(self, task: asyncio.Task[None]) -> None:
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _emit(self, event: str, *args) -> None:
         for callback in list(self._listeners.get(event, [])):
             try:
@@ -397,6 +757,10 @@ class BridgeManager:
         self._socket = None
         self._session_id = None
         self._last_heartbeat_at = None
+        self._context_replica.reset()
+        self._context_resync_requested = False
+        # Unity's generation counter restarts after a domain reload
+        self.clear_context_request_cache()
         self._emit("disconnected")
         self._flush_pending_commands(RuntimeError("Bridge disconnected"))
 
@@ -426,15 +790,24 @@ class BridgeManager:
                 await self._receive_task
             self._receive_task = None
 
+        for task in list(self._background_tasks):
+            task.cancel()
+
         if _is_socket_open(socket):
             await socket.close()
 
         self._flush_pending_commands(RuntimeError("Bridge reattached"))
         self._session_id = None
+        self._context_replica.reset()
+        self.clear_context_request_cache()
 
 
 bridge_manager = BridgeManager()
 
 
+def _is_version(value: object) -> TypeGuard[int]:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
 def _is_socket_open(socket: ClientConnection | None) -> bool:
     return bool(socket and socket.state is not ConnectionState.CLOSED)
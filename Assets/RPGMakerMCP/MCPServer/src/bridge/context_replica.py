@@ -0,0 +1,166 @@
+"""
+Local replica of the Unity editor context.
+
+Unity sends a full ``context:update`` carrying a version number, then
+``context:patch`` messages with JSON-patch style operations against the
+previous version. The replica applies patches copy-on-write, so payloads
+already handed to listeners are never mutated, and reports a version gap
+instead of applying a patch to the wrong base. Short strings in incoming
+payloads and patch values are interned, so repeated component type names,
+node types and asset types share one object across the whole replica.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from bridge.messages import UnityContextPayload
+from utils.memory import deep_sizeof, intern_strings
+
+# Keys that change on every push and do not count as a context change on their own
+_VOLATILE_KEYS = frozenset({"updatedAt"})
+
+
+class ContextVersionGap(Exception):
+    """Raised when a patch does not apply to the replica's current version."""
+
+
+class ContextReplica:
+    def __init__(self) -> None:
+        self._payload: UnityContextPayload | None = None
+        self._version: int | None = None
+        self._full_updates = 0
+        self._patches_applied = 0
+        self._unchanged_updates = 0
+        self._version_gaps = 0
+        self._patch_bytes = 0
+        self._bytes_saved = 0
+
+    @property
+    def payload(self) -> UnityContextPayload | None:
+        return self._payload
+
+    @property
+    def version(self) -> int | None:
+        return self._version
+
+    def reset(self) -> None:
+        """Forget the version so the next patch forces a resync; the payload is kept."""
+        self._version = None
+
+    def apply_full(self, payload: UnityContextPayload, version: int | None = None) -> bool:
+        """Replace the replica. Returns True if the content differs from the previous one."""
+        self._full_updates += 1
+        intern_strings(payload)
+        changed = self._payload is None or _strip_volatile(self._payload) != _strip_volatile(
+            payload
+        )
+        self._payload = payload
+        self._version = version
+        if not changed:
+            self._unchanged_updates += 1
+        return changed
+
+    def apply_patch(
+        self,
+        base_version: int,
+        version: int,
+        ops: Sequence[Mapping[str, Any]],
+        full_size: int | None = None,
+    ) -> bool:
+        """Apply a patch. Returns True if anything besides volatile keys changed.
+
+        Raises:
+            ContextVersionGap: If the replica is not at ``base_version``.
+        """
+        if self._payload is None or self._version is None or self._version != base_version:
+            self._version_gaps += 1
+            raise ContextVersionGap(
+                f"Context patch {base_version}->{version} does not apply to version {self._version}"
+            )
+
+        payload: Any = self._payload
+        changed = False
+        for op in ops:
+            path = _parse_pointer(op.get("path", ""))
+            payload = _apply_op(payload, path, op.get("op"), intern_strings(op.get("value")))
+            if path and path[0] not in _VOLATILE_KEYS:
+                changed = True
+
+        self._payload = payload
+        self._version = version
+        self._patches_applied += 1
+        if full_size is not None:
+            patch_size = len(json.dumps(ops, ensure_ascii=False, separators=(",", ":")))
+            self._patch_bytes += patch_size
+            self._bytes_saved += max(0, full_size - patch_size)
+        if not changed:
+            self._unchanged_updates += 1
+        return changed
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        """Bytes retained by the replicated payload.
+
+        Safe off the loop: patches are applied copy-on-write, so the payload
+        read here is never mutated while it is walked.
+        """
+        return deep_sizeof(self._payload, seen)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "version": self._version,
+            "fullUpdates": self._full_updates,
+            "patchesApplied": self._patches_applied,
+            "unchangedUpdates": self._unchanged_updates,
+            "versionGaps": self._version_gaps,
+            "patchBytes": self._patch_bytes,
+            "bytesSaved": self._bytes_saved,
+        }
+
+
+def _strip_volatile(payload: UnityContextPayload) -> dict[str, Any]:
+    return {key: value for key, value in payload.items() if key not in _VOLATILE_KEYS}
+
+
+def _parse_pointer(pointer: str) -> list[str]:
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/")]
+
+
+def _apply_op(container: Any, path: list[str], op: str | None, value: Any) -> Any:
+    """Return a copy of ``container`` with the operation applied at ``path``."""
+    if not path:
+        if op == "remove":
+            return None
+        return value
+
+    key, rest = path[0], path[1:]
+    if isinstance(container, list):
+        updated_list = list(container)
+        index = int(key)
+        if not rest and op == "remove":
+            del updated_list[index]
+        elif not rest and op == "add" and index == len(updated_list):
+            updated_list.append(value)
+        else:
+            updated_list[index] = _apply_op(updated_list[index], rest, op, value)
+        return updated_list
+
+    if not isinstance(container, dict):
+        raise ValueError(f"Cannot apply {op} below a scalar at {key!r}")
+
+    updated = dict(container)
+    if not rest and op == "remove":
+        updated.pop(key, None)
+    elif rest:
+        if key not in updated:
+            raise ValueError(f"Missing context path segment {key!r}")
+        updated[key] = _apply_op(updated[key], rest, op, value)
+    else:
+        updated[key] = value
+    return updated
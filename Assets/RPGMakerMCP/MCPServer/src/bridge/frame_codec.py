@@ -0,0 +1,187 @@
+"""
+Size-aware decoding and rendering of Unity bridge frames.
+
+Small frames (heartbeats, context updates, ordinary command results) are
+decoded inline on the event loop, which is cheaper than any hand-off. Frames at
+or above ``LARGE_FRAME_THRESHOLD_BYTES`` are handed to a small process pool:
+the worker parses the frame and renders the command result straight to the
+text the caller needs (pretty JSON for MCP tool output, compact JSON for the
+HTTP endpoint), so only a string crosses back to the loop.
+
+``json.loads`` holds the GIL for the whole parse, so a thread cannot keep the
+loop responsive while a multi-megabyte map is decoded; a process can. When
+processes are unavailable the codec falls back to threads, which still helps
+the pure-Python ``indent=2`` encoder since it yields the GIL periodically.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import re
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Literal
+
+from config.constants import network
+from logger import logger
+from utils.json_utils import as_compact_json, as_pretty_json
+
+ResultFormat = Literal["object", "pretty", "json"]
+
+# MiniJson writes keys in insertion order, so type and commandId lead the frame
+_COMMAND_RESULT_PREFIX = re.compile(
+    r'\s*\{\s*"type"\s*:\s*"command:result"\s*,\s*"commandId"\s*:\s*"([^"\\]+)"'
+)
+_PEEK_CHARS = 256
+
+
+def peek_command_result_id(raw: str | bytes) -> str | None:
+    """Return the commandId of a ``command:result`` frame without parsing it."""
+    if not isinstance(raw, str):
+        return None
+    match = _COMMAND_RESULT_PREFIX.match(raw[:_PEEK_CHARS])
+    return match.group(1) if match else None
+
+
+def render_result(result: Any, result_format: ResultFormat) -> Any:
+    """Convert a decoded command result to the representation the caller asked for."""
+    if result_format == "pretty":
+        return result if isinstance(result, str) else as_pretty_json(result)
+    if result_format == "json":
+        return as_compact_json(result)
+    return result
+
+
+def render_command_result_frame(
+    raw: str | bytes,
+    result_format: ResultFormat,
+) -> tuple[bool, Any, str | None]:
+    """Parse a ``command:result`` frame and render its result.
+
+    Runs in a worker, so it must stay a picklable module-level function.
+    Returns ``(ok, rendered_result, error_message)``.
+    """
+    message = json.loads(raw)
+    if not message.get("ok"):
+        return False, None, message.get("errorMessage")
+    return True, render_result(message.get("result"), result_format), None
+
+
+def _warm_up() -> None:
+    return None
+
+
+class FrameCodec:
+    def __init__(
+        self,
+        threshold_bytes: int = network.LARGE_FRAME_THRESHOLD_BYTES,
+        max_workers: int = network.FRAME_CODEC_WORKERS,
+        use_processes: bool = True,
+    ) -> None:
+        self._threshold = threshold_bytes
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+        self._executor: Executor | None = None
+        self._executor_kind = "process" if use_processes else "thread"
+        self._counter_lock = threading.Lock()
+        self._inline_frames = 0
+        self._offloaded_frames = 0
+        self._offloaded_bytes = 0
+        self._total_offload_seconds = 0.0
+        self._max_offload_seconds = 0.0
+
+    def is_large(self, raw: str | bytes) -> bool:
+        return self._threshold > 0 and len(raw) >= self._threshold
+
+    def decode_inline(self, raw: str | bytes) -> Any:
+        with self._counter_lock:
+            self._inline_frames += 1
+        return json.loads(raw)
+
+    async def decode(self, raw: str | bytes) -> Any:
+        """Decode a large frame off the loop."""
+        return await self._submit(len(raw), json.loads, raw)
+
+    async def render_command_result(
+        self,
+        raw: str | bytes,
+        result_format: ResultFormat,
+    ) -> tuple[bool, Any, str | None]:
+        """Parse a large ``command:result`` frame and render its result off the loop."""
+        rendered: tuple[bool, Any, str | None] = await self._submit(
+            len(raw), render_command_result_frame, raw, result_format
+        )
+        return rendered
+
+    def start(self) -> None:
+        """Spawn the worker pool ahead of the first large frame."""
+        try:
+            self._get_executor().submit(_warm_up)
+        except Exception as exc:  # pragma: no cover - defensive
+            self._fall_back_to_threads(exc)
+
+    def shutdown(self) -> None:
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._counter_lock:
+            offloaded = self._offloaded_frames
+            return {
+                "thresholdBytes": self._threshold,
+                "executor": self._executor_kind,
+                "inlineFrames": self._inline_frames,
+                "offloadedFrames": offloaded,
+                "offloadedBytes": self._offloaded_bytes,
+                "avgOffloadMs": (
+                    round(self._total_offload_seconds * 1000 / offloaded, 3) if offloaded else 0.0
+                ),
+                "maxOffloadMs": round(self._max_offload_seconds * 1000, 3),
+            }
+
+    async def _submit(self, size: int, func: Any, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        started_at = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(self._get_executor(), func, *args)
+        except (BrokenProcessPool, OSError) as exc:
+            if self._executor_kind != "process":
+                raise
+            self._fall_back_to_threads(exc)
+            result = await loop.run_in_executor(self._get_executor(), func, *args)
+        elapsed = time.perf_counter() - started_at
+        with self._counter_lock:
+            self._offloaded_frames += 1
+            self._offloaded_bytes += size
+            self._total_offload_seconds += elapsed
+            self._max_offload_seconds = max(self._max_offload_seconds, elapsed)
+        return result
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._executor_kind == "process":
+                # spawn matches Windows behaviour and avoids forking a threaded process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="mcp-codec",
+                )
+        return self._executor
+
+    def _fall_back_to_threads(self, exc: BaseException) -> None:
+        logger.warning("Frame codec process pool unavailable, using threads: %s", exc)
+        self.shutdown()
+        self._executor_kind = "thread"
+
+
+frame_codec = FrameCodec()
@@ -15,6 +15,8 @@ class HierarchyNode(TypedDict, total=False):
     type: Literal["GameObject", "PrefabInstance", "UIElement", "Unknown"]
     components: list[ComponentSummary]
     children: list[HierarchyNode]
+    childCount: int
+    childNames: list[str]
 
 
 class UnityObjectReference(TypedDict, total=False):
@@ -67,6 +69,21 @@ class BridgeHeartbeatMessage(TypedDict):
 class BridgeContextUpdateMessage(TypedDict):
     type: Literal["context:update"]
     payload: UnityContextPayload
+    version: NotRequired[int]
+
+
+class ContextPatchOperation(TypedDict):
+    op: Literal["add", "replace", "remove"]
+    path: str
+    value: NotRequired[Any]
+
+
+class BridgeContextPatchMessage(TypedDict):
+    type: Literal["context:patch"]
+    baseVersion: int
+    version: int
+    ops: list[ContextPatchOperation]
+    fullSize: NotRequired[int]
 
 
 class BridgeCommandResultMessage(TypedDict, total=False):
@@ -88,6 +105,7 @@ BridgeNotificationMessage = (
     BridgeHelloMessage
     | BridgeHeartbeatMessage
     | BridgeContextUpdateMessage
+    | BridgeContextPatchMessage
     | BridgeCommandResultMessage
     | BridgeRestartedMessage
 )
@@ -110,4 +128,28 @@ class ServerInfoMessage(TypedDict):
     clientInfo: ClientInfo
 
 
-ServerMessage = ServerCommandMessage | ServerPingMessage | ServerInfoMessage
+class ServerCommandCancelMessage(TypedDict):
+    type: Literal["command:cancel"]
+    commandId: str
+
+
+class ServerContextResyncMessage(TypedDict):
+    type: Literal["context:resync"]
+
+
+class ServerFrameChunkMessage(TypedDict):
+    type: Literal["frame:chunk"]
+    frameId: str
+    index: int
+    count: int
+    data: str
+
+
+ServerMessage = (
+    ServerCommandMessage
+    | ServerPingMessage
+    | ServerInfoMessage
+    | ServerCommandCancelMessage
+    | ServerContextResyncMessage
+    | ServerFrameChunkMessage
+)
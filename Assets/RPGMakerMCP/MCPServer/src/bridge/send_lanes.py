@@ -0,0 +1,113 @@
+"""
+Outbound frame scheduling for the Unity bridge socket.
+
+Only one frame may be written to the socket at a time. ``SendLanes`` is the
+lock guarding the socket, with two queues of waiters: control frames (ping,
+command:cancel, server:info) are always granted the socket before queued data
+frames. Large data messages are sent as a series of ``frame:chunk`` frames that
+each take the lock separately, so a control frame waits for at most one chunk
+instead of a whole multi-megabyte payload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+Lane = Literal["control", "data"]
+
+
+class _LaneStats:
+    __slots__ = ("frames", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float) -> None:
+        self.frames += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "totalWaitMs": round(self.total_wait * 1000, 3),
+            "avgWaitMs": round(self.total_wait * 1000 / self.frames, 3) if self.frames else 0.0,
+            "maxWaitMs": round(self.max_wait * 1000, 3),
+        }
+
+
+class SendLanes:
+    def __init__(self) -> None:
+        self._locked = False
+        self._waiters: dict[Lane, deque[asyncio.Future[None]]] = {
+            "control": deque(),
+            "data": deque(),
+        }
+        self._stats: dict[Lane, _LaneStats] = {
+            "control": _LaneStats(),
+            "data": _LaneStats(),
+        }
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, lane: Lane) -> AsyncIterator[None]:
+        """Hold the socket for one frame, recording how long the wait took."""
+        started_at = time.perf_counter()
+        await self._acquire(lane)
+        self._stats[lane].record(time.perf_counter() - started_at)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def locked(self) -> bool:
+        return self._locked
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "queuedControl": len(self._waiters["control"]),
+            "queuedData": len(self._waiters["data"]),
+            "control": self._stats["control"].to_dict(),
+            "data": self._stats["data"].to_dict(),
+        }
+
+    async def _acquire(self, lane: Lane) -> None:
+        if not self._locked and not self._has_waiters_ahead(lane):
+            self._locked = True
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = self._waiters[lane]
+        queue.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Ownership was handed over just before the cancellation
+                self._release()
+            else:
+                with contextlib.suppress(ValueError):
+                    queue.remove(future)
+            raise
+
+    def _has_waiters_ahead(self, lane: Lane) -> bool:
+        if self._waiters["control"]:
+            return True
+        return lane == "data" and bool(self._waiters["data"])
+
+    def _release(self) -> None:
+        # Hand the socket directly to the next waiter, control frames first
+        for lane in ("control", "data"):
+            queue = self._waiters[lane]
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._locked = False
@@ -0,0 +1,323 @@
+"""
+A stand-in for the Unity bridge, for tests and benchmarks without Unity.
+
+``StandinBridge`` serves the bridge's websocket protocol: it greets the client
+with ``hello``, answers ``command:execute`` with ``command:result``
+(reassembling ``frame:chunk`` messages) one command at a time like Unity's
+main thread, and implements the ``transaction`` tool. Other tools are modeled
+by operation name: reads answer from an in-memory store, writes update it and
+cost ``write_ms`` plus one asset refresh of ``refresh_ms``, which is what
+``AssetDatabase.Refresh()`` after each write costs in a real project. A
+``bulkUpsert*`` / ``bulkDelete*`` chunk costs one write and one refresh and
+answers with per-record statuses like the Unity handlers. Inside a
+transaction the refreshes are deferred and run once at commit; rollback
+restores the store as it was at ``beginTransaction``.
+
+Compare the same writes with and without a transaction (run from ``src``)::
+
+    python -m bridge.standin_bridge --writes 100 --refresh-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import uuid4
+
+import websockets
+from websockets.asyncio.server import Server, ServerConnection
+from websockets.exceptions import ConnectionClosed
+
+from config.constants import network
+
+READ_PREFIXES = ("get", "list", "search", "find", "inspect", "export", "validate", "analyze")
+
+BULK_PREFIXES = ("bulkUpsert", "bulkDelete")
+
+
+@dataclass
+class StandinStats:
+    commands: int = 0
+    writes: int = 0
+    refreshes: int = 0
+    deferred_refreshes: int = 0
+    transactions: int = 0
+    rollbacks: int = 0
+
+
+class StandinBridge:
+    def __init__(
+        self,
+        write_ms: float = 1.0,
+        refresh_ms: float = 20.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.write_ms = write_ms
+        self.refresh_ms = refresh_ms
+        self.store: dict[str, Any] = {}
+        self.stats = StandinStats()
+        self._host = host
+        self._port = port
+        self._server: Server | None = None
+        self._transaction_id: str | None = None
+        self._snapshot: dict[str, Any] = {}
+        self._refresh_pending = False
+        self._deferred = 0
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self._host}:{self._port}/bridge"
+
+    async def start(self) -> str:
+        """Start serving and return the bridge URL (``port=0`` picks a free port)."""
+        server = await websockets.serve(
+            self._serve,
+            self._host,
+            self._port,
+            compression=None,
+            max_size=network.MAX_MESSAGE_SIZE,
+        )
+        self._server = server
+        self._port = next(iter(server.sockets)).getsockname()[1]
+        return self.url
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> StandinBridge:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def execute(self, tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Run one command the way its Unity handler would, at the modeled cost."""
+        self.stats.commands += 1
+        operation = str(payload.get("operation", ""))
+        if tool_name == "transaction":
+            return await self._transaction(operation, payload)
+
+        key = _store_key(tool_name, payload)
+        if tool_name == "ping" or operation.startswith(READ_PREFIXES):
+            return {"success": True, "data": self.store.get(key)}
+        if operation.startswith(BULK_PREFIXES):
+            return await self._bulk(tool_name, operation, payload)
+
+        await asyncio.sleep(self.write_ms / 1000)
+        self.store[key] = payload
+        self.stats.writes += 1
+        await self._refresh()
+        return {"success": True, "message": f"{operation} applied."}
+
+    async def _bulk(
+        self, tool_name: str, operation: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        # One load and save per chunk, like EditorDataService.BulkUpsert*/BulkDelete*
+        await asyncio.sleep(self.write_ms / 1000)
+        results: list[dict[str, Any]] = []
+        if operation.startswith("bulkUpsert"):
+            for record in payload.get("records") or []:
+                key = f"{tool_name}:{record['uuId']}"
+                results.append(
+                    {
+                        "uuId": record["uuId"],
+                        "status": "updated" if key in self.store else "created",
+                    }
+                )
+                self.store[key] = record.get("data")
+        else:
+            for uuid in payload.get("uuIds") or []:
+                if self.store.pop(f"{tool_name}:{uuid}", None) is None:
+                    results.append(
+                        {
+                            "uuId": uuid,
+                            "status": "error",
+                            "error": f"Record with UUID '{uuid}' not found.",
+                        }
+                    )
+                else:
+                    results.append({"uuId": uuid, "status": "deleted"})
+        self.stats.writes += 1
+        await self._refresh()
+        errors = sum(1 for result in results if result["status"] == "error")
+        return {"success": True, "results": results, "errorCount": errors}
+
+    async def _serve(self, socket: ServerConnection) -> None:
+        await socket.send(
+            json.dumps(
+                {
+                    "type": "hello",
+                    "sessionId": uuid4().hex,
+                    "unityVersion": "stand-in",
+                    "projectName": "StandinProject",
+                }
+            )
+        )
+        chunks: dict[str, list[str | None]] = {}
+        try:
+            async for raw in socket:
+                message = json.loads(raw)
+                if message.get("type") == "frame:chunk":
+                    parts = chunks.setdefault(message["frameId"], [None] * message["count"])
+                    parts[message["index"]] = message["data"]
+                    if any(part is None for part in parts):
+                        continue
+                    message = json.loads("".join(chunks.pop(message["frameId"])))  # type: ignore[arg-type]
+                if message.get("type") == "command:execute":
+                    await socket.send(json.dumps(await self._run_command(message)))
+        except ConnectionClosed:
+            pass
+        finally:
+            # Unity commits a transaction left open by a disconnected client
+            if self._transaction_id is not None:
+                await self._close_transaction("commit")
+
+    async def _run_command(self, message: dict[str, Any]) -> dict[str, Any]:
+        response: dict[str, Any] = {"type": "command:result", "commandId": message.get("commandId")}
+        try:
+            response["result"] = await self.execute(
+                str(message.get("toolName")), message.get("payload") or {}
+            )
+            response["ok"] = True
+        except Exception as exc:
+            response["ok"] = False
+            response["errorMessage"] = str(exc)
+        return response
+
+    async def _transaction(self, operation: str, payload: dict[str, Any]) -> dict[str, Any]:
+        if operation == "beginTransaction":
+            if self._transaction_id is not None:
+                return _error(
+                    f"Transaction {self._transaction_id} is already open. Commit or roll it back first."
+                )
+            self._transaction_id = uuid4().hex
+            self._snapshot = dict(self.store)
+            self.stats.transactions += 1
+            return {"success": True, "transactionId": self._transaction_id}
+
+        if operation not in ("commit", "rollback"):
+            return _error(f"Operation '{operation}' is not supported by transaction handler.")
+        if self._transaction_id is None:
+            return _error("No transaction is open.")
+        requested = payload.get("transactionId")
+        if requested and requested != self._transaction_id:
+            return _error(
+                f"Transaction {requested} is not open (open transaction: {self._transaction_id})"
+            )
+        return await self._close_transaction(operation)
+
+    async def _close_transaction(self, operation: str) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "success": True,
+            "transactionId": self._transaction_id,
+            "deferredRefreshes": self._deferred,
+        }
+        if operation == "rollback":
+            changed = self.store.keys() | self._snapshot.keys()
+            result["restoredFiles"] = sum(
+                1 for key in changed if self.store.get(key) is not self._snapshot.get(key)
+            )
+            self.store = self._snapshot
+            self.stats.rollbacks += 1
+
+        refresh = self._refresh_pending
+        self._transaction_id = None
+        self._snapshot = {}
+        self._refresh_pending = False
+        self._deferred = 0
+
+        started = time.perf_counter()
+        if refresh:
+            await self._refresh()
+        result["refreshMs"] = int((time.perf_counter() - started) * 1000)
+        return result
+
+    async def _refresh(self) -> None:
+        if self._transaction_id is not None:
+            self._refresh_pending = True
+            self._deferred += 1
+            self.stats.deferred_refreshes += 1
+            return
+        await asyncio.sleep(self.refresh_ms / 1000)
+        self.stats.refreshes += 1
+
+
+async def run_benchmark(
+    writes: int = 100, write_ms: float = 1.0, refresh_ms: float = 20.0
+) -> dict[str, Any]:
+    """Time ``writes`` game state writes through BridgeManager, without and then with a transaction."""
+    from bridge.bridge_manager import BridgeManager
+
+    async def run(
+        bridge: StandinBridge, manager: BridgeManager, transactional: bool
+    ) -> dict[str, Any]:
+        before = StandinStats(**asdict(bridge.stats))
+        started = time.perf_counter()
+        payloads = [
+            {"operation": "setProgressFlag", "flagId": f"flag{index}", "value": True}
+            for index in range(writes)
+        ]
+        if transactional:
+            async with manager.transaction():
+                for payload in payloads:
+                    await manager.send_command("rpgMakerGameState", payload)
+        else:
+            for payload in payloads:
+                await manager.send_command("rpgMakerGameState", payload)
+        return {
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 1),
+            "refreshes": bridge.stats.refreshes - before.refreshes,
+        }
+
+    async with StandinBridge(write_ms=write_ms, refresh_ms=refresh_ms) as bridge:
+        async with websockets.connect(
+            bridge.url, compression=None, ping_interval=None, max_size=network.MAX_MESSAGE_SIZE
+        ) as socket:
+            manager = BridgeManager()
+            await manager.attach(socket)
+            direct = await run(bridge, manager, transactional=False)
+            transactional = await run(bridge, manager, transactional=True)
+
+    return {
+        "writes": writes,
+        "writeMs": write_ms,
+        "refreshMs": refresh_ms,
+        "direct": direct,
+        "transaction": transactional,
+        "speedup": round(direct["elapsedMs"] / max(transactional["elapsedMs"], 0.1), 1),
+    }
+
+
+def _store_key(tool_name: str, payload: dict[str, Any]) -> str:
+    for field in ("uuId", "id", "flagId", "itemId", "filename", "slotId"):
+        if payload.get(field) is not None:
+            return f"{tool_name}:{payload[field]}"
+    return tool_name
+
+
+def _error(message: str) -> dict[str, Any]:
+    return {"success": False, "error": message, "category": "transaction"}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark bridge transactions against the stand-in bridge"
+    )
+    parser.add_argument("--writes", type=int, default=100)
+    parser.add_argument("--write-ms", type=float, default=1.0)
+    parser.add_argument("--refresh-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            asyncio.run(run_benchmark(args.writes, args.write_ms, args.refresh_ms)), indent=2
+        )
+    )
@@ -32,6 +32,16 @@ class NetworkConfig:
     # Ping configuration
     MAX_PING_FAILURES: Final[int] = 3
 
+    # Outbound messages larger than this are split into frame:chunk messages so
+    # control frames can be sent between the chunks (characters)
+    MAX_FRAME_CHUNK_CHARS: Final[int] = 64 * 1024
+
+    # Frames at least this large are decoded/rendered off the event loop (bytes)
+    LARGE_FRAME_THRESHOLD_BYTES: Final[int] = 256 * 1024
+
+    # Worker processes used to decode and render large frames
+    FRAME_CODEC_WORKERS: Final[int] = 2
+
 
 # =============================================================================
 # Retry Configuration
@@ -51,6 +61,108 @@ class RetryConfig:
     MIN_RETRY_DELAY: Final[float] = 1.0
 
 
+# =============================================================================
+# Context Configuration
+# =============================================================================
+
+@dataclass(frozen=True)
+class ContextConfig:
+    """Pulled editor context (contextRequest) constants."""
+
+    # Distinct section/scope combinations kept in the pulled-context cache
+    REQUEST_CACHE_SIZE: Final[int] = 32
+
+    # Timeout for a contextRequest round trip (milliseconds)
+    REQUEST_TIMEOUT_MS: Final[int] = 10_000
+
+    # Bytes the pulled-context cache may retain before evicting old scopes
+    REQUEST_CACHE_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+    # Interval between background memory budget checks (seconds)
+    MEMORY_CHECK_INTERVAL: Final[float] = 30.0
+
+
+# =============================================================================
+# I/O and Event Loop Configuration
+# =============================================================================
+
+@dataclass(frozen=True)
+class IoConfig:
+    """Filesystem executor and event-loop watchdog constants."""
+
+    # Worker threads dedicated to filesystem work
+    IO_MAX_WORKERS: Final[int] = 4
+
+    # Outstanding I/O jobs before callers wait for a free slot
+    IO_MAX_PENDING: Final[int] = 64
+
+    # How often the loop watchdog heartbeat is scheduled (seconds)
+    LOOP_LAG_CHECK_INTERVAL: Final[float] = 0.1
+
+    # Stack frames logged for a blocked event loop
+    LOOP_LAG_STACK_LIMIT: Final[int] = 12
+
+
+# =============================================================================
+# Project Data Configuration
+# =============================================================================
+
+@dataclass(frozen=True)
+class DataConfig:
+    """Project data reader and watcher constants."""
+
+    # Polling interval when inotify is unavailable; also how often missing
+    # data directories are looked for again (seconds)
+    WATCH_POLL_INTERVAL: Final[float] = 2.0
+
+    # Quiet period before a burst of file events is turned into entity changes (seconds)
+    WATCH_DEBOUNCE: Final[float] = 0.3
+
+    # Entity changes kept for the rpgmaker://data/changes resource
+    WATCH_HISTORY_SIZE: Final[int] = 200
+
+    # Multi-record files at least this large answer get*ById from a byte-offset
+    # index instead of being parsed whole (bytes)
+    OFFSET_INDEX_MIN_BYTES: Final[int] = 8 * 1024 * 1024
+
+    # Sidecar directory for the byte-offset indexes, relative to the Unity project
+    OFFSET_INDEX_DIR: Final[str] = "Library/RPGMakerMCP/RecordIndex"
+
+    # Event validation and flow analysis run in-process below this many event
+    # command files; above it they parse and walk them in a process pool
+    EVENT_POOL_MIN_FILES: Final[int] = 256
+
+    # Upper bound on their worker processes (also capped by the CPU count)
+    EVENT_POOL_MAX_WORKERS: Final[int] = 8
+
+    # Scenarios one simulateEvent call may run
+    SIMULATION_MAX_SCENARIOS: Final[int] = 10_000
+
+    # Commands one scenario may execute before it is stopped as an endless loop
+    SIMULATION_STEP_LIMIT: Final[int] = 100_000
+
+    # Records per bulkUpsert*/bulkDelete* command sent to Unity
+    BULK_CHUNK_RECORDS: Final[int] = 100
+
+    # Approximate JSON size of one bulk chunk (bytes)
+    BULK_CHUNK_BYTES: Final[int] = 256 * 1024
+
+
+# =============================================================================
+# Notification Configuration
+# =============================================================================
+
+@dataclass(frozen=True)
+class NotificationConfig:
+    """MCP resource notification constants."""
+
+    # Minimum interval between two updated notifications for the same resource (seconds)
+    RESOURCE_UPDATE_MIN_INTERVAL: Final[float] = 1.0
+
+    # Delay used to coalesce bursts of changes into one notification (seconds)
+    RESOURCE_UPDATE_COALESCE_DELAY: Final[float] = 0.2
+
+
 # =============================================================================
 # Token Security
 # =============================================================================
@@ -72,6 +184,10 @@ class SecurityConfig:
 
 network = NetworkConfig()
 retry = RetryConfig()
+context = ContextConfig()
+io_config = IoConfig()
+data_config = DataConfig()
+notification = NotificationConfig()
 security = SecurityConfig()
 
 
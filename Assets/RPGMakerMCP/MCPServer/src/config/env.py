@@ -15,6 +15,7 @@ load_dotenv()
 _config_logger = logging.getLogger(__name__)
 
 LogLevel = Literal["fatal", "error", "warn", "info", "debug", "trace", "silent"]
+DataReadRouting = Literal["local-first", "bridge-first", "bridge-only"]
 
 
 def _parse_bool(value: str | None, default: bool) -> bool:
@@ -71,6 +72,16 @@ def _parse_log_level(value: str | None) -> LogLevel:
     return allowed.get(normalized, "info")
 
 
+def _parse_data_read_routing(value: str | None) -> DataReadRouting:
+    normalized = (value or "").strip().lower()
+    allowed: dict[str, DataReadRouting] = {
+        "local-first": "local-first",
+        "bridge-first": "bridge-first",
+        "bridge-only": "bridge-only",
+    }
+    return allowed.get(normalized, "bridge-first")
+
+
 @dataclass(frozen=True)
 class ServerEnv:
     port: int
@@ -83,6 +94,10 @@ class ServerEnv:
     unity_bridge_port: int
     bridge_reconnect_ms: int
     bridge_token: str | None
+    loop_lag_threshold_ms: int = 250
+    memory_budget_mb: int = 256
+    data_read_routing: DataReadRouting = "bridge-first"
+    write_coalesce_ms: int = 0
 
 
 # CLI argument overrides storage
@@ -210,6 +225,12 @@ def _create_env() -> ServerEnv:
             os.environ.get("MCP_BRIDGE_RECONNECT_MS"), default=5000, minimum=0
         ),
         bridge_token=bridge_token,
+        loop_lag_threshold_ms=_parse_int(
+            os.environ.get("MCP_LOOP_LAG_THRESHOLD_MS"), default=250, minimum=0
+        ),
+        memory_budget_mb=_parse_int(os.environ.get("MCP_MEMORY_BUDGET_MB"), default=256, minimum=0),
+        data_read_routing=_parse_data_read_routing(os.environ.get("MCP_DATA_READ_ROUTING")),
+        write_coalesce_ms=_parse_int(os.environ.get("MCP_WRITE_COALESCE_MS"), default=0, minimum=0),
     )
 
 
@@ -15,7 +15,7 @@ from mcp.server.stdio import stdio_server as mcp_stdio_server
 from mcp.server.websocket import websocket_server as mcp_websocket_server
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 from starlette.routing import Route, WebSocketRoute
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
@@ -26,23 +26,53 @@ if str(_package_root) not in sys.path:
 
 from bridge.bridge_connector import bridge_connector
 from bridge.bridge_manager import bridge_manager
+from bridge.frame_codec import frame_codec
+from bridge.messages import UnityContextPayload
 from config.constants import mask_token, network
 from config.env import env
 from logger import logger
+from resources.register_resources import (
+    COMPILATION_STATUS_URI,
+    DATA_CHANGES_URI,
+    EDITOR_ERRORS_URI,
+    data_entity_uri,
+)
 from server.create_mcp_server import create_mcp_server
+from services.bulk_writer import bulk_writer
+from services.command_index import command_index
+from services.context_index import context_index
 from services.editor_log_watcher import editor_log_watcher
+from services.entity_locks import entity_locks
+from services.event_interpreter import event_interpreter
+from services.event_validator import event_validator
+from services.flow_analysis import flow_analyzer
+from services.io_executor import io_executor
+from services.loop_watchdog import loop_watchdog
+from services.memory_accounting import memory_accountant
+from services.merge_patch import update_patcher
+from services.project_data_reader import project_data_reader
+from services.project_data_watcher import EntityChange, project_data_watcher
+from services.record_catalog import record_catalogs
+from services.reference_index import reference_index
+from services.resource_notifier import resource_notifier
+from services.search_index import search_index
+from services.write_coalescer import write_coalescer
 from version import SERVER_NAME, SERVER_VERSION
 
 mcp_server = create_mcp_server()
 
 
 def _create_init_options() -> Any:
-    return mcp_server.create_initialization_options(
+    options = mcp_server.create_initialization_options(
         notification_options=NotificationOptions(
             resources_changed=True,
             tools_changed=True,
         )
     )
+    # The low-level server always reports subscribe=False; we handle subscriptions
+    if options.capabilities.resources is not None:
+        options.capabilities.resources.subscribe = True
+    return options
 
 
 def _bridge_connected() -> None:
@@ -53,7 +83,8 @@ def _bridge_disconnected() -> None:
     logger.warning("Unity bridge disconnected")
 
 
-def _bridge_context_updated(context: dict[str, Any]) -> None:
+def _bridge_context_updated(context: UnityContextPayload) -> None:
+    context_index.update(context)
     active_scene = context.get("activeScene") or {}
     logger.debug(
         "Unity context updated (scene=%s updatedAt=%s)",
@@ -62,9 +93,38 @@ def _bridge_context_updated(context: dict[str, Any]) -> None:
     )
 
 
+def _project_data_changed(changes: list[EntityChange]) -> None:
+    resource_notifier.notify(DATA_CHANGES_URI)
+    for change in changes:
+        resource_notifier.notify(data_entity_uri(change.entity, change.uu_id))
+    logger.debug("Project data changed: %d entities", len(changes))
+
+
 bridge_manager.on("connected", _bridge_connected)
 bridge_manager.on("disconnected", _bridge_disconnected)
 bridge_manager.on("contextUpdated", _bridge_context_updated)
+bridge_manager.on("compilationStarted", lambda _: resource_notifier.notify(COMPILATION_STATUS_URI))
+bridge_manager.on("compilationComplete", lambda _: resource_notifier.notify(COMPILATION_STATUS_URI))
+editor_log_watcher.on_new_exception(lambda _: resource_notifier.notify(EDITOR_ERRORS_URI))
+project_data_watcher.on_change(_project_data_changed)
+
+# Registration order decides ownership of shared objects (the index points into
+# the replica's nodes) and reverse trim order under memory pressure
+memory_accountant.register("contextReplica", bridge_manager.measure_context_memory)
+memory_accountant.register("contextIndex", context_index.measure_memory, context_index.clear)
+memory_accountant.register(
+    "contextRequestCache",
+    bridge_manager.measure_context_request_cache,
+    bridge_manager.clear_context_request_cache,
+    on_loop=True,
+)
+memory_accountant.register(
+    "projectData", project_data_reader.measure_memory, project_data_reader.clear
+)
+memory_accountant.register("recordCatalogs", record_catalogs.measure_memory, record_catalogs.clear)
+memory_accountant.register("searchIndex", search_index.measure_memory, search_index.clear)
+memory_accountant.register("referenceIndex", reference_index.measure_memory, reference_index.clear)
+memory_accountant.register("commandIndex", command_index.measure_memory, command_index.clear)
 
 
 async def health_endpoint(_: Request) -> JSONResponse:
@@ -90,7 +150,48 @@ async def bridge_status_endpoint(_: Request) -> JSONResponse:
     )
 
 
-async def bridge_command_endpoint(request: Request) -> JSONResponse:
+async def metrics_endpoint(_: Request) -> JSONResponse:
+    return JSONResponse(
+        {
+            "ioExecutor": io_executor.get_stats(),
+            "frameCodec": frame_codec.get_stats(),
+            "bridgeSend": bridge_manager.get_send_stats(),
+            "contextReplica": bridge_manager.get_context_stats(),
+            "eventLoop": loop_watchdog.get_stats(),
+            "resourceNotifications": resource_notifier.get_stats(),
+            "projectData": project_data_reader.get_stats(),
+            "projectDataWatcher": project_data_watcher.get_stats(),
+            "recordCatalogs": record_catalogs.get_stats(),
+            "searchIndex": search_index.get_stats(),
+            "referenceIndex": reference_index.get_stats(),
+            "eventValidator": event_validator.get_stats(),
+            "flowAnalysis": flow_analyzer.get_stats(),
+            "eventInterpreter": event_interpreter.get_stats(),
+            "commandIndex": command_index.get_stats(),
+            "bulkWriter": bulk_writer.get_stats(),
+            "writeCoalescer": write_coalescer.get_stats(),
+            "entityLocks": entity_locks.get_stats(),
+            "mergePatch": update_patcher.get_stats(),
+            "memory": memory_accountant.report(),
+        }
+    )
+
+
+async def context_query_endpoint(request: Request) -> JSONResponse:
+    params = dict(request.query_params)
+    operation = params.pop("operation", None)
+    if not operation:
+        return JSONResponse({"error": "Query parameter 'operation' is required"}, status_code=400)
+
+    try:
+        result = await io_executor.run(context_index.run_query, operation, params)
+    except ValueError as exc:
+        return JSONResponse({"error": str(exc)}, status_code=400)
+
+    return JSONResponse({"ok": True, "operation": operation, **result})
+
+
+async def bridge_command_endpoint(request: Request) -> Response:
     if not bridge_manager.is_connected():
         return JSONResponse(
             {"error": "Unity bridge is not connected"}, status_code=503
@@ -119,6 +220,7 @@ async def bridge_command_endpoint(request: Request) -> JSONResponse:
             tool_name,
             payload if payload is not None else {},
             resolved_timeout,
+            result_format="json",
         )
     except TimeoutError:
         return JSONResponse(
@@ -135,7 +237,11 @@ async def bridge_command_endpoint(request: Request) -> JSONResponse:
             {"error": f"Bridge command failed: {exc}"}, status_code=500
         )
 
-    return JSONResponse({"ok": True, "result": result})
+    # The result is already JSON text; embed it instead of re-encoding on the loop
+    return Response(
+        content='{"ok":true,"result":' + result + "}",
+        media_type="application/json",
+    )
 
 
 async def default_endpoint(_: Request) -> PlainTextResponse:
@@ -182,20 +288,34 @@ async def startup() -> None:
         env.unity_bridge_port,
         mask_token(env.bridge_token),
     )
+    loop_watchdog.start(env.loop_lag_threshold_ms / 1000)
+    memory_accountant.configure(env.memory_budget_mb * 1024 * 1024)
+    memory_accountant.start()
+    write_coalescer.configure(env.write_coalesce_ms)
+    frame_codec.start()
     await editor_log_watcher.start()
+    await project_data_watcher.start()
     bridge_connector.start()
 
 
 async def shutdown() -> None:
     logger.info("Shutting down Unity MCP server")
+    await write_coalescer.flush_all()
     await bridge_connector.stop()
     await editor_log_watcher.stop()
+    await project_data_watcher.stop()
+    loop_watchdog.stop()
+    memory_accountant.stop()
+    io_executor.shutdown()
+    frame_codec.shutdown()
 
 
 routes = [
     Route("/healthz", health_endpoint, methods=["GET"]),
+    Route("/metrics", metrics_endpoint, methods=["GET"]),
     Route("/bridge/status", bridge_status_endpoint, methods=["GET"]),
     Route("/bridge/command", bridge_command_endpoint, methods=["POST"]),
+    Route("/bridge/context/query", context_query_endpoint, methods=["GET"]),
     Route("/{path:path}", default_endpoint, methods=["GET", "POST", "PUT", "PATCH", "DELETE"]),
     WebSocketRoute("/mcp", mcp_ws_endpoint),
 ]
@@ -4,23 +4,140 @@ MCP Resources for RPGMaker Unite MCP Server
 
 from __future__ import annotations
 
+from typing import Any
+
 from mcp import types as mcp_types
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+
+from bridge.bridge_manager import bridge_manager
+from services.editor_log_watcher import editor_log_watcher
+from services.project_data_reader import (
+    DataKind,
+    LocalDataUnavailable,
+    data_kind,
+    project_data_reader,
+)
+from services.project_data_watcher import project_data_watcher
+from services.resource_notifier import resource_notifier
+from utils.json_utils import as_pretty_json
+
+EDITOR_ERRORS_URI = "unity://editor-log/errors"
+COMPILATION_STATUS_URI = "unity://compilation/status"
+DATA_CHANGES_URI = "rpgmaker://data/changes"
+DATA_ENTITY_URI_PREFIX = "rpgmaker://data/"
+
+
+def data_entity_uri(entity: str, uu_id: str) -> str:
+    return f"{DATA_ENTITY_URI_PREFIX}{entity}/{uu_id}"
+
+
+def _parse_data_entity_uri(uri: str) -> tuple[DataKind, str] | None:
+    if not uri.startswith(DATA_ENTITY_URI_PREFIX):
+        return None
+    entity, _, uu_id = uri[len(DATA_ENTITY_URI_PREFIX) :].partition("/")
+    kind = data_kind(entity)
+    if not uu_id or kind is None:
+        return None
+    return kind, uu_id
+
+
+RESOURCE_DEFINITIONS: list[mcp_types.Resource] = [
+    mcp_types.Resource(
+        uri=EDITOR_ERRORS_URI,  # type: ignore[arg-type]
+        name="editor-errors",
+        description=(
+            "Aggregated Unity Editor.log exceptions grouped by stack-trace fingerprint "
+            "(count, firstSeen, lastSeen). Subscribe to be notified of new fingerprints."
+        ),
+        mimeType="application/json",
+    ),
+    mcp_types.Resource(
+        uri=COMPILATION_STATUS_URI,  # type: ignore[arg-type]
+        name="compilation-status",
+        description=(
+            "Current Unity script compilation status and the last compilation result. "
+            "Subscribe to be notified when compilation starts or completes."
+        ),
+        mimeType="application/json",
+    ),
+    mcp_types.Resource(
+        uri=DATA_CHANGES_URI,  # type: ignore[arg-type]
+        name="data-changes",
+        description=(
+            "Recent changes to RPGMaker data files (entity, uuId, created/updated/deleted, sequence). "
+            "Subscribe to be notified when project data is edited in Unity or on disk."
+        ),
+        mimeType="application/json",
+    ),
+]
+
+RESOURCE_TEMPLATES: list[mcp_types.ResourceTemplate] = [
+    mcp_types.ResourceTemplate(
+        uriTemplate=DATA_ENTITY_URI_PREFIX + "{entity}/{uuId}",
+        name="data-entity",
+        description=(
+            "One RPGMaker record read from the project files. entity is one of characters, items, "
+            "animations, enemies, troops, skills, maps, commonEvents. Subscribe to be notified when "
+            "that record changes."
+        ),
+        mimeType="application/json",
+    ),
+]
 
 
 def register_resources(server: Server) -> None:
     """Register MCP resources.
 
     Resources provide read-only access to server state and information.
-    Currently no resources are registered for RPGMaker Unite MCP.
+    All resources, including per-record data URIs, support subscriptions;
+    updates are coalesced and rate-limited by ``resource_notifier``.
     """
 
     @server.list_resources()
     async def list_resources() -> list[mcp_types.Resource]:
         """List all available resources."""
-        return []
+        return RESOURCE_DEFINITIONS
+
+    @server.list_resource_templates()
+    async def list_resource_templates() -> list[mcp_types.ResourceTemplate]:
+        return RESOURCE_TEMPLATES
 
     @server.read_resource()
-    async def read_resource(uri: str) -> str:
+    async def read_resource(uri: mcp_types.AnyUrl) -> list[ReadResourceContents]:
         """Read a resource by URI."""
-        raise ValueError(f"Unknown resource URI: {uri}")
+        key = str(uri)
+        entity_ref = _parse_data_entity_uri(key)
+        if key == EDITOR_ERRORS_URI:
+            payload = editor_log_watcher.get_exception_summary()
+        elif key == COMPILATION_STATUS_URI:
+            payload = bridge_manager.get_compilation_state()
+        elif key == DATA_CHANGES_URI:
+            payload = project_data_watcher.get_changes()
+        elif entity_ref is not None:
+            payload = await _read_data_entity(*entity_ref)
+        else:
+            raise ValueError(f"Unknown resource URI: {uri}")
+        return [ReadResourceContents(content=as_pretty_json(payload), mime_type="application/json")]
+
+    @server.subscribe_resource()
+    async def subscribe_resource(uri: mcp_types.AnyUrl) -> None:
+        key = str(uri)
+        if key not in (EDITOR_ERRORS_URI, COMPILATION_STATUS_URI, DATA_CHANGES_URI) and (
+            _parse_data_entity_uri(key) is None
+        ):
+            raise ValueError(f"Unknown resource URI: {uri}")
+        resource_notifier.subscribe(key, server.request_context.session)
+
+    @server.unsubscribe_resource()
+    async def unsubscribe_resource(uri: mcp_types.AnyUrl) -> None:
+        resource_notifier.unsubscribe(str(uri), server.request_context.session)
+
+
+async def _read_data_entity(kind: DataKind, uu_id: str) -> dict[str, Any]:
+    try:
+        return await project_data_reader.execute(
+            kind.bridge_tool, {"operation": kind.get_operation, "uuId": uu_id}
+        )
+    except LocalDataUnavailable as exc:
+        raise ValueError(str(exc)) from exc
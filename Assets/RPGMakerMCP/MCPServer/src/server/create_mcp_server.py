@@ -16,7 +16,7 @@ def create_mcp_server() -> Server:
                 f"# RPGMaker Unite MCP Server v{SERVER_VERSION}",
                 "",
                 "RPGMaker Unite向けのAI開発支援MCPサーバー。",
-                "10個のツール（ユーティリティ2個 + RPGMaker専用8個）でゲームデータを管理できます。",
+                "13個のツール（ユーティリティ3個 + RPGMaker専用8個 + 検索・参照2個）でゲームデータを管理できます。",
                 "",
                 "## 重要なルール",
                 "1. `.meta`ファイルは絶対に編集しない（Unity自動管理）",
@@ -45,11 +45,18 @@ def create_mcp_server() -> Server:
                 "2. `get*ById` で必要なデータの詳細を取得",
                 "3. `update*` または `delete*` でUUIDを指定して操作",
                 "",
-                "## 利用可能なツール（10個）",
+                "## 利用可能なツール（13個）",
                 "",
-                "### ユーティリティツール（2個）",
+                "### ユーティリティツール（3個）",
                 "- `unity_ping`: Unity Bridgeへの接続確認",
                 "- `unity_compilation_await`: C#スクリプトのコンパイル完了を待機",
+                "- `unity_context`: シーン・階層サブツリー・選択・アセット一覧などのエディタコンテキストを必要な範囲だけ取得（変更がなければキャッシュを返却）。`findByName`/`findByPathPrefix`/`listChildren`/`findAssets` 等の索引検索はUnityを呼ばずに即時応答",
+                "",
+                "### 検索・参照ツール（2個）",
+                "- `rpgmaker_search`: 全データベース（キャラクター・アイテム・敵・スキル・マップ・イベントのメッセージや選択肢など）を横断する全文検索。`query` の語はすべて一致が条件、日本語は部分一致、`pot*` のように末尾`*`で前方一致。`entities` で種類を絞り込み、`limit`/`offset` でページング（Unity不要）",
+                "  - 例: `rpgmaker_search(query='ポーション', entities=['items', 'events'])`",
+                "- `rpgmaker_references`: アイテム・スイッチ・変数・コモンイベント・マップなどの相互参照索引（Unity不要）。削除・名前変更の前に `findUsages`（id）で参照箇所（イベントコマンド・ページ条件・敵グループ・スキル等）を確認。`findUnused`（kind）はどこからも参照されていない定義を一覧、`stats` は索引の規模",
+                "  - 例: `rpgmaker_references(operation='findUsages', id='<アイテムのuuId>')`",
                 "",
                 "### RPGMakerツール（8個）",
                 "",
@@ -68,6 +75,8 @@ def create_mcp_server() -> Server:
                 "| listItems / getItemById / createItem / updateItem / deleteItem | 同パターン | アイテム管理 |",
                 "| listAnimations / getAnimationById / createAnimation / updateAnimation / deleteAnimation | 同パターン | アニメーション管理 |",
                 "| getSystemSettings / updateSystemSettings | settingData | システム設定 |",
+                "| bulkUpsertCharacters / bulkUpsertItems / bulkUpsertAnimations | records | 一括作成・更新（uuId未指定は自動生成、既存データの形で事前検証、チャンク分割して1トランザクションで送信） |",
+                "| bulkDeleteCharacters / bulkDeleteItems / bulkDeleteAnimations | uuIds | 一括削除（レコードごとの結果を表形式で返却） |",
                 "| exportDatabase / importDatabase / backupDatabase / restoreDatabase | 各種パス（オプション） | データベース操作 |",
                 "",
                 "#### rpgmaker_map",
@@ -96,9 +105,15 @@ def create_mcp_server() -> Server:
                 "| createCommonEvent | eventData | 新規作成（id自動生成、filename省略可） |",
                 "| updateCommonEvent / deleteCommonEvent | uuId | イベント更新・削除 |",
                 "| getEventCommands / createEventCommand / updateEventCommand / deleteEventCommand | uuId, commandIndex | イベントコマンド管理 |",
+                "| applyEventCommandPatch | uuId, edits（または commands） | 挿入・置換・削除・移動をまとめて1回の保存で適用（インデックスは適用前のリスト基準） |",
                 "| getEventPages / createEventPage / updateEventPage / deleteEventPage | uuId, pageIndex | イベントページ管理 |",
                 "| copyEvent / moveEvent | sourceFilename, targetFilename | イベントコピー・移動 |",
                 "| validateEvent | uuId | イベント検証 |",
+                "| validateAllEvents | - | 全コモン・マップイベントを一括検証（Unity不要、問題のあるイベントをページング） |",
+                "| analyzeEventFlow | - | 制御フロー・スイッチ/変数の効果グラフ解析（到達不能コード、脱出できないループ、成立しないページ条件など） |",
+                "| simulateEvent | uuId (+pageIndex, scenarios, initialState) | スイッチ・変数・アイテム・所持金への効果をシナリオごとにシミュレーション（Unity不要） |",
+                "| findCommands | code (+parameterFilters) または sequence | コマンドコード・パラメータ条件・連続コマンド列で検索（Unity不要） |",
+                "| getCommandHistogram | - | コマンドコード別の使用数 |",
                 "",
                 "#### rpgmaker_battle",
                 "敵、敵グループ、スキル、バトルアニメーションの管理",
@@ -112,6 +127,8 @@ def create_mcp_server() -> Server:
                 "| updateEnemy / deleteEnemy | uuId | 敵更新・削除 |",
                 "| listTroops / getTroopById / createTroop / updateTroop / deleteTroop | 同パターン | 敵グループ管理 |",
                 "| listSkills / getSkillById / createSkill / updateSkill / deleteSkill | 同パターン | スキル管理 |",
+                "| bulkUpsertEnemies / bulkUpsertTroops / bulkUpsertSkills | records | 一括作成・更新（uuId未指定は自動生成） |",
+                "| bulkDeleteEnemies / bulkDeleteTroops / bulkDeleteSkills | uuIds | 一括削除 |",
                 "| getBattleAnimations / updateBattleAnimation | - | バトルアニメーション管理 |",
                 "",
                 "#### rpgmaker_system",
@@ -168,6 +185,18 @@ def create_mcp_server() -> Server:
                 "| importAudioFile / exportAudioFile / deleteAudioFile | category, filename | オーディオファイル管理 |",
                 "| getAudioInfo | filename | オーディオ情報取得 |",
                 "",
+                "## リソース（購読可能）",
+                "| URI | 内容 |",
+                "|-----|------|",
+                "| `unity://editor-log/errors` | Editor.logの例外をスタックトレースの指紋ごとに集計（件数・初回/最終検出） |",
+                "| `unity://compilation/status` | コンパイル状態と直近のコンパイル結果 |",
+                "| `rpgmaker://data/changes` | プロジェクトデータの直近の変更（entity・uuId・作成/更新/削除・連番） |",
+                "| `rpgmaker://data/{entity}/{uuId}` | プロジェクトファイルから読んだ1レコード（テンプレート。entityは characters / items / animations / enemies / troops / skills / maps / commonEvents） |",
+                "",
+                "`resources/subscribe` で購読すると、新しいエラー指紋やコンパイル結果、データ変更の到着時に",
+                "`notifications/resources/updated` が送信されます（まとめて送信・レート制限あり）。",
+                "ポーリングの代わりに利用してください。",
+                "",
                 "## データ保存場所",
                 "| データ種別 | パス |",
                 "|-----------|------|",
@@ -232,7 +261,7 @@ def create_mcp_server() -> Server:
                 "| 更新失敗 | `uuId`が正しいか`listXxx`で確認 |",
                 "",
                 "---",
-                f"RPGMaker Unite MCP Server v{SERVER_VERSION} - RPGMaker Unite開発用10ツール",
+                f"RPGMaker Unite MCP Server v{SERVER_VERSION} - RPGMaker Unite開発用13ツール",
             ]
         ),
     )
@@ -0,0 +1,410 @@
+"""
+Bulk upserts and deletes of database records.
+
+Creating 500 items with ``createItem`` is 500 round trips, each saving the
+item file and refreshing the AssetDatabase in Unity. ``bulkUpsert*`` and
+``bulkDelete*`` take the whole list instead:
+
+- records without an id get a generated uuId here, so the caller knows every
+  id before Unity sees the records (``uuId`` is accepted as an alias for
+  items' and skills' ``basic.id``),
+- records are checked against the shape of the records already in the
+  project files (unknown fields, values of the wrong JSON type) and rejected
+  before anything is sent; without readable project files the check is
+  skipped and the response says ``schemaChecked: false``,
+- the valid records go to Unity in chunks bounded by record count and
+  payload size, inside one bridge transaction, so each chunk is one load
+  and one save and the AssetDatabase refreshes once at the end.
+
+Chunks are committed independently: Unity saves them through RPGMaker's
+database services, which a transaction rollback does not undo. If a chunk
+fails, the chunks before it stay applied, the rest are not sent, and the
+response reports ``appliedChunks`` and ``failedChunk``.
+
+The response is a compact status table, one row per input record in input
+order: ``[uuId, status]`` or ``[uuId, status, error]`` with status
+``created``, ``updated``, ``deleted``, ``invalid`` or ``error``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from bridge.bridge_manager import bridge_manager
+from config.constants import data_config
+from logger import logger
+from services.io_executor import io_executor
+from services.project_data_reader import (
+    DataKind,
+    LocalDataUnavailable,
+    ProjectDataReader,
+    data_kind,
+    project_data_reader,
+)
+
+# (bridge tool, operation) -> (data kind, "upsert" or "delete")
+BULK_OPERATIONS: dict[tuple[str, str], tuple[str, str]] = {
+    ("rpgMakerDatabase", "bulkUpsertCharacters"): ("characters", "upsert"),
+    ("rpgMakerDatabase", "bulkDeleteCharacters"): ("characters", "delete"),
+    ("rpgMakerDatabase", "bulkUpsertItems"): ("items", "upsert"),
+    ("rpgMakerDatabase", "bulkDeleteItems"): ("items", "delete"),
+    ("rpgMakerDatabase", "bulkUpsertAnimations"): ("animations", "upsert"),
+    ("rpgMakerDatabase", "bulkDeleteAnimations"): ("animations", "delete"),
+    ("rpgMakerBattle", "bulkUpsertEnemies"): ("enemies", "upsert"),
+    ("rpgMakerBattle", "bulkDeleteEnemies"): ("enemies", "delete"),
+    ("rpgMakerBattle", "bulkUpsertTroops"): ("troops", "upsert"),
+    ("rpgMakerBattle", "bulkDeleteTroops"): ("troops", "delete"),
+    ("rpgMakerBattle", "bulkUpsertSkills"): ("skills", "upsert"),
+    ("rpgMakerBattle", "bulkDeleteSkills"): ("skills", "delete"),
+}
+
+STATUSES = ("created", "updated", "deleted", "invalid", "error")
+
+# Schema problems reported per record; the rest are summarized as a count
+MAX_RECORD_ERRORS = 3
+
+
+@dataclass
+class Shape:
+    """The JSON types seen at one path of the existing records."""
+
+    types: set[str] = field(default_factory=set)
+    fields: dict[str, Shape] = field(default_factory=dict)
+    items: Shape | None = None
+
+    def add(self, value: Any) -> None:
+        json_type = _json_type(value)
+        self.types.add(json_type)
+        if json_type == "object":
+            for key, child in value.items():
+                self.fields.setdefault(key, Shape()).add(child)
+        elif json_type == "array":
+            for item in value:
+                if self.items is None:
+                    self.items = Shape()
+                self.items.add(item)
+
+
+@dataclass
+class _Row:
+    uuid: str | None
+    status: str = "pending"
+    error: str | None = None
+
+
+class BulkWriter:
+    def __init__(self, reader: ProjectDataReader | None = None) -> None:
+        self._reader = reader or project_data_reader
+        self._lock = threading.Lock()
+        # Kind key -> (catalog generation, shape of its records)
+        self._shapes: dict[str, tuple[Any, Shape]] = {}
+        self._stats = {
+            "calls": 0,
+            "records": 0,
+            "chunks": 0,
+            "invalid": 0,
+            "errors": 0,
+            "shapeBuilds": 0,
+        }
+
+    @staticmethod
+    def supports(tool_name: str, operation: str | None) -> bool:
+        return (tool_name, operation or "") in BULK_OPERATIONS
+
+    async def execute(self, tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Validate, chunk and send one bulk operation; return the status table.
+
+        Sending stops at the first failed chunk; earlier chunks stay applied.
+
+        Raises:
+            ValueError: If the operation is unknown or 'records' / 'uuIds' is not a list
+        """
+        operation = str(payload.get("operation", ""))
+        if (tool_name, operation) not in BULK_OPERATIONS:
+            raise ValueError(f"{tool_name} does not support bulk operation '{operation}'")
+        kind_key, mode = BULK_OPERATIONS[(tool_name, operation)]
+        kind = data_kind(kind_key)
+        assert kind is not None
+
+        started = time.perf_counter()
+        entries: list[tuple[int, Any]]
+        if mode == "upsert":
+            rows, entries, schema_checked = await io_executor.run(
+                self.prepare_upsert, kind, payload.get("records")
+            )
+        else:
+            rows, entries = self.prepare_delete(payload.get("uuIds"))
+            schema_checked = False
+
+        chunks = self.chunk(entries, mode)
+        failed_chunk: int | None = None
+        if chunks:
+            # No rollback on failure: it would not undo the chunks already saved
+            async with bridge_manager.transaction():
+                for number, chunk in enumerate(chunks):
+                    if not await self._send_chunk(tool_name, operation, mode, chunk, rows):
+                        failed_chunk = number
+                        for later in chunks[number + 1 :]:
+                            _fail(rows, later, f"Not sent: chunk {number} failed.")
+                        break
+
+        counts = dict.fromkeys(STATUSES, 0)
+        for row in rows:
+            counts[row.status] = counts.get(row.status, 0) + 1
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["records"] += len(rows)
+            self._stats["chunks"] += len(chunks)
+            self._stats["invalid"] += counts["invalid"]
+            self._stats["errors"] += counts["error"]
+
+        return {
+            "success": counts["invalid"] == 0 and counts["error"] == 0,
+            "operation": operation,
+            "total": len(rows),
+            "counts": counts,
+            "columns": ["uuId", "status", "error"],
+            "rows": [
+                [row.uuid, row.status] if row.error is None else [row.uuid, row.status, row.error]
+                for row in rows
+            ],
+            "chunks": len(chunks),
+            "appliedChunks": len(chunks) if failed_chunk is None else failed_chunk,
+            "failedChunk": failed_chunk,
+            "schemaChecked": schema_checked,
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def prepare_upsert(
+        self, kind: DataKind, records: Any
+    ) -> tuple[list[_Row], list[tuple[int, dict[str, Any]]], bool]:
+        """Assign ids and check ``records``; return the rows, (row index, bridge entry) pairs and whether shapes were checked.
+
+        Raises:
+            ValueError: If ``records`` is not a list
+        """
+        if not isinstance(records, list):
+            raise ValueError("records must be a list of record objects")
+        shape = self._shape(kind)
+        rows: list[_Row] = []
+        entries: list[tuple[int, dict[str, Any]]] = []
+        seen: set[str] = set()
+        for index, record in enumerate(records):
+            row = _Row(None)
+            rows.append(row)
+            if not isinstance(record, dict):
+                row.status, row.error = "invalid", f"Record {index} must be an object."
+                continue
+            record, error = _assign_id(kind, record)
+            row.uuid = _lookup(record, kind.id_path)
+            if error is None and row.uuid in seen:
+                error = "Listed more than once."
+            if error is None and shape is not None:
+                problems: list[str] = []
+                _check(record, shape, "", problems)
+                if problems:
+                    extra = len(problems) - MAX_RECORD_ERRORS
+                    error = "; ".join(problems[:MAX_RECORD_ERRORS]) + (
+                        f" (+{extra} more)" if extra > 0 else ""
+                    )
+            if error is not None:
+                row.status, row.error = "invalid", error
+                continue
+            seen.add(row.uuid)
+            entries.append((index, {"uuId": row.uuid, "data": record}))
+        return rows, entries, shape is not None
+
+    @staticmethod
+    def prepare_delete(uuids: Any) -> tuple[list[_Row], list[tuple[int, str]]]:
+        """Check ``uuids``; return the rows and (row index, uuId) pairs to send.
+
+        Raises:
+            ValueError: If ``uuids`` is not a list
+        """
+        if not isinstance(uuids, list):
+            raise ValueError("uuIds must be a list of record ids")
+        rows: list[_Row] = []
+        entries: list[tuple[int, str]] = []
+        seen: set[str] = set()
+        for index, uuid in enumerate(uuids):
+            if not isinstance(uuid, str) or not uuid:
+                rows.append(_Row(None, "invalid", f"uuIds[{index}] must be a non-empty string."))
+            elif uuid in seen:
+                rows.append(_Row(uuid, "invalid", "Listed more than once."))
+            else:
+                seen.add(uuid)
+                rows.append(_Row(uuid))
+                entries.append((index, uuid))
+        return rows, entries
+
+    @staticmethod
+    def chunk(entries: list[tuple[int, Any]], mode: str) -> list[list[tuple[int, Any]]]:
+        """Split entries into chunks of at most BULK_CHUNK_RECORDS entries and about BULK_CHUNK_BYTES of JSON.
+
+        A single entry larger than the byte bound gets a chunk of its own.
+        """
+        chunks: list[list[tuple[int, Any]]] = []
+        current: list[tuple[int, Any]] = []
+        size = 0
+        for entry in entries:
+            entry_size = (
+                len(json.dumps(entry[1], ensure_ascii=False))
+                if mode == "upsert"
+                else len(entry[1]) + 3
+            )
+            if current and (
+                len(current) >= data_config.BULK_CHUNK_RECORDS
+                or size + entry_size > data_config.BULK_CHUNK_BYTES
+            ):
+                chunks.append(current)
+                current, size = [], 0
+            current.append(entry)
+            size += entry_size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "cachedShapes": len(self._shapes)}
+
+    async def _send_chunk(
+        self,
+        tool_name: str,
+        operation: str,
+        mode: str,
+        chunk: list[tuple[int, Any]],
+        rows: list[_Row],
+    ) -> bool:
+        """Send one chunk and fill in its rows; return False if Unity did not apply it."""
+        key = "records" if mode == "upsert" else "uuIds"
+        try:
+            result = await bridge_manager.send_command(
+                tool_name,
+                {"operation": operation, key: [entry for _, entry in chunk]},
+                timeout_ms=45_000,
+            )
+        except Exception as exc:
+            logger.warning("Bulk %s chunk failed: %s", operation, exc)
+            _fail(rows, chunk, str(exc))
+            return False
+        if not isinstance(result, dict) or not result.get("success", False):
+            error = result.get("error") if isinstance(result, dict) else None
+            _fail(rows, chunk, str(error or "Unity did not apply the chunk."))
+            return False
+
+        statuses = {
+            item.get("uuId"): item for item in result.get("results") or [] if isinstance(item, dict)
+        }
+        for index, _ in chunk:
+            row = rows[index]
+            status = statuses.get(row.uuid)
+            if status is None:
+                row.status, row.error = "error", "Unity returned no status for this record."
+            else:
+                row.status = str(status.get("status", "error"))
+                row.error = status.get("error")
+        return True
+
+    def _shape(self, kind: DataKind) -> Shape | None:
+        """Return the shape of the existing records of ``kind``, or None if there are none to learn from."""
+        try:
+            generation = self._reader.catalog_generation(kind)
+            with self._lock:
+                cached = self._shapes.get(kind.key)
+            if cached is not None and cached[0] == generation:
+                return cached[1]
+            records, _ = self._reader.catalog_records(kind)
+        except LocalDataUnavailable as exc:
+            logger.debug("Bulk %s without a schema check: %s", kind.key, exc)
+            return None
+        if not records:
+            return None
+
+        shape = Shape()
+        for record in records:
+            shape.add(record)
+        with self._lock:
+            self._shapes[kind.key] = (generation, shape)
+            self._stats["shapeBuilds"] += 1
+        return shape
+
+
+def _assign_id(kind: DataKind, record: dict[str, Any]) -> tuple[dict[str, Any], str | None]:
+    """Return a copy of ``record`` with its id set at ``kind.id_path`` (generated if missing), and an error if it has none usable."""
+    record = dict(record)
+    alias = record.pop("uuId", None) if kind.id_path != ("uuId",) else None
+    uuid = _lookup(record, kind.id_path)
+    if uuid in (None, ""):
+        uuid = alias if alias not in (None, "") else str(uuid4())
+    if not isinstance(uuid, str):
+        return record, f"{'.'.join(kind.id_path)} must be a string."
+
+    target = record
+    for key in kind.id_path[:-1]:
+        child = target.get(key)
+        if child is None:
+            child = {}
+        elif not isinstance(child, dict):
+            return record, f"{key} must be an object."
+        target[key] = child = dict(child)
+        target = child
+    target[kind.id_path[-1]] = uuid
+    return record, None
+
+
+def _check(value: Any, shape: Shape, path: str, problems: list[str]) -> None:
+    # null is accepted anywhere; Unity leaves the field at its default
+    if value is None or len(problems) > MAX_RECORD_ERRORS:
+        return
+    json_type = _json_type(value)
+    known = shape.types - {"null"}
+    if known and json_type not in known:
+        problems.append(f"{path or 'record'}: expected {'/'.join(sorted(known))}, got {json_type}")
+        return
+    if json_type == "object" and shape.fields:
+        for key, child in value.items():
+            child_path = f"{path}.{key}" if path else key
+            if key not in shape.fields:
+                problems.append(f"{child_path}: unknown field")
+            else:
+                _check(child, shape.fields[key], child_path, problems)
+    elif json_type == "array" and shape.items is not None:
+        for index, item in enumerate(value):
+            _check(item, shape.items, f"{path}[{index}]", problems)
+
+
+def _fail(rows: list[_Row], chunk: list[tuple[int, Any]], error: str) -> None:
+    for index, _ in chunk:
+        rows[index].status, rows[index].error = "error", error
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    return "object"
+
+
+def _lookup(record: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value: Any = record
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+bulk_writer = BulkWriter()
@@ -0,0 +1,413 @@
+"""
+Event command index: code histogram and command pattern search.
+
+Refactoring event scripts means finding every "Show Text with face X",
+every "Control Switches" on a range of switches, or every place a
+particular run of commands occurs. ``CommandIndex`` keeps each event page's
+command list (``Event/JSON/Event/{eventId}-{page}.json``) as a compact
+column table - an ``array`` of codes, one of indents and a tuple of
+parameter tuples - plus per-code posting lists and a code histogram.
+
+A query is a sequence of steps, each a command code (or ``null`` for any
+command) with optional parameter predicates; a single-step sequence finds
+single commands. Candidates come from the posting list of the rarest code
+in the sequence and are verified against the neighbouring rows, so a query
+touches only pages that contain that code.
+
+Like the search and reference indexes, the table is maintained
+incrementally: each query stats the command files and re-reads only those
+whose mtime or size changed.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from logger import logger
+from services.event_validator import COMMAND_RULES
+from services.project_data_reader import (
+    EVENT_DIR,
+    EVENT_ENTITY,
+    LocalDataUnavailable,
+    ProjectDataReader,
+    paginate,
+    project_data_reader,
+    stat_data_files,
+)
+from utils.memory import deep_sizeof
+
+COMMAND_INDEX_OPERATIONS = ("findCommands", "getCommandHistogram")
+
+DEFAULT_MATCH_LIMIT = 100
+
+# Longest command sequence a query may match
+MAX_SEQUENCE_LENGTH = 16
+
+PARAMETER_OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "~", "^=", "in")
+
+_PAGE = re.compile(r"-(\d+)$")
+
+# Parameter predicate: parameter tuple -> bool
+_Predicate = Callable[[tuple[Any, ...]], bool]
+
+
+class _Page:
+    """The command table of one event page file."""
+
+    __slots__ = ("mtime_ns", "size", "event_id", "page", "codes", "indents", "parameters")
+
+    def __init__(
+        self,
+        mtime_ns: int,
+        size: int,
+        event_id: str,
+        page: int,
+        codes: array,
+        indents: array,
+        parameters: tuple[tuple[Any, ...], ...],
+    ) -> None:
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.event_id = event_id
+        self.page = page
+        self.codes = codes
+        self.indents = indents
+        self.parameters = parameters
+
+
+class _Step:
+    __slots__ = ("code", "predicates")
+
+    def __init__(self, code: int | None, predicates: list[_Predicate]) -> None:
+        self.code = code
+        self.predicates = predicates
+
+    def matches(self, page: _Page, row: int) -> bool:
+        if self.code is not None and page.codes[row] != self.code:
+            return False
+        parameters = page.parameters[row]
+        return all(predicate(parameters) for predicate in self.predicates)
+
+
+class CommandIndex:
+    def __init__(self, reader: ProjectDataReader) -> None:
+        self._reader = reader
+        self._lock = threading.Lock()
+        self._reset()
+        self._syncs = 0
+        self._pages_indexed = 0
+        self._last_sync_ms = 0.0
+
+    def find_commands(
+        self, sequence: list[Any], limit: int = DEFAULT_MATCH_LIMIT, offset: int = 0
+    ) -> dict[str, Any]:
+        """Return every place ``sequence`` (steps of code and parameter predicates) occurs.
+
+        Raises:
+            ValueError: If the sequence or a predicate is malformed
+        """
+        steps = _compile_sequence(sequence)
+        with self._lock:
+            self._sync()
+            anchor, anchor_code = min(
+                (
+                    (position, step.code)
+                    for position, step in enumerate(steps)
+                    if step.code is not None
+                ),
+                key=lambda anchored: self._histogram.get(anchored[1], 0),
+            )
+            matches = []
+            postings = self._postings.get(anchor_code, {})
+            for path in sorted(
+                postings, key=lambda path: (self._pages[path].event_id, self._pages[path].page)
+            ):
+                page = self._pages[path]
+                for row in postings[path]:
+                    start = row - anchor
+                    if start < 0 or start + len(steps) > len(page.codes):
+                        continue
+                    if all(step.matches(page, start + shift) for shift, step in enumerate(steps)):
+                        matches.append((page, start))
+            result = paginate("matches", matches, {"limit": limit, "offset": offset})
+            result["matches"] = [
+                _present(page, start, len(steps)) for page, start in result["matches"]
+            ]
+        return result
+
+    def histogram(self, limit: int = DEFAULT_MATCH_LIMIT, offset: int = 0) -> dict[str, Any]:
+        """Return command counts per code, most frequent first."""
+        with self._lock:
+            self._sync()
+            counts = sorted(self._histogram.items(), key=lambda item: (-item[1], item[0]))
+            pages = {code: len(self._postings.get(code, ())) for code, _ in counts}
+            total = sum(self._histogram.values())
+        codes = [
+            {
+                "code": code,
+                "name": COMMAND_RULES[code].name if code in COMMAND_RULES else None,
+                "count": count,
+                "pageCount": pages[code],
+            }
+            for code, count in counts
+        ]
+        return {
+            **paginate("codes", codes, {"limit": limit, "offset": offset}),
+            "totalCommands": total,
+        }
+
+    def run_query(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Run a command index operation with tool style camelCase parameters."""
+        limit = int(params.get("limit") or DEFAULT_MATCH_LIMIT)
+        offset = int(params.get("offset") or 0)
+        if operation == "findCommands":
+            sequence = params.get("sequence")
+            if sequence is None:
+                if params.get("code") is None:
+                    raise ValueError("Parameter 'code' or 'sequence' is required")
+                sequence = [
+                    {
+                        "code": params["code"],
+                        "parameterFilters": params.get("parameterFilters") or [],
+                    }
+                ]
+            return self.find_commands(sequence, limit, offset)
+        if operation == "getCommandHistogram":
+            return self.histogram(limit, offset)
+        raise ValueError(
+            f"Unknown command index operation: {operation}. Supported: {', '.join(COMMAND_INDEX_OPERATIONS)}"
+        )
+
+    def clear(self) -> None:
+        """Drop the table; it is rebuilt from the files on the next query."""
+        with self._lock:
+            self._reset()
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        with self._lock:
+            return deep_sizeof((self._pages, self._postings, self._histogram), seen)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "pages": len(self._pages),
+            "commands": sum(self._histogram.values()),
+            "codes": len(self._histogram),
+            "syncs": self._syncs,
+            "pagesIndexed": self._pages_indexed,
+            "lastSyncMs": round(self._last_sync_ms, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._pages: dict[str, _Page] = {}
+        # code -> {path: rows holding that code}
+        self._postings: dict[int, dict[str, array]] = {}
+        self._histogram: Counter[int] = Counter()
+
+    def _sync(self) -> None:
+        started_at = time.perf_counter()
+        present: set[str] = set()
+        targets = [(self._reader.storage_root / EVENT_DIR, "*.json", EVENT_ENTITY, ("id",))]
+        for path, mtime_ns, size, _, _ in stat_data_files(targets):
+            present.add(path)
+            known = self._pages.get(path)
+            if known is None or known.mtime_ns != mtime_ns or known.size != size:
+                self._index_file(path, mtime_ns, size)
+
+        for path in [path for path in self._pages if path not in present]:
+            self._remove_page(path)
+
+        self._syncs += 1
+        self._last_sync_ms = (time.perf_counter() - started_at) * 1000
+
+    def _index_file(self, path: str, mtime_ns: int, size: int) -> None:
+        try:
+            records = self._reader.reload(Path(path)) or []
+        except LocalDataUnavailable as exc:
+            # Usually a partial write; the file is retried on the next query
+            logger.debug("Command index skipped %s: %s", path, exc)
+            return
+
+        self._remove_page(path)
+        record = records[0] if records else {}
+        stem = Path(path).stem
+        match = _PAGE.search(stem)
+        event_id = record.get("id")
+        if not isinstance(event_id, str) or not event_id:
+            event_id = stem[: match.start()] if match else stem
+
+        codes = array("i")
+        indents = array("i")
+        parameters: list[tuple[Any, ...]] = []
+        for command in record.get("eventCommands") or []:
+            if not isinstance(command, dict):
+                continue
+            code = command.get("code")
+            indent = command.get("indent")
+            values = command.get("parameters")
+            codes.append(code if isinstance(code, int) and not isinstance(code, bool) else -1)
+            indents.append(
+                indent if isinstance(indent, int) and not isinstance(indent, bool) else 0
+            )
+            parameters.append(tuple(values) if isinstance(values, list) else ())
+
+        page = _Page(
+            mtime_ns,
+            size,
+            event_id,
+            int(match.group(1)) if match else 0,
+            codes,
+            indents,
+            tuple(parameters),
+        )
+        self._pages[path] = page
+        rows: dict[int, array] = {}
+        for row, code in enumerate(codes):
+            rows.setdefault(code, array("I")).append(row)
+        for code, code_rows in rows.items():
+            self._postings.setdefault(code, {})[path] = code_rows
+            self._histogram[code] += len(code_rows)
+        self._pages_indexed += 1
+
+    def _remove_page(self, path: str) -> None:
+        page = self._pages.pop(path, None)
+        if page is None:
+            return
+        for code in set(page.codes):
+            postings = self._postings.get(code)
+            if postings is None or path not in postings:
+                continue
+            self._histogram[code] -= len(postings.pop(path))
+            if not postings:
+                del self._postings[code]
+                del self._histogram[code]
+
+
+def _compile_sequence(sequence: Any) -> list[_Step]:
+    if not isinstance(sequence, list) or not sequence:
+        raise ValueError("Invalid sequence: expected a non-empty list of codes or steps")
+    if len(sequence) > MAX_SEQUENCE_LENGTH:
+        raise ValueError(f"Invalid sequence: at most {MAX_SEQUENCE_LENGTH} steps are supported")
+
+    steps = []
+    for position, item in enumerate(sequence):
+        step = item if isinstance(item, dict) else {"code": item}
+        code = step.get("code")
+        if code is not None and (not isinstance(code, int) or isinstance(code, bool)):
+            raise ValueError(f"Invalid sequence step {position}: 'code' must be an integer or null")
+        filters = step.get("parameterFilters") or []
+        if not isinstance(filters, list):
+            raise ValueError(f"Invalid sequence step {position}: 'parameterFilters' must be a list")
+        steps.append(
+            _Step(code, [_compile_predicate(position, predicate) for predicate in filters])
+        )
+    if all(step.code is None for step in steps):
+        raise ValueError("Invalid sequence: at least one step needs a 'code'")
+    return steps
+
+
+def _compile_predicate(position: int, predicate: Any) -> _Predicate:
+    if not isinstance(predicate, dict):
+        raise ValueError(f"Invalid parameter filter in step {position}: expected an object")
+    index = predicate.get("index")
+    op = predicate.get("op", "=")
+    value = predicate.get("value")
+    if not isinstance(index, int) or isinstance(index, bool) or index < 0:
+        raise ValueError(
+            f"Invalid parameter filter in step {position}: 'index' must be a non-negative integer"
+        )
+    if op not in PARAMETER_OPERATORS:
+        raise ValueError(
+            f"Invalid parameter filter in step {position}: unknown op '{op}'. "
+            f"Supported: {', '.join(PARAMETER_OPERATORS)}"
+        )
+
+    if op == "in":
+        if not isinstance(value, list):
+            raise ValueError(
+                f"Invalid parameter filter in step {position}: 'in' needs a list value"
+            )
+        keys = {_text(item) for item in value}
+        return lambda parameters: index < len(parameters) and _text(parameters[index]) in keys
+    if op in ("=", "!="):
+        key = _text(value)
+        if op == "=":
+            return lambda parameters: index < len(parameters) and _text(parameters[index]) == key
+        return lambda parameters: index >= len(parameters) or _text(parameters[index]) != key
+    if op in ("~", "^="):
+        needle = _text(value).lower()
+        if op == "~":
+            return (
+                lambda parameters: index < len(parameters)
+                and needle in _text(parameters[index]).lower()
+            )
+        return lambda parameters: index < len(parameters) and _text(
+            parameters[index]
+        ).lower().startswith(needle)
+
+    # Unite stores numeric parameters as strings; numeric bounds compare them as numbers
+    numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if not numeric and not isinstance(value, str):
+        raise ValueError(
+            f"Invalid parameter filter in step {position}: '{op}' needs a number or string"
+        )
+    compare: Callable[[Any], bool] = {
+        "<": lambda left: left < value,
+        "<=": lambda left: left <= value,
+        ">": lambda left: left > value,
+        ">=": lambda left: left >= value,
+    }[op]
+
+    def test(parameters: tuple[Any, ...]) -> bool:
+        if index >= len(parameters):
+            return False
+        if numeric:
+            number = _number(parameters[index])
+            return number is not None and compare(number)
+        return compare(_text(parameters[index]))
+
+    return test
+
+
+def _present(page: _Page, start: int, length: int) -> dict[str, Any]:
+    return {
+        "uuId": page.event_id,
+        "page": page.page,
+        "commandIndex": start,
+        "commands": [
+            {
+                "code": page.codes[row],
+                "indent": page.indents[row],
+                "parameters": list(page.parameters[row]),
+            }
+            for row in range(start, start + length)
+        ],
+    }
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value if isinstance(value, str) else str(value)
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+command_index = CommandIndex(project_data_reader)
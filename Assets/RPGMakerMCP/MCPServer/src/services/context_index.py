@@ -0,0 +1,440 @@
+"""
+Lookup indexes over the Unity editor context replica.
+
+The context pushed by Unity is one nested blob; answering "where is the node
+called Player" or "which textures live under Assets/RPGMaker" used to mean
+scanning it. ``ContextIndex`` builds, per context version, compact tables:
+
+- a hierarchy node table laid out breadth-first, so each node's children are
+  a contiguous row range. Rows hold the node dict (shared with the replica),
+  the interned name and the parent row in ``array`` columns; full paths are
+  never stored and are rebuilt from the parent chain when a result needs one
+- id -> row and name -> rows maps (O(1) lookups); path lookups walk the
+  segments from the roots, binary searching a name-sorted child order for
+  wide parents
+- asset rows pointing at the replica's entries, with row orders sorted by
+  path (overall and per asset type) for prefix queries (O(log n + k))
+
+Node and asset dicts are shared with the replica rather than copied, so the
+index itself only adds a few machine words per row.
+
+Indexes are rebuilt lazily on the first query after a context change, so
+editing sessions with nobody querying do not pay for them. Queries run on the
+I/O executor; ``update`` only bumps a generation, so the loop never waits on a
+rebuild in progress.
+"""
+
+from __future__ import annotations
+
+import bisect
+import sys
+import threading
+import time
+from array import array
+from typing import Any
+
+from bridge.messages import AssetIndexEntry, HierarchyNode, UnityContextPayload
+from utils.memory import deep_sizeof
+
+DEFAULT_QUERY_LIMIT = 100
+
+# Parents with more children than this get a name-sorted child order for lookups
+WIDE_PARENT_CHILDREN = 32
+
+# Parent row used for the scene's root objects
+_ROOT = -1
+
+QUERY_OPERATIONS = (
+    "findByName",
+    "findByPathPrefix",
+    "getNode",
+    "listChildren",
+    "findAssets",
+    "getAsset",
+    "stats",
+)
+
+
+class ContextIndex:
+    def __init__(self) -> None:
+        self._payload: UnityContextPayload | None = None
+        self._generation = 0
+        self._built_generation = 0
+        self._lock = threading.Lock()
+        self._build_count = 0
+        self._last_build_ms = 0.0
+        self._reset_tables()
+
+    def update(self, payload: UnityContextPayload | None) -> None:
+        """Record a new context; the indexes are rebuilt on the next query."""
+        self._payload = payload
+        self._generation += 1
+
+    def clear(self) -> None:
+        """Drop the tables to free memory; they are rebuilt on the next query."""
+        with self._lock:
+            self._reset_tables()
+            self._built_generation = -1
+
+    # ------------------------------------------------------------------
+    # Hierarchy queries
+    # ------------------------------------------------------------------
+
+    def find_by_name(self, name: str, limit: int = DEFAULT_QUERY_LIMIT) -> list[dict[str, Any]]:
+        self._ensure_built()
+        return [self._summarize(row) for row in self._rows_by_name.get(name, [])[:limit]]
+
+    def find_by_path_prefix(
+        self, prefix: str, limit: int = DEFAULT_QUERY_LIMIT
+    ) -> list[dict[str, Any]]:
+        """Return nodes whose path starts with ``prefix``, in hierarchy order."""
+        self._ensure_built()
+        *segments, partial = prefix.split("/")
+        parents = self._walk(segments) if segments else [_ROOT]
+
+        results: list[dict[str, Any]] = []
+        stack: list[int] = []
+        for parent in parents:
+            stack.extend(reversed(self._match_children(parent, partial, prefix=True)))
+            while stack:
+                row = stack.pop()
+                results.append(self._summarize(row))
+                if len(results) >= limit:
+                    return results
+                stack.extend(reversed(self._child_rows(row)))
+        return results
+
+    def get_node(
+        self, node_id: str | None = None, path: str | None = None
+    ) -> dict[str, Any] | None:
+        self._ensure_built()
+        row = self._resolve(node_id, path)
+        if row is None:
+            return None
+        node = self._nodes[row]
+        if node is None:
+            return None
+        parent = self._parents[row]
+        return {
+            **node,
+            "path": self._path(row),
+            "parentId": self._ids[parent] if parent != _ROOT else None,
+        }
+
+    def list_children(
+        self,
+        node_id: str | None = None,
+        path: str | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        self._ensure_built()
+        if node_id is None and path is None:
+            parent = _ROOT
+        else:
+            resolved = self._resolve(node_id, path)
+            if resolved is None:
+                return []
+            parent = resolved
+        return [self._summarize(row) for row in self._child_rows(parent)[:limit]]
+
+    # ------------------------------------------------------------------
+    # Asset queries
+    # ------------------------------------------------------------------
+
+    def get_asset(self, guid: str) -> AssetIndexEntry | None:
+        self._ensure_built()
+        row = self._asset_row_by_guid.get(guid)
+        return self._asset_entries[row] if row is not None else None
+
+    def find_assets(
+        self,
+        asset_type: str | None = None,
+        path_prefix: str | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> list[AssetIndexEntry]:
+        self._ensure_built()
+        if asset_type is None:
+            order = self._asset_order
+        else:
+            order = self._asset_order_by_type.get(asset_type, array("i"))
+
+        prefix = path_prefix or ""
+        results: list[AssetIndexEntry] = []
+        start = bisect.bisect_left(order, prefix, key=self._asset_path)
+        for index in range(start, len(order)):
+            row = order[index]
+            entry = self._asset_entries[row]
+            if not (entry.get("path") or "").startswith(prefix) or len(results) >= limit:
+                break
+            results.append(entry)
+        return results
+
+    # ------------------------------------------------------------------
+    # Dispatch and stats
+    # ------------------------------------------------------------------
+
+    def run_query(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Run a query operation with tool/HTTP style camelCase parameters.
+
+        Blocking (the first query after a change rebuilds the tables); call it
+        through ``io_executor.run``.
+        """
+        limit = int(params.get("limit") or DEFAULT_QUERY_LIMIT)
+        with self._lock:
+            return self._run_query(operation, params, limit)
+
+    def _run_query(self, operation: str, params: dict[str, Any], limit: int) -> dict[str, Any]:
+        if operation == "findByName":
+            name = _require(params, "name")
+            return {"items": self.find_by_name(name, limit)}
+        if operation == "findByPathPrefix":
+            return {"items": self.find_by_path_prefix(params.get("pathPrefix") or "", limit)}
+        if operation == "getNode":
+            return {"node": self.get_node(params.get("id"), params.get("path"))}
+        if operation == "listChildren":
+            return {"items": self.list_children(params.get("id"), params.get("path"), limit)}
+        if operation == "findAssets":
+            return {
+                "items": self.find_assets(params.get("assetType"), params.get("pathPrefix"), limit)
+            }
+        if operation == "getAsset":
+            return {"asset": self.get_asset(_require(params, "guid"))}
+        if operation == "stats":
+            return self._stats()
+        raise ValueError(
+            f"Unknown context query operation: {operation}. Supported: {', '.join(QUERY_OPERATIONS)}"
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> dict[str, Any]:
+        self._ensure_built()
+        return {
+            "nodes": len(self._row_by_id),
+            "names": len(self._rows_by_name),
+            "paths": len(self._names),
+            "assets": len(self._asset_row_by_guid),
+            "assetTypes": len(self._asset_order_by_type),
+            "builds": self._build_count,
+            "lastBuildMs": round(self._last_build_ms, 3),
+            "contextUpdatedAt": self._payload.get("updatedAt") if self._payload else None,
+        }
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        """Bytes retained by the index tables (node dicts already in ``seen`` excluded)."""
+        with self._lock:
+            return self._measure_tables(seen)
+
+    def _measure_tables(self, seen: set[int] | None) -> int:
+        return deep_sizeof(
+            (
+                self._nodes,
+                self._ids,
+                self._names,
+                self._parents,
+                self._child_start,
+                self._child_count,
+                self._row_by_id,
+                self._rows_by_name,
+                self._sorted_children,
+                self._asset_entries,
+                self._asset_row_by_guid,
+                self._asset_order,
+                self._asset_order_by_type,
+            ),
+            seen,
+        )
+
+    # ------------------------------------------------------------------
+    # Index construction
+    # ------------------------------------------------------------------
+
+    def _reset_tables(self) -> None:
+        # Hierarchy node table (one row per node, columns in parallel sequences)
+        self._nodes: list[HierarchyNode | None] = []
+        self._ids: list[str | None] = []
+        self._names: list[str] = []
+        self._parents = array("i")
+        self._child_start = array("i")
+        self._child_count = array("i")
+        self._root_count = 0
+        self._row_by_id: dict[str, int] = {}
+        self._rows_by_name: dict[str, list[int]] = {}
+        self._sorted_children: dict[int, array[int]] = {}
+
+        # Asset table (rows point at the replica's entries)
+        self._asset_entries: list[AssetIndexEntry] = []
+        self._asset_row_by_guid: dict[str, int] = {}
+        self._asset_order = array("i")
+        self._asset_order_by_type: dict[str, array[int]] = {}
+
+    def _ensure_built(self) -> None:
+        generation = self._generation
+        if generation == self._built_generation:
+            return
+        payload = self._payload or {}
+        started_at = time.perf_counter()
+        self._reset_tables()
+        self._build_hierarchy(payload)
+        self._build_assets(payload)
+        self._built_generation = generation
+        self._build_count += 1
+        self._last_build_ms = (time.perf_counter() - started_at) * 1000
+
+    def _build_hierarchy(self, payload: UnityContextPayload) -> None:
+        hierarchy = payload.get("hierarchy")
+        if not hierarchy:
+            return
+
+        # The scene root is a container; its children are the scene's root objects
+        for child in hierarchy.get("children") or []:
+            self._add_row(child, child.get("name") or "", _ROOT)
+        self._root_count = len(self._nodes)
+
+        # Breadth-first, so every node's children land in one contiguous row range
+        row = 0
+        while row < len(self._nodes):
+            node = self._nodes[row]
+            self._child_start[row] = len(self._nodes)
+            if node is not None:
+                children = node.get("children")
+                if children is not None:
+                    for child in children:
+                        self._add_row(child, child.get("name") or "", row)
+                else:
+                    # Pushed context only carries child names below each node
+                    for child_name in node.get("childNames") or []:
+                        self._add_row(None, child_name, row)
+            self._child_count[row] = len(self._nodes) - self._child_start[row]
+            row += 1
+
+        for parent in [_ROOT, *range(len(self._nodes))]:
+            child_rows = self._child_rows(parent)
+            if len(child_rows) > WIDE_PARENT_CHILDREN:
+                self._sorted_children[parent] = array(
+                    "i", sorted(child_rows, key=self._names.__getitem__)
+                )
+
+    def _add_row(self, node: HierarchyNode | None, name: str, parent: int) -> None:
+        row = len(self._nodes)
+        name = sys.intern(name)
+        node_id = node.get("id") if node is not None else None
+        self._nodes.append(node)
+        self._ids.append(node_id)
+        self._names.append(name)
+        self._parents.append(parent)
+        self._child_start.append(0)
+        self._child_count.append(0)
+        if node_id:
+            self._row_by_id[node_id] = row
+            self._rows_by_name.setdefault(name, []).append(row)
+
+    def _build_assets(self, payload: UnityContextPayload) -> None:
+        for entry in payload.get("assets") or []:
+            guid = entry.get("guid")
+            if not guid:
+                continue
+            row = self._asset_row_by_guid.get(guid)
+            if row is None:
+                self._asset_row_by_guid[guid] = len(self._asset_entries)
+                self._asset_entries.append(entry)
+            else:
+                self._asset_entries[row] = entry
+
+        self._asset_order = array(
+            "i", sorted(range(len(self._asset_entries)), key=self._asset_path)
+        )
+        by_type: dict[str, list[int]] = {}
+        for row in self._asset_order:
+            by_type.setdefault(self._asset_entries[row].get("type") or "Unknown", []).append(row)
+        self._asset_order_by_type = {
+            asset_type: array("i", rows) for asset_type, rows in by_type.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Row helpers
+    # ------------------------------------------------------------------
+
+    def _child_rows(self, parent: int) -> range:
+        if parent == _ROOT:
+            return range(self._root_count)
+        start = self._child_start[parent]
+        return range(start, start + self._child_count[parent])
+
+    def _walk(self, segments: list[str]) -> list[int]:
+        """Return the rows at the path made of ``segments`` (duplicates included)."""
+        rows = [_ROOT]
+        for segment in segments:
+            matches: list[int] = []
+            for parent in rows:
+                matches.extend(self._match_children(parent, segment, prefix=False))
+            if not matches:
+                return []
+            rows = matches
+        return rows
+
+    def _match_children(self, parent: int, name: str, prefix: bool) -> list[int]:
+        """Return child rows of ``parent`` named ``name`` (or starting with it), in sibling order."""
+        names = self._names
+        ordered = self._sorted_children.get(parent)
+        if ordered is None:
+            if prefix:
+                return [row for row in self._child_rows(parent) if names[row].startswith(name)]
+            return [row for row in self._child_rows(parent) if names[row] == name]
+
+        matches: list[int] = []
+        for index in range(bisect.bisect_left(ordered, name, key=names.__getitem__), len(ordered)):
+            row = ordered[index]
+            if not (names[row].startswith(name) if prefix else names[row] == name):
+                break
+            matches.append(row)
+        matches.sort()
+        return matches
+
+    def _resolve(self, node_id: str | None, path: str | None) -> int | None:
+        if node_id:
+            return self._row_by_id.get(node_id)
+        if path:
+            rows = self._walk(path.split("/"))
+            if rows:
+                # Prefer an indexed node over an unexpanded name at the same path
+                return next((row for row in rows if self._nodes[row] is not None), rows[0])
+        return None
+
+    def _path(self, row: int) -> str:
+        parts: list[str] = []
+        while row != _ROOT:
+            parts.append(self._names[row])
+            row = self._parents[row]
+        return "/".join(reversed(parts))
+
+    def _summarize(self, row: int) -> dict[str, Any]:
+        node = self._nodes[row]
+        if node is None:
+            return _unexpanded(self._path(row))
+        return {
+            "id": self._ids[row],
+            "name": node.get("name"),
+            "path": self._path(row),
+            "type": node.get("type"),
+            "childCount": node.get("childCount", len(node.get("children") or [])),
+        }
+
+    def _asset_path(self, row: int) -> str:
+        return self._asset_entries[row].get("path") or ""
+
+
+def _unexpanded(path: str) -> dict[str, Any]:
+    return {"id": None, "name": path.rsplit("/", 1)[-1], "path": path, "expanded": False}
+
+
+def _require(params: dict[str, Any], key: str) -> str:
+    value = params.get(key)
+    if not value:
+        raise ValueError(f"Parameter '{key}' is required")
+    return str(value)
+
+
+context_index = ContextIndex()
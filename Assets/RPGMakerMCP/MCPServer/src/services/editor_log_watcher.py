@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import contextlib
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from config.env import env
 from logger import logger
+from services.exception_aggregator import ExceptionAggregator, ExceptionRecord
+from services.io_executor import io_executor
 
 MAX_LINES = 2000
 
+# On first read of an existing log only the tail is scanned
+MAX_INITIAL_READ_BYTES = 4 * 1024 * 1024
+
+# Bytes read per chunk while following the log
+READ_CHUNK_BYTES = 256 * 1024
+
+# Longest line kept; longer lines are truncated to bound memory
+MAX_LINE_CHARS = 8192
+
 
 def _classify_log_line(line: str) -> str:
     """Classify a Unity log line as 'error', 'warning', or 'normal'."""
@@ -29,17 +46,28 @@ class EditorLogSnapshot:
     normal_lines: list[str]
     warning_lines: list[str]
     error_lines: list[str]
+    exceptions: list[ExceptionRecord] = field(default_factory=list)
 
 
 class EditorLogWatcher:
     def __init__(self, explicit_path: Path | None = None, poll_interval: float = 2.0):
         self._target_path = explicit_path or env.unity_editor_log_path
         self._poll_interval = poll_interval
-        self._buffer: list[str] = []
+        self._buffer: deque[str] = deque(maxlen=MAX_LINES)
         self._updated_at: float = 0
-        self._last_mtime: float | None = None
+        self._offset: int = 0
+        self._partial: str = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._aggregator = ExceptionAggregator()
+        self._exception_listeners: list[Callable[[ExceptionRecord], None]] = []
         self._task: asyncio.Task[None] | None = None
         self._lock = asyncio.Lock()
+        # Guards buffer/aggregator state shared with the I/O worker thread
+        self._state_lock = threading.Lock()
+
+    def on_new_exception(self, callback: Callable[[ExceptionRecord], None]) -> None:
+        """Register a callback fired when a previously unseen fingerprint is recorded."""
+        self._exception_listeners.append(callback)
 
     async def start(self) -> None:
         await self.refresh()
@@ -64,38 +92,98 @@ class EditorLogWatcher:
         path = Path(self._target_path)
 
         try:
-            stat_result = path.stat()
+            stat_result = await io_executor.run(path.stat)
         except FileNotFoundError:
             logger.warning("Unity editor log not found: %s", path)
             async with self._lock:
-                self._buffer = []
+                with self._state_lock:
+                    self._reset_position()
+                    self._buffer.clear()
                 self._updated_at = 0
             return
         except OSError as exc:
             logger.warning("Failed to stat Unity editor log %s: %s", path, exc)
             return
 
-        if self._last_mtime is not None and stat_result.st_mtime <= self._last_mtime:
-            return
-
-        try:
-            # Unity Editor.log may contain mixed encodings; be forgiving
-            contents = path.read_text(encoding="utf-8", errors="replace")
-        except OSError as exc:
-            logger.warning("Failed to read Unity editor log %s: %s", path, exc)
-            return
-
-        lines = contents.splitlines()
-        capped = lines[-MAX_LINES:]
-
         async with self._lock:
-            self._buffer = capped
-            self._updated_at = asyncio.get_event_loop().time()
-            self._last_mtime = stat_result.st_mtime
+            size = stat_result.st_size
+            if size < self._offset:
+                # Unity truncates Editor.log when the editor restarts
+                with self._state_lock:
+                    self._reset_position()
+                    self._buffer.clear()
+
+            if size == self._offset:
+                # Nothing appended since the last poll: close any exception block in progress
+                with self._state_lock:
+                    record = self._aggregator.flush(time.time())
+                self._emit_new_records([record] if record and record.count == 1 else [])
+                return
+
+            try:
+                # Reading and parsing run on the I/O pool, never on the event loop
+                new_records = await io_executor.run(self._read_appended, path, size)
+            except OSError as exc:
+                logger.warning("Failed to read Unity editor log %s: %s", path, exc)
+                return
+
+            self._updated_at = asyncio.get_running_loop().time()
+            self._emit_new_records(new_records)
+
+    def _read_appended(self, path: Path, size: int) -> list[ExceptionRecord]:
+        start = self._offset
+        skip_first_line = False
+        if start == 0 and size > MAX_INITIAL_READ_BYTES:
+            start = size - MAX_INITIAL_READ_BYTES
+            skip_first_line = True
+
+        seen_at = time.time()
+        new_records: list[ExceptionRecord] = []
+        with path.open("rb") as handle:
+            handle.seek(start)
+            remaining = size - start
+            while remaining > 0:
+                chunk = handle.read(min(READ_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                text = self._partial + self._decoder.decode(chunk)
+                lines = text.split("\n")
+                self._partial = lines.pop()[:MAX_LINE_CHARS]
+                if skip_first_line and lines:
+                    # The tail read most likely started in the middle of a line
+                    lines = lines[1:]
+                    skip_first_line = False
+                with self._state_lock:
+                    for line in lines:
+                        record = self._ingest_line(line.rstrip("\r")[:MAX_LINE_CHARS], seen_at)
+                        if record is not None and record.count == 1:
+                            new_records.append(record)
+            self._offset = size - remaining
+        return new_records
+
+    def _ingest_line(self, line: str, seen_at: float) -> ExceptionRecord | None:
+        self._buffer.append(line)
+        return self._aggregator.feed(line, seen_at)
+
+    def _emit_new_records(self, records: list[ExceptionRecord]) -> None:
+        for record in records:
+            for callback in list(self._exception_listeners):
+                try:
+                    callback(record)
+                except Exception:  # pragma: no cover - defensive
+                    logger.exception("Editor log exception listener failed")
+
+    def _reset_position(self) -> None:
+        self._offset = 0
+        self._partial = ""
+        self._decoder.reset()
 
     def get_snapshot(self, limit: int = MAX_LINES) -> EditorLogSnapshot:
         clamp = max(0, min(limit, MAX_LINES))
-        buffer = self._buffer[-clamp:] if clamp else []
+        with self._state_lock:
+            buffer = list(self._buffer)[-clamp:] if clamp else []
+            exceptions = self._aggregator.records()
 
         # Classify log lines
         normal_lines = []
@@ -113,13 +201,22 @@ class EditorLogWatcher:
 
         return EditorLogSnapshot(
             updated_at=self._updated_at,
-            lines=list(buffer),
+            lines=buffer,
             source_path=str(self._target_path),
             normal_lines=normal_lines,
             warning_lines=warning_lines,
             error_lines=error_lines,
+            exceptions=exceptions,
         )
 
+    def get_exception_summary(self, limit: int | None = None) -> dict[str, Any]:
+        """Aggregated exception view: one entry per fingerprint, most recent first."""
+        with self._state_lock:
+            summary = self._aggregator.summary(limit)
+        summary["sourcePath"] = str(self._target_path)
+        summary["updatedAt"] = self._updated_at
+        return summary
+
     async def _poll_loop(self) -> None:
         try:
             while True:
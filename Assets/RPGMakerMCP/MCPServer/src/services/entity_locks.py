@@ -0,0 +1,263 @@
+"""
+Per-entity locks for writes sent to Unity.
+
+Clients used to serialize all of their writes because two concurrent
+``updateMap`` calls on the same map race inside Unity. ``EntityLocks`` lets
+writes to different records run concurrently and serializes writes to the
+same one. Each write is mapped to a lock path:
+
+    (bridge tool, entity type[, record id[, command index]])
+
+and holds the last element of its path exclusively and every shorter prefix
+shared. A write to one record therefore waits only for writes to that
+record, while operations on a whole entity type (``bulkUpsert*``, settings)
+hold the type exclusively and wait for, and block, every write of that type.
+For events, ``updateEventCommand`` locks its command; inserting, deleting
+or patching commands shifts the indices of the others, so those lock the
+event (a common event has a single page, so there is no page level).
+``create*`` calls without an id add a new record and only share the type.
+
+Locks are granted in arrival order. Reads are never locked. Wait times are
+reported per entity type so contention shows up in ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+Mode = Literal["shared", "exclusive"]
+
+READ_PREFIXES = (
+    "get",
+    "list",
+    "search",
+    "find",
+    "inspect",
+    "export",
+    "validate",
+    "analyze",
+    "simulate",
+)
+
+# Payload fields naming the record a write targets, first present wins
+TARGET_FIELDS = ("eventId", "uuId", "id", "mapId", "variableId", "switchId", "flagId", "slotId")
+
+# Entity names that are parts of another entity
+ENTITY_ALIASES = {
+    "MapData": "Map",
+    "MapSettings": "Map",
+    "ItemToInventory": "Inventory",
+    "ItemFromInventory": "Inventory",
+}
+
+_OPERATION = re.compile(r"^(bulkUpsert|bulkDelete|[a-z]+)(.*)$")
+
+
+class _WaitStats:
+    __slots__ = ("acquisitions", "contended", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float, contended: bool) -> None:
+        self.acquisitions += 1
+        self.contended += contended
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "totalWaitMs": round(self.total_wait * 1000, 3),
+            "avgWaitMs": (
+                round(self.total_wait * 1000 / self.acquisitions, 3) if self.acquisitions else 0.0
+            ),
+            "maxWaitMs": round(self.max_wait * 1000, 3),
+        }
+
+
+class _KeyLock:
+    """A shared/exclusive lock granted in arrival order."""
+
+    __slots__ = ("shared", "exclusive", "waiters")
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self.exclusive = False
+        self.waiters: deque[tuple[Mode, asyncio.Future[None]]] = deque()
+
+    def idle(self) -> bool:
+        return not self.shared and not self.exclusive and not self.waiters
+
+    def can_grant(self, mode: Mode) -> bool:
+        if mode == "exclusive":
+            return not self.shared and not self.exclusive
+        return not self.exclusive
+
+    def take(self, mode: Mode) -> None:
+        if mode == "exclusive":
+            self.exclusive = True
+        else:
+            self.shared += 1
+
+    def release(self, mode: Mode) -> None:
+        if mode == "exclusive":
+            self.exclusive = False
+        else:
+            self.shared -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        # Grant the front of the queue: one exclusive waiter or a run of shared ones
+        while self.waiters:
+            waiting_mode, future = self.waiters[0]
+            if future.done():
+                self.waiters.popleft()
+                continue
+            if not self.can_grant(waiting_mode):
+                return
+            self.waiters.popleft()
+            self.take(waiting_mode)
+            future.set_result(None)
+
+
+class EntityLocks:
+    def __init__(self) -> None:
+        self._locks: dict[tuple[str, ...], _KeyLock] = {}
+        self._stats: dict[str, _WaitStats] = {}
+
+    @contextlib.asynccontextmanager
+    async def hold(self, tool_name: str, payload: dict[str, Any]) -> AsyncIterator[None]:
+        """Hold the locks of the write ``payload`` describes; reads pass through."""
+        plan = lock_plan(tool_name, payload)
+        if not plan:
+            yield
+            return
+
+        started_at = time.perf_counter()
+        held: list[tuple[tuple[str, ...], Mode]] = []
+        contended = False
+        try:
+            for path, mode in plan:
+                contended |= await self._acquire(path, mode)
+                held.append((path, mode))
+            entity = plan[0][0][1]
+            self._stats.setdefault(entity, _WaitStats()).record(
+                time.perf_counter() - started_at, contended
+            )
+            yield
+        finally:
+            for path, mode in reversed(held):
+                self._release(path, mode)
+
+    def get_stats(self) -> dict[str, Any]:
+        total = _WaitStats()
+        for stats in self._stats.values():
+            total.acquisitions += stats.acquisitions
+            total.contended += stats.contended
+            total.total_wait += stats.total_wait
+            total.max_wait = max(total.max_wait, stats.max_wait)
+        return {
+            **total.to_dict(),
+            "heldKeys": sum(1 for lock in self._locks.values() if lock.shared or lock.exclusive),
+            "waiting": sum(len(lock.waiters) for lock in self._locks.values()),
+            "byEntity": {entity: stats.to_dict() for entity, stats in sorted(self._stats.items())},
+        }
+
+    async def _acquire(self, path: tuple[str, ...], mode: Mode) -> bool:
+        """Take the lock at ``path``; return True if it had to wait."""
+        lock = self._locks.setdefault(path, _KeyLock())
+        if not lock.waiters and lock.can_grant(mode):
+            lock.take(mode)
+            return False
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        lock.waiters.append((mode, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation
+                self._release(path, mode)
+            else:
+                with contextlib.suppress(ValueError):
+                    lock.waiters.remove((mode, future))
+                # Waiters queued behind this one may be grantable now
+                lock.wake()
+                self._discard_if_idle(path)
+            raise
+        return True
+
+    def _release(self, path: tuple[str, ...], mode: Mode) -> None:
+        lock = self._locks[path]
+        lock.release(mode)
+        self._discard_if_idle(path)
+
+    def _discard_if_idle(self, path: tuple[str, ...]) -> None:
+        lock = self._locks.get(path)
+        if lock is not None and lock.idle():
+            del self._locks[path]
+
+
+def lock_plan(tool_name: str, payload: dict[str, Any]) -> list[tuple[tuple[str, ...], Mode]]:
+    """Return the (path, mode) locks a call takes, shortest path first; empty for reads."""
+    operation = str(payload.get("operation") or "")
+    match = _OPERATION.match(operation)
+    if not tool_name.startswith("rpgMaker") or match is None or operation.startswith(READ_PREFIXES):
+        return []
+    verb, rest = match.groups()
+
+    if tool_name == "rpgMakerEvent":
+        # Every event operation works on one event (a common event has one command list)
+        entity = "Event"
+    elif verb.startswith("bulk"):
+        entity = _singular(rest)
+    else:
+        entity = ENTITY_ALIASES.get(rest, rest) or operation
+    path: tuple[str, ...] = (tool_name, entity)
+
+    target = _field(payload, TARGET_FIELDS)
+    if target is None:
+        if verb == "create":
+            # A new record: nothing to serialize with but whole-type writes
+            return [(path, "shared")]
+    else:
+        path += (target,)
+        command = _field(payload, ("commandIndex",))
+        # Inserting or deleting commands shifts the others, so only updates lock one command
+        if (
+            tool_name == "rpgMakerEvent"
+            and rest == "EventCommand"
+            and verb == "update"
+            and command is not None
+        ):
+            path += (command,)
+
+    return [(path[:depth], "shared") for depth in range(2, len(path))] + [(path, "exclusive")]
+
+
+def _field(payload: dict[str, Any], names: tuple[str, ...]) -> str | None:
+    for name in names:
+        value = payload.get(name)
+        if value not in (None, ""):
+            return str(value)
+    return None
+
+
+def _singular(name: str) -> str:
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+    return name[:-1] if name.endswith("s") else name
+
+
+entity_locks = EntityLocks()
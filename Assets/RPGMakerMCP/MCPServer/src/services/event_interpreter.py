@@ -0,0 +1,682 @@
+"""
+Headless interpreter for the deterministic subset of event commands.
+
+Checking what an event does to switches and variables means playing it in
+Unity, once per combination of flags. ``EventInterpreter`` runs an event page
+against a game state model instead, thousands of scenarios per call:
+
+- the state starts with every switch OFF, every variable 0 and no items,
+  then takes the values ``rpgmaker_gamestate`` reads from SaveData:
+  ``gamestate.json`` (``switches``, ``variables``, ``selfSwitches``,
+  ``gold``), ``party.json`` (``gold``) and ``inventory.json`` (item id to
+  count). Each scenario overrides any part of it.
+- Control Switches/Variables/Self Switch, Conditional Branch on a switch,
+  variable, self switch, gold or item, Loop/Break Loop, Label/Jump to Label,
+  Exit Event Processing, Change Gold, Change Items and Common Event calls
+  are executed. Show Choices and Battle Processing take the branch the
+  scenario picks (the first by default); other commands are skipped and
+  counted.
+- each scenario reports the switches, variables, self switches, items and
+  gold it changed, the common events it called and how many commands ran.
+
+A page is compiled once per call into operation tuples, with successors from
+the control-flow graph ``analyzeEventFlow`` builds, so running a scenario
+only dispatches on small integers. Parameter layouts are the MV-compatible
+ones ``validateAllEvents`` checks; switch and variable ids are recognised
+through the reference index like in the flow analysis.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from config.constants import data_config
+from services.event_validator import (
+    BATTLE_CODE,
+    BRANCH_OF,
+    BREAK_LOOP_CODE,
+    END_OF,
+    JUMP_CODE,
+    LABEL_CODE,
+    LOOP_CODE,
+)
+from services.flow_analysis import build_flow_graph
+from services.project_data_reader import (
+    EVENT_DIR,
+    LocalDataUnavailable,
+    ProjectDataReader,
+    paginate,
+    project_data_reader,
+)
+from services.reference_index import ReferenceIndex, reference_index
+
+SIMULATE_OPERATION = "simulateEvent"
+
+SAVE_DATA_DIR = "SaveData"
+
+# Common Event calls nest at most this deep, like in Game_Interpreter
+MAX_CALL_DEPTH = 100
+
+_MAX_GOLD = 99_999_999
+_MAX_ITEMS = 99
+
+_SELF_SWITCHES = ("A", "B", "C", "D")
+
+_SHOW_CHOICES_CODE = 102
+_CONDITIONAL_BRANCH_CODE = 111
+_EXIT_CODE = 115
+_COMMON_EVENT_CODE = 117
+_CONTROL_SWITCHES_CODE = 121
+_CONTROL_VARIABLES_CODE = 122
+_CONTROL_SELF_SWITCH_CODE = 123
+_CHANGE_GOLD_CODE = 125
+_CHANGE_ITEMS_CODE = 126
+
+# Block markers and the flow commands the successors already encode; not reported as skipped
+_FLOW_CODES = {
+    0,
+    *BRANCH_OF,
+    *END_OF,
+    LOOP_CODE,
+    BREAK_LOOP_CODE,
+    LABEL_CODE,
+    JUMP_CODE,
+    _EXIT_CODE,
+}
+
+# Operation kinds of compiled commands
+_SKIP, _SWITCHES, _VARIABLES, _SELF_SWITCH, _BRANCH, _CHOOSE, _CALL, _GOLD, _ITEMS = range(9)
+
+# Operand kinds: a constant, another variable, or a random integer in a range
+_CONSTANT, _VARIABLE, _RANDOM = range(3)
+
+_COMPARISONS: tuple[Callable[[Any, Any], bool], ...] = (
+    lambda a, b: a == b,
+    lambda a, b: a >= b,
+    lambda a, b: a <= b,
+    lambda a, b: a > b,
+    lambda a, b: a < b,
+    lambda a, b: a != b,
+)
+
+
+class Program:
+    """A compiled command list: one operation and its successors per command."""
+
+    __slots__ = ("ops", "successors")
+
+    def __init__(self, ops: list[tuple[Any, ...]], successors: list[tuple[int, ...]]) -> None:
+        self.ops = ops
+        self.successors = successors
+
+
+class GameState:
+    """Switches, variables, self switches of the simulated event, item counts and gold."""
+
+    __slots__ = ("switches", "variables", "self_switches", "items", "gold")
+
+    def __init__(
+        self,
+        switches: dict[str, bool] | None = None,
+        variables: dict[str, int] | None = None,
+        self_switches: dict[str, bool] | None = None,
+        items: dict[str, int] | None = None,
+        gold: int = 0,
+    ) -> None:
+        self.switches = switches or {}
+        self.variables = variables or {}
+        self.self_switches = self_switches or {}
+        self.items = items or {}
+        self.gold = gold
+
+    def overridden(self, overrides: dict[str, Any]) -> GameState:
+        """Return a copy with the switches, variables, self switches, items and gold in ``overrides``.
+
+        Raises:
+            ValueError: If an override has the wrong shape
+        """
+        state = GameState(self.switches, self.variables, self.self_switches, self.items, self.gold)
+        for key, attribute, convert in (
+            ("switches", "switches", _as_bool),
+            ("variables", "variables", _as_int),
+            ("selfSwitches", "self_switches", _as_bool),
+            ("items", "items", _as_int),
+        ):
+            values = overrides.get(key)
+            if values is None:
+                continue
+            if not isinstance(values, dict):
+                raise ValueError(f"Invalid state: '{key}' must be an object of id to value")
+            if key == "selfSwitches" and not set(values) <= set(_SELF_SWITCHES):
+                raise ValueError(
+                    f"Invalid state: selfSwitches keys must be {', '.join(_SELF_SWITCHES)}"
+                )
+            try:
+                updated = {str(flag): convert(value) for flag, value in values.items()}
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    f"Invalid state: '{key}' has a value of the wrong type ({exc})"
+                ) from exc
+            setattr(state, attribute, {**getattr(self, attribute), **updated})
+        if overrides.get("gold") is not None:
+            try:
+                state.gold = _as_int(overrides["gold"])
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"Invalid state: 'gold' must be an integer ({exc})") from exc
+        return state
+
+
+class _Halt(Exception):
+    """Stops a scenario; ``args[0]`` is its status."""
+
+
+class EventInterpreter:
+    def __init__(
+        self,
+        reader: ProjectDataReader,
+        references: ReferenceIndex,
+        max_scenarios: int = data_config.SIMULATION_MAX_SCENARIOS,
+        step_limit: int = data_config.SIMULATION_STEP_LIMIT,
+    ) -> None:
+        self._reader = reader
+        self._references = references
+        self._max_scenarios = max_scenarios
+        self._step_limit = step_limit
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._scenarios = 0
+        self._last_run_ms = 0.0
+        self._last_rate = 0.0
+
+    def simulate(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Run one event page for every scenario in the payload; returns the paginated results.
+
+        Raises:
+            LocalDataUnavailable: If the project has no event data or a file cannot be parsed
+            ValueError: If the page does not exist or a scenario is malformed
+        """
+        started_at = time.perf_counter()
+        event_id = payload.get("uuId")
+        if not isinstance(event_id, str) or not event_id:
+            raise ValueError("uuId is required for simulateEvent")
+        page = int(payload.get("pageIndex") or 0)
+        scenarios = payload.get("scenarios")
+        if scenarios is None:
+            scenarios = [{}]
+        if not isinstance(scenarios, list) or not all(
+            isinstance(scenario, dict) for scenario in scenarios
+        ):
+            raise ValueError("Invalid scenarios: expected a list of objects")
+        if len(scenarios) > self._max_scenarios:
+            raise ValueError(
+                f"Too many scenarios: {len(scenarios)} (at most {self._max_scenarios} per call)"
+            )
+
+        root = self._reader.storage_root
+        if not (root / EVENT_DIR).is_dir():
+            raise LocalDataUnavailable(f"Event directory not found: {root / EVENT_DIR}")
+        definitions = self._references.definitions()
+        programs: dict[tuple[str, int], Program | None] = {}
+
+        def load(callee: str, callee_page: int = 0) -> Program | None:
+            key = (callee, callee_page)
+            if key not in programs:
+                commands = self._commands(root, callee, callee_page)
+                programs[key] = None if commands is None else compile_page(commands, definitions)
+            return programs[key]
+
+        program = load(event_id, page)
+        if program is None:
+            raise ValueError(f"Event page not found: {event_id} page {page}")
+
+        base = self._save_state(root, event_id) if payload.get("useSaveData", True) else GameState()
+        base = base.overridden(payload.get("initialState") or {})
+        results = []
+        for index, scenario in enumerate(scenarios):
+            run = _Run(base.overridden(scenario), scenario, index, load, self._step_limit)
+            result = run.finish(run.start(program))
+            result["scenario"] = index
+            if scenario.get("name") is not None:
+                result["name"] = scenario["name"]
+            results.append(result)
+
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        rate = len(results) / (elapsed_ms / 1000) if elapsed_ms else 0.0
+        with self._lock:
+            self._runs += 1
+            self._scenarios += len(results)
+            self._last_run_ms = elapsed_ms
+            self._last_rate = rate
+
+        return {
+            **paginate("results", results, payload),
+            "uuId": event_id,
+            "page": page,
+            "commandCount": len(program.ops),
+            "statusCounts": dict(sorted(Counter(result["status"] for result in results).items())),
+            "elapsedMs": round(elapsed_ms, 3),
+            "scenariosPerSecond": round(rate),
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "runs": self._runs,
+            "scenarios": self._scenarios,
+            "lastRunMs": round(self._last_run_ms, 3),
+            "lastScenariosPerSecond": round(self._last_rate),
+        }
+
+    def _commands(self, root: Path, event_id: str, page: int) -> list[Any] | None:
+        """Return the command list of an event page, or None if there is no such page."""
+        event_dir = root / EVENT_DIR
+        candidates = [event_dir / f"{event_id}-{page}.json"]
+        if page == 0:
+            candidates.append(event_dir / f"{event_id}.json")
+        for path in candidates:
+            records = self._reader.reload(path) if path.is_file() else None
+            if records:
+                commands = records[0].get("eventCommands")
+                return commands if isinstance(commands, list) else []
+        return None
+
+    def _save_state(self, root: Path, event_id: str) -> GameState:
+        """Return the state stored in SaveData, as rpgmaker_gamestate reads it."""
+        game_state = _read_object(root / SAVE_DATA_DIR / "gamestate.json")
+        party = _read_object(root / SAVE_DATA_DIR / "party.json")
+        inventory = _read_object(root / SAVE_DATA_DIR / "inventory.json")
+
+        self_switches = game_state.get("selfSwitches")
+        self_switches = self_switches.get(event_id) if isinstance(self_switches, dict) else None
+        gold = game_state.get("gold", party.get("gold"))
+        return GameState(
+            switches=_flag_values(game_state.get("switches"), _as_bool),
+            variables=_flag_values(game_state.get("variables"), _as_int),
+            self_switches=_flag_values(self_switches, _as_bool),
+            items=_flag_values(inventory, _as_int),
+            gold=_to_int(gold) or 0,
+        )
+
+
+class _Run:
+    """One scenario: the changes it makes on top of its starting state."""
+
+    __slots__ = (
+        "base",
+        "switches",
+        "variables",
+        "self_switches",
+        "items",
+        "gold",
+        "choices",
+        "choice_index",
+        "seed",
+        "rng",
+        "load",
+        "step_limit",
+        "steps",
+        "calls",
+        "skipped",
+        "warnings",
+    )
+
+    def __init__(
+        self,
+        base: GameState,
+        scenario: dict[str, Any],
+        index: int,
+        load: Callable[..., Program | None],
+        step_limit: int,
+    ) -> None:
+        self.base = base
+        self.switches: dict[str, bool] = {}
+        self.variables: dict[str, int] = {}
+        self.self_switches: dict[str, bool] = {}
+        self.items: dict[str, int] = {}
+        self.gold = base.gold
+        choices = scenario.get("choices") or []
+        parsed_choices = (
+            [_to_int(choice) for choice in choices] if isinstance(choices, list) else []
+        )
+        if not isinstance(choices, list) or None in parsed_choices:
+            raise ValueError(
+                f"Invalid scenario {index}: 'choices' must be a list of branch indexes"
+            )
+        self.choices = [choice for choice in parsed_choices if choice is not None]
+        self.choice_index = 0
+        self.seed = scenario.get("seed", index)
+        self.rng: random.Random | None = None
+        self.load = load
+        self.step_limit = step_limit
+        self.steps = 0
+        self.calls: Counter[str] = Counter()
+        self.skipped: Counter[int] = Counter()
+        self.warnings: set[str] = set()
+
+    def start(self, program: Program) -> str:
+        try:
+            self.execute(program, 0)
+        except _Halt as halt:
+            return str(halt.args[0])
+        return "completed"
+
+    def finish(self, status: str) -> dict[str, Any]:
+        base = self.base
+        effects = {
+            "switches": _changes(base.switches, self.switches, False),
+            "variables": _changes(base.variables, self.variables, 0),
+            "selfSwitches": _changes(base.self_switches, self.self_switches, False),
+            "items": _changes(base.items, self.items, 0),
+        }
+        effects = {kind: changes for kind, changes in effects.items() if changes}
+        if self.gold != base.gold:
+            effects["gold"] = {"before": base.gold, "after": self.gold}
+        return {
+            "status": status,
+            "steps": self.steps,
+            "effects": effects,
+            "calls": dict(sorted(self.calls.items())),
+            "skipped": {str(code): count for code, count in sorted(self.skipped.items())},
+            "warnings": sorted(self.warnings),
+        }
+
+    def execute(self, program: Program, depth: int) -> None:
+        ops = program.ops
+        successors = program.successors
+        end = len(ops)
+        pc = 0
+        while pc < end:
+            self.steps += 1
+            if self.steps > self.step_limit:
+                raise _Halt("stepLimit")
+            op = ops[pc]
+            kind = op[0]
+            following = successors[pc]
+            if kind == _SKIP:
+                if op[1] is not None:
+                    self.skipped[op[1]] += 1
+            elif kind == _SWITCHES:
+                for switch_id in op[1]:
+                    self.switches[switch_id] = op[2]
+            elif kind == _VARIABLES:
+                value = self.operand(op[3])
+                for variable_id in op[1]:
+                    self.variables[variable_id] = _operate(op[2], self.variable(variable_id), value)
+            elif kind == _SELF_SWITCH:
+                self.self_switches[op[1]] = op[2]
+            elif kind == _BRANCH:
+                if len(following) > 1:
+                    pc = following[0] if self.condition(op[1]) else following[1]
+                    continue
+            elif kind == _CHOOSE:
+                if len(following) > 1:
+                    pc = following[self.choose(len(following))]
+                    continue
+            elif kind == _CALL:
+                self.call(op[1], depth)
+            elif kind == _GOLD:
+                self.gold = min(max(self.gold + op[1] * self.operand(op[2]), 0), _MAX_GOLD)
+            elif kind == _ITEMS:
+                count = self.items[op[1]] if op[1] in self.items else self.base.items.get(op[1], 0)
+                self.items[op[1]] = min(max(count + op[2] * self.operand(op[3]), 0), _MAX_ITEMS)
+            pc = following[0]
+
+    def call(self, event_id: str | None, depth: int) -> None:
+        program = self.load(event_id) if event_id else None
+        if not event_id or program is None:
+            self.warnings.add(f"Common event {event_id} not found; the call was skipped")
+            return
+        if depth + 1 >= MAX_CALL_DEPTH:
+            raise _Halt("callDepthExceeded")
+        self.calls[event_id] += 1
+        self.execute(program, depth + 1)
+
+    def choose(self, branches: int) -> int:
+        if self.choice_index >= len(self.choices):
+            return 0
+        choice = self.choices[self.choice_index]
+        self.choice_index += 1
+        if not 0 <= choice < branches:
+            self.warnings.add(f"Choice {choice} is out of range (0-{branches - 1}); took branch 0")
+            return 0
+        return choice
+
+    def condition(self, condition: tuple[Any, ...]) -> bool:
+        kind = condition[0]
+        if kind == 0:
+            return bool(self.switch(condition[1]) == condition[2])
+        if kind == 1:
+            compare: Callable[[Any, Any], bool] = _COMPARISONS[condition[3]]
+            return compare(self.variable(condition[1]), self.operand(condition[2]))
+        if kind == 2:
+            current = self.self_switches.get(
+                condition[1], self.base.self_switches.get(condition[1], False)
+            )
+            return bool(current == condition[2])
+        if kind == 7:
+            gold_comparisons = (
+                self.gold >= condition[1],
+                self.gold <= condition[1],
+                self.gold < condition[1],
+            )
+            return bool(gold_comparisons[condition[2]])
+        if kind == 8:
+            item_id = condition[1]
+            return (
+                self.items[item_id] if item_id in self.items else self.base.items.get(item_id, 0)
+            ) > 0
+        self.warnings.add(f"Conditional Branch type {kind} is not simulated; took the else branch")
+        return False
+
+    def operand(self, operand: tuple[Any, ...]) -> int:
+        kind = operand[0]
+        if kind == _CONSTANT:
+            constant: int = operand[1]
+            return constant
+        if kind == _VARIABLE:
+            return self.variable(operand[1])
+        if self.rng is None:
+            self.rng = random.Random(self.seed)
+        return self.rng.randint(operand[1], operand[2])
+
+    def switch(self, switch_id: str) -> bool:
+        return (
+            self.switches[switch_id]
+            if switch_id in self.switches
+            else self.base.switches.get(switch_id, False)
+        )
+
+    def variable(self, variable_id: str) -> int:
+        if variable_id in self.variables:
+            return self.variables[variable_id]
+        return self.base.variables.get(variable_id, 0)
+
+
+# ----------------------------------------------------------------------
+# Compilation
+# ----------------------------------------------------------------------
+
+
+def compile_page(commands: list[Any], definitions: dict[str, str]) -> Program:
+    """Compile a command list; commands the interpreter cannot run become skips."""
+    codes = []
+    parameters = []
+    for command in commands:
+        command = command if isinstance(command, dict) else {}
+        code = command.get("code")
+        values = command.get("parameters")
+        codes.append(code if isinstance(code, int) and not isinstance(code, bool) else -1)
+        parameters.append(values if isinstance(values, list) else [])
+
+    successors, _ = build_flow_graph(codes, parameters)
+    ops = [
+        _compile_command(code, values, definitions)
+        for code, values in zip(codes, parameters, strict=True)
+    ]
+    return Program(ops, successors)
+
+
+def _compile_command(code: int, values: list[Any], definitions: dict[str, str]) -> tuple[Any, ...]:
+    skip = (_SKIP, None if code in _FLOW_CODES else code)
+    if code == _CONTROL_SWITCHES_CODE:
+        # [switch id(s)..., value]: 0 is ON, 1 is OFF
+        ids = tuple(value for value in values if definitions.get(value) == "switches")
+        return (_SWITCHES, ids, _to_int(values[-1]) != 1) if ids else skip
+    if code == _CONTROL_VARIABLES_CODE:
+        # [variable id(s)..., operation, operand type, operand...]
+        count = 0
+        while count < len(values) and definitions.get(values[count]) == "variables":
+            count += 1
+        ids = tuple(values[:count])
+        operation = _to_int(values[count]) if count < len(values) else None
+        operand = _operand(values[count + 1 :], definitions)
+        if not ids or operation not in range(6) or operand is None:
+            return skip
+        return (_VARIABLES, ids, operation, operand)
+    if code == _CONTROL_SELF_SWITCH_CODE:
+        if not values or values[0] not in _SELF_SWITCHES:
+            return skip
+        return (_SELF_SWITCH, values[0], len(values) < 2 or _to_int(values[1]) != 1)
+    if code == _CONDITIONAL_BRANCH_CODE:
+        return (_BRANCH, _condition(values, definitions))
+    if code in (_SHOW_CHOICES_CODE, BATTLE_CODE):
+        return (_CHOOSE, code)
+    if code == _COMMON_EVENT_CODE:
+        return (_CALL, str(values[0])) if values else skip
+    if code == _CHANGE_GOLD_CODE:
+        # [0 increase / 1 decrease, operand type, operand]
+        operation = _to_int(values[0]) if values else None
+        operand = _operand(values[1:], definitions)
+        if operation not in (0, 1) or operand is None or operand[0] == _RANDOM:
+            return skip
+        return (_GOLD, 1 - 2 * operation, operand)
+    if code == _CHANGE_ITEMS_CODE:
+        # [item id, 0 increase / 1 decrease, operand type, operand]
+        operation = _to_int(values[1]) if len(values) > 1 else None
+        operand = _operand(values[2:], definitions)
+        if operation not in (0, 1) or operand is None or operand[0] == _RANDOM:
+            return skip
+        return (_ITEMS, str(values[0]), 1 - 2 * operation, operand)
+    return skip
+
+
+def _condition(values: list[Any], definitions: dict[str, str]) -> tuple[Any, ...]:
+    kind = _to_int(values[0]) if values else None
+    if kind == 0 and len(values) > 1 and definitions.get(values[1]) == "switches":
+        return (0, values[1], len(values) < 3 or _to_int(values[2]) != 1)
+    if kind == 1 and len(values) > 4 and definitions.get(values[1]) == "variables":
+        operand = _operand(values[2:4], definitions)
+        comparison = _to_int(values[4])
+        if operand is not None and operand[0] != _RANDOM and comparison in range(len(_COMPARISONS)):
+            return (1, values[1], operand, comparison)
+    if kind == 2 and len(values) > 1 and values[1] in _SELF_SWITCHES:
+        return (2, values[1], len(values) < 3 or _to_int(values[2]) != 1)
+    if kind == 7 and len(values) > 2:
+        amount, comparison = _to_int(values[1]), _to_int(values[2])
+        if amount is not None and comparison in range(3):
+            return (7, amount, comparison)
+    if kind == 8 and len(values) > 1:
+        return (8, str(values[1]))
+    return (kind,)
+
+
+def _operand(values: list[Any], definitions: dict[str, str]) -> tuple[Any, ...] | None:
+    """Compile [type, value(s)]: 0 constant, 1 variable, 2 random range; None if unsupported."""
+    kind = _to_int(values[0]) if values else None
+    if kind == _CONSTANT and len(values) > 1 and _to_int(values[1]) is not None:
+        return (_CONSTANT, _to_int(values[1]))
+    if kind == _VARIABLE and len(values) > 1 and definitions.get(values[1]) == "variables":
+        return (_VARIABLE, values[1])
+    if kind == _RANDOM and len(values) > 2:
+        low, high = _to_int(values[1]), _to_int(values[2])
+        if low is not None and high is not None:
+            return (_RANDOM, min(low, high), max(low, high))
+    return None
+
+
+def _operate(operation: int, current: int, value: int) -> int:
+    if operation == 0:
+        return value
+    if operation == 1:
+        return current + value
+    if operation == 2:
+        return current - value
+    if operation == 3:
+        return current * value
+    if value == 0:
+        # Game_Variables would store NaN; keep the variable usable
+        return 0
+    if operation == 4:
+        return current // value
+    return current % value
+
+
+# ----------------------------------------------------------------------
+# State
+# ----------------------------------------------------------------------
+
+
+def _read_object(path: Path) -> dict[str, Any]:
+    try:
+        with path.open(encoding="utf-8-sig") as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        raise LocalDataUnavailable(f"Data file not parseable: {path} ({exc})") from exc
+    return data if isinstance(data, dict) else {}
+
+
+def _flag_values(value: Any, convert: Callable[[Any], Any]) -> dict[str, Any]:
+    """Read {id: value} or [{id, value}] save data, dropping entries of the wrong type."""
+    if isinstance(value, list):
+        value = {entry.get("id"): entry.get("value") for entry in value if isinstance(entry, dict)}
+    if not isinstance(value, dict):
+        return {}
+    flags = {}
+    for flag, flag_value in value.items():
+        try:
+            flags[str(flag)] = convert(flag_value)
+        except (TypeError, ValueError):
+            continue
+    return flags
+
+
+def _changes(before: dict[str, Any], after: dict[str, Any], default: Any) -> dict[str, Any]:
+    return {
+        key: {"before": before.get(key, default), "after": value}
+        for key, value in sorted(after.items())
+        if value != before.get(key, default)
+    }
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"expected true or false, got {value!r}")
+
+
+def _as_int(value: Any) -> int:
+    converted = _to_int(value) if not isinstance(value, bool) else None
+    if converted is None:
+        raise ValueError(f"expected an integer, got {value!r}")
+    return converted
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() else None
+
+
+event_interpreter = EventInterpreter(project_data_reader, reference_index)
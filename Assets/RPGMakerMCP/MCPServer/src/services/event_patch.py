@@ -0,0 +1,248 @@
+"""
+Command list patches for ``applyEventCommandPatch``.
+
+Editing a page with ``createEventCommand`` / ``updateEventCommand`` /
+``deleteEventCommand`` costs a round trip and a Unity save per command, and
+every insert or delete shifts the indices the next call has to use. A patch
+is an ordered list of edits that Unity applies with one save:
+
+- ``{"op": "insert", "index": i, "command": {...}}`` places a command before
+  command ``i`` (``i`` = command count appends),
+- ``{"op": "replace", "index": i, "command": {...}}``,
+- ``{"op": "delete", "index": i}``,
+- ``{"op": "move", "index": i, "to": j}`` places command ``i`` before
+  command ``j``.
+
+Every index refers to the list as it was before the patch, so edits never
+shift each other; commands placed before the same index keep the order of
+their edits. A command may be replaced, deleted or moved only once.
+
+``diff_commands`` computes a minimal patch from the old and the new list (a
+Myers shortest edit script, with adjacent delete/insert pairs turned into
+replaces and deleted commands that reappear elsewhere into moves), so a
+client can send the page it wants instead of the edits. ``apply_patch``
+applies a patch the way the Unity handler does.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+PATCH_OPERATION = "applyEventCommandPatch"
+
+PATCH_OPS = ("insert", "replace", "delete", "move")
+
+
+def normalize_command(command: Any) -> dict[str, Any]:
+    """Return a command the way Unity stores it: integer codes and indent, string parameters.
+
+    Raises:
+        ValueError: If the command is not an object or a code or its indent is not an integer
+    """
+    if not isinstance(command, dict):
+        raise ValueError(f"Invalid command: expected an object, got {type(command).__name__}")
+    try:
+        code = int(command.get("code", 0))
+        indent = int(command.get("indent", 0))
+        route = [
+            {
+                "code": int(step.get("code", 0)),
+                "codeIndex": int(step.get("codeIndex", 0)),
+                "parameters": _strings(step.get("parameters")),
+            }
+            for step in command.get("route") or []
+            if isinstance(step, dict)
+        ]
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            f"Invalid command: code, indent and route codes must be integers ({exc})"
+        ) from exc
+    return {
+        "code": code,
+        "indent": indent,
+        "parameters": _strings(command.get("parameters")),
+        "route": route,
+    }
+
+
+def diff_commands(old: list[dict[str, Any]], new: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return a minimal patch turning ``old`` into ``new``; empty if they are equal.
+
+    Raises:
+        ValueError: If a command is malformed
+    """
+    old_commands = [normalize_command(command) for command in old]
+    new_commands = [normalize_command(command) for command in new]
+    old_keys = [_key(command) for command in old_commands]
+    new_keys = [_key(command) for command in new_commands]
+    matches = _common_subsequence(old_keys, new_keys)
+
+    # Gaps between matched commands: (old start, old end, new start, new end)
+    gaps = []
+    old_start = new_start = 0
+    for old_index, new_index in [*matches, (len(old_keys), len(new_keys))]:
+        if old_index > old_start or new_index > new_start:
+            gaps.append((old_start, old_index, new_start, new_index))
+        old_start, new_start = old_index + 1, new_index + 1
+
+    # Replace pairwise within a gap; the rest are deletes and inserts before the gap's end
+    deleted: dict[str, list[int]] = {}
+    placements: list[tuple[int, int]] = []
+    replaces: list[tuple[int, int]] = []
+    for old_start, old_end, new_start, new_end in gaps:
+        paired = min(old_end - old_start, new_end - new_start)
+        replaces.extend((old_start + offset, new_start + offset) for offset in range(paired))
+        for old_index in range(old_start + paired, old_end):
+            deleted.setdefault(old_keys[old_index], []).append(old_index)
+        placements.extend((old_end, new_index) for new_index in range(new_start + paired, new_end))
+
+    edits: list[dict[str, Any]] = [
+        {"op": "replace", "index": old_index, "command": new_commands[new_index]}
+        for old_index, new_index in replaces
+    ]
+    moved: set[int] = set()
+    for target, new_index in placements:
+        candidates = deleted.get(new_keys[new_index])
+        if candidates:
+            old_index = candidates.pop(0)
+            moved.add(old_index)
+            edits.append({"op": "move", "index": old_index, "to": target})
+        else:
+            edits.append({"op": "insert", "index": target, "command": new_commands[new_index]})
+    edits.extend(
+        {"op": "delete", "index": old_index}
+        for indexes in deleted.values()
+        for old_index in indexes
+        if old_index not in moved
+    )
+    return edits
+
+
+def apply_patch(
+    commands: list[dict[str, Any]], edits: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Apply ``edits`` to ``commands``, resolving every index against the unpatched list.
+
+    Raises:
+        ValueError: If an edit is malformed, out of range or touches a command twice
+    """
+    count = len(commands)
+    before: list[list[dict[str, Any]]] = [[] for _ in range(count + 1)]
+    current: list[dict[str, Any] | None] = list(commands)
+    touched: set[int] = set()
+    for number, edit in enumerate(edits):
+        if not isinstance(edit, dict):
+            raise ValueError(f"Edit {number} must be an object")
+        op = edit.get("op")
+        if op not in PATCH_OPS:
+            raise ValueError(f"Edit {number}: unknown op {op!r}. Use {', '.join(PATCH_OPS)}")
+        index = edit.get("index")
+        highest = count if op == "insert" else count - 1
+        if not isinstance(index, int) or not 0 <= index <= highest:
+            raise ValueError(f"Edit {number} ({op}): index {index!r} is out of range 0-{highest}")
+        if op != "insert":
+            if index in touched:
+                raise ValueError(
+                    f"Edit {number} ({op}): command {index} is already replaced, deleted or moved"
+                )
+            touched.add(index)
+
+        if op == "insert":
+            before[index].append(normalize_command(edit.get("command")))
+        elif op == "replace":
+            current[index] = normalize_command(edit.get("command"))
+        elif op == "delete":
+            current[index] = None
+        else:
+            target = edit.get("to")
+            if not isinstance(target, int) or not 0 <= target <= count:
+                raise ValueError(
+                    f"Edit {number} (move): target {target!r} is out of range 0-{count}"
+                )
+            before[target].append(commands[index])
+            current[index] = None
+
+    patched: list[dict[str, Any]] = []
+    for index in range(count + 1):
+        patched.extend(before[index])
+        kept = current[index] if index < count else None
+        if kept is not None:
+            patched.append(kept)
+    return patched
+
+
+def _common_subsequence(old: list[str], new: list[str]) -> list[tuple[int, int]]:
+    """Return the (old, new) index pairs of a longest common subsequence (Myers' O(ND) algorithm)."""
+    # Equal ends are common to every solution and cheap to strip
+    prefix = 0
+    while prefix < len(old) and prefix < len(new) and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < len(old) - prefix
+        and suffix < len(new) - prefix
+        and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]
+    ):
+        suffix += 1
+    a = old[prefix : len(old) - suffix]
+    b = new[prefix : len(new) - suffix]
+
+    n, m = len(a), len(b)
+    furthest = {1: 0}
+    trace: list[dict[int, int]] = []
+    for depth in range(n + m + 1):
+        trace.append(dict(furthest))
+        done = False
+        for diagonal in range(-depth, depth + 1, 2):
+            if diagonal == -depth or (
+                diagonal != depth and furthest[diagonal - 1] < furthest[diagonal + 1]
+            ):
+                x = furthest[diagonal + 1]
+            else:
+                x = furthest[diagonal - 1] + 1
+            y = x - diagonal
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            furthest[diagonal] = x
+            if x >= n and y >= m:
+                done = True
+                break
+        if done:
+            break
+
+    pairs: list[tuple[int, int]] = []
+    x, y = n, m
+    for depth in range(len(trace) - 1, -1, -1):
+        furthest = trace[depth]
+        diagonal = x - y
+        if diagonal == -depth or (
+            diagonal != depth and furthest[diagonal - 1] < furthest[diagonal + 1]
+        ):
+            previous = diagonal + 1
+        else:
+            previous = diagonal - 1
+        previous_x = furthest[previous]
+        previous_y = previous_x - previous
+        while x > previous_x and y > previous_y:
+            x -= 1
+            y -= 1
+            pairs.append((prefix + x, prefix + y))
+        x, y = previous_x, previous_y
+
+    middle = sorted(pairs)
+    head = [(index, index) for index in range(prefix)]
+    tail = [(len(old) - suffix + index, len(new) - suffix + index) for index in range(suffix)]
+    return head + middle + tail
+
+
+def _key(command: dict[str, Any]) -> str:
+    return json.dumps(command, sort_keys=True, ensure_ascii=False)
+
+
+def _strings(values: Any) -> list[str]:
+    # Unity stores every parameter as a string, null as ""
+    if not isinstance(values, list):
+        return []
+    return ["" if value is None else str(value) for value in values]
@@ -0,0 +1,629 @@
+"""
+Project-wide validation of event pages and command lists.
+
+``validateEvent`` checks a single event inside Unity, on the editor thread, so
+checking a whole project takes thousands of round trips. ``EventValidator``
+checks every common event and map event page from the project files in one
+call:
+
+- the event checks of the Unity handler: missing name, no trigger conditions,
+  missing or empty command lists, negative command codes,
+- the minimum parameter count and the integer parameters of each known
+  command code,
+- references to common events, items, switches and variables that are not
+  defined anywhere (definitions come from the reference index),
+- conditional branch, loop, choice and battle blocks that are not closed, are
+  closed twice or end at another indent than they start, ``Break Loop``
+  outside a loop and jumps to labels that do not exist.
+
+Command files are parsed and checked in a process pool once there are enough
+of them to pay for starting the workers. The report counts issues by type and
+lists the events that have any, paginated like the list operations.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from config.constants import data_config
+from logger import logger
+from services.project_data_reader import (
+    EVENT_DIR,
+    EVENT_ENTITY,
+    LocalDataUnavailable,
+    ProjectDataReader,
+    paginate,
+    project_data_reader,
+    stat_data_files,
+)
+from services.reference_index import MAP_EVENT_ENTITY, ReferenceIndex, reference_index
+from utils.process_pool import map_chunks, pool_workers, split_chunks
+
+VALIDATE_ALL_OPERATION = "validateAllEvents"
+
+
+@dataclass(frozen=True)
+class CommandRule:
+    """What one command code requires of its parameter list."""
+
+    name: str
+    min_params: int = 0
+    # Positions that must hold integers (Unite stores them as strings)
+    int_params: tuple[int, ...] = ()
+    # (position, definition kind) of ids that must be defined
+    references: tuple[tuple[int, str], ...] = ()
+
+
+# Command codes shared by RPGMaker Unite and MV. Codes not listed here are
+# only checked for a valid code and a parameter list.
+COMMAND_RULES: dict[int, CommandRule] = {
+    101: CommandRule("Show Text"),
+    401: CommandRule("Text Line", 1),
+    102: CommandRule("Show Choices", 1),
+    402: CommandRule("When Choice", 1, int_params=(0,)),
+    403: CommandRule("When Cancel"),
+    404: CommandRule("End Choices"),
+    103: CommandRule("Input Number", 2, int_params=(1,)),
+    108: CommandRule("Comment", 1),
+    408: CommandRule("Comment Line", 1),
+    111: CommandRule("Conditional Branch", 1, int_params=(0,)),
+    411: CommandRule("Else"),
+    412: CommandRule("End Branch"),
+    112: CommandRule("Loop"),
+    413: CommandRule("Repeat Above"),
+    113: CommandRule("Break Loop"),
+    115: CommandRule("Exit Event Processing"),
+    117: CommandRule("Common Event", 1, references=((0, "commonEvents"),)),
+    118: CommandRule("Label", 1),
+    119: CommandRule("Jump to Label", 1),
+    125: CommandRule("Change Gold", 3, int_params=(0, 1)),
+    126: CommandRule("Change Items", 3, int_params=(1, 2), references=((0, "items"),)),
+    301: CommandRule("Battle Processing", 1),
+    601: CommandRule("If Win"),
+    602: CommandRule("If Escape"),
+    603: CommandRule("If Lose"),
+    604: CommandRule("End Battle"),
+}
+
+# Block start code -> (branch codes, end code)
+BLOCK_CODES: dict[int, tuple[tuple[int, ...], int]] = {
+    111: ((411,), 412),
+    112: ((), 413),
+    102: ((402, 403), 404),
+    301: ((601, 602, 603), 604),
+}
+BRANCH_OF = {branch: start for start, (branches, _) in BLOCK_CODES.items() for branch in branches}
+END_OF = {end: start for start, (_, end) in BLOCK_CODES.items()}
+# Branches a block may contain more than once (one per choice)
+_REPEATABLE_BRANCHES = {402}
+
+LOOP_CODE = 112
+BREAK_LOOP_CODE = 113
+LABEL_CODE = 118
+JUMP_CODE = 119
+BATTLE_CODE = 301
+
+# Condition keys holding flag ids, and the kind those ids must be defined as
+CONDITION_REFERENCES = {"switchId": "switches", "variableId": "variables"}
+
+_INT = re.compile(r"^-?\d+$")
+_PAGE = re.compile(r"-(\d+)$")
+
+_KIND_LABELS = {
+    "commonEvents": "common event",
+    "items": "item",
+    "switches": "switch",
+    "variables": "variable",
+}
+
+
+class EventValidator:
+    def __init__(
+        self,
+        reader: ProjectDataReader,
+        references: ReferenceIndex,
+        pool_min_files: int = data_config.EVENT_POOL_MIN_FILES,
+        max_workers: int = data_config.EVENT_POOL_MAX_WORKERS,
+    ) -> None:
+        self._reader = reader
+        self._references = references
+        self._pool_min_files = pool_min_files
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._files_checked = 0
+        self._last_workers = 0
+        self._last_run_ms = 0.0
+
+    def validate(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Validate every common and map event; returns the aggregated report.
+
+        Raises:
+            LocalDataUnavailable: If the project has no event data
+        """
+        started_at = time.perf_counter()
+        root = self._reader.storage_root
+        if not (root / EVENT_DIR).is_dir():
+            raise LocalDataUnavailable(f"Event directory not found: {root / EVENT_DIR}")
+
+        definitions = self._references.definitions()
+        known_kinds = set(definitions.values())
+        reports = self._event_reports(root, definitions, known_kinds)
+        paths = sorted(
+            path for path, *_ in stat_data_files([(root / EVENT_DIR, "*.json", EVENT_ENTITY, ())])
+        )
+        results, workers = self._check(paths, definitions)
+
+        command_count = 0
+        for path, record_id, commands, issues in results:
+            command_count += commands
+            stem = Path(path).stem
+            owner, page = _owner(stem, reports)
+            if owner is None:
+                owner = stem
+                reports[owner] = _report(str(record_id or stem), "", "unknown")
+                issues = [
+                    _issue(
+                        "warning",
+                        "orphanPage",
+                        "Event page file belongs to no common or map event.",
+                    ),
+                    *issues,
+                ]
+            report = reports[owner]
+            report["pagesFound"].add(page)
+            report["commandCount"] += commands
+            report["issues"].extend(dict(issue, page=page) for issue in issues)
+
+        counts: Counter[str] = Counter()
+        severities: Counter[str] = Counter()
+        flagged = []
+        for report in sorted(reports.values(), key=_report_order):
+            for page in range(report["pageCount"]):
+                if page not in report["pagesFound"]:
+                    report["issues"].append(
+                        _issue("error", "missingData", "Event data is missing.", page=page)
+                    )
+            report.pop("pagesFound")
+            report["issueCount"] = len(report["issues"])
+            for issue in report["issues"]:
+                counts[issue["type"]] += 1
+                severities[issue["severity"]] += 1
+            if report["issues"]:
+                flagged.append(report)
+
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        with self._lock:
+            self._runs += 1
+            self._files_checked += len(paths)
+            self._last_workers = workers
+            self._last_run_ms = elapsed_ms
+
+        return {
+            **paginate("events", flagged, payload),
+            "valid": severities["error"] == 0,
+            "eventCount": len(reports),
+            "pageCount": len(paths),
+            "commandCount": command_count,
+            "issueCount": sum(severities.values()),
+            "errorCount": severities["error"],
+            "warningCount": severities["warning"],
+            "issuesByType": dict(sorted(counts.items())),
+            "workers": workers,
+            "elapsedMs": round(elapsed_ms, 3),
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "runs": self._runs,
+            "filesChecked": self._files_checked,
+            "lastWorkers": self._last_workers,
+            "lastRunMs": round(self._last_run_ms, 3),
+        }
+
+    def _event_reports(
+        self, root: Path, definitions: dict[str, str], known_kinds: set[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Build one report per common and map event with its event-level issues."""
+        reports: dict[str, dict[str, Any]] = {}
+        targets = [
+            (root / "Event" / "JSON", "eventCommon*.json", "commonEvents", ()),
+            (root / "Event" / "JSON", "eventMap*.json", MAP_EVENT_ENTITY, ()),
+        ]
+        for path, _, _, entity, _ in stat_data_files(targets):
+            try:
+                records = self._reader.reload(Path(path)) or []
+            except LocalDataUnavailable as exc:
+                logger.debug("Event validation skipped %s: %s", path, exc)
+                continue
+            for record in records:
+                event_id = record.get("eventId")
+                if not isinstance(event_id, str) or not event_id:
+                    continue
+                if entity == "commonEvents":
+                    report = _report(event_id, record.get("name"), "common")
+                    conditions = record.get("conditions") or []
+                    if not conditions:
+                        report["issues"].append(
+                            _issue("warning", "noConditions", "Event has no trigger conditions.")
+                        )
+                    report["issues"].extend(
+                        _condition_issues(conditions, definitions, known_kinds, None)
+                    )
+                else:
+                    report = _report(event_id, record.get("name"), "map", record.get("mapId"))
+                    pages = record.get("pages") or []
+                    report["pageCount"] = len(pages)
+                    for page, page_data in enumerate(pages):
+                        report["issues"].extend(
+                            _condition_issues(page_data, definitions, known_kinds, page)
+                        )
+                if not report["name"]:
+                    report["issues"].insert(0, _issue("warning", "noName", "Event has no name."))
+                reports[event_id] = report
+        return reports
+
+    def _check(
+        self, paths: list[str], definitions: dict[str, str]
+    ) -> tuple[list[tuple[str, Any, int, list[dict[str, Any]]]], int]:
+        """Check the command files, in a process pool if there are enough; returns (results, workers)."""
+        workers = pool_workers(self._max_workers)
+        if len(paths) < self._pool_min_files or workers < 2:
+            return _check_files(paths, definitions), 1
+
+        try:
+            results = map_chunks(
+                _check_chunk, split_chunks(paths, workers), workers, _init_worker, (definitions,)
+            )
+        except (OSError, BrokenProcessPool) as exc:
+            logger.warning("Event validation pool failed, checking in-process: %s", exc)
+            return _check_files(paths, definitions), 1
+        return results, workers
+
+
+# ----------------------------------------------------------------------
+# Checks (run in the worker processes)
+# ----------------------------------------------------------------------
+
+_worker_definitions: dict[str, str] = {}
+
+
+def _init_worker(definitions: dict[str, str]) -> None:
+    global _worker_definitions
+    _worker_definitions = definitions
+
+
+def _check_chunk(paths: list[str]) -> list[tuple[str, Any, int, list[dict[str, Any]]]]:
+    return _check_files(paths, _worker_definitions)
+
+
+def _check_files(
+    paths: list[str], definitions: dict[str, str]
+) -> list[tuple[str, Any, int, list[dict[str, Any]]]]:
+    """Return (path, record id, command count, issues) for each command file."""
+    known_kinds = set(definitions.values())
+    results = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8-sig") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as exc:
+            results.append(
+                (
+                    path,
+                    None,
+                    0,
+                    [_issue("error", "unreadable", f"Event data is not readable: {exc}")],
+                )
+            )
+            continue
+        commands = data.get("eventCommands") if isinstance(data, dict) else None
+        record_id = data.get("id") if isinstance(data, dict) else None
+        if not isinstance(commands, list):
+            results.append(
+                (path, record_id, 0, [_issue("error", "missingData", "Event data is missing.")])
+            )
+            continue
+        if not commands:
+            results.append(
+                (path, record_id, 0, [_issue("warning", "noCommands", "Event has no commands.")])
+            )
+            continue
+        results.append(
+            (path, record_id, len(commands), check_commands(commands, definitions, known_kinds))
+        )
+    return results
+
+
+def check_commands(
+    commands: list[Any], definitions: dict[str, str], known_kinds: set[str] | None = None
+) -> list[dict[str, Any]]:
+    """Check one command list: codes, parameters, references and block structure."""
+    if known_kinds is None:
+        known_kinds = set(definitions.values())
+    issues: list[dict[str, Any]] = []
+    # Open blocks: [start code, command index, indent, branch codes seen]
+    blocks: list[list[Any]] = []
+    labels: set[str] = set()
+    jumps: list[tuple[int, str]] = []
+
+    for index, command in enumerate(commands):
+        if not isinstance(command, dict):
+            issues.append(
+                _issue("error", "invalidCommand", f"Command {index} is not an object", index)
+            )
+            continue
+        code = command.get("code")
+        if not isinstance(code, int) or isinstance(code, bool) or code < 0:
+            issues.append(
+                _issue("error", "invalidCode", f"Command {index} has invalid code: {code}", index)
+            )
+            continue
+        parameters = command.get("parameters")
+        if parameters is None:
+            parameters = []
+        elif not isinstance(parameters, list):
+            issues.append(
+                _issue(
+                    "error",
+                    "parameterType",
+                    f"Command {index} parameters are not a list",
+                    index,
+                    code,
+                )
+            )
+            parameters = []
+        indent = command.get("indent")
+        indent = indent if isinstance(indent, int) and not isinstance(indent, bool) else None
+
+        rule = COMMAND_RULES.get(code)
+        if rule is not None:
+            issues.extend(
+                _parameter_issues(index, code, rule, parameters, definitions, known_kinds)
+            )
+
+        if code in BLOCK_CODES and (
+            code != BATTLE_CODE or _next_code(commands, index) in BLOCK_CODES[code][0]
+        ):
+            blocks.append([code, index, indent, set()])
+        elif code in BRANCH_OF or code in END_OF:
+            start = BRANCH_OF.get(code) or END_OF[code]
+            issues.extend(_close_blocks(blocks, start, index, code, indent))
+            if blocks and blocks[-1][0] == start:
+                if code in END_OF:
+                    blocks.pop()
+                elif code in blocks[-1][3] and code not in _REPEATABLE_BRANCHES:
+                    issues.append(
+                        _issue(
+                            "error",
+                            "unbalancedBlock",
+                            f"Command {index} ({_name(code)}) appears twice in one block",
+                            index,
+                            code,
+                        )
+                    )
+                else:
+                    blocks[-1][3].add(code)
+
+        if code == BREAK_LOOP_CODE and not any(block[0] == LOOP_CODE for block in blocks):
+            issues.append(
+                _issue(
+                    "error",
+                    "breakOutsideLoop",
+                    f"Command {index} (Break Loop) is not inside a loop",
+                    index,
+                    code,
+                )
+            )
+        elif code == LABEL_CODE and parameters:
+            labels.add(str(parameters[0]))
+        elif code == JUMP_CODE and parameters:
+            jumps.append((index, str(parameters[0])))
+
+    for start, index, _, _ in blocks:
+        issues.append(
+            _issue(
+                "error",
+                "unbalancedBlock",
+                f"Command {index} ({_name(start)}) is never closed",
+                index,
+                start,
+            )
+        )
+    for index, label in jumps:
+        if label not in labels:
+            issues.append(
+                _issue(
+                    "error",
+                    "missingLabel",
+                    f"Command {index} jumps to missing label '{label}'",
+                    index,
+                    JUMP_CODE,
+                )
+            )
+    return issues
+
+
+def _parameter_issues(
+    index: int,
+    code: int,
+    rule: CommandRule,
+    parameters: list[Any],
+    definitions: dict[str, str],
+    known_kinds: set[str],
+) -> list[dict[str, Any]]:
+    issues = []
+    if len(parameters) < rule.min_params:
+        issues.append(
+            _issue(
+                "error",
+                "parameterCount",
+                f"Command {index} ({rule.name}) needs at least {rule.min_params} parameters, has {len(parameters)}",
+                index,
+                code,
+            )
+        )
+    for position in rule.int_params:
+        if position < len(parameters) and not _is_int(parameters[position]):
+            issues.append(
+                _issue(
+                    "error",
+                    "parameterType",
+                    f"Command {index} ({rule.name}) parameter {position} must be an integer, got {parameters[position]!r}",
+                    index,
+                    code,
+                )
+            )
+    for position, kind in rule.references:
+        # Kinds without any definitions are missing data, not dangling references
+        if position < len(parameters) and kind in known_kinds:
+            issue = _reference_issue(
+                parameters[position], kind, definitions, f"Command {index} ({rule.name})"
+            )
+            if issue is not None:
+                issues.append(dict(issue, commandIndex=index, code=code))
+    return issues
+
+
+def _close_blocks(
+    blocks: list[list[Any]], start: int, index: int, code: int, indent: int | None
+) -> list[dict[str, Any]]:
+    """Report the blocks left open inside the one ``code`` branches or ends, or a stray ``code``."""
+    issues = []
+    if not any(block[0] == start for block in blocks):
+        return [
+            _issue(
+                "error",
+                "unbalancedBlock",
+                f"Command {index} ({_name(code)}) has no matching {_name(start)}",
+                index,
+                code,
+            )
+        ]
+    while blocks[-1][0] != start:
+        inner, inner_index, _, _ = blocks.pop()
+        issues.append(
+            _issue(
+                "error",
+                "unbalancedBlock",
+                f"Command {inner_index} ({_name(inner)}) is never closed",
+                inner_index,
+                inner,
+            )
+        )
+    block_indent = blocks[-1][2]
+    if indent is not None and block_indent is not None and indent != block_indent:
+        issues.append(
+            _issue(
+                "warning",
+                "indentMismatch",
+                f"Command {index} ({_name(code)}) is at indent {indent}, its {_name(start)} at {block_indent}",
+                index,
+                code,
+            )
+        )
+    return issues
+
+
+def _condition_issues(
+    value: Any, definitions: dict[str, str], known_kinds: set[str], page: int | None
+) -> list[dict[str, Any]]:
+    """Check the switch and variable ids in page or common event conditions."""
+    issues = []
+    if isinstance(value, dict):
+        # Disabled condition slots keep the id of whatever was selected last
+        if value.get("enabled") in (False, 0):
+            return []
+        for key, child in value.items():
+            kind = CONDITION_REFERENCES.get(key)
+            if kind is not None and kind in known_kinds:
+                issue = _reference_issue(child, kind, definitions, "Trigger condition")
+                if issue is not None:
+                    issues.append(issue if page is None else dict(issue, page=page))
+            else:
+                issues.extend(_condition_issues(child, definitions, known_kinds, page))
+    elif isinstance(value, list):
+        for child in value:
+            issues.extend(_condition_issues(child, definitions, known_kinds, page))
+    return issues
+
+
+def _reference_issue(
+    value: Any, kind: str, definitions: dict[str, str], subject: str
+) -> dict[str, Any] | None:
+    if not isinstance(value, str) or not value:
+        return None
+    if definitions.get(value) == kind:
+        return None
+    label = _KIND_LABELS.get(kind, kind)
+    return _issue("error", "danglingReference", f"{subject} references unknown {label} {value}")
+
+
+def _issue(
+    severity: str,
+    issue_type: str,
+    message: str,
+    command_index: int | None = None,
+    code: int | None = None,
+    **extra: Any,
+) -> dict[str, Any]:
+    issue: dict[str, Any] = {"severity": severity, "type": issue_type, "message": message}
+    if command_index is not None:
+        issue["commandIndex"] = command_index
+    if code is not None:
+        issue["code"] = code
+    issue.update(extra)
+    return issue
+
+
+def _report(event_id: str, name: Any, event_kind: str, map_id: Any = None) -> dict[str, Any]:
+    report: dict[str, Any] = {"uuId": event_id, "name": str(name or ""), "eventKind": event_kind}
+    if event_kind == "map":
+        report["mapId"] = map_id
+    report.update(
+        pageCount=1 if event_kind == "common" else 0, pagesFound=set(), commandCount=0, issues=[]
+    )
+    return report
+
+
+def _owner(stem: str, reports: dict[str, dict[str, Any]]) -> tuple[str | None, int]:
+    """Return (event id, page) for a command file name (``{id}`` or ``{id}-{page}``)."""
+    if stem in reports:
+        return stem, 0
+    match = _PAGE.search(stem)
+    if match and stem[: match.start()] in reports:
+        return stem[: match.start()], int(match.group(1))
+    return None, 0
+
+
+def _report_order(report: dict[str, Any]) -> tuple[str, str, str, str]:
+    return (report["eventKind"], str(report.get("mapId") or ""), report["name"], report["uuId"])
+
+
+def _next_code(commands: list[Any], index: int) -> Any:
+    following = commands[index + 1] if index + 1 < len(commands) else None
+    return following.get("code") if isinstance(following, dict) else None
+
+
+def _name(code: int) -> str:
+    rule = COMMAND_RULES.get(code)
+    return rule.name if rule is not None else f"code {code}"
+
+
+def _is_int(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (
+        isinstance(value, str) and _INT.match(value.strip()) is not None
+    )
+
+
+event_validator = EventValidator(project_data_reader, reference_index)
@@ -0,0 +1,215 @@
+"""
+Exception fingerprinting for Unity Editor.log.
+
+Unity writes every runtime exception as a header line followed by its stack
+trace. Identical failures raised every frame produce thousands of copies of the
+same block, so this module groups the lines of each block, reduces the stack
+frames to a stable fingerprint and keeps one counter per fingerprint in a
+bounded table.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+# Maximum number of distinct fingerprints kept in memory (least recently seen evicted)
+MAX_FINGERPRINTS = 256
+
+# Number of leading stack frames that contribute to a fingerprint
+MAX_FINGERPRINT_FRAMES = 12
+
+# Sample message length kept per fingerprint
+MAX_MESSAGE_CHARS = 500
+
+# "NullReferenceException: ..." / "System.IO.IOException: ..." / "UnityException"
+_HEADER_PATTERN = re.compile(
+    r"^(?P<type>(?:[A-Za-z_][\w`]*\.)*[A-Za-z_][\w`]*(?:Exception|Error))(?::\s*(?P<message>.*))?$"
+)
+
+# Mono style: "  at Foo.Bar (System.String x) [0x00012] in /path/Foo.cs:45"
+_MONO_FRAME_PATTERN = re.compile(r"^\s+at\s+(?P<frame>.+)$")
+
+# Unity style: "Foo.Bar:Baz (int) (at Assets/Foo.cs:12)" / "UnityEngine.Debug:LogError (object)"
+_UNITY_FRAME_PATTERN = re.compile(r"^(?P<frame>[^\s(]+\s?\(.*?\))(?:\s+\(at\s+.*\))?\s*$")
+
+# Lines that belong to a stack trace but carry no frame information
+_TRACE_NOISE_PATTERN = re.compile(r"^\s*(?:--- End of .*---|\(Filename: .*\)|Rethrow as .*)\s*$")
+
+_LOCATION_PATTERN = re.compile(r"\s+(?:\[0x[0-9a-fA-F]+\]\s*)?in\s+\S.*$")
+_ADDRESS_PATTERN = re.compile(r"\[0x[0-9a-fA-F]+\]|0x[0-9a-fA-F]+")
+_NUMBER_PATTERN = re.compile(r"\d+")
+_QUOTED_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"")
+
+
+def normalize_frame(frame: str) -> str:
+    """Strip file locations, IL offsets and compiler-generated numbers from a frame."""
+    normalized = _LOCATION_PATTERN.sub("", frame.strip())
+    normalized = re.sub(r"\s+\(at\s+.*\)$", "", normalized)
+    normalized = _ADDRESS_PATTERN.sub("0x?", normalized)
+    # Lambda/closure names such as <Update>b__12_0 change between builds
+    normalized = _NUMBER_PATTERN.sub("N", normalized)
+    return normalized
+
+
+def normalize_message(message: str) -> str:
+    """Reduce a message to a shape that ignores ids, counts and quoted names."""
+    return _NUMBER_PATTERN.sub("N", _QUOTED_PATTERN.sub("'?'", message.strip()))
+
+
+def compute_fingerprint(exception_type: str, frames: list[str], message: str = "") -> str:
+    """Return a stable fingerprint for an exception type and its normalized frames.
+
+    Exceptions without a stack trace fall back to the normalized message so that
+    unrelated frameless errors of the same type are not merged.
+    """
+    parts = [exception_type]
+    if frames:
+        parts.extend(frames)
+    else:
+        parts.append(normalize_message(message))
+    digest = hashlib.sha1("\n".join(parts).encode("utf-8", errors="replace"))
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class ExceptionRecord:
+    fingerprint: str
+    exception_type: str
+    message: str
+    frames: list[str]
+    count: int
+    first_seen: float
+    last_seen: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "exceptionType": self.exception_type,
+            "message": self.message,
+            "frames": list(self.frames),
+            "count": self.count,
+            "firstSeen": self.first_seen,
+            "lastSeen": self.last_seen,
+        }
+
+
+@dataclass
+class _PendingBlock:
+    exception_type: str
+    message: str
+    started_at: float
+    frames: list[str] = field(default_factory=list)
+
+
+class ExceptionAggregator:
+    """Group multi-line exception blocks and count them per fingerprint.
+
+    Lines are fed one at a time. A block starts at an exception header and ends
+    at the first line that is neither a stack frame nor trace noise. Memory is
+    bounded by ``max_fingerprints`` records of at most ``max_frames`` frames each.
+    """
+
+    def __init__(
+        self,
+        max_fingerprints: int = MAX_FINGERPRINTS,
+        max_frames: int = MAX_FINGERPRINT_FRAMES,
+    ) -> None:
+        self._max_fingerprints = max(1, max_fingerprints)
+        self._max_frames = max(1, max_frames)
+        self._records: OrderedDict[str, ExceptionRecord] = OrderedDict()
+        self._pending: _PendingBlock | None = None
+        self._total_occurrences = 0
+        self._evicted = 0
+
+    def feed(self, line: str, seen_at: float) -> ExceptionRecord | None:
+        """Consume one log line.
+
+        Returns the record updated by a block that this line completed, if any.
+        A returned record with ``count == 1`` is a newly seen fingerprint.
+        """
+        pending = self._pending
+        header = _HEADER_PATTERN.match(line.strip())
+        if pending is not None and header is None:
+            frame = _match_frame(line)
+            if frame is not None:
+                if len(pending.frames) < self._max_frames:
+                    pending.frames.append(normalize_frame(frame))
+                return None
+            if _TRACE_NOISE_PATTERN.match(line):
+                return None
+
+        completed = self.flush(seen_at) if pending is not None else None
+
+        if header is not None:
+            self._pending = _PendingBlock(
+                exception_type=header.group("type"),
+                message=(header.group("message") or "")[:MAX_MESSAGE_CHARS],
+                started_at=seen_at,
+            )
+        return completed
+
+    def flush(self, seen_at: float) -> ExceptionRecord | None:
+        """Finalize the block in progress, if any."""
+        pending = self._pending
+        if pending is None:
+            return None
+        self._pending = None
+
+        fingerprint = compute_fingerprint(pending.exception_type, pending.frames, pending.message)
+        self._total_occurrences += 1
+
+        record = self._records.get(fingerprint)
+        if record is not None:
+            record.count += 1
+            record.last_seen = seen_at
+            record.message = pending.message
+            self._records.move_to_end(fingerprint)
+            return record
+
+        record = ExceptionRecord(
+            fingerprint=fingerprint,
+            exception_type=pending.exception_type,
+            message=pending.message,
+            frames=pending.frames,
+            count=1,
+            first_seen=pending.started_at,
+            last_seen=seen_at,
+        )
+        self._records[fingerprint] = record
+        while len(self._records) > self._max_fingerprints:
+            self._records.popitem(last=False)
+            self._evicted += 1
+        return record
+
+    def records(self, limit: int | None = None) -> list[ExceptionRecord]:
+        """Return records ordered by most recently seen first."""
+        ordered = list(reversed(self._records.values()))
+        return ordered if limit is None else ordered[: max(0, limit)]
+
+    def summary(self, limit: int | None = None) -> dict[str, Any]:
+        return {
+            "fingerprintCount": len(self._records),
+            "totalOccurrences": self._total_occurrences,
+            "evictedFingerprints": self._evicted,
+            "exceptions": [record.to_dict() for record in self.records(limit)],
+        }
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._pending = None
+        self._total_occurrences = 0
+        self._evicted = 0
+
+
+def _match_frame(line: str) -> str | None:
+    mono = _MONO_FRAME_PATTERN.match(line)
+    if mono is not None:
+        return mono.group("frame")
+    unity = _UNITY_FRAME_PATTERN.match(line)
+    if unity is not None:
+        return unity.group("frame")
+    return None
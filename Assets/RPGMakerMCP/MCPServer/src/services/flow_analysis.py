@@ -0,0 +1,633 @@
+"""
+Static flow analysis of event pages and of the switches and variables
+connecting them.
+
+Agents editing events introduce bugs that no single command is wrong for:
+code after ``Exit Event Processing``, loops nothing breaks out of, labels
+nothing jumps to, pages whose conditions can never all be true because no
+command ever sets the switch they wait for. ``FlowAnalyzer`` finds them with
+two graphs:
+
+- a control-flow graph per page (one node per command plus an end node, with
+  edges for fall-through, branches, loop back edges, breaks, jumps and
+  exits). Commands not reachable from the first one are dead code; a loop
+  from which no node outside it is reachable never ends.
+- a project-wide effect graph: pages and common events enable each other
+  through the switches, variables and self switches their reachable commands
+  set and their conditions require, and common events are enabled by the
+  pages calling them. Starting from the pages and common events without
+  conditions, a worklist propagation (AND over a page's conditions, OR over
+  the writers of a flag) finds the pages that can never become active.
+
+Flags are recognised by their ids: a switch or variable id (from the
+reference index) among the parameters of Control Switches/Variables or a
+Conditional Branch, a self switch letter in Control Self Switch. If a
+project has no writes of a kind at all, conditions of that kind are assumed
+satisfiable rather than reported.
+
+Pages are parsed and walked in a process pool, one unit of work per map
+(common events form one more unit), once there are enough of them.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from config.constants import data_config
+from logger import logger
+from services.event_validator import (
+    BATTLE_CODE,
+    BLOCK_CODES,
+    BRANCH_OF,
+    BREAK_LOOP_CODE,
+    END_OF,
+    JUMP_CODE,
+    LABEL_CODE,
+    LOOP_CODE,
+)
+from services.project_data_reader import (
+    EVENT_DIR,
+    EVENT_ENTITY,
+    LocalDataUnavailable,
+    ProjectDataReader,
+    paginate,
+    project_data_reader,
+    stat_data_files,
+)
+from services.reference_index import MAP_EVENT_ENTITY, ReferenceIndex, reference_index
+from utils.process_pool import map_chunks, pool_workers
+
+FLOW_ANALYSIS_OPERATION = "analyzeEventFlow"
+
+_CONDITIONAL_BRANCH_CODE = 111
+_EXIT_CODE = 115
+_COMMON_EVENT_CODE = 117
+_CONTROL_SWITCHES_CODE = 121
+_CONTROL_VARIABLES_CODE = 122
+_CONTROL_SELF_SWITCH_CODE = 123
+
+# Block markers and list terminators; unreachable ones are not dead code
+_STRUCTURAL_CODES = {0, *BRANCH_OF, *END_OF}
+
+_SELF_SWITCHES = ("A", "B", "C", "D")
+
+# (kind, flag) a page requires or a command sets; self switches are (event id, letter)
+Flag = tuple[str, Any]
+
+
+class FlowAnalyzer:
+    def __init__(
+        self,
+        reader: ProjectDataReader,
+        references: ReferenceIndex,
+        pool_min_files: int = data_config.EVENT_POOL_MIN_FILES,
+        max_workers: int = data_config.EVENT_POOL_MAX_WORKERS,
+    ) -> None:
+        self._reader = reader
+        self._references = references
+        self._pool_min_files = pool_min_files
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._last_workers = 0
+        self._last_run_ms = 0.0
+
+    def analyze(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Analyze every common and map event page; returns the paginated findings.
+
+        Raises:
+            LocalDataUnavailable: If the project has no event data
+        """
+        started_at = time.perf_counter()
+        root = self._reader.storage_root
+        if not (root / EVENT_DIR).is_dir():
+            raise LocalDataUnavailable(f"Event directory not found: {root / EVENT_DIR}")
+
+        definitions = self._references.definitions()
+        events = self._events(root, definitions)
+        files = {
+            Path(path).stem: path
+            for path, *_ in stat_data_files([(root / EVENT_DIR, "*.json", EVENT_ENTITY, ())])
+        }
+        units: dict[str, list[tuple[str, int, str]]] = {}
+        for event_id, event in events.items():
+            for page in range(len(event["requires"])):
+                path = files.get(f"{event_id}-{page}") or (
+                    files.get(event_id) if page == 0 else None
+                )
+                if path is not None:
+                    units.setdefault(str(event.get("mapId") or "common"), []).append(
+                        (event_id, page, path)
+                    )
+
+        pages, workers = self._walk(list(units.values()), definitions)
+        findings = [
+            dict(finding, **_location(events[page["uuId"]], page["page"]))
+            for page in pages
+            for finding in page["findings"]
+        ]
+        effects = _propagate(events, pages)
+        findings.extend(effects.pop("findings"))
+        findings.sort(key=_finding_order)
+
+        counts = Counter(finding["type"] for finding in findings)
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        with self._lock:
+            self._runs += 1
+            self._last_workers = workers
+            self._last_run_ms = elapsed_ms
+
+        return {
+            **paginate("findings", findings, payload),
+            "eventCount": len(events),
+            "pageCount": len(pages),
+            "commandCount": sum(page["commandCount"] for page in pages),
+            "findingsByType": dict(sorted(counts.items())),
+            "flagEffects": effects,
+            "mapCount": sum(1 for key in units if key != "common"),
+            "workers": workers,
+            "elapsedMs": round(elapsed_ms, 3),
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "runs": self._runs,
+            "lastWorkers": self._last_workers,
+            "lastRunMs": round(self._last_run_ms, 3),
+        }
+
+    def _events(self, root: Path, definitions: dict[str, str]) -> dict[str, dict[str, Any]]:
+        """Return the common and map events with the flags each page requires."""
+        events: dict[str, dict[str, Any]] = {}
+        targets = [
+            (root / "Event" / "JSON", "eventCommon*.json", "commonEvents", ()),
+            (root / "Event" / "JSON", "eventMap*.json", MAP_EVENT_ENTITY, ()),
+        ]
+        for path, _, _, entity, _ in stat_data_files(targets):
+            try:
+                records = self._reader.reload(Path(path)) or []
+            except LocalDataUnavailable as exc:
+                logger.debug("Flow analysis skipped %s: %s", path, exc)
+                continue
+            for record in records:
+                event_id = record.get("eventId")
+                if not isinstance(event_id, str) or not event_id:
+                    continue
+                event: dict[str, Any] = {"uuId": event_id, "name": str(record.get("name") or "")}
+                if entity == "commonEvents":
+                    event["eventKind"] = "common"
+                    # Common events without a trigger run when called, possibly from the database
+                    triggered = [
+                        condition
+                        for condition in record.get("conditions") or []
+                        if isinstance(condition, dict) and condition.get("trigger")
+                    ]
+                    event["requires"] = [
+                        sorted(set(_requirements(triggered, event_id, definitions)), key=repr)
+                    ]
+                else:
+                    event["eventKind"] = "map"
+                    event["mapId"] = record.get("mapId")
+                    event["requires"] = [
+                        sorted(set(_requirements(page, event_id, definitions)), key=repr)
+                        for page in record.get("pages") or []
+                    ]
+                events[event_id] = event
+        return events
+
+    def _walk(
+        self, units: list[list[tuple[str, int, str]]], definitions: dict[str, str]
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Walk the pages of every unit (map), in a process pool if there are enough; returns (pages, workers)."""
+        workers = pool_workers(self._max_workers)
+        if sum(len(unit) for unit in units) < self._pool_min_files or workers < 2:
+            return _walk_units(units, definitions), 1
+
+        # Whole maps per chunk, largest first into the emptiest of a few bins per worker
+        bins: list[list[list[tuple[str, int, str]]]] = [
+            [] for _ in range(min(len(units), workers * 4))
+        ]
+        sizes = [0] * len(bins)
+        for unit in sorted(units, key=len, reverse=True):
+            smallest = sizes.index(min(sizes))
+            bins[smallest].append(unit)
+            sizes[smallest] += len(unit)
+        try:
+            pages = map_chunks(_walk_chunk, bins, workers, _init_worker, (definitions,))
+        except (OSError, BrokenProcessPool) as exc:
+            logger.warning("Flow analysis pool failed, walking in-process: %s", exc)
+            return _walk_units(units, definitions), 1
+        return pages, workers
+
+
+# ----------------------------------------------------------------------
+# Effect graph
+# ----------------------------------------------------------------------
+
+
+def _propagate(events: dict[str, dict[str, Any]], pages: list[dict[str, Any]]) -> dict[str, Any]:
+    """Find the pages that can never become active; returns the flag summary and findings."""
+    writes: dict[tuple[str, int], set[Flag]] = {}
+    calls: dict[tuple[str, int], list[str]] = {}
+    reads: set[Flag] = set()
+    written_kinds: set[str] = set()
+    for page in pages:
+        node = (page["uuId"], page["page"])
+        page_writes = {("switches", flag) for flag in page["switchWrites"]}
+        page_writes.update(("variables", flag) for flag in page["variableWrites"])
+        if events[page["uuId"]]["eventKind"] == "map":
+            # In a common event, Control Self Switch acts on whichever event called it
+            page_writes.update(
+                ("selfSwitches", (page["uuId"], letter)) for letter in page["selfSwitchWrites"]
+            )
+        writes[node] = page_writes
+        written_kinds.update(kind for kind, _ in page_writes)
+        calls[node] = page["calls"]
+        reads.update(("switches", flag) for flag in page["switchReads"])
+
+    # Kinds nothing writes are probably stored in a way the analysis does not recognise
+    requires: dict[tuple[str, int], list[Flag]] = {}
+    required: set[Flag] = set()
+    waiting: dict[Flag, list[tuple[str, int]]] = {}
+    pending: dict[tuple[str, int], int] = {}
+    queue: deque[tuple[str, int]] = deque()
+    for event_id, event in events.items():
+        for page_index, page_requires in enumerate(event["requires"]):
+            node = (event_id, page_index)
+            required.update(page_requires)
+            requires[node] = [flag for flag in page_requires if flag[0] in written_kinds]
+            pending[node] = len(requires[node])
+            for flag in requires[node]:
+                waiting.setdefault(flag, []).append(node)
+            if not requires[node]:
+                queue.append(node)
+
+    active: set[tuple[str, int]] = set()
+    settable: set[Flag] = set()
+    while queue:
+        node = queue.popleft()
+        if node in active:
+            continue
+        active.add(node)
+        for flag in writes.get(node, ()):
+            if flag in settable:
+                continue
+            settable.add(flag)
+            for waiter in waiting.get(flag, ()):
+                pending[waiter] -= 1
+                if pending[waiter] == 0:
+                    queue.append(waiter)
+        for callee in calls.get(node, ()):
+            # A called common event runs whatever its trigger switch says
+            if callee in events and events[callee]["eventKind"] == "common":
+                queue.append((callee, 0))
+
+    findings = []
+    for node, flag_list in requires.items():
+        if node in active:
+            continue
+        event = events[node[0]]
+        blockers = [flag for flag in flag_list if flag not in settable]
+        described = ", ".join(_describe(flag) for flag in blockers)
+        blocked_by = [
+            {"kind": kind, "id": value[1] if kind == "selfSwitches" else value}
+            for kind, value in blockers
+        ]
+        findings.append(
+            {
+                "type": "unreachablePage" if event["eventKind"] == "map" else "unreachableEvent",
+                "severity": "warning",
+                "message": f"Conditions can never all be true: {described} is never set by a reachable command",
+                "blockedBy": blocked_by,
+                **_location(event, node[1]),
+            }
+        )
+
+    written: set[Flag] = set()
+    for node in active:
+        written.update(writes.get(node, ()))
+    for flag in sorted(written - reads - required, key=repr):
+        kind, value = flag
+        if kind == "variables":
+            # Variables are also read by text codes, formulas and scripts
+            continue
+        finding = {
+            "type": "flagNeverRead",
+            "severity": "info",
+            "message": f"{_describe(flag).capitalize()} is set but no page condition or branch reads it",
+            "kind": kind,
+            "id": value,
+        }
+        if kind == "selfSwitches":
+            finding.update(id=value[1], **_location(events[value[0]], None))
+        findings.append(finding)
+
+    summary: dict[str, Any] = {
+        kind: {
+            "written": sum(1 for flag in written if flag[0] == kind),
+            "required": sum(1 for flag in required if flag[0] == kind),
+            "analyzed": kind in written_kinds,
+        }
+        for kind in ("switches", "variables", "selfSwitches")
+    }
+    summary["activePages"] = len(active)
+    summary["findings"] = findings
+    return summary
+
+
+def _requirements(value: Any, event_id: str, definitions: dict[str, str]) -> list[Flag]:
+    """Return the flags a page or trigger condition requires."""
+    flags: list[Flag] = []
+    if isinstance(value, dict):
+        # Disabled condition slots keep the id of whatever was selected last
+        if value.get("enabled") in (False, 0):
+            return []
+        for key, child in value.items():
+            if (
+                key == "switchId"
+                and isinstance(child, str)
+                and definitions.get(child) == "switches"
+            ):
+                flags.append(("switches", child))
+            elif (
+                key == "variableId"
+                and isinstance(child, str)
+                and definitions.get(child) == "variables"
+            ):
+                # Variables start at 0, so only a positive threshold needs a write
+                threshold = _number(value.get("value"))
+                if threshold is not None and threshold > 0:
+                    flags.append(("variables", child))
+            elif key == "selfSwitch" and child in _SELF_SWITCHES:
+                flags.append(("selfSwitches", (event_id, child)))
+            else:
+                flags.extend(_requirements(child, event_id, definitions))
+    elif isinstance(value, list):
+        for child in value:
+            flags.extend(_requirements(child, event_id, definitions))
+    return flags
+
+
+# ----------------------------------------------------------------------
+# Page control flow (run in the worker processes)
+# ----------------------------------------------------------------------
+
+_worker_definitions: dict[str, str] = {}
+
+
+def _init_worker(definitions: dict[str, str]) -> None:
+    global _worker_definitions
+    _worker_definitions = definitions
+
+
+def _walk_chunk(units: list[list[tuple[str, int, str]]]) -> list[dict[str, Any]]:
+    return _walk_units(units, _worker_definitions)
+
+
+def _walk_units(
+    units: list[list[tuple[str, int, str]]], definitions: dict[str, str]
+) -> list[dict[str, Any]]:
+    pages = []
+    for unit in units:
+        for event_id, page, path in unit:
+            try:
+                with open(path, encoding="utf-8-sig") as handle:
+                    data = json.load(handle)
+            except (OSError, ValueError):
+                # Unreadable pages are reported by validateAllEvents
+                continue
+            commands = data.get("eventCommands") if isinstance(data, dict) else None
+            if isinstance(commands, list):
+                pages.append(analyze_page(event_id, page, commands, definitions))
+    return pages
+
+
+def analyze_page(
+    event_id: str, page: int, commands: list[Any], definitions: dict[str, str]
+) -> dict[str, Any]:
+    """Walk one page's control-flow graph; returns its findings and flag effects."""
+    codes = []
+    parameters = []
+    for command in commands:
+        command = command if isinstance(command, dict) else {}
+        code = command.get("code")
+        values = command.get("parameters")
+        codes.append(code if isinstance(code, int) and not isinstance(code, bool) else -1)
+        parameters.append(values if isinstance(values, list) else [])
+
+    successors, loops = build_flow_graph(codes, parameters)
+    reachable = _reachable(successors, 0) if codes else set()
+    findings: list[dict[str, Any]] = []
+
+    start = None
+    for index in range(len(codes) + 1):
+        dead = (
+            index < len(codes) and index not in reachable and codes[index] not in _STRUCTURAL_CODES
+        )
+        if dead and start is None:
+            start = index
+        elif not dead and start is not None:
+            findings.append(
+                {
+                    "type": "unreachableCode",
+                    "severity": "warning",
+                    "message": (
+                        f"Commands {start}-{index - 1} can never run"
+                        if index - 1 > start
+                        else f"Command {start} can never run"
+                    ),
+                    "commandIndex": start,
+                    "endIndex": index - 1,
+                }
+            )
+            start = None
+
+    end = len(codes)
+    for loop_start, loop_end in loops:
+        if loop_start not in reachable:
+            continue
+        # The end node lies outside every loop, so reaching it counts as an exit
+        if all(loop_start <= node <= loop_end for node in _reachable(successors, loop_start)):
+            findings.append(
+                {
+                    "type": "loopWithoutExit",
+                    "severity": "warning",
+                    "message": f"Loop at command {loop_start} has no reachable Break Loop, jump or exit",
+                    "commandIndex": loop_start,
+                }
+            )
+
+    jumped = {
+        str(parameters[index][0])
+        for index in range(len(codes))
+        if codes[index] == JUMP_CODE and parameters[index]
+    }
+    for index, code in enumerate(codes):
+        if code == LABEL_CODE and parameters[index] and str(parameters[index][0]) not in jumped:
+            findings.append(
+                {
+                    "type": "unusedLabel",
+                    "severity": "info",
+                    "message": f"Label '{parameters[index][0]}' at command {index} is never jumped to",
+                    "commandIndex": index,
+                }
+            )
+
+    effects: dict[str, set[Any]] = {
+        "switchWrites": set(),
+        "variableWrites": set(),
+        "selfSwitchWrites": set(),
+        "switchReads": set(),
+        "calls": set(),
+    }
+    for index in reachable:
+        if index >= end:
+            continue
+        code, values = codes[index], parameters[index]
+        if code == _CONTROL_SWITCHES_CODE:
+            effects["switchWrites"].update(
+                value for value in values if definitions.get(value) == "switches"
+            )
+        elif code == _CONTROL_VARIABLES_CODE:
+            effects["variableWrites"].update(
+                value for value in values if definitions.get(value) == "variables"
+            )
+        elif code == _CONTROL_SELF_SWITCH_CODE:
+            effects["selfSwitchWrites"].update(
+                value for value in values[:1] if value in _SELF_SWITCHES
+            )
+        elif code == _CONDITIONAL_BRANCH_CODE:
+            effects["switchReads"].update(
+                value for value in values if definitions.get(value) == "switches"
+            )
+        elif code == _COMMON_EVENT_CODE:
+            effects["calls"].update(
+                value for value in values[:1] if definitions.get(value) == "commonEvents"
+            )
+
+    return {
+        "uuId": event_id,
+        "page": page,
+        "commandCount": len(codes),
+        "findings": findings,
+        **{key: sorted(values) for key, values in effects.items()},
+    }
+
+
+def build_flow_graph(
+    codes: list[int], parameters: list[list[Any]]
+) -> tuple[list[tuple[int, ...]], list[tuple[int, int]]]:
+    """Return (successors per command, (start, end) of each loop); node ``len(codes)`` is the page end.
+
+    Blocks are matched like ``validateAllEvents`` matches them; commands of
+    blocks that do not match fall through.
+    """
+    end = len(codes)
+    successors: list[tuple[int, ...]] = [(index + 1,) for index in range(end)]
+    labels: dict[str, int] = {}
+    loops: list[tuple[int, int]] = []
+    # Open blocks: [start code, command index, branch indexes, Break Loop indexes]
+    blocks: list[list[Any]] = []
+
+    for index, code in enumerate(codes):
+        if code in BLOCK_CODES and (
+            code != BATTLE_CODE or (index + 1 < end and codes[index + 1] in BLOCK_CODES[code][0])
+        ):
+            blocks.append([code, index, [], []])
+        elif code in BRANCH_OF and blocks and blocks[-1][0] == BRANCH_OF[code]:
+            blocks[-1][2].append(index)
+        elif code in END_OF and blocks and blocks[-1][0] == END_OF[code]:
+            start_code, start, branches, breaks = blocks.pop()
+            if start_code == LOOP_CODE:
+                successors[index] = (start,)
+                for break_index in breaks:
+                    successors[break_index] = (index + 1,)
+                loops.append((start, index))
+            elif start_code == _CONDITIONAL_BRANCH_CODE:
+                successors[start] = (start + 1, branches[0] + 1 if branches else index)
+            else:
+                successors[start] = tuple(branch + 1 for branch in branches) or (start + 1,)
+            # Reaching a branch marker means the previous branch body is done
+            for branch in branches:
+                successors[branch] = (index,)
+        elif code == BREAK_LOOP_CODE:
+            loop = next((block for block in reversed(blocks) if block[0] == LOOP_CODE), None)
+            if loop is not None:
+                loop[3].append(index)
+        elif code == _EXIT_CODE:
+            successors[index] = (end,)
+        elif code == LABEL_CODE and parameters[index]:
+            labels.setdefault(str(parameters[index][0]), index)
+
+    for index, code in enumerate(codes):
+        if code == JUMP_CODE and parameters[index] and str(parameters[index][0]) in labels:
+            successors[index] = (labels[str(parameters[index][0])],)
+    return successors, loops
+
+
+def _reachable(successors: list[tuple[int, ...]], start: int) -> set[int]:
+    seen = {start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node >= len(successors):
+            continue
+        for following in successors[node]:
+            if following not in seen:
+                seen.add(following)
+                stack.append(following)
+    return seen
+
+
+# ----------------------------------------------------------------------
+# Presentation
+# ----------------------------------------------------------------------
+
+
+def _location(event: dict[str, Any], page: int | None) -> dict[str, Any]:
+    location = {"uuId": event["uuId"], "name": event["name"], "eventKind": event["eventKind"]}
+    if event["eventKind"] == "map":
+        location["mapId"] = event.get("mapId")
+    if page is not None:
+        location["page"] = page
+    return location
+
+
+def _describe(flag: Flag) -> str:
+    kind, value = flag
+    if kind == "selfSwitches":
+        return f"self switch {value[1]}"
+    return f"{'switch' if kind == 'switches' else 'variable'} {value}"
+
+
+def _finding_order(finding: dict[str, Any]) -> tuple[Any, ...]:
+    # Event findings first, then the project-wide ones about flags
+    return (
+        "eventKind" not in finding,
+        finding.get("eventKind") or "",
+        str(finding.get("mapId") or ""),
+        finding.get("name") or "",
+        finding.get("uuId") or "",
+        finding.get("page", -1),
+        finding.get("commandIndex", -1),
+        finding["type"],
+        str(finding.get("id") or ""),
+    )
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+flow_analyzer = FlowAnalyzer(project_data_reader, reference_index)
@@ -0,0 +1,160 @@
+"""
+Dedicated thread pool for server-side filesystem work.
+
+The asyncio loop also drives the Unity bridge receive loop, the ping loop and
+every MCP session, so blocking ``stat``/``read`` calls must not run on it. All
+filesystem access goes through ``io_executor.run`` which bounds both the number
+of worker threads and the number of queued jobs, and records queue depth and
+time spent waiting and running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from config.constants import io_config
+
+T = TypeVar("T")
+
+
+class _Job:
+    __slots__ = ("enqueued_at", "started")
+
+    def __init__(self, enqueued_at: float) -> None:
+        self.enqueued_at = enqueued_at
+        self.started = False
+
+
+class IoExecutor:
+    def __init__(
+        self,
+        max_workers: int = io_config.IO_MAX_WORKERS,
+        max_pending: int = io_config.IO_MAX_PENDING,
+    ) -> None:
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+        self._queued = 0
+        self._active = 0
+        self._peak_queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+        self._max_run_seconds = 0.0
+        self._counter_lock = threading.Lock()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the I/O pool and await its result.
+
+        Callers beyond ``max_pending`` outstanding jobs wait on the loop
+        (without blocking it) until a slot frees up.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._get_slots(loop)
+        executor = self._get_executor()
+
+        enqueued_at = time.perf_counter()
+        async with slots:
+            job = _Job(enqueued_at)
+            with self._counter_lock:
+                self._submitted += 1
+                self._queued += 1
+                self._peak_queued = max(self._peak_queued, self._queued)
+            call = functools.partial(self._invoke, job, func, args, kwargs)
+            try:
+                return await loop.run_in_executor(executor, call)
+            except asyncio.CancelledError:
+                with self._counter_lock:
+                    if not job.started:
+                        # Cancelled while still queued; the job will never run
+                        job.started = True
+                        self._queued -= 1
+                raise
+
+    def _invoke(
+        self,
+        job: _Job,
+        func: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        started_at = time.perf_counter()
+        with self._counter_lock:
+            if job.started:
+                raise asyncio.CancelledError()
+            job.started = True
+            self._queued -= 1
+            self._active += 1
+            self._total_wait_seconds += started_at - job.enqueued_at
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            with self._counter_lock:
+                self._active -= 1
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+                self._total_run_seconds += elapsed
+                self._max_run_seconds = max(self._max_run_seconds, elapsed)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._counter_lock:
+            return self._build_stats()
+
+    def _build_stats(self) -> dict[str, Any]:
+        finished = self._completed + self._failed
+        return {
+            "maxWorkers": self._max_workers,
+            "maxPending": self._max_pending,
+            "queueDepth": self._queued,
+            "peakQueueDepth": self._peak_queued,
+            "active": self._active,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "totalWaitMs": round(self._total_wait_seconds * 1000, 3),
+            "totalRunMs": round(self._total_run_seconds * 1000, 3),
+            "avgWaitMs": round(self._total_wait_seconds * 1000 / finished, 3) if finished else 0.0,
+            "avgRunMs": round(self._total_run_seconds * 1000 / finished, 3) if finished else 0.0,
+            "maxRunMs": round(self._max_run_seconds * 1000, 3),
+        }
+
+    def shutdown(self) -> None:
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="mcp-io",
+            )
+        return self._executor
+
+    def _get_slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # Semaphores bind to the loop that first waits on them; recreate per loop
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self._max_pending)
+            self._slots_loop = loop
+        return self._slots
+
+
+io_executor = IoExecutor()
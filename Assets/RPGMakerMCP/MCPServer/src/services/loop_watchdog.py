@@ -0,0 +1,131 @@
+"""
+Event-loop lag watchdog.
+
+A heartbeat callback is scheduled on the asyncio loop every
+``LOOP_LAG_CHECK_INTERVAL`` seconds. A separate monitor thread checks that the
+heartbeat keeps running; when the loop has been blocked for longer than the
+threshold it captures the loop thread's current stack and the running task, so
+the log names the coroutine that is holding the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from config.constants import io_config
+from logger import logger
+
+
+class LoopLagWatchdog:
+    def __init__(
+        self,
+        threshold_seconds: float = 0.25,
+        check_interval: float = io_config.LOOP_LAG_CHECK_INTERVAL,
+    ) -> None:
+        self._threshold = threshold_seconds
+        self._interval = check_interval
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._tick_handle: asyncio.TimerHandle | None = None
+        self._monitor: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._last_tick = 0.0
+        self._expected_tick = 0.0
+        self._stall_reported = False
+        self._stall_count = 0
+        self._max_lag = 0.0
+        self._last_lag = 0.0
+
+    def start(self, threshold_seconds: float | None = None) -> None:
+        if self._monitor is not None:
+            return
+        if threshold_seconds is not None:
+            self._threshold = threshold_seconds
+        if self._threshold <= 0:
+            logger.debug("Event loop lag watchdog disabled")
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        now = time.monotonic()
+        self._last_tick = now
+        self._expected_tick = now + self._interval
+        self._tick_handle = self._loop.call_later(self._interval, self._tick)
+
+        self._monitor = threading.Thread(
+            target=self._monitor_loop,
+            name="mcp-loop-watchdog",
+            daemon=True,
+        )
+        self._monitor.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+        monitor = self._monitor
+        self._monitor = None
+        if monitor is not None and monitor is not threading.current_thread():
+            monitor.join(timeout=1.0)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "thresholdMs": round(self._threshold * 1000, 3),
+            "lastLagMs": round(self._last_lag * 1000, 3),
+            "maxLagMs": round(self._max_lag * 1000, 3),
+            "stallCount": self._stall_count,
+        }
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        lag = max(0.0, now - self._expected_tick)
+        self._last_lag = lag
+        self._max_lag = max(self._max_lag, lag)
+        self._last_tick = now
+        self._stall_reported = False
+        self._expected_tick = now + self._interval
+        if self._loop is not None and not self._stop_event.is_set():
+            self._tick_handle = self._loop.call_later(self._interval, self._tick)
+
+    def _monitor_loop(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            blocked_for = time.monotonic() - self._last_tick - self._interval
+            if blocked_for <= self._threshold or self._stall_reported:
+                continue
+            self._stall_reported = True
+            self._stall_count += 1
+            self._report_stall(blocked_for)
+
+    def _report_stall(self, blocked_for: float) -> None:
+        task_description = "unknown"
+        loop = self._loop
+        if loop is not None:
+            try:
+                task = asyncio.current_task(loop)
+            except RuntimeError:
+                task = None
+            if task is not None:
+                task_description = f"{task.get_name()} ({task.get_coro()!r})"
+
+        stack = ""
+        frame = sys._current_frames().get(self._loop_thread_id or -1)
+        if frame is not None:
+            stack = "".join(traceback.format_stack(frame, limit=io_config.LOOP_LAG_STACK_LIMIT))
+
+        logger.warning(
+            "Event loop blocked for %.0fms (threshold %.0fms) by task %s\n%s",
+            blocked_for * 1000,
+            self._threshold * 1000,
+            task_description,
+            stack,
+        )
+
+
+loop_watchdog = LoopLagWatchdog()
@@ -0,0 +1,249 @@
+"""
+Memory accounting for long-lived in-process structures.
+
+The context replica, its lookup indexes and the pulled-context cache can all
+grow with the size of the Unity project. Each registers a measure callback
+(bytes retained) and, if it can give memory back, a trim callback. ``measure``
+walks every structure with a shared ``seen`` set so objects referenced from
+several structures (the index points into the replica's nodes) are charged to
+the first one registered; ``enforce`` trims trimmable structures, most recently
+registered first, until the total fits the configured budget.
+
+Walking large structures takes seconds, so enforcement never happens on the
+asyncio loop: ``start`` runs ``enforce`` every ``MEMORY_CHECK_INTERVAL``
+seconds on a background thread, and ``report`` only returns the last
+measurement. Structures the loop mutates without a lock register with
+``on_loop``, so their measure and trim callbacks are marshalled back onto
+the loop; keep those measures cheap. A measure that still fails (for example
+a walk racing a mutation) is retried, and if it keeps failing the previous
+value is kept, so a busy structure is never reported as empty and skipped
+by trimming.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from config.constants import context as context_config
+from logger import logger
+
+# measure(seen) -> bytes not already in ``seen``
+MeasureCallback = Callable[[set[int]], int]
+TrimCallback = Callable[[], None]
+
+T = TypeVar("T")
+
+# Longest a loop-owned measure or trim may take before enforcement moves on (seconds)
+_LOOP_CALL_TIMEOUT = 5.0
+
+# Attempts per structure and measurement before the previous value is kept
+_MEASURE_ATTEMPTS = 3
+
+
+class _Structure:
+    __slots__ = ("name", "measure", "trim", "on_loop", "last_bytes")
+
+    def __init__(
+        self,
+        name: str,
+        measure: MeasureCallback,
+        trim: TrimCallback | None,
+        on_loop: bool,
+    ) -> None:
+        self.name = name
+        self.measure = measure
+        self.trim = trim
+        self.on_loop = on_loop
+        self.last_bytes = 0
+
+
+class MemoryAccountant:
+    def __init__(
+        self,
+        budget_bytes: int = 0,
+        check_interval: float = context_config.MEMORY_CHECK_INTERVAL,
+    ) -> None:
+        self._budget_bytes = budget_bytes
+        self._interval = check_interval
+        self._structures: dict[str, _Structure] = {}
+        self._trims = 0
+        self._measurements = 0
+        self._measure_failures = 0
+        self._last_total = 0
+        self._last_measure_ms = 0.0
+        self._last_measured_at: float | None = None
+        self._enforce_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    def configure(self, budget_bytes: int) -> None:
+        """Set the budget in bytes (0 disables enforcement)."""
+        self._budget_bytes = max(0, budget_bytes)
+
+    def register(
+        self,
+        name: str,
+        measure: MeasureCallback,
+        trim: TrimCallback | None = None,
+        on_loop: bool = False,
+    ) -> None:
+        """Register a structure; structures measured earlier own shared objects.
+
+        ``measure`` and ``trim`` run on the enforcement thread, so both must
+        be safe to call off the loop, unless ``on_loop`` runs them on it.
+        """
+        self._structures[name] = _Structure(name, measure, trim, on_loop)
+
+    def unregister(self, name: str) -> None:
+        self._structures.pop(name, None)
+
+    def start(self) -> None:
+        """Enforce the budget periodically from a background thread."""
+        if self._thread is not None or not self._budget_bytes or self._interval <= 0:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._enforce_loop,
+            name="mcp-memory-budget",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._loop = None
+
+    def measure(self) -> int:
+        """Measure every structure and return the total bytes retained.
+
+        Blocking; never call it on the asyncio loop.
+        """
+        started_at = time.perf_counter()
+        seen: set[int] = set()
+        total = 0
+        for structure in list(self._structures.values()):
+            structure.last_bytes = self._measure(structure, seen)
+            total += structure.last_bytes
+        self._last_total = total
+        self._measurements += 1
+        self._last_measured_at = time.time()
+        self._last_measure_ms = (time.perf_counter() - started_at) * 1000
+        return total
+
+    def enforce(self) -> int:
+        """Trim structures until the total fits the budget. Returns the final total.
+
+        Blocking; runs on the enforcement thread (or directly in tests).
+        """
+        with self._enforce_lock:
+            return self._enforce()
+
+    def _enforce(self) -> int:
+        total = self.measure()
+        if not self._budget_bytes or total <= self._budget_bytes:
+            return total
+
+        # Later registrations are the most expendable (caches before indexes)
+        for structure in reversed(list(self._structures.values())):
+            if structure.trim is None or structure.last_bytes == 0:
+                continue
+            logger.info(
+                "Memory budget exceeded (%d > %d bytes); trimming %s (%d bytes)",
+                total,
+                self._budget_bytes,
+                structure.name,
+                structure.last_bytes,
+            )
+            if not self._trim(structure):
+                continue
+            self._trims += 1
+            total = self.measure()
+            if total <= self._budget_bytes:
+                break
+        return total
+
+    def report(self) -> dict[str, Any]:
+        """Return the last measurement; never measures or trims."""
+        total = self._last_total
+        return {
+            "budgetBytes": self._budget_bytes,
+            "totalBytes": total,
+            "overBudget": bool(self._budget_bytes) and total > self._budget_bytes,
+            "structures": {
+                structure.name: structure.last_bytes
+                for structure in list(self._structures.values())
+            },
+            "trims": self._trims,
+            "measurements": self._measurements,
+            "measureFailures": self._measure_failures,
+            "lastMeasuredAt": self._last_measured_at,
+            "lastMeasureMs": round(self._last_measure_ms, 3),
+        }
+
+    def _measure(self, structure: _Structure, seen: set[int]) -> int:
+        error: Exception | None = None
+        for _ in range(_MEASURE_ATTEMPTS):
+            # A failed walk leaves partial ids behind, so each attempt starts from a copy
+            attempt_seen = set(seen)
+            try:
+                size = self._call(structure, lambda: structure.measure(attempt_seen))
+            except Exception as exc:
+                error = exc
+                continue
+            seen |= attempt_seen
+            return size
+        self._measure_failures += 1
+        logger.debug(
+            "Memory measure failed for %s, keeping %d bytes: %s",
+            structure.name,
+            structure.last_bytes,
+            error,
+        )
+        return structure.last_bytes
+
+    def _trim(self, structure: _Structure) -> bool:
+        assert structure.trim is not None
+        try:
+            self._call(structure, structure.trim)
+        except Exception as exc:
+            logger.debug("Memory trim failed for %s: %s", structure.name, exc)
+            return False
+        return True
+
+    def _call(self, structure: _Structure, callback: Callable[[], T]) -> T:
+        loop = self._loop
+        if not structure.on_loop or loop is None:
+            # Without a started loop nothing else touches the structure
+            return callback()
+        if loop.is_closed():
+            raise RuntimeError("event loop is closed")
+        future = asyncio.run_coroutine_threadsafe(_call(callback), loop)
+        try:
+            return future.result(timeout=_LOOP_CALL_TIMEOUT)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _enforce_loop(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                self.enforce()
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("Memory budget enforcement failed: %s", exc)
+
+
+async def _call(callback: Callable[[], T]) -> T:
+    return callback()
+
+
+memory_accountant = MemoryAccountant()
@@ -0,0 +1,165 @@
+"""
+JSON merge patches (RFC 7386) for record updates.
+
+``updateCharacter`` / ``updateItem`` / ``updateMap`` and the other record
+updates used to carry the whole ``characterData`` / ``itemData`` /
+``mapData`` object even when one field changed, and Unity deserialized and
+walked all of it. Updates now take ``"patchFormat": "merge"``, which makes
+the data object an RFC 7386 merge patch: objects are merged member by
+member, ``null`` clears a member and anything else replaces it
+(``DataModelMapper.UseMergePatch`` in Unity). ``"patchFormat": "full"`` keeps
+the previous behaviour, where nulls are ignored, and is what an update
+without a ``patchFormat`` does.
+
+With ``"patchFormat": "diff"`` (opt-in, server only), ``UpdatePatcher``
+computes the patch here: it diffs the data against the record as it is in
+the project files and sends only the members that differ, as a ``merge``
+patch. The base comes from ``ProjectDataReader.current_record``, which checks
+the file's content rather than only its mtime and size, so a member is never
+dropped because it equals a stale copy. The diff never clears anything, so
+it applies exactly like the full object did. Records without a readable base
+are sent as full updates. The Unity handlers save every update, so the files
+are the state Unity applies the patch to; writes hold the record's entity
+lock while diffing.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any
+
+from logger import logger
+from services.project_data_reader import (
+    LocalDataUnavailable,
+    ProjectDataReader,
+    data_kind,
+    project_data_reader,
+)
+
+# (bridge tool, operation) -> (data kind, payload keys of the data, first present wins)
+UPDATE_OPERATIONS: dict[tuple[str, str], tuple[str, tuple[str, ...]]] = {
+    ("rpgMakerDatabase", "updateCharacter"): ("characters", ("itemData", "characterData")),
+    ("rpgMakerDatabase", "updateItem"): ("items", ("itemData",)),
+    ("rpgMakerDatabase", "updateAnimation"): ("animations", ("itemData", "animationData")),
+    ("rpgMakerBattle", "updateEnemy"): ("enemies", ("enemyData",)),
+    ("rpgMakerBattle", "updateTroop"): ("troops", ("troopData",)),
+    ("rpgMakerBattle", "updateSkill"): ("skills", ("skillData",)),
+    ("rpgMakerMap", "updateMap"): ("maps", ("mapData",)),
+}
+
+PATCH_FORMATS = ("merge", "full", "diff")
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """Return ``target`` with the RFC 7386 merge patch ``patch`` applied; neither is modified."""
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
+
+
+def diff_merge_patch(base: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Return the merge patch of the members of ``data`` that differ from ``base``.
+
+    Members missing from ``data`` and ``null`` values are left out, as a
+    partial update leaves those members unchanged.
+    """
+    patch: dict[str, Any] = {}
+    for key, value in data.items():
+        if value is None:
+            continue
+        current = base.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            child = diff_merge_patch(current, value)
+            if child:
+                patch[key] = child
+        elif isinstance(value, dict):
+            # Nulls nested in a new object are ignored by a partial update too
+            patch[key] = _without_nulls(value)
+        elif value != current or type(value) is not type(current):
+            patch[key] = value
+    return patch
+
+
+class UpdatePatcher:
+    def __init__(self, reader: ProjectDataReader | None = None) -> None:
+        self._reader = reader or project_data_reader
+        self._lock = threading.Lock()
+        self._stats = {
+            "patched": 0,
+            "fullUpdates": 0,
+            "passthrough": 0,
+            "bytesFull": 0,
+            "bytesSent": 0,
+        }
+
+    @staticmethod
+    def supports(tool_name: str, payload: dict[str, Any]) -> bool:
+        return (tool_name, str(payload.get("operation", ""))) in UPDATE_OPERATIONS
+
+    def prepare(self, tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Return the payload to send for an update.
+
+        Only ``"patchFormat": "diff"`` updates are changed: they become a
+        merge patch if the base record is readable, else a full update.
+        Blocking (reads project files); run it through ``io_executor``.
+        """
+        if payload.get("patchFormat") != "diff":
+            self._count("passthrough")
+            return payload
+
+        full = {key: value for key, value in payload.items() if key != "patchFormat"}
+        kind_key, data_keys = UPDATE_OPERATIONS[(tool_name, str(payload.get("operation", "")))]
+        data_key = next((key for key in data_keys if payload.get(key) is not None), None)
+        data = payload.get(data_key) if data_key else None
+        record_id = payload.get("uuId") or payload.get("id")
+        kind = data_kind(kind_key)
+        if not isinstance(data, dict) or not record_id or kind is None or data_key is None:
+            self._count("fullUpdates")
+            return full
+
+        try:
+            base = self._reader.current_record(kind, str(record_id))
+        except LocalDataUnavailable as exc:
+            logger.debug("No base for %s %s, sending a full update: %s", kind.key, record_id, exc)
+            self._count("fullUpdates")
+            return full
+
+        patch = diff_merge_patch(base, data)
+        with self._lock:
+            self._stats["patched"] += 1
+            self._stats["bytesFull"] += _size(data)
+            self._stats["bytesSent"] += _size(patch)
+        return {**payload, data_key: patch, "patchFormat": "merge"}
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "bytesSaved": self._stats["bytesFull"] - self._stats["bytesSent"],
+            }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+def _without_nulls(value: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: _without_nulls(child) if isinstance(child, dict) else child
+        for key, child in value.items()
+        if child is not None
+    }
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+
+
+update_patcher = UpdatePatcher()
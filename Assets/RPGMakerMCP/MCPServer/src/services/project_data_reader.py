@@ -0,0 +1,673 @@
+"""
+Read-only access to the RPGMaker Unite database stored in the Unity project.
+
+RPGMaker Unite persists its database as JSON under ``Assets/RPGMaker/Storage``.
+Listing or fetching records through the bridge needs a running editor and
+occupies its main thread, so ``ProjectDataReader`` serves the read-only
+``list*``, ``get*ById`` and ``getDatabaseInfo`` operations straight from those
+files, returning the same response shapes as the Unity handlers.
+
+Files are parsed lazily, one at a time, the first time an operation needs
+them. Parsed records are cached per file and revalidated against the file's
+mtime and size on every access, so edits made in the editor are picked up
+without rescanning unchanged files. ``get*ById`` on large multi-record files
+that are not already cached is answered through ``RecordOffsetIndex`` instead,
+which decodes only the requested record.
+
+``current_record`` is for callers that must not act on a stale copy: it also
+compares a hash of the file's content with the one taken at parse time, since
+two saves of the same size within one mtime tick look unchanged otherwise.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from config.constants import data_config
+from config.env import env
+from services.io_executor import io_executor
+from services.record_offset_index import RecordOffsetIndex
+from utils.memory import deep_sizeof, intern_strings
+
+STORAGE_DIR = ("Assets", "RPGMaker", "Storage")
+
+# Directory holding the per-event command files of common and map events
+EVENT_DIR = "Event/JSON/Event"
+
+# Entity name used for change notifications about files in EVENT_DIR
+EVENT_ENTITY = "events"
+
+
+class LocalDataUnavailable(Exception):
+    """Raised when an operation cannot be answered from the project files."""
+
+
+@dataclass(frozen=True)
+class DataKind:
+    """How one record type is stored and how the Unity handler presents it."""
+
+    key: str
+    bridge_tool: str
+    list_operation: str
+    get_operation: str
+    items_key: str
+    directory: str
+    pattern: str
+    id_path: tuple[str, ...]
+    name_path: tuple[str, ...]
+    default_name: str
+    # Response keys carrying the record id ("uuId" only, or "id" and "uuId")
+    id_keys: tuple[str, ...] = ("id", "uuId")
+    filename: str | None = None
+    # Extra list fields: (response key, record path)
+    summary_fields: tuple[tuple[str, tuple[str, ...]], ...] = ()
+
+
+DATA_KINDS: tuple[DataKind, ...] = (
+    DataKind(
+        key="characters",
+        bridge_tool="rpgMakerDatabase",
+        list_operation="listCharacters",
+        get_operation="getCharacterById",
+        items_key="characters",
+        directory="Character/JSON",
+        pattern="characterActor.json",
+        id_path=("uuId",),
+        name_path=("basic", "name"),
+        default_name="Unnamed",
+        id_keys=("uuId",),
+        filename="characterActor",
+        summary_fields=(("charaType", ("charaType",)),),
+    ),
+    DataKind(
+        key="items",
+        bridge_tool="rpgMakerDatabase",
+        list_operation="listItems",
+        get_operation="getItemById",
+        items_key="items",
+        directory="Item/JSON",
+        pattern="item.json",
+        id_path=("basic", "id"),
+        name_path=("basic", "name"),
+        default_name="Unnamed",
+        id_keys=("uuId",),
+        filename="item",
+    ),
+    DataKind(
+        key="animations",
+        bridge_tool="rpgMakerDatabase",
+        list_operation="listAnimations",
+        get_operation="getAnimationById",
+        items_key="animations",
+        directory="Animation/JSON",
+        pattern="animation.json",
+        id_path=("id",),
+        name_path=("particleName",),
+        default_name="Unnamed",
+        id_keys=("uuId",),
+        filename="animation",
+    ),
+    DataKind(
+        key="enemies",
+        bridge_tool="rpgMakerBattle",
+        list_operation="listEnemies",
+        get_operation="getEnemyById",
+        items_key="enemies",
+        directory="Character/JSON",
+        pattern="enemy.json",
+        id_path=("id",),
+        name_path=("name",),
+        default_name="Unnamed Enemy",
+    ),
+    DataKind(
+        key="troops",
+        bridge_tool="rpgMakerBattle",
+        list_operation="listTroops",
+        get_operation="getTroopById",
+        items_key="troops",
+        directory="Character/JSON",
+        pattern="troop.json",
+        id_path=("id",),
+        name_path=("name",),
+        default_name="Unnamed Troop",
+    ),
+    DataKind(
+        key="skills",
+        bridge_tool="rpgMakerBattle",
+        list_operation="listSkills",
+        get_operation="getSkillById",
+        items_key="skills",
+        directory="Initializations/JSON",
+        pattern="skill.json",
+        id_path=("basic", "id"),
+        name_path=("basic", "name"),
+        default_name="Unnamed Skill",
+    ),
+    DataKind(
+        key="maps",
+        bridge_tool="rpgMakerMap",
+        list_operation="listMaps",
+        get_operation="getMapById",
+        items_key="maps",
+        directory="Map/JSON/Map",
+        pattern="*.json",
+        id_path=("id",),
+        name_path=("name",),
+        default_name="Unnamed Map",
+        summary_fields=(
+            ("displayName", ("displayName",)),
+            ("width", ("width",)),
+            ("height", ("height",)),
+        ),
+    ),
+    DataKind(
+        key="commonEvents",
+        bridge_tool="rpgMakerEvent",
+        list_operation="listCommonEvents",
+        get_operation="getCommonEventById",
+        items_key="events",
+        directory="Event/JSON",
+        pattern="eventCommon.json",
+        id_path=("eventId",),
+        name_path=("name",),
+        default_name="Unnamed Event",
+    ),
+)
+
+
+def _build_operations() -> dict[tuple[str, str], tuple[DataKind | None, str]]:
+    """Map (bridge tool, operation) to the kind and mode ("list", "get", "info")."""
+    operations: dict[tuple[str, str], tuple[DataKind | None, str]] = {
+        ("rpgMakerDatabase", "getDatabaseInfo"): (None, "info"),
+    }
+    for kind in DATA_KINDS:
+        operations[(kind.bridge_tool, kind.list_operation)] = (kind, "list")
+        operations[(kind.bridge_tool, kind.get_operation)] = (kind, "get")
+    return operations
+
+
+_OPERATIONS = _build_operations()
+
+
+def data_kind(entity: str) -> DataKind | None:
+    """Return the kind registered under ``entity`` (e.g. "characters")."""
+    return next((kind for kind in DATA_KINDS if kind.key == entity), None)
+
+
+class _ParsedFile:
+    __slots__ = ("mtime_ns", "size", "digest", "records", "by_id")
+
+    def __init__(
+        self,
+        mtime_ns: int,
+        size: int,
+        digest: bytes,
+        records: list[dict[str, Any]],
+        by_id: dict[str, int],
+    ) -> None:
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.records = records
+        self.by_id = by_id
+
+
+class ProjectDataReader:
+    def __init__(self, project_root: Path | None = None) -> None:
+        self._project_root = project_root
+        self._files: dict[Path, _ParsedFile] = {}
+        self._offsets: RecordOffsetIndex | None = None
+        self._lock = threading.Lock()
+        self._files_parsed = 0
+        self._cache_hits = 0
+        self._invalidations = 0
+        self._served = 0
+        self._unavailable = 0
+
+    @property
+    def storage_root(self) -> Path:
+        return (self._project_root or env.unity_project_root).joinpath(*STORAGE_DIR)
+
+    @property
+    def offset_index(self) -> RecordOffsetIndex:
+        if self._offsets is None:
+            cache_dir = (
+                self._project_root or env.unity_project_root
+            ) / data_config.OFFSET_INDEX_DIR
+            self._offsets = RecordOffsetIndex(cache_dir, record_ids)
+        return self._offsets
+
+    def supports(self, bridge_tool: str, operation: str | None) -> bool:
+        """Return True if the operation is one the reader can answer."""
+        return (bridge_tool, operation or "") in _OPERATIONS
+
+    async def execute(self, bridge_tool: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Answer a read operation from the project files on the I/O pool.
+
+        Raises:
+            LocalDataUnavailable: If the operation is not supported, the data
+                files are missing or unreadable, or the record does not exist
+        """
+        return await io_executor.run(self.execute_sync, bridge_tool, payload)
+
+    def execute_sync(self, bridge_tool: str, payload: dict[str, Any]) -> dict[str, Any]:
+        operation = payload.get("operation") or ""
+        entry = _OPERATIONS.get((bridge_tool, operation))
+        if entry is None:
+            raise LocalDataUnavailable(
+                f"{bridge_tool}.{operation} is not served from project files"
+            )
+
+        kind, mode = entry
+        try:
+            if kind is None:
+                result = self._database_info()
+            elif mode == "list":
+                result = self._list(kind, payload)
+            else:
+                result = self._get(kind, payload)
+        except LocalDataUnavailable:
+            with self._lock:
+                self._unavailable += 1
+            raise
+        with self._lock:
+            self._served += 1
+        return result
+
+    def current_record(self, kind: DataKind, record_id: str) -> dict[str, Any]:
+        """Return the record as it is on disk now, never a stale cached parse.
+
+        Unlike ``get*ById``, a cached file is reused only if its content hash
+        still matches, so every call reads the file. Blocking.
+
+        Raises:
+            LocalDataUnavailable: If the data files are missing or unreadable,
+                or the record does not exist
+        """
+        for path in self._search_order(kind, record_id):
+            parsed = self._load(path, verify_content=True)
+            index = parsed.by_id.get(record_id)
+            if index is not None:
+                return parsed.records[index]
+        raise LocalDataUnavailable(f"{kind.key} record '{record_id}' not found in project files")
+
+    def list_kind(self, bridge_tool: str, operation: str | None) -> DataKind | None:
+        """Return the kind listed by a ``list*`` operation, or None for other operations."""
+        entry = _OPERATIONS.get((bridge_tool, operation or ""))
+        return entry[0] if entry is not None and entry[1] == "list" else None
+
+    def catalog_generation(self, kind: DataKind) -> tuple[tuple[str, int, int], ...]:
+        """Return a token that changes whenever any data file of ``kind`` changes.
+
+        Raises:
+            LocalDataUnavailable: If the data files are missing
+        """
+        generation = []
+        for path in self._files_for(kind):
+            try:
+                stat = path.stat()
+            except OSError as exc:
+                raise LocalDataUnavailable(f"Data file not readable: {path} ({exc})") from exc
+            generation.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(generation)
+
+    def catalog_records(self, kind: DataKind) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Return every record of ``kind`` and its list summary, in list order."""
+        records = self._records(kind)
+        return records, [self._summarize(kind, record) for record in records]
+
+    def watch_targets(self) -> list[tuple[Path, str, str, tuple[str, ...]]]:
+        """Return (directory, file pattern, entity, id path) for every data location."""
+        targets = [
+            (self.storage_root / kind.directory, kind.pattern, kind.key, kind.id_path)
+            for kind in DATA_KINDS
+        ]
+        targets.append((self.storage_root / EVENT_DIR, "*.json", EVENT_ENTITY, ("id",)))
+        return targets
+
+    def reload(self, path: Path) -> list[dict[str, Any]] | None:
+        """Re-read a changed file into the cache. Returns None if the file is gone.
+
+        Raises:
+            LocalDataUnavailable: If the file exists but cannot be parsed (for
+                example while Unity is still writing it)
+        """
+        try:
+            return self._load(path).records
+        except LocalDataUnavailable:
+            if path.exists():
+                raise
+            with self._lock:
+                self._files.pop(path, None)
+            return None
+
+    def clear(self) -> None:
+        """Drop all parsed files; they are parsed again on next use."""
+        with self._lock:
+            self._files.clear()
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        with self._lock:
+            return deep_sizeof(self._files, seen)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "cachedFiles": len(self._files),
+            "filesParsed": self._files_parsed,
+            "cacheHits": self._cache_hits,
+            "invalidations": self._invalidations,
+            "served": self._served,
+            "unavailable": self._unavailable,
+            "offsetIndex": self._offsets.get_stats() if self._offsets is not None else None,
+        }
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+
+    def _list(self, kind: DataKind, payload: dict[str, Any]) -> dict[str, Any]:
+        summaries = [self._summarize(kind, record) for record in self._records(kind)]
+        return paginate(kind.items_key, summaries, payload)
+
+    def _get(self, kind: DataKind, payload: dict[str, Any]) -> dict[str, Any]:
+        record_id = payload.get("uuId") or payload.get("id")
+        if not record_id:
+            raise LocalDataUnavailable("uuId is required.")
+
+        record = self._find(kind, str(record_id))
+        if record is None:
+            raise LocalDataUnavailable(
+                f"{kind.key} record '{record_id}' not found in project files"
+            )
+
+        response: dict[str, Any] = {"success": True}
+        for key in kind.id_keys:
+            response[key] = _lookup(record, kind.id_path)
+        if kind.filename:
+            response["filename"] = kind.filename
+        response["data"] = self._common_event_data(record) if kind.key == "commonEvents" else record
+        return response
+
+    def _database_info(self) -> dict[str, Any]:
+        # Mirrors RPGMakerDatabaseHandler.GetDatabaseInfo (JSON file counts per directory)
+        paths = {
+            "characters": self.storage_root / "Character" / "JSON",
+            "items": self.storage_root / "Item" / "JSON",
+            "animations": self.storage_root / "Animation" / "JSON",
+            "system": self.storage_root / "System",
+        }
+        return {
+            "success": True,
+            "characterCount": _count_json_files(paths["characters"]),
+            "itemCount": _count_json_files(paths["items"]),
+            "animationCount": _count_json_files(paths["animations"]),
+            "systemConfigExists": paths["system"].is_dir(),
+            "paths": {key: str(path) for key, path in paths.items()},
+        }
+
+    def _common_event_data(self, record: dict[str, Any]) -> dict[str, Any]:
+        # Unity joins the common event with its command list from the event file
+        event_id = record.get("eventId")
+        commands: list[Any] = []
+        event_dir = self.storage_root / EVENT_DIR
+        if event_id and event_dir.is_dir():
+            for path in sorted(event_dir.glob(f"{event_id}*.json")):
+                parsed = self._load(path)
+                if parsed.records:
+                    commands = parsed.records[0].get("eventCommands") or []
+                    break
+        return {
+            "eventId": event_id,
+            "name": record.get("name"),
+            "conditions": [
+                {"trigger": condition.get("trigger"), "switchId": condition.get("switchId")}
+                for condition in record.get("conditions") or []
+            ],
+            "eventCommands": [
+                {
+                    "code": command.get("code"),
+                    "indent": command.get("indent"),
+                    "parameters": command.get("parameters"),
+                    "route": [
+                        {
+                            "code": route.get("code"),
+                            "codeIndex": route.get("codeIndex"),
+                            "parameters": route.get("parameters"),
+                        }
+                        for route in command.get("route") or []
+                    ],
+                }
+                for command in commands
+            ],
+        }
+
+    def _summarize(self, kind: DataKind, record: dict[str, Any]) -> dict[str, Any]:
+        summary: dict[str, Any] = {}
+        record_id = _lookup(record, kind.id_path)
+        for key in kind.id_keys:
+            summary[key] = record_id
+        name = _lookup(record, kind.name_path) or kind.default_name
+        summary["name"] = name
+        for key, path in kind.summary_fields:
+            value = _lookup(record, path)
+            summary[key] = name if value is None and key == "displayName" else value
+        if kind.filename:
+            summary["filename"] = kind.filename
+        return summary
+
+    # ------------------------------------------------------------------
+    # File cache
+    # ------------------------------------------------------------------
+
+    def _files_for(self, kind: DataKind) -> list[Path]:
+        directory = self.storage_root / kind.directory
+        if not any(char in kind.pattern for char in "*?["):
+            path = directory / kind.pattern
+            if not path.is_file():
+                raise LocalDataUnavailable(f"Data file not found: {path}")
+            return [path]
+
+        try:
+            names = sorted(
+                entry.name
+                for entry in os.scandir(directory)
+                if entry.is_file() and fnmatch.fnmatch(entry.name, kind.pattern)
+            )
+        except OSError as exc:
+            raise LocalDataUnavailable(f"Data directory not readable: {directory} ({exc})") from exc
+
+        paths = [directory / name for name in names]
+        self._forget_missing(directory, set(paths))
+        return paths
+
+    def _records(self, kind: DataKind) -> list[dict[str, Any]]:
+        records: list[dict[str, Any]] = []
+        for path in self._files_for(kind):
+            records.extend(self._load(path).records)
+        return records
+
+    def _search_order(self, kind: DataKind, record_id: str) -> list[Path]:
+        paths = self._files_for(kind)
+        # One-file-per-record layouts are usually named after the id
+        named = [path for path in paths if path.stem == record_id]
+        return named + [path for path in paths if path not in named]
+
+    def _find(self, kind: DataKind, record_id: str) -> dict[str, Any] | None:
+        for path in self._search_order(kind, record_id):
+            if self._use_offset_index(path):
+                try:
+                    return self.offset_index.get(path, record_id)
+                except (OSError, ValueError):
+                    # Not a record array or unreadable; the full parse reports it
+                    pass
+            parsed = self._load(path)
+            index = parsed.by_id.get(record_id)
+            if index is not None:
+                return parsed.records[index]
+        return None
+
+    def _use_offset_index(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        with self._lock:
+            cached = self._files.get(path)
+        if (
+            cached is not None
+            and cached.mtime_ns == stat.st_mtime_ns
+            and cached.size == stat.st_size
+        ):
+            return False
+        return stat.st_size >= data_config.OFFSET_INDEX_MIN_BYTES
+
+    def _load(self, path: Path, verify_content: bool = False) -> _ParsedFile:
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            raise LocalDataUnavailable(f"Data file not readable: {path} ({exc})") from exc
+
+        with self._lock:
+            cached = self._files.get(path)
+        unchanged = (
+            cached is not None
+            and cached.mtime_ns == stat.st_mtime_ns
+            and cached.size == stat.st_size
+        )
+        raw: bytes | None = None
+        if unchanged and verify_content:
+            raw = _read_bytes(path)
+            unchanged = cached is not None and hashlib.sha1(raw).digest() == cached.digest
+        with self._lock:
+            if unchanged and cached is not None:
+                self._cache_hits += 1
+                return cached
+            if cached is not None:
+                self._invalidations += 1
+
+        if raw is None:
+            raw = _read_bytes(path)
+        try:
+            data = json.loads(raw.decode("utf-8-sig"))
+        except ValueError as exc:
+            raise LocalDataUnavailable(f"Data file not parseable: {path} ({exc})") from exc
+
+        records = [record for record in _as_records(data) if isinstance(record, dict)]
+        intern_strings(records)
+        by_id: dict[str, int] = {}
+        for index, record in enumerate(records):
+            for record_id in record_ids(record):
+                by_id.setdefault(record_id, index)
+
+        parsed = _ParsedFile(
+            stat.st_mtime_ns, stat.st_size, hashlib.sha1(raw).digest(), records, by_id
+        )
+        with self._lock:
+            self._files[path] = parsed
+            self._files_parsed += 1
+        return parsed
+
+    def _forget_missing(self, directory: Path, present: set[Path]) -> None:
+        with self._lock:
+            stale = [
+                path for path in self._files if path.parent == directory and path not in present
+            ]
+            for path in stale:
+                del self._files[path]
+
+
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError as exc:
+        raise LocalDataUnavailable(f"Data file not readable: {path} ({exc})") from exc
+
+
+def record_ids(record: dict[str, Any]) -> list[str]:
+    """Return the ids a record can be fetched by (uuId, id, eventId, basic.id)."""
+    ids = [record.get(id_key) for id_key in ("uuId", "id", "eventId")]
+    basic = record.get("basic")
+    if isinstance(basic, dict):
+        ids.append(basic.get("id"))
+    return [value for value in ids if isinstance(value, str) and value]
+
+
+def _as_records(data: Any) -> list[Any]:
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        # Unity's JsonUtility cannot serialize a top-level list and wraps it
+        if len(data) == 1:
+            (value,) = data.values()
+            if isinstance(value, list):
+                return value
+        return [data]
+    return []
+
+
+def _lookup(record: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value: Any = record
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def paginate(items_key: str, items: list[Any], payload: dict[str, Any]) -> dict[str, Any]:
+    # Mirrors BaseCommandHandler.CreatePaginatedResponse
+    total = len(items)
+    offset = max(0, int(payload.get("offset") or 0))
+    raw_limit = payload.get("limit")
+    limit = int(raw_limit if raw_limit is not None else 100)
+    page = items[offset:] if limit <= 0 else items[offset : offset + limit]
+    return {
+        "success": True,
+        items_key: page,
+        "count": len(page),
+        "totalCount": total,
+        "offset": offset,
+        "limit": limit,
+        "hasMore": offset + len(page) < total,
+    }
+
+
+def stat_data_files(
+    targets: Iterable[tuple[Path, str, str, tuple[str, ...]]],
+) -> Iterator[tuple[str, int, int, str, tuple[str, ...]]]:
+    """Yield (path, mtime_ns, size, entity, id path) for the files matching ``watch_targets``-style targets.
+
+    Paths are plain strings: incremental indexes call this before every query,
+    so it avoids building ``Path`` objects for unchanged files.
+    """
+    for directory, pattern, entity, id_path in targets:
+        matches = re.compile(fnmatch.translate(pattern)).match
+        try:
+            entries = [entry for entry in os.scandir(directory) if matches(entry.name)]
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield entry.path, stat.st_mtime_ns, stat.st_size, entity, id_path
+
+
+def _count_json_files(directory: Path) -> int:
+    try:
+        return sum(1 for entry in os.scandir(directory) if entry.name.endswith(".json"))
+    except OSError:
+        return 0
+
+
+project_data_reader = ProjectDataReader()
@@ -0,0 +1,457 @@
+"""
+Change tracking for the RPGMaker data files under the Unity project.
+
+Edits made in the Unity editor (or by hand) land in the JSON files that
+``ProjectDataReader`` serves. ``ProjectDataWatcher`` watches only the data
+directories the reader knows about and turns file events into per-entity
+changes (entity type, uuId, created/updated/deleted):
+
+- On Linux, inotify delivers events on the event loop without threads; other
+  platforms, or a failed inotify setup, fall back to polling directory
+  listings (mtime and size) on the I/O pool.
+- Events are debounced, so an editor save that rewrites a file several times
+  produces one batch.
+- Each changed file is re-read into the reader's cache and compared with a
+  per-record fingerprint taken at startup, so only the records that actually
+  changed are reported.
+
+Listeners receive each batch; the server uses them to notify resource
+subscribers, and other caches can update per entity instead of rescanning.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ctypes
+import ctypes.util
+import fnmatch
+import json
+import os
+import struct
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from config.constants import data_config
+from config.env import env
+from logger import logger
+from services.io_executor import io_executor
+from services.project_data_reader import (
+    LocalDataUnavailable,
+    ProjectDataReader,
+    project_data_reader,
+)
+
+ChangeType = Literal["created", "updated", "deleted"]
+
+
+@dataclass(frozen=True)
+class EntityChange:
+    entity: str
+    uu_id: str
+    change: ChangeType
+    path: str
+    sequence: int = 0
+    timestamp: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "entity": self.entity,
+            "uuId": self.uu_id,
+            "change": self.change,
+            "path": self.path,
+            "sequence": self.sequence,
+            "timestamp": self.timestamp,
+        }
+
+
+class _Target:
+    __slots__ = ("directory", "pattern", "entity", "id_path")
+
+    def __init__(
+        self, directory: Path, pattern: str, entity: str, id_path: tuple[str, ...]
+    ) -> None:
+        self.directory = directory
+        self.pattern = pattern
+        self.entity = entity
+        self.id_path = id_path
+
+    def matches(self, path: Path) -> bool:
+        return path.parent == self.directory and fnmatch.fnmatch(path.name, self.pattern)
+
+
+class _InotifyBackend:
+    """inotify through libc; the descriptor is read on the event loop."""
+
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_DELETE = 0x00000200
+    _IN_IGNORED = 0x00008000
+    _MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_DELETE
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, libc: Any, fd: int) -> None:
+        self._libc = libc
+        self._fd = fd
+        self._directories: dict[int, Path] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def create(cls) -> _InotifyBackend | None:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as exc:
+            logger.debug("inotify unavailable: %s", exc)
+            return None
+        if fd < 0:
+            logger.debug("inotify_init1 failed: errno %d", ctypes.get_errno())
+            return None
+        return cls(libc, fd)
+
+    @property
+    def watched(self) -> set[Path]:
+        return set(self._directories.values())
+
+    def watch(self, directory: Path) -> bool:
+        if directory in self._directories.values():
+            return True
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._MASK)
+        if wd < 0:
+            return False
+        self._directories[wd] = directory
+        return True
+
+    def start(self, loop: asyncio.AbstractEventLoop, on_path: Callable[[Path], None]) -> None:
+        self._loop = loop
+        loop.add_reader(self._fd, self._drain, on_path)
+
+    def close(self) -> None:
+        if self._loop is not None:
+            with contextlib.suppress(Exception):
+                self._loop.remove_reader(self._fd)
+        with contextlib.suppress(OSError):
+            os.close(self._fd)
+        self._directories.clear()
+
+    def _drain(self, on_path: Callable[[Path], None]) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            except OSError as exc:
+                logger.debug("inotify read failed: %s", exc)
+                return
+            if not data:
+                return
+
+            offset = 0
+            header_size = self._EVENT_HEADER.size
+            while offset + header_size <= len(data):
+                wd, mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + header_size : offset + header_size + length].rstrip(b"\0")
+                offset += header_size + length
+                if mask & self._IN_IGNORED:
+                    # The directory was removed; it is watched again if it reappears
+                    self._directories.pop(wd, None)
+                    continue
+                directory = self._directories.get(wd)
+                if directory is not None and name:
+                    on_path(directory / os.fsdecode(name))
+
+
+class _PollingBackend:
+    """Directory listing snapshots compared on every poll."""
+
+    def __init__(self) -> None:
+        self._snapshots: dict[Path, dict[Path, tuple[int, int]]] = {}
+
+    def scan(self, directories: list[Path]) -> list[Path]:
+        changed: list[Path] = []
+        for directory in directories:
+            entries: dict[Path, tuple[int, int]] = {}
+            try:
+                with os.scandir(directory) as iterator:
+                    for entry in iterator:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            stat = entry.stat()
+                            entries[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+
+            previous = self._snapshots.get(directory)
+            self._snapshots[directory] = entries
+            if previous is None:
+                # First scan is the baseline
+                continue
+            changed.extend(
+                path for path, signature in entries.items() if previous.get(path) != signature
+            )
+            changed.extend(path for path in previous if path not in entries)
+        return changed
+
+
+class ProjectDataWatcher:
+    def __init__(
+        self,
+        reader: ProjectDataReader = project_data_reader,
+        poll_interval: float = data_config.WATCH_POLL_INTERVAL,
+        debounce: float = data_config.WATCH_DEBOUNCE,
+        history_size: int = data_config.WATCH_HISTORY_SIZE,
+        use_inotify: bool = True,
+    ) -> None:
+        self._reader = reader
+        self._poll_interval = poll_interval
+        self._debounce = debounce
+        self._use_inotify = use_inotify
+        self._targets: list[_Target] = []
+        self._inotify: _InotifyBackend | None = None
+        self._poller: _PollingBackend | None = None
+        self._listeners: list[Callable[[list[EntityChange]], None]] = []
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: set[Path] = set()
+        self._debounce_handle: asyncio.TimerHandle | None = None
+        self._processing: asyncio.Task[None] | None = None
+        # path -> {uuId: record fingerprint}; only touched on the I/O pool, one batch at a time
+        self._fingerprints: dict[Path, dict[str, int]] = {}
+        self._history: deque[EntityChange] = deque(maxlen=history_size)
+        self._sequence = 0
+        self._file_events = 0
+        self._batches = 0
+
+    def on_change(self, callback: Callable[[list[EntityChange]], None]) -> None:
+        """Register a callback fired with each debounced batch of entity changes."""
+        self._listeners.append(callback)
+
+    async def start(self) -> None:
+        if self._task or not env.enable_file_watcher:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._targets = [_Target(*target) for target in self._reader.watch_targets()]
+        await io_executor.run(self._prime)
+
+        if self._use_inotify:
+            self._inotify = _InotifyBackend.create()
+        if self._inotify is not None:
+            self._inotify.start(self._loop, self._enqueue)
+            await self._watch_new_directories()
+        else:
+            self._poller = _PollingBackend()
+            await io_executor.run(self._poller.scan, self._directories())
+
+        self._task = self._loop.create_task(self._tick_loop())
+        logger.info(
+            "Project data watcher started (%s, %d directories)",
+            self.backend,
+            len(self._directories()),
+        )
+
+    async def stop(self) -> None:
+        task = self._task
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        self._task = None
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._poller = None
+
+    @property
+    def backend(self) -> str:
+        if self._inotify is not None:
+            return "inotify"
+        if self._poller is not None:
+            return "polling"
+        return "disabled"
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest entity change."""
+        return self._sequence
+
+    def get_changes(self, since: int = 0) -> dict[str, Any]:
+        """Return recorded changes with a sequence number greater than ``since``."""
+        return {
+            "sequence": self._sequence,
+            "changes": [change.to_dict() for change in self._history if change.sequence > since],
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "watchedDirectories": (
+                len(self._inotify.watched) if self._inotify else len(self._directories())
+            ),
+            "trackedFiles": len(self._fingerprints),
+            "fileEvents": self._file_events,
+            "batches": self._batches,
+            "sequence": self._sequence,
+        }
+
+    # ------------------------------------------------------------------
+    # Event intake
+    # ------------------------------------------------------------------
+
+    def _directories(self) -> list[Path]:
+        return list(dict.fromkeys(target.directory for target in self._targets))
+
+    async def _tick_loop(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self._poll_interval)
+                if self._inotify is not None:
+                    await self._watch_new_directories()
+                elif self._poller is not None:
+                    for path in await io_executor.run(self._poller.scan, self._directories()):
+                        self._enqueue(path)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Project data watcher stopped: %s", exc)
+
+    async def _watch_new_directories(self) -> None:
+        assert self._inotify is not None
+        watched = self._inotify.watched
+        for directory in self._directories():
+            if directory in watched or not self._inotify.watch(directory):
+                continue
+            if self._task is not None:
+                # Files may have been written before the watch existed
+                for path in await io_executor.run(_list_json_files, directory):
+                    self._enqueue(path)
+
+    def _enqueue(self, path: Path) -> None:
+        if not any(target.matches(path) for target in self._targets):
+            return
+        self._file_events += 1
+        self._pending.add(path)
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        assert self._loop is not None
+        self._debounce_handle = self._loop.call_later(self._debounce, self._flush)
+
+    def _flush(self) -> None:
+        self._debounce_handle = None
+        if self._processing is not None and not self._processing.done():
+            # The running batch picks the pending paths up when it finishes
+            return
+        paths, self._pending = self._pending, set()
+        if paths and self._loop is not None:
+            self._processing = self._loop.create_task(self._process(paths))
+
+    async def _process(self, paths: set[Path]) -> None:
+        try:
+            changes = await io_executor.run(self._diff_files, sorted(paths))
+        except Exception as exc:
+            logger.warning("Failed to process project data changes: %s", exc)
+            changes = []
+
+        if changes:
+            self._batches += 1
+            now = time.time()
+            stamped: list[EntityChange] = []
+            for change in changes:
+                self._sequence += 1
+                stamped.append(
+                    EntityChange(
+                        change.entity, change.uu_id, change.change, change.path, self._sequence, now
+                    )
+                )
+            self._history.extend(stamped)
+            for listener in list(self._listeners):
+                try:
+                    listener(stamped)
+                except Exception as exc:
+                    logger.debug("Project data change listener failed: %s", exc)
+
+        if self._pending:
+            self._flush()
+
+    # ------------------------------------------------------------------
+    # Diffing (runs on the I/O pool)
+    # ------------------------------------------------------------------
+
+    def _prime(self) -> None:
+        for directory in self._directories():
+            for path in _list_json_files(directory):
+                target = self._target_for(path)
+                if target is None:
+                    continue
+                with contextlib.suppress(LocalDataUnavailable):
+                    records = self._reader.reload(path)
+                    if records is not None:
+                        self._fingerprints[path] = _fingerprint(records, target.id_path)
+
+    def _diff_files(self, paths: list[Path]) -> list[EntityChange]:
+        changes: list[EntityChange] = []
+        for path in paths:
+            target = self._target_for(path)
+            if target is None:
+                continue
+            try:
+                records = self._reader.reload(path)
+            except LocalDataUnavailable as exc:
+                # Usually a partial write; the closing write event follows
+                logger.debug("Skipping unreadable data file %s: %s", path, exc)
+                continue
+
+            previous = self._fingerprints.pop(path, {})
+            current = _fingerprint(records, target.id_path) if records is not None else {}
+            if records is not None:
+                self._fingerprints[path] = current
+
+            for uu_id, digest in current.items():
+                old = previous.get(uu_id)
+                if old is None:
+                    changes.append(EntityChange(target.entity, uu_id, "created", str(path)))
+                elif old != digest:
+                    changes.append(EntityChange(target.entity, uu_id, "updated", str(path)))
+            for uu_id in previous.keys() - current.keys():
+                changes.append(EntityChange(target.entity, uu_id, "deleted", str(path)))
+        return changes
+
+    def _target_for(self, path: Path) -> _Target | None:
+        return next((target for target in self._targets if target.matches(path)), None)
+
+
+def _list_json_files(directory: Path) -> list[Path]:
+    try:
+        with os.scandir(directory) as iterator:
+            return sorted(Path(entry.path) for entry in iterator if entry.name.endswith(".json"))
+    except OSError:
+        return []
+
+
+def _fingerprint(records: list[dict[str, Any]], id_path: tuple[str, ...]) -> dict[str, int]:
+    fingerprints: dict[str, int] = {}
+    for record in records:
+        value: Any = record
+        for key in id_path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if isinstance(value, str) and value:
+            fingerprints[value] = hash(
+                json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            )
+    return fingerprints
+
+
+project_data_watcher = ProjectDataWatcher()
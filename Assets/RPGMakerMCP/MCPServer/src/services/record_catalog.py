@@ -0,0 +1,475 @@
+"""
+Filter, sort and projection for the RPGMaker ``list*`` operations.
+
+``list*`` only pages through lightweight summaries, so "items with price over
+500" used to mean fetching every record. ``RecordCatalog`` holds all records
+of one type as lazily materialized columns (one list per field path) and
+answers queries written in a small expression language::
+
+    price > 500 and (name ~ "slime" or basic.id in ["a", "b"]) and not hidden = true
+
+Comparisons are ``=`` (``==``), ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``~``
+(case-insensitive contains), ``^=`` (starts with), ``in [...]`` and
+``exists``; they combine with ``and``, ``or``, ``not`` and parentheses.
+Fields are dotted paths into the stored record; summary keys such as
+``name`` or ``uuId`` resolve to the summary the list operation returns.
+
+Expressions are compiled once (and cached) into functions from a catalog to
+a set of row numbers. Equality and range comparisons use per-field hash and
+sorted indexes that a catalog builds on first use and keeps until its data
+changes; only ``~`` scans a column.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from services.project_data_reader import DataKind, paginate
+from utils.memory import deep_sizeof
+
+# Compiled filter: catalog -> matching row numbers
+RowFilter = Callable[["RecordCatalog"], set[int]]
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>==|!=|<=|>=|\^=|[=<>~()\[\],])
+      | (?P<name>[A-Za-z_][\w]*(?:\.[A-Za-z_]\w*)*)
+    )""",
+    re.VERBOSE,
+)
+
+_KEYWORDS = {"and", "or", "not", "in", "exists", "true", "false", "null"}
+_COMPARISONS = {"=", "==", "!=", "<", "<=", ">", ">=", "~", "^="}
+
+
+class RecordCatalog:
+    """Columnar view over every record of one data kind."""
+
+    def __init__(
+        self, kind: DataKind, records: list[dict[str, Any]], summaries: list[dict[str, Any]]
+    ) -> None:
+        self.kind = kind
+        self._records = records
+        self._summaries = summaries
+        self._columns: dict[str, list[Any]] = {}
+        self._hash_indexes: dict[str, dict[Hashable, list[int]]] = {}
+        # field -> (number keys, rows, string keys, rows), each sorted by key
+        self._range_indexes: dict[str, tuple[list[Any], list[int], list[Any], list[int]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def all_rows(self) -> set[int]:
+        return set(range(len(self._records)))
+
+    def column(self, field: str) -> list[Any]:
+        column = self._columns.get(field)
+        if column is None:
+            if self._summaries and field in self._summaries[0]:
+                column = [summary.get(field) for summary in self._summaries]
+            else:
+                path = field.split(".")
+                column = [_lookup(record, path) for record in self._records]
+            with self._lock:
+                self._columns[field] = column
+        return column
+
+    def hash_index(self, field: str) -> dict[Hashable, list[int]]:
+        index = self._hash_indexes.get(field)
+        if index is None:
+            index = {}
+            for row, value in enumerate(self.column(field)):
+                index.setdefault(_hashable(value), []).append(row)
+            with self._lock:
+                self._hash_indexes[field] = index
+        return index
+
+    def range_index(self, field: str, numeric: bool) -> tuple[list[Any], list[int]]:
+        indexes = self._range_indexes.get(field)
+        if indexes is None:
+            numbers: list[tuple[Any, int]] = []
+            strings: list[tuple[Any, int]] = []
+            for row, value in enumerate(self.column(field)):
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    numbers.append((value, row))
+                elif isinstance(value, str):
+                    strings.append((value, row))
+            numbers.sort()
+            strings.sort()
+            indexes = (
+                [key for key, _ in numbers],
+                [row for _, row in numbers],
+                [key for key, _ in strings],
+                [row for _, row in strings],
+            )
+            with self._lock:
+                self._range_indexes[field] = indexes
+        return (indexes[0], indexes[1]) if numeric else (indexes[2], indexes[3])
+
+    def project(self, rows: list[int], fields: list[str] | None) -> list[dict[str, Any]]:
+        if not fields:
+            return [self._summaries[row] for row in rows]
+        id_keys = [
+            key for key in self.kind.id_keys if self._summaries and key in self._summaries[0]
+        ]
+        columns = [(field, self.column(field)) for field in fields]
+        ids = [(key, self.column(key)) for key in id_keys]
+        return [
+            {
+                **{key: column[row] for key, column in ids},
+                **{field: column[row] for field, column in columns},
+            }
+            for row in rows
+        ]
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        # Records and summaries belong to their source (reader cache or bridge result)
+        with self._lock:
+            return deep_sizeof((self._columns, self._hash_indexes, self._range_indexes), seen)
+
+
+@dataclass(frozen=True)
+class ListQuery:
+    """A compiled filter and sort order."""
+
+    row_filter: RowFilter | None
+    sort_keys: tuple[tuple[str, bool], ...]
+
+    def run(self, catalog: RecordCatalog, payload: dict[str, Any]) -> dict[str, Any]:
+        """Filter, sort, project and paginate; the response matches the list operation's."""
+        if self.row_filter is None:
+            rows = list(range(len(catalog)))
+        else:
+            rows = sorted(self.row_filter(catalog))
+        for field, descending in reversed(self.sort_keys):
+            column = catalog.column(field)
+            present = [row for row in rows if column[row] is not None]
+            missing = [row for row in rows if column[row] is None]
+            present.sort(key=lambda row: _order_key(column[row]), reverse=descending)
+            rows = present + missing
+
+        result = paginate(catalog.kind.items_key, rows, payload)
+        result[catalog.kind.items_key] = catalog.project(
+            result[catalog.kind.items_key], payload.get("fields")
+        )
+        return result
+
+
+@lru_cache(maxsize=256)
+def compile_list_query(filter_expression: str | None, sort: str | None) -> ListQuery:
+    """Compile ``filter`` and ``sort`` parameters.
+
+    Raises:
+        ValueError: If either expression is malformed
+    """
+    row_filter = (
+        _Parser(filter_expression).parse()
+        if filter_expression and filter_expression.strip()
+        else None
+    )
+    return ListQuery(row_filter, _parse_sort(sort or ""))
+
+
+class CatalogStore:
+    """Catalogs per data source, reused until the source's generation changes."""
+
+    def __init__(self) -> None:
+        self._catalogs: dict[tuple[str, str], tuple[Hashable, RecordCatalog]] = {}
+        self._lock = threading.Lock()
+        self._builds = 0
+        self._hits = 0
+        self._queries = 0
+
+    def get(
+        self,
+        source: str,
+        kind: DataKind,
+        generation: Hashable | None,
+        build: Callable[[], RecordCatalog],
+    ) -> RecordCatalog:
+        """Return the cached catalog for ``generation`` or build a new one.
+
+        A ``generation`` of None means the source cannot tell when its data
+        changes; such catalogs are built for one query and not kept.
+        """
+        key = (source, kind.key)
+        with self._lock:
+            self._queries += 1
+            cached = self._catalogs.get(key)
+            if generation is not None and cached is not None and cached[0] == generation:
+                self._hits += 1
+                return cached[1]
+
+        catalog = build()
+        with self._lock:
+            self._builds += 1
+            if generation is None:
+                self._catalogs.pop(key, None)
+            else:
+                self._catalogs[key] = (generation, catalog)
+        return catalog
+
+    def peek(
+        self, source: str, kind: DataKind, generation: Hashable | None
+    ) -> RecordCatalog | None:
+        """Return the cached catalog if it is still current, without building one."""
+        if generation is None:
+            return None
+        with self._lock:
+            cached = self._catalogs.get((source, kind.key))
+            if cached is None or cached[0] != generation:
+                return None
+            self._queries += 1
+            self._hits += 1
+            return cached[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalogs.clear()
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        with self._lock:
+            catalogs = [catalog for _, catalog in self._catalogs.values()]
+        return sum(catalog.measure_memory(seen) for catalog in catalogs)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "catalogs": len(self._catalogs),
+            "builds": self._builds,
+            "hits": self._hits,
+            "queries": self._queries,
+            "compiledQueries": compile_list_query.cache_info().currsize,
+        }
+
+
+# ----------------------------------------------------------------------
+# Expression compiler
+# ----------------------------------------------------------------------
+
+
+class _Parser:
+    def __init__(self, expression: str) -> None:
+        self._expression = expression
+        self._tokens = _tokenize(expression)
+        self._position = 0
+
+    def parse(self) -> RowFilter:
+        row_filter = self._or()
+        if self._position < len(self._tokens):
+            raise self._error(f"unexpected '{self._tokens[self._position][1]}'")
+        return row_filter
+
+    def _or(self) -> RowFilter:
+        parts = [self._and()]
+        while self._accept_word("or"):
+            parts.append(self._and())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda catalog: set().union(*(part(catalog) for part in parts))
+
+    def _and(self) -> RowFilter:
+        parts = [self._not()]
+        while self._accept_word("and"):
+            parts.append(self._not())
+        if len(parts) == 1:
+            return parts[0]
+
+        def intersect(catalog: RecordCatalog) -> set[int]:
+            rows = parts[0](catalog)
+            for part in parts[1:]:
+                if not rows:
+                    break
+                rows = rows & part(catalog)
+            return rows
+
+        return intersect
+
+    def _not(self) -> RowFilter:
+        if self._accept_word("not"):
+            inner = self._not()
+            return lambda catalog: catalog.all_rows() - inner(catalog)
+        if self._accept_op("("):
+            inner = self._or()
+            self._expect_op(")")
+            return inner
+        return self._comparison()
+
+    def _comparison(self) -> RowFilter:
+        kind, field = self._next("field name")
+        if kind != "name" or field in _KEYWORDS:
+            raise self._error(f"expected a field name, got '{field}'")
+
+        if self._accept_word("exists"):
+            return lambda catalog: {
+                row for row, value in enumerate(catalog.column(field)) if value is not None
+            }
+        if self._accept_word("in"):
+            self._expect_op("[")
+            values = [self._value()]
+            while self._accept_op(","):
+                values.append(self._value())
+            self._expect_op("]")
+            keys = [_hashable(value) for value in values]
+            return lambda catalog: _union(catalog.hash_index(field).get(key, ()) for key in keys)
+
+        kind, op = self._next("comparison operator")
+        if kind != "op" or op not in _COMPARISONS:
+            raise self._error(f"expected a comparison operator after '{field}', got '{op}'")
+        return _compile_comparison(field, op, self._value())
+
+    def _value(self) -> Any:
+        kind, text = self._next("value")
+        if kind == "number":
+            return float(text) if any(char in text for char in ".eE") else int(text)
+        if kind == "string":
+            return re.sub(r"\\(.)", r"\1", text[1:-1])
+        if kind == "name" and text in ("true", "false", "null"):
+            return {"true": True, "false": False, "null": None}[text]
+        raise self._error(f"expected a value, got '{text}'")
+
+    def _next(self, expected: str) -> tuple[str, str]:
+        if self._position >= len(self._tokens):
+            raise self._error(f"expected {expected} at end of expression")
+        token = self._tokens[self._position]
+        self._position += 1
+        return token
+
+    def _accept_word(self, word: str) -> bool:
+        if self._position < len(self._tokens) and self._tokens[self._position] == ("name", word):
+            self._position += 1
+            return True
+        return False
+
+    def _accept_op(self, op: str) -> bool:
+        if self._position < len(self._tokens) and self._tokens[self._position] == ("op", op):
+            self._position += 1
+            return True
+        return False
+
+    def _expect_op(self, op: str) -> None:
+        if not self._accept_op(op):
+            raise self._error(f"expected '{op}'")
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid filter '{self._expression}': {message}")
+
+
+def _tokenize(expression: str) -> list[tuple[str, str]]:
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    while position < len(expression):
+        if expression[position:].strip() == "":
+            break
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            raise ValueError(f"Invalid filter '{expression}': unexpected character at {position}")
+        kind = match.lastgroup or ""
+        text = match.group(kind)
+        # Keywords are case-insensitive, field names are not
+        tokens.append(
+            (kind, text.lower() if kind == "name" and text.lower() in _KEYWORDS else text)
+        )
+        position = match.end()
+    return tokens
+
+
+def _compile_comparison(field: str, op: str, value: Any) -> RowFilter:
+    if op in ("=", "=="):
+        key = _hashable(value)
+        return lambda catalog: set(catalog.hash_index(field).get(key, ()))
+    if op == "!=":
+        key = _hashable(value)
+        return lambda catalog: catalog.all_rows() - set(catalog.hash_index(field).get(key, ()))
+    if op in ("~", "^="):
+        needle = str(value).lower()
+        if op == "~":
+
+            def test(text: str) -> bool:
+                return needle in text.lower()
+
+        else:
+
+            def test(text: str) -> bool:
+                return text.lower().startswith(needle)
+
+        return lambda catalog: {
+            row
+            for row, item in enumerate(catalog.column(field))
+            if isinstance(item, str) and test(item)
+        }
+
+    numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if not numeric and not isinstance(value, str):
+        raise ValueError(f"Invalid filter: '{op}' needs a number or string, got {value!r}")
+
+    def compare(catalog: RecordCatalog) -> set[int]:
+        keys, rows = catalog.range_index(field, numeric)
+        if op == "<":
+            return set(rows[: bisect.bisect_left(keys, value)])
+        if op == "<=":
+            return set(rows[: bisect.bisect_right(keys, value)])
+        if op == ">":
+            return set(rows[bisect.bisect_right(keys, value) :])
+        return set(rows[bisect.bisect_left(keys, value) :])
+
+    return compare
+
+
+def _parse_sort(sort: str) -> tuple[tuple[str, bool], ...]:
+    keys: list[tuple[str, bool]] = []
+    for part in sort.split(","):
+        words = part.split()
+        if not words:
+            continue
+        direction = words[1].lower() if len(words) > 1 else "asc"
+        if (
+            len(words) > 2
+            or direction not in ("asc", "desc")
+            or not re.fullmatch(r"[A-Za-z_][\w.]*", words[0])
+        ):
+            raise ValueError(f"Invalid sort '{sort}': expected 'field [asc|desc], ...'")
+        keys.append((words[0], direction == "desc"))
+    return tuple(keys)
+
+
+def _union(groups: Any) -> set[int]:
+    rows: set[int] = set()
+    for group in groups:
+        rows.update(group)
+    return rows
+
+
+def _hashable(value: Any) -> Hashable:
+    # Decoded JSON: scalars hash as-is, dicts and lists by their repr
+    if isinstance(value, Hashable):
+        return value
+    return repr(value)
+
+
+def _order_key(value: Any) -> tuple[int, Any]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return (2, repr(value))
+
+
+def _lookup(record: dict[str, Any], path: list[str]) -> Any:
+    value: Any = record
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+record_catalogs = CatalogStore()
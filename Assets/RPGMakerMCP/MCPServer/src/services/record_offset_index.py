@@ -0,0 +1,209 @@
+"""
+Byte-offset index for large multi-record JSON data files.
+
+Files such as the common event list keep every record in one JSON array, so
+answering ``get*ById`` by parsing the file costs time and memory proportional
+to the whole file. ``RecordOffsetIndex`` scans a file once and records, per
+record id, the byte span of that array element. The spans are persisted as a
+sidecar under the project's ``Library`` folder (never imported by Unity) and
+validated against the data file's size and mtime; afterwards a lookup maps the
+file and decodes only the target record.
+
+Spans are found by decoding the file as latin-1, which maps every byte to one
+character, so the character offsets reported by ``json.JSONDecoder.raw_decode``
+are byte offsets of the UTF-8 file. Record ids are ASCII, so reading them from
+the latin-1 decoded elements is safe.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+SIDECAR_VERSION = 1
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_WHITESPACE = " \t\n\r"
+
+# Returns every id a record can be looked up by
+RecordIdsFunc = Callable[[dict[str, Any]], Iterable[str]]
+
+
+class _Spans:
+    __slots__ = ("size", "mtime_ns", "spans")
+
+    def __init__(self, size: int, mtime_ns: int, spans: dict[str, tuple[int, int]]) -> None:
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.spans = spans
+
+
+class RecordOffsetIndex:
+    def __init__(self, cache_dir: Path, record_ids: RecordIdsFunc) -> None:
+        self._cache_dir = cache_dir
+        self._record_ids = record_ids
+        self._indexes: dict[Path, _Spans] = {}
+        self._lock = threading.Lock()
+        self._builds = 0
+        self._sidecar_loads = 0
+        self._lookups = 0
+        self._misses = 0
+        self._last_build_ms = 0.0
+
+    def get(self, path: Path, record_id: str) -> dict[str, Any] | None:
+        """Decode the record with ``record_id`` from ``path`` using its span.
+
+        Returns None if the file has no record with that id or is not a
+        JSON array of records. Raises OSError if the file cannot be read.
+        """
+        spans = self._spans_for(path)
+        with self._lock:
+            self._lookups += 1
+        span = spans.spans.get(record_id) if spans is not None else None
+        if span is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        start, end = span
+        with (
+            path.open("rb") as handle,
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            record = json.loads(mapped[start:end].decode("utf-8"))
+        return record if isinstance(record, dict) else None
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self._indexes.pop(path, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "indexedFiles": len(self._indexes),
+            "builds": self._builds,
+            "sidecarLoads": self._sidecar_loads,
+            "lookups": self._lookups,
+            "misses": self._misses,
+            "lastBuildMs": round(self._last_build_ms, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _spans_for(self, path: Path) -> _Spans | None:
+        stat = path.stat()
+        with self._lock:
+            cached = self._indexes.get(path)
+        if (
+            cached is not None
+            and cached.size == stat.st_size
+            and cached.mtime_ns == stat.st_mtime_ns
+        ):
+            return cached
+
+        sidecar = self._sidecar_path(path)
+        spans = _read_sidecar(sidecar, stat.st_size, stat.st_mtime_ns)
+        if spans is not None:
+            with self._lock:
+                self._sidecar_loads += 1
+        else:
+            started_at = time.perf_counter()
+            found = self._scan(path)
+            if found is None:
+                return None
+            spans = _Spans(stat.st_size, stat.st_mtime_ns, found)
+            _write_sidecar(sidecar, spans)
+            with self._lock:
+                self._builds += 1
+                self._last_build_ms = (time.perf_counter() - started_at) * 1000
+
+        with self._lock:
+            self._indexes[path] = spans
+        return spans
+
+    def _scan(self, path: Path) -> dict[str, tuple[int, int]] | None:
+        text = path.read_bytes().decode("latin-1")
+        position = len(_UTF8_BOM) if text.startswith(_UTF8_BOM.decode("latin-1")) else 0
+        position = _skip_whitespace(text, position)
+
+        # Unity's JsonUtility wraps top-level lists in a single-key object
+        if text.startswith("{", position):
+            position = _skip_whitespace(text, position + 1)
+            if not text.startswith('"', position):
+                return None
+            _, position = _DECODER.raw_decode(text, position)
+            position = _skip_whitespace(text, position)
+            if not text.startswith(":", position):
+                return None
+            position = _skip_whitespace(text, position + 1)
+
+        if not text.startswith("[", position):
+            return None
+        position = _skip_whitespace(text, position + 1)
+
+        spans: dict[str, tuple[int, int]] = {}
+        while position < len(text) and text[position] != "]":
+            element, end = _DECODER.raw_decode(text, position)
+            if isinstance(element, dict):
+                for record_id in self._record_ids(element):
+                    spans.setdefault(record_id, (position, end))
+            position = _skip_whitespace(text, end)
+            if text.startswith(",", position):
+                position = _skip_whitespace(text, position + 1)
+        return spans
+
+    def _sidecar_path(self, path: Path) -> Path:
+        digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+        return self._cache_dir / f"{path.stem}-{digest}.idx.json"
+
+
+_DECODER = json.JSONDecoder()
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    while position < len(text) and text[position] in _WHITESPACE:
+        position += 1
+    return position
+
+
+def _read_sidecar(sidecar: Path, size: int, mtime_ns: int) -> _Spans | None:
+    try:
+        with sidecar.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != SIDECAR_VERSION
+        or data.get("size") != size
+        or data.get("mtimeNs") != mtime_ns
+    ):
+        return None
+    return _Spans(
+        size, mtime_ns, {key: (span[0], span[1]) for key, span in data.get("spans", {}).items()}
+    )
+
+
+def _write_sidecar(sidecar: Path, spans: _Spans) -> None:
+    payload = {
+        "version": SIDECAR_VERSION,
+        "size": spans.size,
+        "mtimeNs": spans.mtime_ns,
+        "spans": spans.spans,
+    }
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        temporary = sidecar.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(temporary, sidecar)
+    except OSError:
+        # The in-memory index still serves this process
+        pass
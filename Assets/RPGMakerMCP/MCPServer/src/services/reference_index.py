@@ -0,0 +1,387 @@
+"""
+Cross-reference graph over the RPGMaker database in the project files.
+
+Before deleting or renaming an item, switch or common event an agent needs to
+know where it is used. ``ReferenceIndex`` answers ``findUsages`` (every site
+referencing an id) and ``findUnused`` (definitions nobody references) without
+walking the event pages through Unity.
+
+Definitions come from the database files the project data reader serves,
+the map event list (``Event/JSON/eventMap*.json``) and the switch and
+variable lists (``Flags/JSON``). References are extracted from event command
+files (one per event page), map events, common events, troops, skills, items
+and the system settings (``Initializations/JSON/system*.json``).
+
+Records in RPGMaker Unite refer to each other by UUID string, so extraction is
+schema-agnostic: every UUID-shaped string, and every string stored under an
+``...Id`` key, that is not the record's own id is a reference. Sites carry the
+map, event, page and command index for event commands, or the record and
+field path elsewhere.
+
+The graph is maintained incrementally like the search index: each query
+stats the files, re-reads changed ones and replaces the outgoing references
+of the records whose content changed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from logger import logger
+from services.project_data_reader import (
+    DATA_KINDS,
+    EVENT_ENTITY,
+    LocalDataUnavailable,
+    ProjectDataReader,
+    data_kind,
+    project_data_reader,
+    stat_data_files,
+)
+from utils.memory import deep_sizeof
+
+DEFAULT_USAGE_LIMIT = 100
+
+REFERENCE_OPERATIONS = ("findUsages", "findUnused", "stats")
+
+MAP_EVENT_ENTITY = "mapEvents"
+FLAG_ENTITY = "flags"
+SYSTEM_ENTITY = "system"
+
+# Definition kinds reported by findUnused, besides the data kinds
+FLAG_KINDS = ("switches", "variables")
+
+_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+_PAGE = re.compile(r"-(\d+)$")
+
+
+class ReferenceIndex:
+    def __init__(self, reader: ProjectDataReader) -> None:
+        self._reader = reader
+        self._lock = threading.Lock()
+        self._reset()
+        self._syncs = 0
+        self._records_extracted = 0
+        self._last_sync_ms = 0.0
+
+    def find_usages(
+        self, target_id: str, limit: int = DEFAULT_USAGE_LIMIT, offset: int = 0
+    ) -> dict[str, Any]:
+        with self._lock:
+            self._sync()
+            sites = sorted(self._incoming.get(target_id, {}).values(), key=_site_order)
+            page = [self._present_site(site) for site in sites[offset : offset + limit]]
+            definition = self._present_definition(target_id)
+        return {
+            "success": True,
+            "id": target_id,
+            "definition": definition,
+            "usages": page,
+            "count": len(page),
+            "totalCount": len(sites),
+            "offset": offset,
+            "limit": limit,
+            "hasMore": offset + len(page) < len(sites),
+        }
+
+    def find_unused(
+        self, kind: str, limit: int = DEFAULT_USAGE_LIMIT, offset: int = 0
+    ) -> dict[str, Any]:
+        if kind not in self.definition_kinds():
+            raise ValueError(
+                f"Unknown kind: {kind}. Supported: {', '.join(self.definition_kinds())}"
+            )
+        with self._lock:
+            self._sync()
+            unused = sorted(
+                (definition_id, name)
+                for definition_id, (definition_kind, name, _) in self._defined.items()
+                if definition_kind == kind and definition_id not in self._incoming
+            )
+        page = unused[offset : offset + limit]
+        return {
+            "success": True,
+            "kind": kind,
+            "unused": [{"id": definition_id, "name": name} for definition_id, name in page],
+            "count": len(page),
+            "totalCount": len(unused),
+            "offset": offset,
+            "limit": limit,
+            "hasMore": offset + len(page) < len(unused),
+        }
+
+    def run_query(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Run a reference operation with tool style camelCase parameters."""
+        limit = int(params.get("limit") or DEFAULT_USAGE_LIMIT)
+        offset = int(params.get("offset") or 0)
+        if operation == "findUsages":
+            target_id = params.get("id") or params.get("uuId")
+            if not target_id:
+                raise ValueError("Parameter 'id' is required")
+            return self.find_usages(str(target_id), limit, offset)
+        if operation == "findUnused":
+            if not params.get("kind"):
+                raise ValueError("Parameter 'kind' is required")
+            return self.find_unused(str(params["kind"]), limit, offset)
+        if operation == "stats":
+            with self._lock:
+                self._sync()
+            return {"success": True, **self.get_stats()}
+        raise ValueError(
+            f"Unknown reference operation: {operation}. Supported: {', '.join(REFERENCE_OPERATIONS)}"
+        )
+
+    @staticmethod
+    def definition_kinds() -> tuple[str, ...]:
+        return (*(kind.key for kind in DATA_KINDS), MAP_EVENT_ENTITY, *FLAG_KINDS)
+
+    def definitions(self) -> dict[str, str]:
+        """Return {id: kind} for every definition in the project files."""
+        with self._lock:
+            self._sync()
+            return {definition_id: found[0] for definition_id, found in self._defined.items()}
+
+    def clear(self) -> None:
+        """Drop the graph; it is rebuilt from the files on the next query."""
+        with self._lock:
+            self._reset()
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        with self._lock:
+            return deep_sizeof(
+                (self._files, self._outgoing, self._incoming, self._defined, self._defined_by_path),
+                seen,
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "files": len(self._files),
+            "definitions": len(self._defined),
+            "referencedIds": len(self._incoming),
+            "references": sum(len(sites) for sites in self._incoming.values()),
+            "syncs": self._syncs,
+            "recordsExtracted": self._records_extracted,
+            "lastSyncMs": round(self._last_sync_ms, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        # path -> (mtime_ns, size, {record key: fingerprint})
+        self._files: dict[str, tuple[int, int, dict[str, int]]] = {}
+        # (path, record key) -> referenced ids
+        self._outgoing: dict[tuple[str, str], list[str]] = {}
+        # referenced id -> {(path, record key, field path): site}
+        self._incoming: dict[str, dict[tuple[str, str, str], dict[str, Any]]] = {}
+        # defined id -> (kind, name, map id of map events), and the ids each file defines
+        self._defined: dict[str, tuple[str, str, Any]] = {}
+        self._defined_by_path: dict[str, list[str]] = {}
+
+    def _targets(self) -> list[tuple[Path, str, str, tuple[str, ...]]]:
+        root = self._reader.storage_root
+        targets = self._reader.watch_targets()
+        targets.extend(
+            [
+                (root / "Event" / "JSON", "eventMap*.json", MAP_EVENT_ENTITY, ("eventId",)),
+                (root / "Flags" / "JSON", "*.json", FLAG_ENTITY, ()),
+                (root / "Initializations" / "JSON", "system*.json", SYSTEM_ENTITY, ()),
+            ]
+        )
+        return targets
+
+    def _sync(self) -> None:
+        started_at = time.perf_counter()
+        present: set[str] = set()
+        for path, mtime_ns, size, entity, id_path in stat_data_files(self._targets()):
+            present.add(path)
+            known = self._files.get(path)
+            if known is None or known[0] != mtime_ns or known[1] != size:
+                self._extract_file(path, mtime_ns, size, entity, id_path)
+
+        for path in [path for path in self._files if path not in present]:
+            for key in self._files.pop(path)[2]:
+                self._remove_record(path, key)
+            self._replace_definitions(path, {})
+
+        self._syncs += 1
+        self._last_sync_ms = (time.perf_counter() - started_at) * 1000
+
+    def _extract_file(
+        self, path: str, mtime_ns: int, size: int, entity: str, id_path: tuple[str, ...]
+    ) -> None:
+        try:
+            records = self._reader.reload(Path(path)) or []
+        except LocalDataUnavailable as exc:
+            # Usually a partial write; the file is retried on the next query
+            logger.debug("Reference index skipped %s: %s", path, exc)
+            return
+
+        previous = self._files.get(path, (0, 0, {}))[2]
+        fingerprints: dict[str, int] = {}
+        definitions: dict[str, tuple[str, str, Any]] = {}
+        for position, record in enumerate(records):
+            own_id = _lookup(record, id_path) if id_path else None
+            key = own_id if isinstance(own_id, str) and own_id else f"#{position}"
+            defined = dict(_definitions(entity, record, own_id))
+            definitions.update(defined)
+
+            fingerprint = hash(
+                json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            )
+            fingerprints[key] = fingerprint
+            if previous.get(key) != fingerprint:
+                self._remove_record(path, key)
+                self._add_record(path, key, entity, record, own_id, defined.keys() | {own_id})
+
+        for key in previous.keys() - fingerprints.keys():
+            self._remove_record(path, key)
+        self._files[path] = (mtime_ns, size, fingerprints)
+        self._replace_definitions(path, definitions)
+
+    def _replace_definitions(self, path: str, definitions: dict[str, tuple[str, str, Any]]) -> None:
+        for definition_id in self._defined_by_path.pop(path, ()):
+            self._defined.pop(definition_id, None)
+        if definitions:
+            self._defined.update(definitions)
+            self._defined_by_path[path] = list(definitions)
+
+    def _add_record(
+        self,
+        path: str,
+        key: str,
+        entity: str,
+        record: dict[str, Any],
+        own_id: Any,
+        own_ids: set[Any],
+    ) -> None:
+        base: dict[str, Any] = {
+            "source": entity,
+            "uuId": own_id if isinstance(own_id, str) else None,
+        }
+        if entity == EVENT_ENTITY:
+            match = _PAGE.search(Path(path).stem)
+            base["page"] = int(match.group(1)) if match else None
+        elif entity == MAP_EVENT_ENTITY:
+            base["mapId"] = record.get("mapId")
+
+        targets: list[str] = []
+        for field, value in _references(record):
+            # Ids a record defines (its own, or the flags it lists) are not references
+            if value in own_ids:
+                continue
+            site = dict(base, path=field)
+            if entity == EVENT_ENTITY:
+                command = _COMMAND_PATH.match(field)
+                if command:
+                    site["commandIndex"] = int(command.group(1))
+                    site["code"] = record["eventCommands"][site["commandIndex"]].get("code")
+            self._incoming.setdefault(value, {})[(path, key, field)] = site
+            targets.append(value)
+        if targets:
+            self._outgoing[(path, key)] = targets
+        self._records_extracted += 1
+
+    def _remove_record(self, path: str, key: str) -> None:
+        for target_id in self._outgoing.pop((path, key), ()):
+            sites = self._incoming.get(target_id)
+            if sites is None:
+                continue
+            for site_key in [
+                site_key for site_key in sites if site_key[0] == path and site_key[1] == key
+            ]:
+                del sites[site_key]
+            if not sites:
+                del self._incoming[target_id]
+
+    # ------------------------------------------------------------------
+    # Presentation
+    # ------------------------------------------------------------------
+
+    def _present_definition(self, definition_id: str) -> dict[str, Any] | None:
+        found = self._defined.get(definition_id)
+        if found is None:
+            return None
+        definition = {"kind": found[0], "name": found[1]}
+        if found[0] == MAP_EVENT_ENTITY:
+            definition["mapId"] = found[2]
+        return definition
+
+    def _present_site(self, site: dict[str, Any]) -> dict[str, Any]:
+        presented = dict(site)
+        if site["source"] == EVENT_ENTITY:
+            # Event pages do not record their owner; resolve it from the definitions
+            owner = self._defined.get(site["uuId"]) if site["uuId"] else None
+            if owner is None:
+                presented["eventKind"] = "unknown"
+            else:
+                presented["eventKind"] = {"commonEvents": "common", MAP_EVENT_ENTITY: "map"}.get(
+                    owner[0], "unknown"
+                )
+                if owner[0] == MAP_EVENT_ENTITY:
+                    presented["mapId"] = owner[2]
+        return presented
+
+
+_COMMAND_PATH = re.compile(r"^eventCommands\[(\d+)\]")
+
+
+def _definitions(
+    entity: str, record: dict[str, Any], own_id: Any
+) -> Iterator[tuple[str, tuple[str, str, Any]]]:
+    """Yield (id, (kind, name, map id)) for the ids a record defines."""
+    if entity == FLAG_ENTITY:
+        for flag_kind in FLAG_KINDS:
+            for flag in record.get(flag_kind) or []:
+                if isinstance(flag, dict) and isinstance(flag.get("id"), str):
+                    yield flag["id"], (flag_kind, str(flag.get("name") or ""), None)
+        return
+    if not isinstance(own_id, str) or not own_id:
+        return
+    if entity == MAP_EVENT_ENTITY:
+        yield own_id, (MAP_EVENT_ENTITY, str(record.get("name") or ""), record.get("mapId"))
+        return
+    kind = data_kind(entity)
+    if kind is not None:
+        yield own_id, (kind.key, str(_lookup(record, kind.name_path) or ""), None)
+
+
+def _references(value: Any, path: str = "", key: str = "") -> Iterator[tuple[str, str]]:
+    """Yield (field path, referenced id) for the id-like strings in a record."""
+    if isinstance(value, dict):
+        for child_key, child in value.items():
+            yield from _references(child, f"{path}.{child_key}" if path else child_key, child_key)
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            yield from _references(child, f"{path}[{index}]", key)
+    elif isinstance(value, str) and value:
+        if _UUID.match(value) or (key != "id" and key.endswith(("Id", "ID"))):
+            yield path, value
+
+
+def _site_order(site: dict[str, Any]) -> tuple[str, str, int, int, str]:
+    page = site.get("page")
+    command_index = site.get("commandIndex")
+    return (
+        str(site["source"]),
+        str(site.get("uuId") or ""),
+        page if isinstance(page, int) else -1,
+        command_index if isinstance(command_index, int) else -1,
+        str(site["path"]),
+    )
+
+
+def _lookup(record: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value: Any = record
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+reference_index = ReferenceIndex(project_data_reader)
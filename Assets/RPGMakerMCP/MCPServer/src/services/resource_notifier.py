@@ -0,0 +1,123 @@
+"""
+MCP resource subscription bookkeeping and updated-notification delivery.
+
+Producers call ``notify(uri)`` whenever the state behind a resource changes.
+Changes are coalesced per URI and delivered to every subscribed session at most
+once per ``RESOURCE_UPDATE_MIN_INTERVAL`` seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+
+from mcp.server.session import ServerSession
+from pydantic import AnyUrl
+
+from config.constants import notification
+from logger import logger
+
+
+class ResourceNotifier:
+    def __init__(
+        self,
+        min_interval: float = notification.RESOURCE_UPDATE_MIN_INTERVAL,
+        coalesce_delay: float = notification.RESOURCE_UPDATE_COALESCE_DELAY,
+    ) -> None:
+        self._min_interval = min_interval
+        self._coalesce_delay = coalesce_delay
+        self._subscriptions: dict[str, weakref.WeakSet[ServerSession]] = {}
+        self._dirty: set[str] = set()
+        self._last_sent: dict[str, float] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # The loop keeps only weak references to tasks; hold sends until they finish
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._sent_count = 0
+        self._coalesced_count = 0
+
+    def subscribe(self, uri: str, session: ServerSession) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._subscriptions.setdefault(uri, weakref.WeakSet()).add(session)
+        logger.debug("Resource subscribed: %s", uri)
+
+    def unsubscribe(self, uri: str, session: ServerSession) -> None:
+        sessions = self._subscriptions.get(uri)
+        if sessions is None:
+            return
+        sessions.discard(session)
+        if not sessions:
+            self._subscriptions.pop(uri, None)
+        logger.debug("Resource unsubscribed: %s", uri)
+
+    def has_subscribers(self, uri: str) -> bool:
+        return bool(self._subscriptions.get(uri))
+
+    def notify(self, uri: str) -> None:
+        """Mark a resource as changed. Safe to call from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._mark_dirty(uri)
+        else:
+            loop.call_soon_threadsafe(self._mark_dirty, uri)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "subscriptions": sum(len(sessions) for sessions in self._subscriptions.values()),
+            "notificationsSent": self._sent_count,
+            "changesCoalesced": self._coalesced_count,
+        }
+
+    def _mark_dirty(self, uri: str) -> None:
+        if not self.has_subscribers(uri):
+            return
+        if uri in self._dirty:
+            self._coalesced_count += 1
+            return
+        self._dirty.add(uri)
+        self._schedule_flush(self._coalesce_delay)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._flush_handle is not None or self._loop is None:
+            return
+        self._flush_handle = self._loop.call_later(delay, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        now = time.monotonic()
+        next_delay: float | None = None
+
+        for uri in list(self._dirty):
+            wait = self._last_sent.get(uri, float("-inf")) + self._min_interval - now
+            if wait > 0:
+                next_delay = wait if next_delay is None else min(next_delay, wait)
+                continue
+
+            self._dirty.discard(uri)
+            self._last_sent[uri] = now
+            for session in list(self._subscriptions.get(uri, ())):
+                task = asyncio.ensure_future(self._send(uri, session))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        if next_delay is not None:
+            self._schedule_flush(next_delay)
+
+    async def _send(self, uri: str, session: ServerSession) -> None:
+        try:
+            await session.send_resource_updated(AnyUrl(uri))
+            self._sent_count += 1
+        except Exception as exc:
+            # The session is gone; stop notifying it
+            logger.debug("Dropping subscriber for %s after send failure: %s", uri, exc)
+            self.unsubscribe(uri, session)
+
+
+resource_notifier = ResourceNotifier()
@@ -0,0 +1,427 @@
+"""
+Full-text search over the RPGMaker database in the project files.
+
+``SearchIndex`` keeps an inverted index of every text field (names,
+descriptions, notes, event messages, ...) of the records the project data
+reader knows about: characters, items, animations, enemies, troops, skills,
+maps, common events and the command lists of map and common events.
+
+Text is NFKC-normalized and case-folded, then tokenized two ways: ASCII
+letters and digits become whole words, everything else (Japanese, accented
+letters, ...) becomes character unigrams and bigrams so that queries match
+inside unsegmented text. ``word*`` matches words by prefix through a sorted
+vocabulary. Results are ranked with BM25, with name fields weighted up.
+
+The index is maintained incrementally: before each search the data files are
+stat'ed, and only files whose mtime or size changed are re-read; within them
+only records whose content changed are re-indexed. Writes made through Unity
+are therefore visible to the next search without a rebuild.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from logger import logger
+from services.project_data_reader import (
+    LocalDataUnavailable,
+    ProjectDataReader,
+    project_data_reader,
+    stat_data_files,
+)
+from utils.memory import deep_sizeof
+
+DEFAULT_SEARCH_LIMIT = 20
+
+# Only the start of very long strings is indexed
+MAX_FIELD_LENGTH = 4096
+
+# Prefix queries expand to at most this many vocabulary words
+MAX_PREFIX_EXPANSION = 200
+
+# BM25 parameters and the boost for name-like fields
+_K1 = 1.2
+_B = 0.75
+_NAME_WEIGHT = 2.0
+
+_SEGMENT = re.compile(r"[a-z0-9]+|[^\W_a-z0-9]+")
+_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+_SNIPPET_RADIUS = 40
+
+
+class _Doc:
+    """One indexed text field."""
+
+    __slots__ = ("entity", "uu_id", "field", "text", "length", "weight")
+
+    def __init__(
+        self, entity: str, uu_id: str, field: str, text: str, length: int, weight: float
+    ) -> None:
+        self.entity = entity
+        self.uu_id = uu_id
+        self.field = field
+        self.text = text
+        self.length = length
+        self.weight = weight
+
+
+class _QueryTerm:
+    __slots__ = ("text", "grams", "prefix")
+
+    def __init__(self, text: str, grams: list[str], prefix: bool) -> None:
+        self.text = text
+        self.grams = grams
+        self.prefix = prefix
+
+
+class SearchIndex:
+    def __init__(self, reader: ProjectDataReader) -> None:
+        self._reader = reader
+        self._lock = threading.Lock()
+        self._reset()
+        self._syncs = 0
+        self._records_indexed = 0
+        self._last_sync_ms = 0.0
+        self._last_search_ms = 0.0
+
+    def search(
+        self,
+        query: str,
+        entities: list[str] | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return ranked text-field hits for ``query`` after syncing changed files.
+
+        Raises:
+            ValueError: If the query has no searchable terms
+        """
+        terms = _query_terms(query)
+        if not terms:
+            raise ValueError("Search query must contain at least one letter or digit")
+
+        with self._lock:
+            self._sync()
+            started_at = time.perf_counter()
+            total, hits = self._rank(terms, set(entities) if entities else None, offset + limit)
+            self._last_search_ms = (time.perf_counter() - started_at) * 1000
+
+        page = hits[offset:]
+        return {
+            "success": True,
+            "query": query,
+            "results": [self._present(doc, score, terms) for doc, score in page],
+            "count": len(page),
+            "totalCount": total,
+            "offset": offset,
+            "limit": limit,
+            "hasMore": offset + len(page) < total,
+        }
+
+    def clear(self) -> None:
+        """Drop the index; it is rebuilt from the files on the next search."""
+        with self._lock:
+            self._reset()
+
+    def measure_memory(self, seen: set[int] | None = None) -> int:
+        with self._lock:
+            return deep_sizeof(
+                (self._docs, self._postings, self._record_docs, self._files, self._vocabulary), seen
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "documents": len(self._docs) - len(self._free),
+            "terms": len(self._postings),
+            "records": len(self._record_docs),
+            "files": len(self._files),
+            "syncs": self._syncs,
+            "recordsIndexed": self._records_indexed,
+            "lastSyncMs": round(self._last_sync_ms, 3),
+            "lastSearchMs": round(self._last_search_ms, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._docs: list[_Doc | None] = []
+        self._free: list[int] = []
+        self._postings: dict[str, dict[int, int]] = {}
+        # (file, uuId) -> docs; map and common events can span several event files
+        self._record_docs: dict[tuple[str, str], list[int]] = {}
+        # path -> (mtime_ns, size, entity, {uuId: record fingerprint})
+        self._files: dict[str, tuple[int, int, str, dict[str, int]]] = {}
+        self._vocabulary: list[str] | None = None
+        self._total_length = 0
+
+    def _sync(self) -> None:
+        started_at = time.perf_counter()
+        present: set[str] = set()
+        for path, mtime_ns, size, entity, id_path in stat_data_files(self._reader.watch_targets()):
+            present.add(path)
+            known = self._files.get(path)
+            if known is None or known[0] != mtime_ns or known[1] != size:
+                self._index_file(path, mtime_ns, size, entity, id_path)
+
+        for path in [path for path in self._files if path not in present]:
+            for uu_id in self._files.pop(path)[3]:
+                self._remove_record(path, uu_id)
+
+        self._syncs += 1
+        self._last_sync_ms = (time.perf_counter() - started_at) * 1000
+
+    def _index_file(
+        self, path: str, mtime_ns: int, size: int, entity: str, id_path: tuple[str, ...]
+    ) -> None:
+        try:
+            records = self._reader.reload(Path(path)) or []
+        except LocalDataUnavailable as exc:
+            # Usually a partial write; the file is retried on the next search
+            logger.debug("Search index skipped %s: %s", path, exc)
+            return
+
+        previous = self._files.get(path, (0, 0, entity, {}))[3]
+        fingerprints: dict[str, int] = {}
+        for record in records:
+            uu_id = _lookup(record, id_path)
+            if not isinstance(uu_id, str) or not uu_id:
+                continue
+            fingerprint = hash(
+                json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            )
+            fingerprints[uu_id] = fingerprint
+            if previous.get(uu_id) != fingerprint:
+                self._remove_record(path, uu_id)
+                self._add_record(path, entity, uu_id, record)
+
+        for uu_id in previous.keys() - fingerprints.keys():
+            self._remove_record(path, uu_id)
+        self._files[path] = (mtime_ns, size, entity, fingerprints)
+
+    def _add_record(self, path: str, entity: str, uu_id: str, record: dict[str, Any]) -> None:
+        doc_ids: list[int] = []
+        for field, text in _text_fields(record):
+            terms = _index_terms(_normalize(text))
+            if not terms:
+                continue
+            leaf = field.rsplit(".", 1)[-1]
+            weight = _NAME_WEIGHT if leaf.lower().endswith("name") else 1.0
+            doc = _Doc(entity, uu_id, field, text, len(terms), weight)
+            if self._free:
+                doc_id = self._free.pop()
+                self._docs[doc_id] = doc
+            else:
+                doc_id = len(self._docs)
+                self._docs.append(doc)
+            for term, frequency in Counter(terms).items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._vocabulary = None
+                postings[doc_id] = frequency
+            self._total_length += doc.length
+            doc_ids.append(doc_id)
+        if doc_ids:
+            self._record_docs[(path, uu_id)] = doc_ids
+        self._records_indexed += 1
+
+    def _remove_record(self, path: str, uu_id: str) -> None:
+        for doc_id in self._record_docs.pop((path, uu_id), ()):
+            doc = self._docs[doc_id]
+            if doc is None:
+                continue
+            for term in set(_index_terms(_normalize(doc.text))):
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+                    self._vocabulary = None
+            self._total_length -= doc.length
+            self._docs[doc_id] = None
+            self._free.append(doc_id)
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def _rank(
+        self, terms: list[_QueryTerm], entities: set[str] | None, count: int
+    ) -> tuple[int, list[tuple[_Doc, float]]]:
+        """Return the number of matching fields and the ``count`` best (doc, score) pairs."""
+        matches: list[dict[int, int]] = []
+        for term in terms:
+            found = self._match(term)
+            if not found:
+                return 0, []
+            matches.append(found)
+
+        smallest: dict[int, int] = min(matches, key=len)
+        candidate_ids = set(smallest)
+        for found in matches:
+            candidate_ids.intersection_update(found)
+
+        candidates: dict[int, _Doc] = {}
+        for doc_id in candidate_ids:
+            doc = self._docs[doc_id]
+            if doc is None or (entities is not None and doc.entity not in entities):
+                continue
+            candidates[doc_id] = doc
+        for term in terms:
+            if len(term.grams) > 1:
+                # Bigrams alone do not guarantee the characters are adjacent
+                candidates = {
+                    doc_id: doc
+                    for doc_id, doc in candidates.items()
+                    if term.text in _normalize(doc.text)
+                }
+
+        doc_count = max(1, len(self._docs) - len(self._free))
+        length_scale = _B / (self._total_length / doc_count)
+        norms = {
+            doc_id: _K1 * (1 - _B + length_scale * doc.length) for doc_id, doc in candidates.items()
+        }
+        scores = dict.fromkeys(candidates, 0.0)
+        for found in matches:
+            idf = math.log(1 + (doc_count - len(found) + 0.5) / (len(found) + 0.5)) * (_K1 + 1)
+            for doc_id, norm in norms.items():
+                tf = found[doc_id]
+                scores[doc_id] += idf * tf / (tf + norm)
+
+        # Ties go to the field indexed first
+        best = heapq.nlargest(
+            count,
+            ((score * candidates[doc_id].weight, -doc_id) for doc_id, score in scores.items()),
+        )
+        return len(scores), [(candidates[-negated_id], score) for score, negated_id in best]
+
+    def _match(self, term: _QueryTerm) -> dict[int, int]:
+        """Return doc id -> term frequency for the docs containing ``term``."""
+        if term.prefix:
+            found: dict[int, int] = {}
+            for word in self._expand_prefix(term.text):
+                for doc_id, tf in self._postings[word].items():
+                    found[doc_id] = found.get(doc_id, 0) + tf
+            return found
+
+        postings: list[dict[int, int]] = []
+        for gram in term.grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return {}
+            postings.append(posting)
+        postings.sort(key=len)
+        found = dict(postings[0])
+        for posting in postings[1:]:
+            found = {
+                doc_id: min(tf, posting[doc_id])
+                for doc_id, tf in found.items()
+                if doc_id in posting
+            }
+            if not found:
+                break
+        return found
+
+    def _expand_prefix(self, prefix: str) -> list[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\uffff")
+        return self._vocabulary[start : min(end, start + MAX_PREFIX_EXPANSION)]
+
+    def _present(self, doc: _Doc, score: float, terms: list[_QueryTerm]) -> dict[str, Any]:
+        return {
+            "entity": doc.entity,
+            "uuId": doc.uu_id,
+            "field": doc.field,
+            "snippet": _snippet(doc.text, terms),
+            "score": round(score, 4),
+        }
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _index_terms(normalized: str) -> list[str]:
+    terms: list[str] = []
+    for match in _SEGMENT.finditer(normalized):
+        segment = match.group()
+        if segment.isascii():
+            terms.append(segment)
+            continue
+        terms.extend(segment)
+        terms.extend(segment[i : i + 2] for i in range(len(segment) - 1))
+    return terms
+
+
+def _query_terms(query: str) -> list[_QueryTerm]:
+    terms: list[_QueryTerm] = []
+    normalized = _normalize(query)
+    for match in _SEGMENT.finditer(normalized):
+        segment = match.group()
+        prefix = normalized.startswith("*", match.end())
+        if segment.isascii():
+            terms.append(_QueryTerm(segment, [segment], prefix))
+        elif len(segment) == 1:
+            terms.append(_QueryTerm(segment, [segment], False))
+        else:
+            grams = list(dict.fromkeys(segment[i : i + 2] for i in range(len(segment) - 1)))
+            terms.append(_QueryTerm(segment, grams, False))
+    return terms
+
+
+def _text_fields(record: Any, path: str = "") -> Iterator[tuple[str, str]]:
+    """Yield (field path, text) for the string values worth searching."""
+    if isinstance(record, dict):
+        for key, value in record.items():
+            # Ids and references to other records are not text
+            if key == "id" or key.endswith(("Id", "ID")):
+                continue
+            yield from _text_fields(value, f"{path}.{key}" if path else key)
+    elif isinstance(record, list):
+        for index, value in enumerate(record):
+            yield from _text_fields(value, f"{path}[{index}]")
+    elif isinstance(record, str):
+        text = record.strip()
+        if text and not _UUID.match(text):
+            yield path, text[:MAX_FIELD_LENGTH]
+
+
+def _snippet(text: str, terms: list[_QueryTerm]) -> str:
+    normalized = _normalize(text)
+    # NFKC can change lengths; only use the position when it maps one to one
+    position = -1
+    if len(normalized) == len(text):
+        positions = [normalized.find(term.text) for term in terms]
+        found = [p for p in positions if p >= 0]
+        position = min(found) if found else -1
+    if position < 0 or len(text) <= 2 * _SNIPPET_RADIUS:
+        return text if len(text) <= 2 * _SNIPPET_RADIUS else text[: 2 * _SNIPPET_RADIUS] + "…"
+    start = max(0, position - _SNIPPET_RADIUS)
+    end = min(len(text), position + _SNIPPET_RADIUS)
+    return ("…" if start else "") + text[start:end] + ("…" if end < len(text) else "")
+
+
+def _lookup(record: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value: Any = record
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+search_index = SearchIndex(project_data_reader)
@@ -0,0 +1,269 @@
+"""
+Write coalescing for bursts of updates to the same record.
+
+Agents often send several small ``updateCharacter`` / ``updateMap`` /
+``setGameVariable`` calls against one target within a few hundred
+milliseconds, and each one is a Unity round trip with a save and a refresh.
+With ``MCP_WRITE_COALESCE_MS`` set, ``WriteCoalescer`` holds such a write for
+that long, keyed on (bridge tool, operation, target id), and merges every
+write to the same key that arrives meanwhile into one bridge command:
+
+- objects are merged recursively and scalars and lists from later writes
+  win, which is what applying the writes one after another does, since the
+  Unity handlers update nested objects field by field
+  (``DataModelMapper.ApplyPartialUpdate``),
+- ``null`` in a later write keeps the earlier value, as Unity ignores nulls,
+- record data sent under an alias (``characterData`` / ``animationData``
+  next to ``itemData``) is moved to the key Unity reads first before
+  merging, so two writes naming the data differently cannot shadow each other.
+
+Writes with ``"patchFormat": "merge"`` are not coalesced, since their nulls
+clear members (see ``services/merge_patch.py``).
+
+Every caller of a merged command gets its result (or its error). The window
+starts with the first write and is not extended, so a write waits at most
+one window. Any other bridge call flushes first: a call on the same tool that
+names a target flushes that target's writes, every other bridge call (lists,
+other tools) flushes all of them, so reads through Unity always see earlier
+writes. Tools answered only from local indexes (search, references) do not
+flush; they follow the project files once a window has been sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from logger import logger
+
+# (bridge tool, operation) -> payload fields naming the target, first present wins;
+# an empty tuple coalesces every write of the operation (settings objects)
+COALESCED_OPERATIONS: dict[tuple[str, str], tuple[str, ...]] = {
+    ("rpgMakerDatabase", "updateCharacter"): ("uuId", "id"),
+    ("rpgMakerDatabase", "updateItem"): ("uuId", "id"),
+    ("rpgMakerDatabase", "updateAnimation"): ("uuId", "id"),
+    ("rpgMakerDatabase", "updateSystemSettings"): (),
+    ("rpgMakerMap", "updateMap"): ("uuId", "id"),
+    ("rpgMakerMap", "updateMapEvent"): ("eventId", "uuId", "id"),
+    ("rpgMakerMap", "updateMapSettings"): ("uuId", "id", "mapId"),
+    ("rpgMakerEvent", "updateCommonEvent"): ("uuId", "id"),
+    ("rpgMakerBattle", "updateBattleSettings"): (),
+    ("rpgMakerBattle", "updateEnemy"): ("uuId", "id"),
+    ("rpgMakerBattle", "updateTroop"): ("uuId", "id"),
+    ("rpgMakerBattle", "updateSkill"): ("uuId", "id"),
+    ("rpgMakerSystem", "setGameVariable"): ("variableId",),
+    ("rpgMakerSystem", "setSwitch"): ("switchId",),
+    ("rpgMakerSystem", "updateSystemSettings"): (),
+}
+
+# (bridge tool, operation) -> payload keys of the record data, in the order Unity reads
+# them (RPGMakerDatabaseHandler takes itemData first); writes are normalized to the first
+DATA_KEYS: dict[tuple[str, str], tuple[str, ...]] = {
+    ("rpgMakerDatabase", "updateCharacter"): ("itemData", "characterData"),
+    ("rpgMakerDatabase", "updateAnimation"): ("itemData", "animationData"),
+}
+
+# Payload fields a read may name its target with
+TARGET_FIELDS = ("uuId", "id", "eventId", "mapId", "variableId", "switchId")
+
+SendCallback = Callable[[str, dict[str, Any]], Awaitable[Any]]
+
+_Key = tuple[str, str, str]
+
+
+@dataclass
+class _Pending:
+    tool_name: str
+    payload: dict[str, Any]
+    send: SendCallback
+    future: asyncio.Future[Any]
+    writes: int = 1
+    timer: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+
+class WriteCoalescer:
+    def __init__(self, window_ms: int = 0) -> None:
+        self._window = max(0, window_ms) / 1000
+        self._pending: dict[_Key, _Pending] = {}
+        self._inflight: dict[_Key, asyncio.Future[Any]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stats = {
+            "writes": 0,
+            "merged": 0,
+            "commands": 0,
+            "forcedFlushes": 0,
+            "failedCommands": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._window > 0
+
+    def configure(self, window_ms: int) -> None:
+        """Set the coalescing window in milliseconds (0 disables coalescing)."""
+        self._window = max(0, window_ms) / 1000
+
+    def supports(self, tool_name: str, payload: dict[str, Any]) -> bool:
+        return self.enabled and self._key(tool_name, payload) is not None
+
+    async def submit(self, tool_name: str, payload: dict[str, Any], send: SendCallback) -> Any:
+        """Merge a write into the pending command for its key and return that command's result.
+
+        ``send(tool_name, payload)`` sends the merged command; the first write of
+        a window supplies it. Errors of the merged command are raised to every
+        write merged into it.
+
+        Raises:
+            ValueError: If the operation is not coalesced
+        """
+        key = self._key(tool_name, payload)
+        if key is None:
+            raise ValueError(f"{tool_name} {payload.get('operation')!r} is not a coalesced write")
+        payload = normalize_data_key(tool_name, payload)
+
+        self._stats["writes"] += 1
+        pending = self._pending.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future[Any] = loop.create_future()
+            # Marks the error retrieved when every merged caller was cancelled
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            pending = _Pending(tool_name, merge_write({}, payload), send, future)
+            pending.timer = loop.call_later(self._window, self._start_flush, key)
+            self._pending[key] = pending
+        else:
+            pending.payload = merge_write(pending.payload, payload)
+            pending.writes += 1
+            self._stats["merged"] += 1
+
+        # A cancelled caller must not cancel the command the others wait for
+        return await asyncio.shield(pending.future)
+
+    async def flush(self, tool_name: str, payload: dict[str, Any]) -> None:
+        """Send and wait for the pending writes a call on bridge tool ``tool_name`` may read.
+
+        Errors of the flushed writes go to their callers, not to the caller of ``flush``.
+        """
+        target = _target(payload, TARGET_FIELDS)
+        await self._flush_keys(
+            [
+                key
+                for key in (*self._pending, *self._inflight)
+                if target is None or key[0] != tool_name or key[2] == target
+            ]
+        )
+
+    async def flush_all(self) -> None:
+        await self._flush_keys([*self._pending, *self._inflight])
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "windowMs": int(self._window * 1000),
+            "pending": len(self._pending),
+            "inflight": len(self._inflight),
+        }
+
+    async def _flush_keys(self, keys: list[_Key]) -> None:
+        if not keys:
+            return
+
+        waits: list[asyncio.Future[Any]] = []
+        for key in dict.fromkeys(keys):
+            if key in self._pending:
+                self._stats["forcedFlushes"] += 1
+                waits.append(asyncio.shield(self._pending[key].future))
+                self._start_flush(key)
+            elif key in self._inflight:
+                waits.append(asyncio.shield(self._inflight[key]))
+        await asyncio.gather(*waits, return_exceptions=True)
+
+    def _start_flush(self, key: _Key) -> None:
+        task = asyncio.ensure_future(self._flush_key(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_key(self, key: _Key) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        self._inflight[key] = pending.future
+        self._stats["commands"] += 1
+        try:
+            result = await pending.send(pending.tool_name, pending.payload)
+        except asyncio.CancelledError:
+            pending.future.cancel()
+            raise
+        except Exception as exc:
+            self._stats["failedCommands"] += 1
+            logger.debug("Coalesced %s (%d writes) failed: %s", key[1], pending.writes, exc)
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+        else:
+            if not pending.future.done():
+                pending.future.set_result(result)
+        finally:
+            with contextlib.suppress(KeyError):
+                if self._inflight[key] is pending.future:
+                    del self._inflight[key]
+
+    @staticmethod
+    def _key(tool_name: str, payload: dict[str, Any]) -> _Key | None:
+        operation = str(payload.get("operation", ""))
+        fields = COALESCED_OPERATIONS.get((tool_name, operation))
+        if fields is None or payload.get("patchFormat") == "merge":
+            return None
+        if not fields:
+            return tool_name, operation, ""
+        target = _target(payload, fields)
+        # Without a target these operations create a record instead
+        return None if target is None else (tool_name, operation, target)
+
+
+def merge_write(earlier: dict[str, Any], later: dict[str, Any]) -> dict[str, Any]:
+    """Return ``earlier`` with ``later`` applied the way two consecutive partial updates apply."""
+    merged = dict(earlier)
+    for key, value in later.items():
+        if value is None and key in merged:
+            continue
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_write(merged[key], value)
+        elif isinstance(value, dict):
+            merged[key] = merge_write({}, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def normalize_data_key(tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Return ``payload`` with its record data under the key Unity reads first.
+
+    Of several data keys in one payload Unity only reads the first present one,
+    so the others are dropped.
+    """
+    data_keys = DATA_KEYS.get((tool_name, str(payload.get("operation", ""))))
+    if not data_keys:
+        return payload
+    present = next((key for key in data_keys if payload.get(key) is not None), None)
+    if present is None:
+        return payload
+    normalized = {key: value for key, value in payload.items() if key not in data_keys}
+    normalized[data_keys[0]] = payload[present]
+    return normalized
+
+
+def _target(payload: dict[str, Any], fields: tuple[str, ...]) -> str | None:
+    for name in fields:
+        value = payload.get(name)
+        if value not in (None, ""):
+            return str(value)
+    return None
+
+
+write_coalescer = WriteCoalescer()
@@ -1,6 +1,6 @@
 """
 Tool registration for RPGMaker Unite MCP Server.
-Registers RPGMaker-specific tools (8 tools) plus ping and compilation_await.
+Registers RPGMaker-specific tools (8 tools) plus ping, compilation_await, context, search and references.
 """
 
 from __future__ import annotations
@@ -11,8 +11,31 @@ import mcp.types as types
 from mcp.server import Server
 
 from bridge.bridge_manager import bridge_manager
+from config.env import env
 from logger import logger
-from tools.rpgmaker_tools import RPGMAKER_TOOL_DEFINITIONS, RPGMAKER_TOOL_MAP
+from services.bulk_writer import bulk_writer
+from services.command_index import COMMAND_INDEX_OPERATIONS, command_index
+from services.context_index import QUERY_OPERATIONS, context_index
+from services.entity_locks import entity_locks
+from services.event_interpreter import SIMULATE_OPERATION, event_interpreter
+from services.event_patch import PATCH_OPERATION, diff_commands
+from services.event_validator import VALIDATE_ALL_OPERATION, event_validator
+from services.flow_analysis import FLOW_ANALYSIS_OPERATION, flow_analyzer
+from services.io_executor import io_executor
+from services.merge_patch import update_patcher
+from services.project_data_reader import (
+    DATA_KINDS,
+    EVENT_ENTITY,
+    DataKind,
+    LocalDataUnavailable,
+    project_data_reader,
+)
+from services.project_data_watcher import project_data_watcher
+from services.record_catalog import ListQuery, RecordCatalog, compile_list_query, record_catalogs
+from services.reference_index import DEFAULT_USAGE_LIMIT, REFERENCE_OPERATIONS, reference_index
+from services.search_index import DEFAULT_SEARCH_LIMIT, search_index
+from services.write_coalescer import write_coalescer
+from tools.rpgmaker_tools import LIST_QUERY_KEYS, RPGMAKER_TOOL_DEFINITIONS, RPGMAKER_TOOL_MAP
 from utils.json_utils import as_pretty_json
 
 
@@ -32,14 +55,142 @@ async def _call_bridge_tool(tool_name: str, payload: dict[str, Any]) -> list[typ
         timeout_ms = (unity_timeout + 20) * 1000
 
     try:
-        response = await bridge_manager.send_command(tool_name, payload, timeout_ms=timeout_ms)
+        # Large results are pretty-printed off the event loop by the bridge
+        text = await bridge_manager.send_command(
+            tool_name, payload, timeout_ms=timeout_ms, result_format="pretty"
+        )
     except Exception as exc:
         raise RuntimeError(f'Unity bridge tool "{tool_name}" failed: {exc}') from exc
 
-    text = response if isinstance(response, str) else as_pretty_json(response)
     return [types.TextContent(type="text", text=text)]
 
 
+async def _call_bridge_write(tool_name: str, payload: dict[str, Any]) -> list[types.Content]:
+    """Call Unity holding the entity locks of the write; reads are not locked.
+
+    Record updates with ``"patchFormat": "diff"`` are reduced to a merge
+    patch against the record in the project files while the lock is held.
+    """
+    async with entity_locks.hold(tool_name, payload):
+        if update_patcher.supports(tool_name, payload):
+            payload = await io_executor.run(update_patcher.prepare, tool_name, payload)
+        return await _call_bridge_tool(tool_name, payload)
+
+
+async def _call_event_patch(tool_name: str, payload: dict[str, Any]) -> list[types.Content]:
+    """Apply a command patch; given the wanted 'commands' instead of 'edits', diff them against Unity first."""
+    if payload.get("edits") is not None or payload.get("commands") is None:
+        return await _call_bridge_tool(tool_name, payload)
+
+    _ensure_bridge_connected()
+    try:
+        current = await bridge_manager.send_command(
+            tool_name,
+            {"operation": "getEventCommands", "uuId": payload.get("uuId")},
+            timeout_ms=45_000,
+        )
+    except Exception as exc:
+        raise RuntimeError(f'Unity bridge tool "{tool_name}" failed: {exc}') from exc
+    old = current.get("commands") if isinstance(current, dict) else None
+    if not isinstance(old, list):
+        raise RuntimeError(f'Unity bridge tool "{tool_name}" returned no "commands" list')
+    if not isinstance(payload["commands"], list):
+        raise ValueError("commands must be a list of event commands")
+
+    edits = await io_executor.run(diff_commands, old, payload["commands"])
+    if not edits:
+        result = {
+            "success": True,
+            "id": payload.get("uuId"),
+            "editCount": 0,
+            "commandCount": len(old),
+        }
+        return [types.TextContent(type="text", text=as_pretty_json(result))]
+    # baseCount makes Unity refuse the patch if the page changed since it was read
+    patch = {key: value for key, value in payload.items() if key != "commands"}
+    return await _call_bridge_tool(tool_name, {**patch, "edits": edits, "baseCount": len(old)})
+
+
+async def _call_read_tool(tool_name: str, payload: dict[str, Any]) -> list[types.Content]:
+    """Answer a read-only operation from the project files or Unity, per MCP_DATA_READ_ROUTING."""
+    routing = env.data_read_routing
+    if routing == "bridge-only" or (routing == "bridge-first" and bridge_manager.is_connected()):
+        return await _call_bridge_tool(tool_name, payload)
+
+    try:
+        result = await project_data_reader.execute(tool_name, payload)
+    except LocalDataUnavailable as exc:
+        if not bridge_manager.is_connected():
+            raise RuntimeError(f'Project data read "{tool_name}" failed: {exc}') from exc
+        logger.debug("Falling back to Unity for %s: %s", tool_name, exc)
+        return await _call_bridge_tool(tool_name, payload)
+
+    return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+
+def _query_project_files(
+    kind: DataKind, query: ListQuery, payload: dict[str, Any]
+) -> dict[str, Any]:
+    catalog = record_catalogs.get(
+        "project",
+        kind,
+        project_data_reader.catalog_generation(kind),
+        lambda: RecordCatalog(kind, *project_data_reader.catalog_records(kind)),
+    )
+    return query.run(catalog, payload)
+
+
+async def _query_bridge(
+    tool_name: str, kind: DataKind, query: ListQuery, payload: dict[str, Any]
+) -> dict[str, Any]:
+    _ensure_bridge_connected()
+    # The watcher sequence changes whenever the data files do; without it every query refetches
+    generation = (
+        project_data_watcher.sequence if project_data_watcher.backend != "disabled" else None
+    )
+
+    catalog = record_catalogs.peek("bridge", kind, generation)
+    if catalog is None:
+        try:
+            result = await bridge_manager.send_command(
+                tool_name,
+                {"operation": kind.list_operation, "offset": 0, "limit": -1},
+                timeout_ms=45_000,
+            )
+        except Exception as exc:
+            raise RuntimeError(f'Unity bridge tool "{tool_name}" failed: {exc}') from exc
+        items = result.get(kind.items_key) if isinstance(result, dict) else None
+        if not isinstance(items, list):
+            raise RuntimeError(
+                f'Unity bridge tool "{tool_name}" returned no "{kind.items_key}" list'
+            )
+        catalog = record_catalogs.get(
+            "bridge", kind, generation, lambda: RecordCatalog(kind, items, items)
+        )
+    return await io_executor.run(query.run, catalog, payload)
+
+
+async def _call_list_query(
+    tool_name: str, kind: DataKind, payload: dict[str, Any]
+) -> list[types.Content]:
+    """Answer a list operation with filter/sort/fields over the catalog of all its records."""
+    query = compile_list_query(payload.get("filter"), payload.get("sort"))
+
+    routing = env.data_read_routing
+    if routing == "bridge-only" or (routing == "bridge-first" and bridge_manager.is_connected()):
+        result = await _query_bridge(tool_name, kind, query, payload)
+    else:
+        try:
+            result = await io_executor.run(_query_project_files, kind, query, payload)
+        except LocalDataUnavailable as exc:
+            if not bridge_manager.is_connected():
+                raise RuntimeError(f'Project data read "{tool_name}" failed: {exc}') from exc
+            logger.debug("Querying Unity for %s: %s", tool_name, exc)
+            result = await _query_bridge(tool_name, kind, query, payload)
+
+    return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+
 def register_tools(server: Server) -> None:
     """Register all MCP tools for RPGMaker Unite."""
 
@@ -73,6 +224,161 @@ def register_tools(server: Server) -> None:
         "additionalProperties": False,
     }
 
+    # ============================================================
+    # Context Request Tool Schema
+    # ============================================================
+    context_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "enum": ["request", *QUERY_OPERATIONS],
+                "description": (
+                    "'request' pulls sections from Unity. The other operations query the local index "
+                    "of the pushed context without a Unity round trip: findByName (name), "
+                    "findByPathPrefix (pathPrefix), getNode (id or path), listChildren (id or path; "
+                    "omit both for scene roots), findAssets (assetType and/or pathPrefix), getAsset (guid), stats."
+                ),
+            },
+            "name": {"type": "string", "description": "GameObject name (findByName)."},
+            "id": {"type": "string", "description": "Hierarchy node id (getNode, listChildren)."},
+            "path": {
+                "type": "string",
+                "description": "Full hierarchy path, e.g. 'Canvas/Panel' (getNode, listChildren).",
+            },
+            "pathPrefix": {
+                "type": "string",
+                "description": "Hierarchy path prefix (findByPathPrefix) or asset path prefix (findAssets).",
+            },
+            "assetType": {
+                "type": "string",
+                "description": "Asset type full name, e.g. 'UnityEngine.Texture2D' (findAssets).",
+            },
+            "guid": {"type": "string", "description": "Asset GUID (getAsset)."},
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "default": 100,
+                "description": "Maximum number of results for index queries.",
+            },
+            "sections": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["scene", "hierarchy", "selection", "assets", "git"],
+                },
+                "description": "Context sections to fetch (default: scene, hierarchy, selection).",
+            },
+            "hierarchyPath": {
+                "type": "string",
+                "description": "Hierarchy path of the subtree root (e.g. 'Canvas/Panel'). Omit for scene roots.",
+            },
+            "depth": {
+                "type": "integer",
+                "minimum": 0,
+                "maximum": 8,
+                "default": 0,
+                "description": "Levels of children to expand below the root (0 = child names only).",
+            },
+            "assetOffset": {
+                "type": "integer",
+                "minimum": 0,
+                "default": 0,
+                "description": "First asset index entry to return.",
+            },
+            "assetLimit": {
+                "type": "integer",
+                "minimum": 1,
+                "default": 50,
+                "description": "Maximum number of asset index entries to return.",
+            },
+        },
+        "required": ["operation"],
+        "additionalProperties": False,
+    }
+
+    # ============================================================
+    # Search Tool Schema
+    # ============================================================
+    search_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": (
+                    "Words to find (all must match). Japanese and other unspaced text matches anywhere "
+                    "in a field; append '*' to a word for a prefix match, e.g. 'pot*'."
+                ),
+            },
+            "entities": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": [*(kind.key for kind in DATA_KINDS), EVENT_ENTITY],
+                },
+                "description": (
+                    f"Restrict to these record types (default: all). '{EVENT_ENTITY}' are the command "
+                    "lists (messages, choices) of map and common events."
+                ),
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "default": DEFAULT_SEARCH_LIMIT,
+                "description": "Maximum number of hits.",
+            },
+            "offset": {
+                "type": "integer",
+                "minimum": 0,
+                "default": 0,
+                "description": "Number of hits to skip.",
+            },
+        },
+        "required": ["query"],
+        "additionalProperties": False,
+    }
+
+    # ============================================================
+    # References Tool Schema
+    # ============================================================
+    references_schema: dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "enum": list(REFERENCE_OPERATIONS),
+                "description": (
+                    "findUsages (id): every place an id is referenced - event commands (map/common event, "
+                    "page, command index), map event conditions, troops, skills, items, system settings. "
+                    "findUnused (kind): definitions of that kind nothing references. stats: index size."
+                ),
+            },
+            "id": {
+                "type": "string",
+                "description": "Referenced id (findUsages), e.g. an item uuId or a switch id.",
+            },
+            "kind": {
+                "type": "string",
+                "enum": list(reference_index.definition_kinds()),
+                "description": "Definition kind (findUnused).",
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "default": DEFAULT_USAGE_LIMIT,
+                "description": "Maximum number of results.",
+            },
+            "offset": {
+                "type": "integer",
+                "minimum": 0,
+                "default": 0,
+                "description": "Number of results to skip.",
+            },
+        },
+        "required": ["operation"],
+        "additionalProperties": False,
+    }
+
     # ============================================================
     # Tool Definitions List
     # ============================================================
@@ -91,8 +397,37 @@ def register_tools(server: Server) -> None:
             ),
             inputSchema=compilation_await_schema,
         ),
+        types.Tool(
+            name="unity_context",
+            description=(
+                "Fetch selected Unity Editor context sections on demand: active scene, a hierarchy "
+                "subtree to a given depth, selection, a page of the asset index, or git status. "
+                "Results are cached until the editor context changes. Index query operations look up "
+                "hierarchy nodes and assets in the pushed context in O(1)/O(log n) without calling Unity."
+            ),
+            inputSchema=context_schema,
+        ),
         # RPGMaker Tools (8 tools)
         *RPGMAKER_TOOL_DEFINITIONS,
+        types.Tool(
+            name="rpgmaker_search",
+            description=(
+                "Full-text search across names, descriptions, notes and event messages of characters, "
+                "items, animations, skills, enemies, troops, maps, map events and common events. "
+                "Returns ranked field hits (entity, uuId, field, snippet) read from the project files; "
+                "follow up with the matching get*ById operation."
+            ),
+            inputSchema=search_schema,
+        ),
+        types.Tool(
+            name="rpgmaker_references",
+            description=(
+                "Cross-reference index over the project files. Check findUsages before deleting or renaming "
+                "items, switches, variables, common events, maps or other records; findUnused lists "
+                "definitions nothing refers to. Answered locally without Unity."
+            ),
+            inputSchema=references_schema,
+        ),
     ]
 
     # ============================================================
@@ -101,6 +436,7 @@ def register_tools(server: Server) -> None:
     tool_name_map: dict[str, str] = {
         "unity_ping": "ping",
         "unity_compilation_await": "compilationAwait",
+        "unity_context": "contextRequest",
         **RPGMAKER_TOOL_MAP,
     }
 
@@ -122,6 +458,35 @@ def register_tools(server: Server) -> None:
         payload = arguments or {}
         logger.info("Tool call: %s", name)
 
+        # With MCP_WRITE_COALESCE_MS set, bursts of updates to one record become one
+        # bridge command; every other bridge call first flushes the writes it may read
+        if write_coalescer.enabled:
+            coalesced_tool = tool_name_map.get(name)
+            if coalesced_tool is not None:
+                if write_coalescer.supports(coalesced_tool, payload):
+                    written: list[types.Content] = await write_coalescer.submit(
+                        coalesced_tool, payload, _call_bridge_write
+                    )
+                    return written
+                await write_coalescer.flush(coalesced_tool, payload)
+
+        # Search is answered from the local index and has no Unity counterpart
+        if name == "rpgmaker_search":
+            result = await io_executor.run(
+                search_index.search,
+                str(payload.get("query") or ""),
+                payload.get("entities"),
+                int(payload.get("limit") or DEFAULT_SEARCH_LIMIT),
+                int(payload.get("offset") or 0),
+            )
+            return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+        if name == "rpgmaker_references":
+            result = await io_executor.run(
+                reference_index.run_query, payload.get("operation", ""), payload
+            )
+            return [types.TextContent(type="text", text=as_pretty_json(result))]
+
         # Map tool name to Unity bridge tool name
         bridge_tool_name = tool_name_map.get(name)
         if bridge_tool_name is None:
@@ -141,5 +506,68 @@ def register_tools(server: Server) -> None:
                     "error": str(exc),
                 }))]
 
+        if name == "unity_context" and payload.get("operation") != "request":
+            result = await io_executor.run(
+                context_index.run_query, payload.get("operation", ""), payload
+            )
+            return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+        if name == "unity_context":
+            _ensure_bridge_connected()
+            result = await bridge_manager.request_context(
+                sections=payload.get("sections"),
+                hierarchy_path=payload.get("hierarchyPath"),
+                depth=payload.get("depth", 0),
+                asset_offset=payload.get("assetOffset", 0),
+                asset_limit=payload.get("assetLimit", 50),
+            )
+            return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+        # Validation, analysis and simulation run over the project files, not in Unity
+        project_analyses = {
+            VALIDATE_ALL_OPERATION: event_validator.validate,
+            FLOW_ANALYSIS_OPERATION: flow_analyzer.analyze,
+            SIMULATE_OPERATION: event_interpreter.simulate,
+        }
+        if bridge_tool_name == "rpgMakerEvent" and payload.get("operation") in project_analyses:
+            try:
+                result = await io_executor.run(project_analyses[payload["operation"]], payload)
+            except LocalDataUnavailable as exc:
+                raise RuntimeError(
+                    f'Event operation "{payload["operation"]}" failed: {exc}'
+                ) from exc
+            return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+        if (
+            bridge_tool_name == "rpgMakerEvent"
+            and payload.get("operation") in COMMAND_INDEX_OPERATIONS
+        ):
+            result = await io_executor.run(command_index.run_query, payload["operation"], payload)
+            return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+        if bridge_tool_name == "rpgMakerEvent" and payload.get("operation") == PATCH_OPERATION:
+            # The lock also covers reading the commands the patch is diffed against
+            async with entity_locks.hold(bridge_tool_name, payload):
+                return await _call_event_patch(bridge_tool_name, payload)
+
+        if bulk_writer.supports(bridge_tool_name, payload.get("operation")):
+            _ensure_bridge_connected()
+            async with entity_locks.hold(bridge_tool_name, payload):
+                result = await bulk_writer.execute(bridge_tool_name, payload)
+            return [types.TextContent(type="text", text=as_pretty_json(result))]
+
+        if any(payload.get(key) for key in LIST_QUERY_KEYS):
+            kind = project_data_reader.list_kind(bridge_tool_name, payload.get("operation"))
+            if kind is None:
+                raise ValueError(
+                    f"{', '.join(LIST_QUERY_KEYS)} are only supported on database, battle, map and "
+                    f"common event list operations, not {payload.get('operation')}"
+                )
+            return await _call_list_query(bridge_tool_name, kind, payload)
+
+        # Read-only database operations can be answered from the project JSON
+        if project_data_reader.supports(bridge_tool_name, payload.get("operation")):
+            return await _call_read_tool(bridge_tool_name, payload)
+
         # Call Unity bridge for all other tools
-        return await _call_bridge_tool(bridge_tool_name, payload)
+        return await _call_bridge_write(bridge_tool_name, payload)
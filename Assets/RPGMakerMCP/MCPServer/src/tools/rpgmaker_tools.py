@@ -33,6 +33,60 @@ PAGINATION_PROPERTIES = {
     },
 }
 
+# Record lists for bulkUpsert*/bulkDelete* (validated and chunked by the server)
+BULK_PROPERTIES = {
+    "records": {
+        "type": "array",
+        "items": {"type": "object", "additionalProperties": True},
+        "description": (
+            "bulkUpsert* only. Records to create or update, shaped like the get*ById data. "
+            "Records without an id get a generated uuId; existing ids are updated."
+        ),
+    },
+    "uuIds": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "bulkDelete* only. UUIDs of the records to delete.",
+    },
+}
+
+# Merge patch format of update* data objects (applied by DataModelMapper in Unity)
+PATCH_FORMAT_PROPERTIES = {
+    "patchFormat": {
+        "type": "string",
+        "enum": ["merge", "full", "diff"],
+        "description": (
+            "update* only. 'merge': the data object is an RFC 7386 merge patch (null clears a field). "
+            "'full' (default): nulls are ignored. 'diff': like 'full', but the server sends only "
+            "the fields that differ from the record in the project files."
+        ),
+    },
+}
+
+# Filter/sort/projection parameters for list operations (evaluated by the server)
+LIST_QUERY_KEYS = ("filter", "sort", "fields")
+
+LIST_QUERY_PROPERTIES = {
+    "filter": {
+        "type": "string",
+        "description": (
+            "list* only. Filter expression over record fields (dotted paths such as 'basic.name'; "
+            "list keys such as 'name' and 'uuId' also work). Operators: = != < <= > >= "
+            "~ (contains, case-insensitive) ^= (starts with), 'in [..]', 'exists'; combine with "
+            'and/or/not and parentheses. Example: price > 500 and name ~ "slime".'
+        ),
+    },
+    "sort": {
+        "type": "string",
+        "description": "list* only. Sort keys, e.g. 'price desc, name'. Records without the field sort last.",
+    },
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "list* only. Fields to return per record (plus its id) instead of the default summary.",
+    },
+}
+
 
 # ============================================================
 # RPGMaker Database Tool Schema
@@ -66,6 +120,13 @@ rpgmaker_database_schema = _schema_with_required(
                     "createAnimation",
                     "updateAnimation",
                     "deleteAnimation",
+                    # Bulk operations
+                    "bulkUpsertCharacters",
+                    "bulkDeleteCharacters",
+                    "bulkUpsertItems",
+                    "bulkDeleteItems",
+                    "bulkUpsertAnimations",
+                    "bulkDeleteAnimations",
                     # System operations
                     "getSystemSettings",
                     "updateSystemSettings",
@@ -77,7 +138,9 @@ rpgmaker_database_schema = _schema_with_required(
                 "description": (
                     "Database operation. "
                     "Recommended: 'list*' (lightweight UUID list) + 'get*ById' (full data by UUID). "
-                    "Deprecated: 'get*' (all records) - use list + getById instead for large datasets."
+                    "Deprecated: 'get*' (all records) - use list + getById instead for large datasets. "
+                    "'bulkUpsert*' / 'bulkDelete*' write many records in chunked commands and return "
+                    "a per-record status table."
                 ),
             },
             "uuId": {
@@ -132,7 +195,10 @@ rpgmaker_database_schema = _schema_with_required(
                 "type": "string",
                 "description": "Path for backup/restore operations. Optional for backup.",
             },
+            **BULK_PROPERTIES,
+            **PATCH_FORMAT_PROPERTIES,
             **PAGINATION_PROPERTIES,
+            **LIST_QUERY_PROPERTIES,
         },
     },
     ["operation"],
@@ -202,6 +268,7 @@ rpgmaker_map_schema = _schema_with_required(
                     "If 'id' is omitted, it will be auto-generated on create."
                 ),
             },
+            **PATCH_FORMAT_PROPERTIES,
             "eventId": {
                 "type": "string",
                 "description": "Event UUID for map event operations.",
@@ -240,11 +307,69 @@ rpgmaker_map_schema = _schema_with_required(
                 "description": "Import file path for map import.",
             },
             **PAGINATION_PROPERTIES,
+            **LIST_QUERY_PROPERTIES,
         },
     },
     ["operation"],
 )
 
+# Parameter predicate for the event command index (findCommands)
+COMMAND_PARAMETER_FILTER = {
+    "type": "object",
+    "properties": {
+        "index": {"type": "integer", "minimum": 0, "description": "Parameter position (0-based)."},
+        "op": {
+            "type": "string",
+            "enum": ["=", "!=", "<", "<=", ">", ">=", "~", "^=", "in"],
+            "default": "=",
+            "description": "Comparison; < <= > >= with a number compare numerically, ~ is contains.",
+        },
+        "value": {"description": "Value to compare with (a list for 'in')."},
+    },
+    "required": ["index", "value"],
+}
+
+COMMAND_EDIT = {
+    "type": "object",
+    "properties": {
+        "op": {"type": "string", "enum": ["insert", "replace", "delete", "move"]},
+        "index": {
+            "type": "integer",
+            "minimum": 0,
+            "description": "Command the edit applies to; insert places the command before it (command count appends).",
+        },
+        "command": {
+            "type": "object",
+            "additionalProperties": True,
+            "description": "insert/replace: {code, indent, parameters, route}.",
+        },
+        "to": {
+            "type": "integer",
+            "minimum": 0,
+            "description": "move: place the command before this command.",
+        },
+    },
+    "required": ["op", "index"],
+}
+
+SIMULATION_STATE = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "description": "Label echoed in the scenario's result."},
+        "switches": {"type": "object", "additionalProperties": {"type": "boolean"}},
+        "variables": {"type": "object", "additionalProperties": {"type": "integer"}},
+        "selfSwitches": {
+            "type": "object",
+            "additionalProperties": {"type": "boolean"},
+            "description": "Self switches A-D of the simulated event.",
+        },
+        "items": {"type": "object", "additionalProperties": {"type": "integer"}},
+        "gold": {"type": "integer"},
+        "choices": {"type": "array", "items": {"type": "integer", "minimum": 0}},
+        "seed": {"type": "integer"},
+    },
+}
+
 
 # ============================================================
 # RPGMaker Event Tool Schema
@@ -268,6 +393,7 @@ rpgmaker_event_schema = _schema_with_required(
                     "createEventCommand",
                     "updateEventCommand",
                     "deleteEventCommand",
+                    "applyEventCommandPatch",
                     # Event page operations
                     "getEventPages",
                     "createEventPage",
@@ -277,11 +403,27 @@ rpgmaker_event_schema = _schema_with_required(
                     "copyEvent",
                     "moveEvent",
                     "validateEvent",
+                    "validateAllEvents",
+                    "analyzeEventFlow",
+                    "simulateEvent",
+                    # Command index (answered by the server)
+                    "findCommands",
+                    "getCommandHistogram",
                 ],
                 "description": (
                     "Event operation. "
                     "Recommended: 'list*' (lightweight UUID list) + 'get*ById' (full data by UUID). "
-                    "Deprecated: 'get*' (all records) - use list + getById instead for large datasets."
+                    "Deprecated: 'get*' (all records) - use list + getById instead for large datasets. "
+                    "applyEventCommandPatch applies 'edits' (or the diff to the wanted 'commands') to an "
+                    "event's command list with one save. "
+                    "validateAllEvents checks every common and map event from the project files in one call "
+                    "(parameters, dangling references, unbalanced blocks) and pages the events with issues. "
+                    "analyzeEventFlow finds dead code, loops without exit, unused labels, pages whose "
+                    "conditions can never be true and switches set but never read. "
+                    "simulateEvent runs a page (uuId, pageIndex) headlessly for each of 'scenarios' and "
+                    "reports the switches, variables, self switches, items and gold it changes. "
+                    "findCommands finds commands by code and parameter filters, or runs of commands by "
+                    "sequence; getCommandHistogram counts commands per code."
                 ),
             },
             "uuId": {
@@ -321,6 +463,70 @@ rpgmaker_event_schema = _schema_with_required(
                 "additionalProperties": True,
                 "description": "Command data for creating/updating.",
             },
+            "edits": {
+                "type": "array",
+                "items": COMMAND_EDIT,
+                "description": (
+                    "applyEventCommandPatch: ordered edits. Every index refers to the command list before "
+                    "the patch, so edits do not shift each other; a command can be replaced, deleted or moved once."
+                ),
+            },
+            "commands": {
+                "type": "array",
+                "items": {"type": "object", "additionalProperties": True},
+                "description": (
+                    "applyEventCommandPatch: the complete command list wanted instead of 'edits'; the server "
+                    "reads the current list and sends the minimal patch."
+                ),
+            },
+            "baseCount": {
+                "type": "integer",
+                "description": "applyEventCommandPatch: command count the edits were made for; the patch fails if it differs.",
+            },
+            "code": {
+                "type": "integer",
+                "description": "Command code for findCommands, e.g. 101 (Show Text) or 121 (Control Switches).",
+            },
+            "parameterFilters": {
+                "type": "array",
+                "items": COMMAND_PARAMETER_FILTER,
+                "description": "findCommands: predicates on the parameters of the 'code' command (all must hold).",
+            },
+            "sequence": {
+                "type": "array",
+                "items": {
+                    "type": ["integer", "object", "null"],
+                    "properties": {
+                        "code": {"type": ["integer", "null"]},
+                        "parameterFilters": {"type": "array", "items": COMMAND_PARAMETER_FILTER},
+                    },
+                },
+                "description": (
+                    "findCommands: consecutive commands to match, each a code, null (any command) or "
+                    '{code, parameterFilters}. Example: [101, 401, {"code": 121, "parameterFilters": '
+                    '[{"index": 0, "op": ">=", "value": 12}]}].'
+                ),
+            },
+            "scenarios": {
+                "type": "array",
+                "items": SIMULATION_STATE,
+                "description": (
+                    "simulateEvent: starting states to run the page from (one run each, default one run "
+                    "of the saved state). 'choices' picks the branch of each Show Choices / battle in "
+                    "order (0 = first), 'seed' fixes random operands."
+                ),
+            },
+            "initialState": {
+                **SIMULATION_STATE,
+                "description": "simulateEvent: overrides applied to the saved state before every scenario.",
+            },
+            "useSaveData": {
+                "type": "boolean",
+                "description": (
+                    "simulateEvent: start from SaveData (gamestate, party gold, inventory). "
+                    "If false, every switch is OFF, every variable 0 and there are no items or gold. Default: true."
+                ),
+            },
             "sourceFilename": {
                 "type": "string",
                 "description": "Source filename for copy/move operations.",
@@ -330,6 +536,7 @@ rpgmaker_event_schema = _schema_with_required(
                 "description": "Target filename for copy/move operations.",
             },
             **PAGINATION_PROPERTIES,
+            **LIST_QUERY_PROPERTIES,
         },
     },
     ["operation"],
@@ -369,6 +576,13 @@ rpgmaker_battle_schema = _schema_with_required(
                     "createSkill",
                     "updateSkill",
                     "deleteSkill",
+                    # Bulk operations
+                    "bulkUpsertEnemies",
+                    "bulkDeleteEnemies",
+                    "bulkUpsertTroops",
+                    "bulkDeleteTroops",
+                    "bulkUpsertSkills",
+                    "bulkDeleteSkills",
                     # Animation operations
                     "getBattleAnimations",
                     "updateBattleAnimation",
@@ -376,7 +590,9 @@ rpgmaker_battle_schema = _schema_with_required(
                 "description": (
                     "Battle system operation. "
                     "Recommended: 'list*' (lightweight UUID list) + 'get*ById' (full data by UUID). "
-                    "Deprecated: 'get*' (all records) - use list + getById instead for large datasets."
+                    "Deprecated: 'get*' (all records) - use list + getById instead for large datasets. "
+                    "'bulkUpsert*' / 'bulkDelete*' write many records in chunked commands and return "
+                    "a per-record status table."
                 ),
             },
             "uuId": {
@@ -424,7 +640,10 @@ rpgmaker_battle_schema = _schema_with_required(
                 "additionalProperties": True,
                 "description": "Animation data for updating.",
             },
+            **BULK_PROPERTIES,
+            **PATCH_FORMAT_PROPERTIES,
             **PAGINATION_PROPERTIES,
+            **LIST_QUERY_PROPERTIES,
         },
     },
     ["operation"],
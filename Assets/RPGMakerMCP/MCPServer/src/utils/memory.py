@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any
+
+# Strings longer than this are rarely repeated (descriptions, serialized values)
+INTERN_MAX_LENGTH = 128
+
+
+def intern_strings(value: Any, max_length: int = INTERN_MAX_LENGTH) -> Any:
+    """Intern the short string values of a decoded JSON value in place.
+
+    ``json.loads`` returns a fresh ``str`` for every occurrence of a value, so a
+    context with thousands of ``"Transform"`` component types holds thousands of
+    copies. Interning collapses them into one shared object (``json.loads``
+    already shares repeated keys within a document). Containers are updated in
+    place and the same value is returned for convenience.
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= max_length else value
+
+    stack: list[Any] = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for key, item in current.items():
+                if isinstance(item, str):
+                    if len(item) <= max_length:
+                        current[key] = sys.intern(item)
+                elif isinstance(item, dict | list):
+                    stack.append(item)
+        elif isinstance(current, list):
+            for index, item in enumerate(current):
+                if isinstance(item, str):
+                    if len(item) <= max_length:
+                        current[index] = sys.intern(item)
+                elif isinstance(item, dict | list):
+                    stack.append(item)
+    return value
+
+
+def deep_sizeof(value: Any, seen: set[int] | None = None) -> int:
+    """Return the bytes retained by ``value`` and everything it references.
+
+    Objects reachable more than once (shared or interned strings, nodes shared
+    between structures) are counted once per ``seen`` set; pass the same set to
+    several calls to measure structures without double counting.
+    """
+    if seen is None:
+        seen = set()
+
+    total = 0
+    stack: list[Any] = [value]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, bool):
+            continue
+        identity = id(current)
+        if identity in seen:
+            continue
+        seen.add(identity)
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, list | tuple | set | frozenset):
+            stack.extend(current)
+        elif isinstance(current, str | bytes | int | float | array):
+            continue
+        else:
+            slots = getattr(type(current), "__slots__", ())
+            stack.extend(getattr(current, slot) for slot in slots if hasattr(current, slot))
+            instance_dict = getattr(current, "__dict__", None)
+            if instance_dict is not None:
+                stack.append(instance_dict)
+    return total
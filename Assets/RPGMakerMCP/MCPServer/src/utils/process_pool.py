@@ -0,0 +1,54 @@
+"""
+Process pool helpers for CPU-bound analyses of the project files.
+
+Event validation and flow analysis parse and walk thousands of event files,
+which a thread pool cannot speed up. ``map_chunks`` spreads chunks of work
+over worker processes started with ``spawn``: the server process runs an
+event loop and thread pools whose state must not be forked into children.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def pool_workers(max_workers: int) -> int:
+    """Return how many worker processes to start, at most one per CPU."""
+    return max(1, min(max_workers, os.cpu_count() or 1))
+
+
+def split_chunks(items: Sequence[T], workers: int) -> list[list[T]]:
+    """Split ``items`` into a few chunks per worker, keeping workers busy when item costs vary."""
+    size = max(1, math.ceil(len(items) / (workers * 4)))
+    return [list(items[start : start + size]) for start in range(0, len(items), size)]
+
+
+def map_chunks(
+    func: Callable[[Any], list[T]],
+    chunks: list[Any],
+    workers: int,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> list[T]:
+    """Run ``func`` on every chunk in ``workers`` processes and concatenate the results in order.
+
+    ``func`` and ``initializer`` must be module-level functions.
+
+    Raises:
+        OSError: If the worker processes cannot be started
+        concurrent.futures.process.BrokenProcessPool: If a worker dies
+    """
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as pool:
+        return [result for chunk in pool.map(func, chunks) for result in chunk]
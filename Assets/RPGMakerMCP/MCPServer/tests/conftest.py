@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Generator
 from unittest.mock import AsyncMock, MagicMock
@@ -54,3 +57,44 @@ def temp_project_dir(tmp_path: Path) -> Path:
     project_dir.mkdir()
     (project_dir / "Assets").mkdir()
     return project_dir
+
+
+@pytest.fixture
+def rpgmaker_storage(tmp_path: Path) -> Path:
+    """RPGMaker Unite's Storage directory in a temporary project rooted at tmp_path."""
+    return tmp_path / "Assets" / "RPGMaker" / "Storage"
+
+
+@pytest.fixture
+def write_json() -> Callable[[Path, object], None]:
+    """Return a function writing JSON data files, creating parent directories.
+
+    Every write moves the file's mtime a second forward, so caches comparing
+    mtime and size see rewrites made within one test.
+    """
+
+    def write(path: Path, data: object) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    return write
+
+
+@pytest.fixture
+def project_service() -> Callable[..., Any]:
+    """Return a factory building a service over a project's files.
+
+    ``project_service(EventValidator, root, **kwargs)`` passes a
+    ProjectDataReader for ``root`` and a ReferenceIndex over it, as the
+    event services expect.
+    """
+    from services.project_data_reader import ProjectDataReader
+    from services.reference_index import ReferenceIndex
+
+    def build(service_class: Callable[..., Any], root: Path, **kwargs: Any) -> Any:
+        reader = ProjectDataReader(root)
+        return service_class(reader, ReferenceIndex(reader), **kwargs)
+
+    return build
@@ -411,3 +411,312 @@ class TestBridgeManagerMessageHandling:
             assert result["bridgeRestarted"] is True
         finally:
             loop.close()
+
+    def test_compilation_state_tracks_events(self) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        started = MagicMock()
+        completed = MagicMock()
+        manager.on("compilationStarted", started)
+        manager.on("compilationComplete", completed)
+
+        assert manager.get_compilation_state()["status"] == "idle"
+
+        manager._handle_compilation_started({"type": "compilation:started", "timestamp": 100})
+        assert manager.get_compilation_state()["status"] == "compiling"
+        started.assert_called_once()
+
+        manager._handle_compilation_complete(
+            {
+                "type": "compilation:complete",
+                "timestamp": 200,
+                "result": {"success": False, "errorCount": 2},
+            }
+        )
+        state = manager.get_compilation_state()
+        assert state["status"] == "idle"
+        assert state["completedAt"] == 200
+        assert state["lastResult"]["errorCount"] == 2
+        completed.assert_called_once()
+
+
+class TestBridgeManagerLargeFrames:
+    """Tests for size-aware decoding of large bridge frames."""
+
+    @staticmethod
+    def _result_frame(command_id: str, result: Any, ok: bool = True) -> str:
+        return json.dumps(
+            {
+                "type": "command:result",
+                "commandId": command_id,
+                "ok": ok,
+                "result": result,
+                "errorMessage": None if ok else "Operation failed",
+            }
+        )
+
+    def test_peek_command_result_id(self) -> None:
+        from bridge.frame_codec import peek_command_result_id
+
+        assert peek_command_result_id(self._result_frame("abc123", {})) == "abc123"
+        assert peek_command_result_id('{"type":"heartbeat","timestamp":1}') is None
+        assert peek_command_result_id(b'{"type":"command:result"}') is None
+
+    def test_render_command_result_frame(self) -> None:
+        from bridge.frame_codec import render_command_result_frame
+
+        frame = self._result_frame("cmd", {"name": "ハロルド"})
+
+        assert render_command_result_frame(frame, "pretty") == (
+            True,
+            '{\n  "name": "ハロルド"\n}',
+            None,
+        )
+        assert render_command_result_frame(frame, "json") == (True, '{"name":"ハロルド"}', None)
+        assert render_command_result_frame(self._result_frame("cmd", None, ok=False), "pretty") == (
+            False,
+            None,
+            "Operation failed",
+        )
+
+    @pytest.mark.asyncio
+    async def test_small_result_rendered_inline(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        async def resolve_command() -> None:
+            await asyncio.sleep(0.01)
+            command_id = next(iter(manager._pending_commands))
+            manager._handle_command_result(
+                {"type": "command:result", "commandId": command_id, "ok": True, "result": {"a": 1}}
+            )
+
+        asyncio.create_task(resolve_command())
+        result = await manager.send_command("tool", {}, timeout_ms=1000, result_format="pretty")
+
+        assert result == '{\n  "a": 1\n}'
+
+    @pytest.mark.asyncio
+    async def test_large_result_rendered_off_loop(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+        from bridge.frame_codec import FrameCodec
+
+        codec = FrameCodec(threshold_bytes=1024, use_processes=False)
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        large_result = {"events": [{"id": i, "name": f"EV{i:03d}"} for i in range(200)]}
+
+        async def resolve_command() -> None:
+            await asyncio.sleep(0.01)
+            command_id = next(iter(manager._pending_commands))
+            await manager._handle_large_frame(self._result_frame(command_id, large_result))
+
+        try:
+            with patch("bridge.bridge_manager.frame_codec", codec):
+                asyncio.create_task(resolve_command())
+                result = await manager.send_command(
+                    "tool", {}, timeout_ms=1000, result_format="json"
+                )
+        finally:
+            codec.shutdown()
+
+        assert json.loads(result) == large_result
+        assert codec.get_stats()["offloadedFrames"] == 1
+
+    @pytest.mark.asyncio
+    async def test_large_frame_decoded_for_object_callers(self) -> None:
+        from bridge.bridge_manager import BridgeManager
+        from bridge.frame_codec import FrameCodec
+
+        codec = FrameCodec(threshold_bytes=64, use_processes=False)
+        manager = BridgeManager()
+        payload = {"activeScene": {"name": "Map" * 50}}
+
+        try:
+            with patch("bridge.bridge_manager.frame_codec", codec):
+                await manager._handle_large_frame(
+                    json.dumps({"type": "context:update", "payload": payload})
+                )
+        finally:
+            codec.shutdown()
+
+        assert manager.get_context() == payload
+
+    @pytest.mark.asyncio
+    async def test_process_pool_renders_result(self) -> None:
+        from bridge.frame_codec import FrameCodec
+
+        codec = FrameCodec(threshold_bytes=16, max_workers=1)
+        try:
+            ok, text, error = await codec.render_command_result(
+                self._result_frame("cmd", [1, 2, 3]), "json"
+            )
+        finally:
+            codec.shutdown()
+
+        assert (ok, text, error) == (True, "[1,2,3]", None)
+
+
+class TestBridgeManagerSendLanes:
+    """Tests for control-frame priority and chunked data sends."""
+
+    @pytest.mark.asyncio
+    async def test_large_command_is_chunked(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        payload = {"data": "x" * 300}
+
+        with patch("bridge.bridge_manager.network") as mock_network:
+            mock_network.MAX_FRAME_CHUNK_CHARS = 100
+            task = asyncio.create_task(manager.send_command("setMapData", payload, timeout_ms=1000))
+            await asyncio.sleep(0.01)
+            task.cancel()
+
+        frames = [json.loads(call.args[0]) for call in mock_websocket.send.call_args_list]
+        assert {frame["type"] for frame in frames} == {"frame:chunk"}
+        assert [frame["index"] for frame in frames] == list(range(frames[0]["count"]))
+        assembled = json.loads("".join(frame["data"] for frame in frames))
+        assert assembled["toolName"] == "setMapData"
+        assert assembled["payload"] == payload
+
+    @pytest.mark.asyncio
+    async def test_ping_overtakes_queued_chunks(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        sent: list[str] = []
+
+        async def slow_send(text: str) -> None:
+            sent.append(json.loads(text)["type"])
+            await asyncio.sleep(0.01)
+
+        mock_websocket.send = AsyncMock(side_effect=slow_send)
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        with patch("bridge.bridge_manager.network") as mock_network:
+            mock_network.MAX_FRAME_CHUNK_CHARS = 100
+            bulk = asyncio.create_task(
+                manager.send_command("importDatabase", {"data": "x" * 1000}, timeout_ms=1000)
+            )
+            await asyncio.sleep(0.015)
+            await manager.send_ping()
+            bulk.cancel()
+
+        ping_index = sent.index("ping")
+        assert 0 < ping_index <= 2
+        stats = manager.get_send_stats()
+        assert stats["control"]["frames"] == 1
+        assert stats["control"]["maxWaitMs"] < 20
+
+    @pytest.mark.asyncio
+    async def test_timeout_sends_cancel(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+
+        with pytest.raises(TimeoutError):
+            await manager.send_command("test_tool", {}, timeout_ms=10)
+        await asyncio.sleep(0)
+
+        frames = [json.loads(call.args[0]) for call in mock_websocket.send.call_args_list]
+        assert frames[-1]["type"] == "command:cancel"
+        assert frames[-1]["commandId"] == frames[0]["commandId"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_lane(self) -> None:
+        from bridge.send_lanes import SendLanes
+
+        lanes = SendLanes()
+        async with lanes.acquire("data"):
+            waiter = asyncio.create_task(lanes.acquire("data").__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0)
+
+        assert not lanes.locked()
+        assert lanes.get_stats()["queuedData"] == 0
+
+
+class TestBridgeManagerTransactions:
+    """Tests for BridgeManager.transaction against the stand-in bridge."""
+
+    @staticmethod
+    async def _connect(bridge: Any) -> Any:
+        import websockets
+
+        from bridge.bridge_manager import BridgeManager
+
+        socket = await websockets.connect(bridge.url, compression=None, ping_interval=None)
+        manager = BridgeManager()
+        await manager.attach(socket)
+        return manager, socket
+
+    @pytest.mark.asyncio
+    async def test_commit_refreshes_once(self) -> None:
+        from bridge.standin_bridge import StandinBridge
+
+        async with StandinBridge(write_ms=0, refresh_ms=0) as bridge:
+            manager, socket = await self._connect(bridge)
+            for index in range(3):
+                await manager.send_command(
+                    "rpgMakerGameState", {"operation": "setProgressFlag", "flagId": index}
+                )
+            assert bridge.stats.refreshes == 3
+
+            async with manager.transaction() as transaction:
+                for index in range(5):
+                    await manager.send_command(
+                        "rpgMakerGameState", {"operation": "setProgressFlag", "flagId": index}
+                    )
+                assert bridge.stats.refreshes == 3
+            await socket.close()
+
+        assert bridge.stats.refreshes == 4
+        assert transaction.result is not None
+        assert transaction.result["deferredRefreshes"] == 5
+
+    @pytest.mark.asyncio
+    async def test_exception_rolls_back(self) -> None:
+        from bridge.standin_bridge import StandinBridge
+
+        async with StandinBridge(write_ms=0, refresh_ms=0) as bridge:
+            manager, socket = await self._connect(bridge)
+            await manager.send_command(
+                "rpgMakerGameState", {"operation": "setProgressFlag", "flagId": "a"}
+            )
+            before = dict(bridge.store)
+
+            with pytest.raises(ValueError, match="abort"):
+                async with manager.transaction() as transaction:
+                    await manager.send_command(
+                        "rpgMakerGameState", {"operation": "setProgressFlag", "flagId": "a"}
+                    )
+                    await manager.send_command(
+                        "rpgMakerGameState", {"operation": "setProgressFlag", "flagId": "b"}
+                    )
+                    raise ValueError("abort")
+            await socket.close()
+
+        assert bridge.store == before
+        assert bridge.stats.rollbacks == 1
+        assert transaction.result is not None
+        assert transaction.result["restoredFiles"] == 2
+
+    @pytest.mark.asyncio
+    async def test_begin_failure_raises(self) -> None:
+        from bridge.standin_bridge import StandinBridge
+
+        async with StandinBridge(write_ms=0, refresh_ms=0) as bridge:
+            manager, socket = await self._connect(bridge)
+            await bridge.execute("transaction", {"operation": "beginTransaction"})
+
+            with pytest.raises(RuntimeError, match="already open"):
+                async with manager.transaction():
+                    pass
+            await socket.close()
@@ -0,0 +1,199 @@
+"""Tests for services/bulk_writer.py module."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def _project(tmp_path: Path) -> Path:
+    item_file = tmp_path / "Assets" / "RPGMaker" / "Storage" / "Item" / "JSON" / "item.json"
+    item_file.parent.mkdir(parents=True)
+    item_file.write_text(
+        json.dumps(
+            [
+                {
+                    "basic": {"id": "potion", "name": "Potion", "price": 50},
+                    "effects": [{"code": 1, "value": 30}],
+                },
+                {"basic": {"id": "ether", "name": "Ether", "price": None}, "effects": []},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+class TestPrepare:
+    """Tests for BulkWriter.prepare_upsert and prepare_delete."""
+
+    def test_ids_are_assigned_and_records_checked(self, tmp_path: Path) -> None:
+        from services.bulk_writer import BulkWriter
+        from services.project_data_reader import ProjectDataReader, data_kind
+
+        writer = BulkWriter(ProjectDataReader(_project(tmp_path)))
+        rows, entries, checked = writer.prepare_upsert(
+            data_kind("items"),
+            [
+                {"basic": {"name": "Elixir", "price": 500}},
+                {"uuId": "potion", "basic": {"price": 60}, "effects": [{"code": 1, "value": 50}]},
+                {"basic": {"id": "potion"}},
+                {"basic": {"price": "cheap"}, "colour": "red"},
+                {"effects": [{"code": "x"}]},
+                "not a record",
+            ],
+        )
+
+        assert checked
+        assert [row.status for row in rows] == [
+            "pending",
+            "pending",
+            "invalid",
+            "invalid",
+            "invalid",
+            "invalid",
+        ]
+        assert len(rows[0].uuid) == 36
+        assert entries[0] == (
+            0,
+            {
+                "uuId": rows[0].uuid,
+                "data": {"basic": {"name": "Elixir", "price": 500, "id": rows[0].uuid}},
+            },
+        )
+        assert entries[1][1]["data"]["basic"] == {"price": 60, "id": "potion"}
+        assert rows[2].error == "Listed more than once."
+        assert rows[3].error == "basic.price: expected number, got string; colour: unknown field"
+        assert rows[4].error == "effects[0].code: expected number, got string"
+        assert rows[5].uuid is None
+
+    def test_without_project_files_shapes_are_not_checked(self, tmp_path: Path) -> None:
+        from services.bulk_writer import BulkWriter
+        from services.project_data_reader import ProjectDataReader, data_kind
+
+        writer = BulkWriter(ProjectDataReader(tmp_path))
+        rows, entries, checked = writer.prepare_upsert(
+            data_kind("enemies"), [{"anything": [1, "a"]}]
+        )
+
+        assert not checked
+        assert rows[0].status == "pending"
+        assert entries[0][1]["data"]["id"] == rows[0].uuid
+
+    def test_delete_ids(self) -> None:
+        from services.bulk_writer import BulkWriter
+
+        rows, entries = BulkWriter.prepare_delete(["a", "", "a", 3, "b"])
+
+        assert [(row.uuid, row.status) for row in rows] == [
+            ("a", "pending"),
+            (None, "invalid"),
+            ("a", "invalid"),
+            (None, "invalid"),
+            ("b", "pending"),
+        ]
+        assert entries == [(0, "a"), (4, "b")]
+        with pytest.raises(ValueError, match="uuIds"):
+            BulkWriter.prepare_delete("a")
+
+
+class TestExecute:
+    """Tests for BulkWriter.execute against the stand-in bridge."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_in_one_transaction_and_reports_a_status_table(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import websockets
+
+        import services.bulk_writer as bulk_writer_module
+        from bridge.bridge_manager import BridgeManager
+        from bridge.standin_bridge import StandinBridge
+        from services.bulk_writer import BulkWriter
+        from services.project_data_reader import ProjectDataReader
+
+        async with StandinBridge(write_ms=0, refresh_ms=0) as bridge:
+            socket = await websockets.connect(bridge.url, compression=None, ping_interval=None)
+            manager = BridgeManager()
+            await manager.attach(socket)
+            monkeypatch.setattr(bulk_writer_module, "bridge_manager", manager)
+            writer = BulkWriter(ProjectDataReader(_project(tmp_path)))
+
+            records: list[Any] = [{"basic": {"name": f"Item {index}"}} for index in range(250)]
+            created = await writer.execute(
+                "rpgMakerDatabase",
+                {"operation": "bulkUpsertItems", "records": [*records, {"bad": 1}]},
+            )
+            ids = [row[0] for row in created["rows"][:250]]
+            deleted = await writer.execute(
+                "rpgMakerDatabase", {"operation": "bulkDeleteItems", "uuIds": [ids[0], "missing"]}
+            )
+            await socket.close()
+
+        assert created["chunks"] == 3
+        assert created["counts"] == {
+            "created": 250,
+            "updated": 0,
+            "deleted": 0,
+            "invalid": 1,
+            "error": 0,
+        }
+        assert created["rows"][250][1:] == ["invalid", "bad: unknown field"]
+        assert not created["success"]
+        assert bridge.stats.writes == 4
+        assert bridge.stats.refreshes == 2
+        assert deleted["rows"] == [
+            [ids[0], "deleted"],
+            ["missing", "error", "Record with UUID 'missing' not found."],
+        ]
+        assert writer.get_stats()["records"] == 253
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_keeps_earlier_chunks_and_skips_later_ones(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import websockets
+
+        import services.bulk_writer as bulk_writer_module
+        from bridge.bridge_manager import BridgeManager
+        from bridge.standin_bridge import StandinBridge
+        from services.bulk_writer import BulkWriter
+        from services.project_data_reader import ProjectDataReader
+
+        async with StandinBridge(write_ms=0, refresh_ms=0) as bridge:
+            execute = bridge.execute
+            bulk_calls: list[str] = []
+
+            async def fail_second_chunk(tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+                if str(payload.get("operation")).startswith("bulk"):
+                    bulk_calls.append(tool_name)
+                    if len(bulk_calls) == 2:
+                        return {"success": False, "error": "Disk full"}
+                return await execute(tool_name, payload)
+
+            monkeypatch.setattr(bridge, "execute", fail_second_chunk)
+            socket = await websockets.connect(bridge.url, compression=None, ping_interval=None)
+            manager = BridgeManager()
+            await manager.attach(socket)
+            monkeypatch.setattr(bulk_writer_module, "bridge_manager", manager)
+            writer = BulkWriter(ProjectDataReader(_project(tmp_path)))
+
+            records: list[Any] = [{"basic": {"name": f"Item {index}"}} for index in range(250)]
+            result = await writer.execute(
+                "rpgMakerDatabase", {"operation": "bulkUpsertItems", "records": records}
+            )
+            await socket.close()
+
+        assert (result["chunks"], result["appliedChunks"], result["failedChunk"]) == (3, 1, 1)
+        assert result["counts"]["created"] == 100
+        assert result["counts"]["error"] == 150
+        assert result["rows"][100][1:] == ["error", "Disk full"]
+        assert result["rows"][200][1:] == ["error", "Not sent: chunk 1 failed."]
+        assert not result["success"]
+        # The first chunk was committed, not rolled back
+        assert len(bridge.store) == 100
+        assert bridge.stats.rollbacks == 0
+        assert bulk_calls == ["rpgMakerDatabase", "rpgMakerDatabase"]
@@ -0,0 +1,124 @@
+"""Tests for services/command_index.py module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+def _command(code: int, *parameters: str) -> dict:
+    return {"code": code, "indent": 0, "parameters": list(parameters)}
+
+
+@pytest.fixture
+def events(rpgmaker_storage: Path) -> Path:
+    return rpgmaker_storage / "Event" / "JSON" / "Event"
+
+
+@pytest.fixture
+def project(tmp_path: Path, events: Path, write_json) -> Path:
+    write_json(
+        events / "shop-0.json",
+        {
+            "id": "shop",
+            "eventCommands": [
+                _command(101, "merchant", "0"),
+                _command(401, "Welcome!"),
+                _command(121, "12", "14", "0"),
+                _command(101, "guard", "1"),
+                _command(401, "Move along."),
+            ],
+        },
+    )
+    write_json(
+        events / "inn-1.json",
+        {
+            "id": "inn",
+            "eventCommands": [_command(121, "30", "30", "1"), _command(101, "merchant", "2")],
+        },
+    )
+    return tmp_path
+
+
+def _index(root: Path):
+    from services.command_index import CommandIndex
+    from services.project_data_reader import ProjectDataReader
+
+    return CommandIndex(ProjectDataReader(root))
+
+
+def _where(result: dict) -> list[tuple[str, int, int]]:
+    return [(match["uuId"], match["page"], match["commandIndex"]) for match in result["matches"]]
+
+
+class TestCommandIndex:
+    """Tests for CommandIndex."""
+
+    def test_code_and_parameter_filters(self, project: Path) -> None:
+        index = _index(project)
+
+        faces = index.run_query(
+            "findCommands", {"code": 101, "parameterFilters": [{"index": 0, "value": "merchant"}]}
+        )
+        switches = index.run_query(
+            "findCommands",
+            {
+                "code": 121,
+                "parameterFilters": [
+                    {"index": 0, "op": ">=", "value": 12},
+                    {"index": 1, "op": "<=", "value": 20},
+                ],
+            },
+        )
+
+        assert _where(faces) == [("inn", 1, 1), ("shop", 0, 0)]
+        assert faces["matches"][1]["commands"] == [
+            {"code": 101, "indent": 0, "parameters": ["merchant", "0"]}
+        ]
+        assert _where(switches) == [("shop", 0, 2)]
+
+    def test_sequences_and_pagination(self, project: Path) -> None:
+        index = _index(project)
+
+        pairs = index.find_commands([101, 401])
+        after_switch = index.find_commands([121, None], limit=1)
+
+        assert _where(pairs) == [("shop", 0, 0), ("shop", 0, 3)]
+        assert [command["code"] for command in pairs["matches"][1]["commands"]] == [101, 401]
+        assert _where(after_switch) == [("inn", 1, 0)]
+        assert (after_switch["totalCount"], after_switch["hasMore"]) == (2, True)
+
+    def test_histogram_follows_file_changes(self, project: Path, events: Path, write_json) -> None:
+        index = _index(project)
+        assert index.histogram()["codes"][0] == {
+            "code": 101,
+            "name": "Show Text",
+            "count": 3,
+            "pageCount": 2,
+        }
+
+        write_json(
+            events / "shop-0.json",
+            {"id": "shop", "eventCommands": [_command(121, "1", "1", "0")]},
+        )
+        (events / "inn-1.json").unlink()
+
+        histogram = index.histogram()
+        assert histogram["codes"] == [{"code": 121, "name": None, "count": 1, "pageCount": 1}]
+        assert histogram["totalCommands"] == 1
+        assert index.find_commands([101])["totalCount"] == 0
+        assert index.get_stats()["pagesIndexed"] == 3
+
+    @pytest.mark.parametrize(
+        "sequence",
+        [
+            [],
+            [None],
+            ["101"],
+            [{"code": 101, "parameterFilters": [{"index": 0, "op": "like", "value": "x"}]}],
+        ],
+    )
+    def test_malformed_sequences_raise(self, project: Path, sequence: list) -> None:
+        with pytest.raises(ValueError, match="Invalid"):
+            _index(project).find_commands(sequence)
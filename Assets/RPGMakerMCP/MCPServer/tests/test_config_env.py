@@ -87,6 +87,19 @@ class TestParseLogLevel:
         assert _parse_log_level(None) == "info"
 
 
+class TestParseDataReadRouting:
+    """Tests for _parse_data_read_routing function."""
+
+    def test_parse_data_read_routing(self) -> None:
+        from config.env import _parse_data_read_routing
+
+        assert _parse_data_read_routing("Bridge-Only") == "bridge-only"
+        assert _parse_data_read_routing("bridge-first") == "bridge-first"
+        assert _parse_data_read_routing("Local-First") == "local-first"
+        assert _parse_data_read_routing("sometimes") == "bridge-first"
+        assert _parse_data_read_routing(None) == "bridge-first"
+
+
 class TestLoadBridgeToken:
     """Tests for _load_bridge_token function."""
 
@@ -0,0 +1,219 @@
+"""Tests for services/context_index.py module."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+
+def _context() -> dict:
+    return {
+        "hierarchy": {
+            "id": "scene-root",
+            "name": "Map001",
+            "type": "Scene",
+            "children": [
+                {
+                    "id": "1",
+                    "name": "Main Camera",
+                    "type": "GameObject",
+                    "childCount": 0,
+                    "childNames": [],
+                },
+                {
+                    "id": "2",
+                    "name": "Canvas",
+                    "type": "UIElement",
+                    "childCount": 2,
+                    "children": [
+                        {
+                            "id": "3",
+                            "name": "Panel",
+                            "type": "UIElement",
+                            "childCount": 1,
+                            "childNames": ["Button"],
+                        },
+                        {
+                            "id": "4",
+                            "name": "Panel",
+                            "type": "UIElement",
+                            "childCount": 0,
+                            "childNames": [],
+                        },
+                    ],
+                },
+            ],
+        },
+        "assets": [
+            {
+                "guid": "g1",
+                "path": "Assets/RPGMaker/Images/Faces/Actor1.png",
+                "type": "UnityEngine.Texture2D",
+            },
+            {
+                "guid": "g2",
+                "path": "Assets/RPGMaker/Images/Faces/Actor2.png",
+                "type": "UnityEngine.Texture2D",
+            },
+            {
+                "guid": "g3",
+                "path": "Assets/RPGMaker/Sounds/BGM/Battle1.ogg",
+                "type": "UnityEngine.AudioClip",
+            },
+            {"guid": "g4", "path": "Assets/Scenes/Title.unity", "type": "UnityEditor.SceneAsset"},
+        ],
+        "updatedAt": 1,
+    }
+
+
+class TestContextIndex:
+    """Tests for ContextIndex."""
+
+    def test_hierarchy_lookups(self) -> None:
+        from services.context_index import ContextIndex
+
+        index = ContextIndex()
+        index.update(_context())
+
+        assert [item["id"] for item in index.find_by_name("Panel")] == ["3", "4"]
+        assert index.get_node(path="Canvas")["id"] == "2"
+        assert index.get_node(node_id="3")["parentId"] == "2"
+        assert [item["name"] for item in index.list_children()] == ["Main Camera", "Canvas"]
+        assert [item["path"] for item in index.find_by_path_prefix("Canvas/")] == [
+            "Canvas/Panel",
+            "Canvas/Panel/Button",
+            "Canvas/Panel",
+        ]
+
+    def test_unexpanded_children_are_listed_by_name(self) -> None:
+        from services.context_index import ContextIndex
+
+        index = ContextIndex()
+        index.update(_context())
+
+        children = index.list_children(node_id="3")
+
+        assert children == [
+            {"id": None, "name": "Button", "path": "Canvas/Panel/Button", "expanded": False}
+        ]
+        assert index.get_node(path="Canvas/Panel/Button") is None
+
+    def test_asset_lookups(self) -> None:
+        from services.context_index import ContextIndex
+
+        index = ContextIndex()
+        index.update(_context())
+
+        assert index.get_asset("g3")["path"].endswith("Battle1.ogg")
+        faces = index.find_assets(path_prefix="Assets/RPGMaker/Images/")
+        assert [entry["guid"] for entry in faces] == ["g1", "g2"]
+        textures = index.find_assets(
+            asset_type="UnityEngine.Texture2D", path_prefix="Assets/RPGMaker"
+        )
+        assert len(textures) == 2
+        assert (
+            index.find_assets(asset_type="UnityEngine.AudioClip", path_prefix="Assets/Scenes") == []
+        )
+
+    def test_rebuilds_lazily_after_update(self) -> None:
+        from services.context_index import ContextIndex
+
+        index = ContextIndex()
+        index.update(_context())
+        index.update(_context())
+        assert index.get_stats()["builds"] == 1
+
+        renamed = _context()
+        renamed["hierarchy"]["children"][0]["name"] = "Camera"
+        index.update(renamed)
+
+        assert index.find_by_name("Main Camera") == []
+        assert index.find_by_name("Camera")[0]["id"] == "1"
+
+    def test_update_during_rebuild_is_not_lost(self) -> None:
+        from services.context_index import ContextIndex
+
+        index = ContextIndex()
+        index.update(_context())
+        renamed = _context()
+        renamed["hierarchy"]["children"][0]["name"] = "Camera"
+
+        build_assets = index._build_assets
+
+        def update_mid_build(payload: dict) -> None:
+            build_assets(payload)
+            index.update(renamed)
+
+        index._build_assets = update_mid_build  # type: ignore[method-assign]
+        assert index.run_query("findByName", {"name": "Main Camera"})["items"]
+        index._build_assets = build_assets  # type: ignore[method-assign]
+
+        assert index.run_query("findByName", {"name": "Main Camera"})["items"] == []
+        assert index.get_stats()["builds"] == 2
+
+    def test_run_query_validates_operation(self) -> None:
+        from services.context_index import ContextIndex
+
+        index = ContextIndex()
+        index.update(_context())
+
+        assert index.run_query("getAsset", {"guid": "g4"})["asset"]["guid"] == "g4"
+        with pytest.raises(ValueError, match="Unknown context query operation"):
+            index.run_query("scan", {})
+        with pytest.raises(ValueError, match="'name' is required"):
+            index.run_query("findByName", {})
+
+    def test_large_scene_lookups_stay_fast(self) -> None:
+        from services.context_index import ContextIndex
+
+        roots = [
+            {
+                "id": f"r{r}",
+                "name": f"Root{r}",
+                "children": [
+                    {"id": f"r{r}c{c}", "name": f"Child{c}", "childNames": []} for c in range(100)
+                ],
+            }
+            for r in range(300)
+        ]
+        index = ContextIndex()
+        index.update({"hierarchy": {"id": "scene-root", "children": roots}})
+        assert index.get_stats()["nodes"] == 30_300
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            index.get_node(path="Root299/Child99")
+            index.find_by_path_prefix("Root150/Child5", limit=20)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.5
+
+    def test_paths_are_not_stored_per_node(self) -> None:
+        from services.context_index import ContextIndex
+        from utils.memory import deep_sizeof
+
+        roots = [
+            {
+                "id": f"r{r}",
+                "name": f"Root{r}",
+                "children": [
+                    {"id": f"r{r}c{c}", "name": f"Child{c}", "childNames": []} for c in range(100)
+                ],
+            }
+            for r in range(50)
+        ]
+        payload = {"hierarchy": {"id": "scene-root", "children": roots}}
+        index = ContextIndex()
+        index.update(payload)
+
+        seen: set[int] = set()
+        payload_bytes = deep_sizeof(payload, seen)
+        index_bytes = index.measure_memory(seen)
+
+        assert index.get_node(path="Root49/Child99")["path"] == "Root49/Child99"
+        # The index shares node dicts with the payload and keeps no path strings
+        assert index_bytes < payload_bytes / 2
+
+        index.clear()
+        assert index.get_stats()["nodes"] == 5_050
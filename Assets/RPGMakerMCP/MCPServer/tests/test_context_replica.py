@@ -0,0 +1,225 @@
+"""Tests for bridge/context_replica.py and context:patch handling."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _base_context() -> dict:
+    return {
+        "activeScene": {"name": "Title", "path": "Assets/Title.unity"},
+        "hierarchy": {"id": "scene-root", "children": [{"name": "Camera"}, {"name": "Light"}]},
+        "selection": [],
+        "gitDiffSummary": "",
+        "updatedAt": 1000,
+    }
+
+
+class TestContextReplica:
+    """Tests for ContextReplica."""
+
+    def test_apply_patch_is_copy_on_write(self) -> None:
+        from bridge.context_replica import ContextReplica
+
+        replica = ContextReplica()
+        original = _base_context()
+        replica.apply_full(original, version=1)
+
+        changed = replica.apply_patch(
+            1,
+            2,
+            [
+                {"op": "replace", "path": "/hierarchy/children/1/name", "value": "Sun"},
+                {"op": "add", "path": "/selection/0", "value": {"name": "Sun"}},
+                {"op": "replace", "path": "/updatedAt", "value": 2000},
+            ],
+            full_size=5000,
+        )
+
+        assert changed is True
+        assert replica.version == 2
+        assert replica.payload["hierarchy"]["children"][1]["name"] == "Sun"
+        assert replica.payload["selection"] == [{"name": "Sun"}]
+        assert original["hierarchy"]["children"][1]["name"] == "Light"
+        assert original["selection"] == []
+        stats = replica.get_stats()
+        assert stats["patchesApplied"] == 1
+        assert 0 < stats["bytesSaved"] < 5000
+
+    def test_remove_and_escaped_pointer(self) -> None:
+        from bridge.context_replica import ContextReplica
+
+        replica = ContextReplica()
+        replica.apply_full({"assets": {"a/b": 1, "c~d": 2}, "gitDiffSummary": "M x"}, version=3)
+
+        replica.apply_patch(
+            3,
+            4,
+            [
+                {"op": "remove", "path": "/assets/a~1b"},
+                {"op": "replace", "path": "/assets/c~0d", "value": 5},
+                {"op": "remove", "path": "/gitDiffSummary"},
+            ],
+        )
+
+        assert replica.payload == {"assets": {"c~d": 5}}
+
+    def test_version_gap_raises_without_applying(self) -> None:
+        from bridge.context_replica import ContextReplica, ContextVersionGap
+
+        replica = ContextReplica()
+        replica.apply_full(_base_context(), version=5)
+
+        with pytest.raises(ContextVersionGap):
+            replica.apply_patch(6, 7, [{"op": "replace", "path": "/selection", "value": [1]}])
+
+        assert replica.version == 5
+        assert replica.payload["selection"] == []
+        assert replica.get_stats()["versionGaps"] == 1
+
+    def test_timestamp_only_changes_are_not_changes(self) -> None:
+        from bridge.context_replica import ContextReplica
+
+        replica = ContextReplica()
+        assert replica.apply_full(_base_context(), version=1) is True
+
+        refreshed = {**_base_context(), "updatedAt": 9999}
+        assert replica.apply_full(refreshed, version=2) is False
+        assert (
+            replica.apply_patch(2, 3, [{"op": "replace", "path": "/updatedAt", "value": 1}])
+            is False
+        )
+        assert replica.get_stats()["unchangedUpdates"] == 2
+
+
+class TestBridgeManagerContextPatch:
+    """Tests for BridgeManager context:patch handling."""
+
+    @pytest.mark.asyncio
+    async def test_patch_updates_context_and_notifies(self) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        callback = MagicMock()
+        manager.on("contextUpdated", callback)
+
+        await manager._handle_message(
+            {"type": "context:update", "version": 1, "payload": _base_context()}
+        )
+        await manager._handle_message(
+            {
+                "type": "context:patch",
+                "baseVersion": 1,
+                "version": 2,
+                "ops": [{"op": "replace", "path": "/activeScene/name", "value": "Map001"}],
+                "fullSize": 400,
+            }
+        )
+        await manager._handle_message(
+            {
+                "type": "context:patch",
+                "baseVersion": 2,
+                "version": 3,
+                "ops": [{"op": "replace", "path": "/updatedAt", "value": 3000}],
+            }
+        )
+
+        assert manager.get_context()["activeScene"]["name"] == "Map001"
+        assert callback.call_count == 2
+        assert manager.get_context_stats()["version"] == 3
+
+    @pytest.mark.asyncio
+    async def test_gap_requests_single_resync(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        await manager._handle_message(
+            {"type": "context:update", "version": 1, "payload": _base_context()}
+        )
+
+        for base in (4, 5):
+            await manager._handle_message(
+                {"type": "context:patch", "baseVersion": base, "version": base + 1, "ops": []}
+            )
+        await asyncio.sleep(0)
+
+        frames = [json.loads(call.args[0]) for call in mock_websocket.send.call_args_list]
+        assert frames == [{"type": "context:resync"}]
+
+        await manager._handle_message(
+            {"type": "context:update", "version": 6, "payload": _base_context()}
+        )
+        assert manager._context_resync_requested is False
+
+    @pytest.mark.asyncio
+    async def test_patch_without_versions_requests_resync(self, mock_websocket: MagicMock) -> None:
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager._socket = mock_websocket
+        await manager._handle_message(
+            {"type": "context:update", "version": 1, "payload": _base_context()}
+        )
+
+        await manager._handle_message(
+            {
+                "type": "context:patch",
+                "version": 2,
+                "ops": [{"op": "replace", "path": "/activeScene/name", "value": "Map001"}],
+            }
+        )
+        await asyncio.sleep(0)
+
+        frames = [json.loads(call.args[0]) for call in mock_websocket.send.call_args_list]
+        assert frames == [{"type": "context:resync"}]
+        assert manager.get_context()["activeScene"]["name"] != "Map001"
+        assert manager.get_context_stats()["version"] == 1
+
+
+class TestBridgeManagerContextRequest:
+    """Tests for pulled, generation-cached context requests."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_generation_returns_cached_sections(self) -> None:
+        from unittest.mock import AsyncMock
+
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        sections = {"hierarchy": {"name": "Canvas", "children": []}}
+        manager.send_command = AsyncMock(
+            side_effect=[
+                {"success": True, "generation": 7, "unchanged": False, "sections": sections},
+                {"success": True, "generation": 7, "unchanged": True},
+            ]
+        )
+
+        first = await manager.request_context(["hierarchy"], hierarchy_path="Canvas", depth=2)
+        second = await manager.request_context(["hierarchy"], hierarchy_path="Canvas", depth=2)
+
+        assert first == {"generation": 7, "sections": sections, "cached": False}
+        assert second == {"generation": 7, "sections": sections, "cached": True}
+        second_payload = manager.send_command.call_args_list[1].args[1]
+        assert second_payload["ifGeneration"] == 7
+        assert second_payload["hierarchyPath"] == "Canvas"
+        assert manager.get_context_stats()["pullCacheHits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self) -> None:
+        from unittest.mock import AsyncMock
+
+        from bridge.bridge_manager import BridgeManager
+
+        manager = BridgeManager()
+        manager.send_command = AsyncMock(
+            return_value={"success": False, "error": "GameObject not found at hierarchy path: X"}
+        )
+
+        with pytest.raises(RuntimeError, match="GameObject not found"):
+            await manager.request_context(["hierarchy"], hierarchy_path="X")
+        assert manager._context_request_cache == {}
@@ -0,0 +1,154 @@
+"""Tests for services/editor_log_watcher.py and services/exception_aggregator.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+UNITY_BLOCK = [
+    "NullReferenceException: Object reference not set to an instance of an object",
+    "RPGMaker.Codebase.Runtime.Map.MapManager.Update () (at Packages/jp.ggg.rpgmaker.unite/Runtime/Map/MapManager.cs:{line})",
+    "UnityEngine.Debug:LogException (System.Exception)",
+    "",
+]
+
+MONO_BLOCK = [
+    "System.InvalidOperationException: Item {n} not found",
+    "  at MCP.Editor.Foo.<Run>b__{n}_0 (System.String id) [0x0001{n}] in /tmp/Foo.cs:{n}",
+    "  at MCP.Editor.Foo.Run () [0x00000] in <a1b2c3>:0",
+    "",
+]
+
+
+def _unity_block(line: int) -> list[str]:
+    return [entry.format(line=line) for entry in UNITY_BLOCK]
+
+
+def _mono_block(n: int) -> list[str]:
+    return [entry.format(n=n) for entry in MONO_BLOCK]
+
+
+class TestExceptionAggregator:
+    """Tests for ExceptionAggregator grouping and fingerprinting."""
+
+    def test_identical_blocks_share_fingerprint(self) -> None:
+        from services.exception_aggregator import ExceptionAggregator
+
+        aggregator = ExceptionAggregator()
+        for index in range(50):
+            for line in _unity_block(100 + index):
+                aggregator.feed(line, float(index))
+
+        records = aggregator.records()
+        assert len(records) == 1
+        assert records[0].count == 50
+        assert records[0].exception_type == "NullReferenceException"
+        assert records[0].first_seen == 0.0
+        assert records[0].last_seen == 49.0
+
+    def test_mono_frames_normalized(self) -> None:
+        from services.exception_aggregator import ExceptionAggregator
+
+        aggregator = ExceptionAggregator()
+        for n in range(1, 6):
+            for line in _mono_block(n):
+                aggregator.feed(line, 1.0)
+
+        records = aggregator.records()
+        assert len(records) == 1
+        assert records[0].count == 5
+        assert all(" in " not in frame for frame in records[0].frames)
+
+    def test_distinct_traces_are_separate(self) -> None:
+        from services.exception_aggregator import ExceptionAggregator
+
+        aggregator = ExceptionAggregator()
+        for line in _unity_block(1) + _mono_block(1):
+            aggregator.feed(line, 1.0)
+
+        assert len(aggregator.records()) == 2
+
+    def test_back_to_back_headers_close_previous_block(self) -> None:
+        from services.exception_aggregator import ExceptionAggregator
+
+        aggregator = ExceptionAggregator()
+        completed = None
+        for line in _unity_block(1)[:-1] + _mono_block(1)[:-1]:
+            completed = aggregator.feed(line, 1.0) or completed
+
+        assert completed is not None
+        assert completed.exception_type == "NullReferenceException"
+        aggregator.flush(2.0)
+        assert aggregator.summary()["totalOccurrences"] == 2
+
+    def test_table_is_bounded(self) -> None:
+        from services.exception_aggregator import ExceptionAggregator
+
+        aggregator = ExceptionAggregator(max_fingerprints=4)
+        for index in range(20):
+            aggregator.feed(f"Type{index}Exception: boom", float(index))
+            aggregator.feed(f"  at Namespace.Class{index}.Method ()", float(index))
+            aggregator.feed("", float(index))
+
+        summary = aggregator.summary()
+        assert summary["fingerprintCount"] == 4
+        assert summary["evictedFingerprints"] == 16
+        assert summary["exceptions"][0]["exceptionType"] == "Type19Exception"
+
+
+class TestEditorLogWatcher:
+    """Tests for incremental Editor.log reading."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_aggregates(self, tmp_path: Path) -> None:
+        from services.editor_log_watcher import EditorLogWatcher
+
+        log_path = tmp_path / "Editor.log"
+        log_path.write_text("\n".join(["Loading scene"] + _unity_block(1)) + "\n", encoding="utf-8")
+
+        watcher = EditorLogWatcher(explicit_path=log_path)
+        await watcher.refresh()
+
+        with log_path.open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(_unity_block(2) * 3) + "\n")
+        await watcher.refresh()
+        await watcher.refresh()  # no new data: pending block is flushed
+
+        summary = watcher.get_exception_summary()
+        assert summary["fingerprintCount"] == 1
+        assert summary["exceptions"][0]["count"] == 4
+
+        snapshot = watcher.get_snapshot()
+        assert snapshot.lines[0] == "Loading scene"
+        assert len(snapshot.exceptions) == 1
+
+    @pytest.mark.asyncio
+    async def test_truncated_log_is_reread(self, tmp_path: Path) -> None:
+        from services.editor_log_watcher import EditorLogWatcher
+
+        log_path = tmp_path / "Editor.log"
+        log_path.write_text("first session line\n" * 10, encoding="utf-8")
+
+        watcher = EditorLogWatcher(explicit_path=log_path)
+        await watcher.refresh()
+        assert len(watcher.get_snapshot().lines) == 10
+
+        log_path.write_text("second session\n", encoding="utf-8")
+        await watcher.refresh()
+
+        assert watcher.get_snapshot().lines == ["second session"]
+
+    @pytest.mark.asyncio
+    async def test_buffer_is_capped(self, tmp_path: Path) -> None:
+        from services.editor_log_watcher import MAX_LINES, EditorLogWatcher
+
+        log_path = tmp_path / "Editor.log"
+        log_path.write_text("".join(f"line {i}\n" for i in range(MAX_LINES * 2)), encoding="utf-8")
+
+        watcher = EditorLogWatcher(explicit_path=log_path)
+        await watcher.refresh()
+
+        lines = watcher.get_snapshot().lines
+        assert len(lines) == MAX_LINES
+        assert lines[-1] == f"line {MAX_LINES * 2 - 1}"
@@ -0,0 +1,136 @@
+"""Tests for services/entity_locks.py module."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+
+class TestLockPlan:
+    """Tests for lock_plan."""
+
+    @pytest.mark.parametrize(
+        ("tool_name", "payload", "expected"),
+        [
+            ("rpgMakerMap", {"operation": "getMapById", "uuId": "m1"}, []),
+            ("contextRequest", {"operation": "updateMap"}, []),
+            (
+                "rpgMakerMap",
+                {"operation": "updateMapSettings", "mapId": "m1"},
+                [(("rpgMakerMap", "Map"), "shared"), (("rpgMakerMap", "Map", "m1"), "exclusive")],
+            ),
+            (
+                "rpgMakerDatabase",
+                {"operation": "createItem"},
+                [(("rpgMakerDatabase", "Item"), "shared")],
+            ),
+            (
+                "rpgMakerBattle",
+                {"operation": "bulkUpsertEnemies", "records": []},
+                [(("rpgMakerBattle", "Enemy"), "exclusive")],
+            ),
+            (
+                "rpgMakerEvent",
+                {"operation": "updateEventCommand", "uuId": "ev", "commandIndex": 3},
+                [
+                    (("rpgMakerEvent", "Event"), "shared"),
+                    (("rpgMakerEvent", "Event", "ev"), "shared"),
+                    (("rpgMakerEvent", "Event", "ev", "3"), "exclusive"),
+                ],
+            ),
+            (
+                "rpgMakerEvent",
+                {"operation": "createEventCommand", "uuId": "ev", "commandIndex": 3},
+                [
+                    (("rpgMakerEvent", "Event"), "shared"),
+                    (("rpgMakerEvent", "Event", "ev"), "exclusive"),
+                ],
+            ),
+        ],
+    )
+    def test_paths(self, tool_name: str, payload: dict[str, Any], expected: list[Any]) -> None:
+        from services.entity_locks import lock_plan
+
+        assert lock_plan(tool_name, payload) == expected
+
+
+class TestEntityLocks:
+    """Tests for EntityLocks."""
+
+    @staticmethod
+    async def _run(
+        locks: Any, log: list[str], name: str, tool_name: str, payload: dict[str, Any]
+    ) -> None:
+        async with locks.hold(tool_name, payload):
+            log.append(f"{name}+")
+            await asyncio.sleep(0.01)
+            log.append(f"{name}-")
+
+    @pytest.mark.asyncio
+    async def test_same_record_serializes_and_different_records_overlap(self) -> None:
+        from services.entity_locks import EntityLocks
+
+        locks = EntityLocks()
+        log: list[str] = []
+        map_a = {"operation": "updateMap", "uuId": "a"}
+        await asyncio.gather(
+            self._run(locks, log, "a1", "rpgMakerMap", map_a),
+            self._run(locks, log, "a2", "rpgMakerMap", map_a),
+            self._run(locks, log, "b", "rpgMakerMap", {"operation": "updateMap", "uuId": "b"}),
+        )
+
+        assert log.index("a1-") < log.index("a2+")
+        assert log.index("b+") < log.index("a1-")
+        stats = locks.get_stats()
+        assert stats["byEntity"]["Map"]["acquisitions"] == 3
+        assert stats["byEntity"]["Map"]["contended"] == 1
+        assert stats["byEntity"]["Map"]["maxWaitMs"] > 0
+        assert stats["heldKeys"] == 0
+
+    @pytest.mark.asyncio
+    async def test_whole_type_writes_exclude_record_writes(self) -> None:
+        from services.entity_locks import EntityLocks
+
+        locks = EntityLocks()
+        log: list[str] = []
+        await asyncio.gather(
+            self._run(
+                locks,
+                log,
+                "item",
+                "rpgMakerDatabase",
+                {"operation": "updateItem", "uuId": "potion"},
+            ),
+            self._run(
+                locks,
+                log,
+                "bulk",
+                "rpgMakerDatabase",
+                {"operation": "bulkDeleteItems", "uuIds": []},
+            ),
+            self._run(locks, log, "new", "rpgMakerDatabase", {"operation": "createItem"}),
+        )
+
+        assert log == ["item+", "item-", "bulk+", "bulk-", "new+", "new-"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_block_the_queue(self) -> None:
+        from services.entity_locks import EntityLocks
+
+        locks = EntityLocks()
+        log: list[str] = []
+        payload = {"operation": "updateSkill", "uuId": "fire"}
+        first = asyncio.create_task(self._run(locks, log, "first", "rpgMakerBattle", payload))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(
+            self._run(locks, log, "cancelled", "rpgMakerBattle", payload)
+        )
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await self._run(locks, log, "last", "rpgMakerBattle", payload)
+        await first
+
+        assert log == ["first+", "first-", "last+", "last-"]
+        assert locks.get_stats()["waiting"] == 0
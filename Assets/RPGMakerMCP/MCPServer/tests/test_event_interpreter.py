@@ -0,0 +1,158 @@
+"""Tests for services/event_interpreter.py module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+POTION = "11111111-1111-4111-8111-111111111111"
+DOOR = "33333333-3333-4333-8333-333333333333"
+VISITS = "44444444-4444-4444-8444-444444444444"
+COUNTER = "55555555-5555-4555-8555-555555555555"
+INN = "66666666-6666-4666-8666-666666666666"
+REWARD = "77777777-7777-4777-8777-777777777777"
+ECHO = "88888888-8888-4888-8888-888888888888"
+
+
+def _commands(*commands: tuple) -> list[dict]:
+    return [
+        {"code": code, "indent": 0, "parameters": list(parameters)}
+        for code, *parameters in commands
+    ]
+
+
+@pytest.fixture
+def project(tmp_path: Path, rpgmaker_storage: Path, write_json) -> Path:
+    storage = rpgmaker_storage
+    events = storage / "Event" / "JSON" / "Event"
+    write_json(
+        storage / "Flags" / "JSON" / "flags.json",
+        {"switches": [{"id": DOOR}], "variables": [{"id": VISITS}, {"id": COUNTER}]},
+    )
+    write_json(
+        storage / "Event" / "JSON" / "eventCommon.json",
+        [{"eventId": REWARD, "name": "Reward"}, {"eventId": ECHO, "name": "Echo"}],
+    )
+    write_json(storage / "SaveData" / "gamestate.json", {"variables": {VISITS: 2}, "gold": 100})
+    write_json(storage / "SaveData" / "inventory.json", {POTION: 1})
+    write_json(
+        events / f"{INN}-0.json",
+        {
+            "id": INN,
+            "eventCommands": _commands(
+                (122, VISITS, "1", "0", "1"),  # VISITS += 1
+                (111, "1", VISITS, "0", "3", "1"),  # if VISITS >= 3
+                (121, DOOR, "0"),
+                (117, REWARD),
+                (411,),
+                (125, "1", "0", "10"),  # else: gold -= 10
+                (412,),
+                (112,),  # count COUNTER up to VISITS
+                (122, COUNTER, "1", "0", "1"),
+                (111, "1", COUNTER, "1", VISITS, "1"),
+                (113,),
+                (412,),
+                (413,),
+                (102, "Stay", "Leave"),
+                (402, "0"),
+                (123, "A", "0"),
+                (402, "1"),
+                (115,),
+                (404,),
+                (101, "Good night"),
+                (401, "Sleep well."),
+            ),
+        },
+    )
+    write_json(
+        events / f"{REWARD}-0.json",
+        {"id": REWARD, "eventCommands": _commands((126, POTION, "0", "0", "2"))},
+    )
+    write_json(events / f"{ECHO}-0.json", {"id": ECHO, "eventCommands": _commands((117, ECHO))})
+    return tmp_path
+
+
+class TestEventInterpreter:
+    """Tests for EventInterpreter."""
+
+    def test_runs_branches_loops_calls_and_choices_from_save_data(
+        self, project: Path, project_service
+    ) -> None:
+        from services.event_interpreter import EventInterpreter
+
+        result = project_service(EventInterpreter, project).simulate({"uuId": INN})
+
+        (run,) = result["results"]
+        assert run["status"] == "completed"
+        assert run["effects"] == {
+            "switches": {DOOR: {"before": False, "after": True}},
+            "variables": {COUNTER: {"before": 0, "after": 3}, VISITS: {"before": 2, "after": 3}},
+            "selfSwitches": {"A": {"before": False, "after": True}},
+            "items": {POTION: {"before": 1, "after": 3}},
+        }
+        assert run["calls"] == {REWARD: 1}
+        assert run["skipped"] == {"101": 1, "401": 1}
+        assert result["statusCounts"] == {"completed": 1}
+
+    def test_scenarios_override_the_starting_state(self, project: Path, project_service) -> None:
+        from services.event_interpreter import EventInterpreter
+
+        result = project_service(EventInterpreter, project).simulate(
+            {
+                "uuId": INN,
+                "useSaveData": False,
+                "initialState": {"gold": 50},
+                "scenarios": [
+                    {"name": "first visit", "choices": [1]},
+                    {"variables": {VISITS: 9}, "selfSwitches": {"A": True}},
+                ],
+            }
+        )
+
+        first, regular = result["results"]
+        assert first["name"] == "first visit"
+        assert first["effects"] == {
+            "variables": {COUNTER: {"before": 0, "after": 1}, VISITS: {"before": 0, "after": 1}},
+            "gold": {"before": 50, "after": 40},
+        }
+        assert first["skipped"] == {}
+        assert regular["effects"]["variables"][COUNTER] == {"before": 0, "after": 10}
+        assert "selfSwitches" not in regular["effects"]
+        assert regular["effects"]["items"] == {POTION: {"before": 0, "after": 2}}
+
+    def test_endless_loops_and_recursion_are_stopped(
+        self, project: Path, rpgmaker_storage: Path, write_json, project_service
+    ) -> None:
+        from services.event_interpreter import EventInterpreter
+
+        events = rpgmaker_storage / "Event" / "JSON" / "Event"
+        write_json(
+            events / f"{INN}-1.json",
+            {"id": INN, "eventCommands": _commands((112,), (121, DOOR, "0"), (413,))},
+        )
+        interpreter = project_service(EventInterpreter, project, step_limit=500)
+
+        looping = interpreter.simulate({"uuId": INN, "pageIndex": 1})
+        recursive = interpreter.simulate({"uuId": ECHO})
+
+        assert looping["results"][0]["status"] == "stepLimit"
+        assert looping["results"][0]["steps"] == 501
+        assert recursive["results"][0]["status"] == "callDepthExceeded"
+        assert interpreter.get_stats()["scenarios"] == 2
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"uuId": INN, "scenarios": {"gold": 1}},
+            {"uuId": INN, "scenarios": [{"switches": {DOOR: "yes"}}]},
+            {"uuId": INN, "scenarios": [{"selfSwitches": {"E": True}}]},
+            {"uuId": INN, "scenarios": [{"choices": ["first"]}]},
+            {"uuId": INN, "pageIndex": 5},
+        ],
+    )
+    def test_malformed_payloads_raise(self, project: Path, project_service, payload: dict) -> None:
+        from services.event_interpreter import EventInterpreter
+
+        with pytest.raises(ValueError):
+            project_service(EventInterpreter, project).simulate(payload)
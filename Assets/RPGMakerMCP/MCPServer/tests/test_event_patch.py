@@ -0,0 +1,97 @@
+"""Tests for services/event_patch.py module."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+
+def _command(code: int, *parameters: str, indent: int = 0) -> dict:
+    return {"code": code, "indent": indent, "parameters": list(parameters), "route": []}
+
+
+class TestApplyPatch:
+    """Tests for apply_patch."""
+
+    def test_indices_refer_to_the_unpatched_list(self) -> None:
+        from services.event_patch import apply_patch
+
+        commands = [_command(101, "a"), _command(101, "b"), _command(101, "c"), _command(0)]
+        edits = [
+            {"op": "delete", "index": 0},
+            {"op": "insert", "index": 2, "command": {"code": 121, "parameters": [1, None]}},
+            {"op": "replace", "index": 1, "command": _command(101, "B")},
+            {"op": "move", "index": 3, "to": 0},
+            {"op": "insert", "index": 2, "command": _command(115)},
+        ]
+
+        assert apply_patch(commands, edits) == [
+            _command(0),
+            _command(101, "B"),
+            _command(121, "1", ""),
+            _command(115),
+            _command(101, "c"),
+        ]
+
+    @pytest.mark.parametrize(
+        ("edit", "message"),
+        [
+            ({"op": "delete", "index": 3}, "out of range"),
+            ({"op": "insert", "index": 4, "command": {}}, "out of range"),
+            ({"op": "move", "index": 1, "to": 5}, "out of range"),
+            ({"op": "swap", "index": 0}, "unknown op"),
+            ({"op": "replace", "index": 1}, "Invalid command"),
+            ({"op": "replace", "index": 0, "command": {}}, "already"),
+        ],
+    )
+    def test_invalid_edits_raise(self, edit: dict, message: str) -> None:
+        from services.event_patch import apply_patch
+
+        with pytest.raises(ValueError, match=message):
+            apply_patch(
+                [_command(101), _command(401), _command(0)], [{"op": "delete", "index": 0}, edit]
+            )
+
+
+class TestDiffCommands:
+    """Tests for diff_commands."""
+
+    def test_small_changes_give_small_patches(self) -> None:
+        from services.event_patch import diff_commands
+
+        commands = [_command(101, str(index)) for index in range(6)]
+
+        assert diff_commands(commands, commands) == []
+        assert diff_commands(commands, [*commands[:3], _command(115), *commands[3:]]) == [
+            {"op": "insert", "index": 3, "command": _command(115)}
+        ]
+        assert diff_commands(commands, [*commands[:2], _command(102), *commands[3:]]) == [
+            {"op": "replace", "index": 2, "command": _command(102)}
+        ]
+        assert diff_commands(commands, [commands[5], *commands[:5]]) == [
+            {"op": "move", "index": 5, "to": 0}
+        ]
+
+    def test_patches_reproduce_random_edits(self) -> None:
+        from services.event_patch import apply_patch, diff_commands
+
+        rng = random.Random(7)
+        for _ in range(200):
+            old = [
+                _command(rng.choice((101, 121, 0)), str(rng.randrange(4)))
+                for _ in range(rng.randrange(12))
+            ]
+            new = [command for command in old if rng.random() > 0.2]
+            for _ in range(rng.randrange(4)):
+                new.insert(
+                    rng.randrange(len(new) + 1),
+                    _command(rng.choice((101, 122)), str(rng.randrange(4))),
+                )
+            if rng.random() < 0.1:
+                rng.shuffle(new)
+
+            edits = diff_commands(old, new)
+
+            assert apply_patch(old, edits) == new
+            assert len(edits) <= len(old) + len(new)
@@ -0,0 +1,182 @@
+"""Tests for services/event_validator.py module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+POTION = "11111111-1111-4111-8111-111111111111"
+DOOR_SWITCH = "33333333-3333-4333-8333-333333333333"
+MISSING = "99999999-9999-4999-8999-999999999999"
+SHOP_EVENT = "55555555-5555-4555-8555-555555555555"
+HEAL_EVENT = "66666666-6666-4666-8666-666666666666"
+TOWN = "77777777-7777-4777-8777-777777777777"
+
+
+@pytest.fixture
+def project(tmp_path: Path, rpgmaker_storage: Path, write_json) -> Path:
+    storage = rpgmaker_storage
+    events = storage / "Event" / "JSON" / "Event"
+    write_json(
+        storage / "Item" / "JSON" / "item.json", [{"basic": {"id": POTION, "name": "Potion"}}]
+    )
+    write_json(
+        storage / "Flags" / "JSON" / "flags.json",
+        {"switches": [{"id": DOOR_SWITCH, "name": "Door open"}], "variables": []},
+    )
+    write_json(
+        storage / "Event" / "JSON" / "eventMap.json",
+        [
+            {
+                "eventId": SHOP_EVENT,
+                "mapId": TOWN,
+                "name": "Shop",
+                "pages": [
+                    {"condition": {"switchOne": {"enabled": 1, "switchId": MISSING}}},
+                    {"condition": {"switchOne": {"enabled": 0, "switchId": MISSING}}},
+                ],
+            }
+        ],
+    )
+    write_json(
+        storage / "Event" / "JSON" / "eventCommon.json",
+        [
+            {
+                "eventId": HEAL_EVENT,
+                "name": "Heal",
+                "conditions": [{"trigger": 0, "switchId": DOOR_SWITCH}],
+            }
+        ],
+    )
+    write_json(
+        events / f"{HEAL_EVENT}-0.json",
+        {
+            "id": HEAL_EVENT,
+            "eventCommands": [
+                {"code": 111, "indent": 0, "parameters": ["0", DOOR_SWITCH]},
+                {"code": 126, "indent": 1, "parameters": [POTION, "0", "1"]},
+                {"code": 411, "indent": 0, "parameters": []},
+                {"code": 117, "indent": 1, "parameters": [HEAL_EVENT]},
+                {"code": 412, "indent": 0, "parameters": []},
+                {"code": 0, "indent": 0, "parameters": []},
+            ],
+        },
+    )
+    write_json(
+        events / f"{SHOP_EVENT}-0.json",
+        {
+            "id": SHOP_EVENT,
+            "eventCommands": [
+                {"code": 112, "indent": 0, "parameters": []},
+                {"code": 126, "indent": 1, "parameters": [MISSING, "add", "1"]},
+                {"code": 111, "indent": 1, "parameters": ["0"]},
+                {"code": 413, "indent": 0, "parameters": []},
+                {"code": 113, "indent": 0, "parameters": []},
+                {"code": 119, "indent": 0, "parameters": ["end"]},
+                {"code": 117, "indent": 0, "parameters": []},
+                {"code": -1, "indent": 0, "parameters": []},
+            ],
+        },
+    )
+    return tmp_path
+
+
+class TestCheckCommands:
+    """Tests for check_commands."""
+
+    def test_balanced_blocks_pass(self) -> None:
+        from services.event_validator import check_commands
+
+        commands = [
+            {"code": 102, "indent": 0, "parameters": ["Yes,No"]},
+            {"code": 402, "indent": 0, "parameters": ["0", "Yes"]},
+            {"code": 118, "indent": 1, "parameters": ["top"]},
+            {"code": 402, "indent": 0, "parameters": ["1", "No"]},
+            {"code": 119, "indent": 1, "parameters": ["top"]},
+            {"code": 404, "indent": 0, "parameters": []},
+            {"code": 301, "indent": 0, "parameters": ["troop"]},
+            {"code": 999, "indent": 0, "parameters": ["unknown codes are allowed"]},
+        ]
+
+        assert check_commands(commands, {}) == []
+
+    def test_stray_branch_and_indent_mismatch(self) -> None:
+        from services.event_validator import check_commands
+
+        issues = check_commands(
+            [
+                {"code": 411, "indent": 0, "parameters": []},
+                {"code": 111, "indent": 0, "parameters": ["0"]},
+                {"code": 411, "indent": 0, "parameters": []},
+                {"code": 411, "indent": 0, "parameters": []},
+                {"code": 412, "indent": 1, "parameters": []},
+            ],
+            {},
+        )
+
+        assert [(issue["type"], issue["commandIndex"]) for issue in issues] == [
+            ("unbalancedBlock", 0),
+            ("unbalancedBlock", 3),
+            ("indentMismatch", 4),
+        ]
+
+
+class TestEventValidator:
+    """Tests for EventValidator."""
+
+    def test_report_aggregates_issues_per_event(self, project: Path, project_service) -> None:
+        from services.event_validator import EventValidator
+
+        result = project_service(EventValidator, project).validate({})
+
+        assert result["valid"] is False
+        assert (result["eventCount"], result["pageCount"], result["commandCount"]) == (2, 2, 14)
+        assert result["workers"] == 1
+        assert [event["uuId"] for event in result["events"]] == [SHOP_EVENT]
+        shop = result["events"][0]
+        assert (shop["eventKind"], shop["mapId"]) == ("map", TOWN)
+        assert [
+            (issue["type"], issue.get("commandIndex"), issue.get("page"))
+            for issue in shop["issues"]
+        ] == [
+            ("danglingReference", None, 0),
+            ("parameterType", 1, 0),
+            ("danglingReference", 1, 0),
+            ("unbalancedBlock", 2, 0),
+            ("breakOutsideLoop", 4, 0),
+            ("parameterCount", 6, 0),
+            ("invalidCode", 7, 0),
+            ("missingLabel", 5, 0),
+            ("missingData", None, 1),
+        ]
+        assert result["issuesByType"]["danglingReference"] == 2
+        assert result["errorCount"] == result["issueCount"] == 9
+
+    def test_process_pool_matches_in_process_report(
+        self,
+        project: Path,
+        rpgmaker_storage: Path,
+        write_json,
+        project_service,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from services.event_validator import EventValidator
+
+        monkeypatch.setattr("os.cpu_count", lambda: 2)
+        events = rpgmaker_storage / "Event" / "JSON" / "Event"
+        for page in range(2, 6):
+            write_json(events / f"orphan-{page}.json", {"id": "orphan", "eventCommands": []})
+
+        in_process = project_service(EventValidator, project).validate({"limit": 0})
+        pooled = project_service(EventValidator, project, pool_min_files=0, max_workers=2).validate(
+            {"limit": 0}
+        )
+
+        assert pooled["workers"] == 2
+        assert in_process["issuesByType"]["orphanPage"] == 4
+        assert in_process["issuesByType"]["noCommands"] == 4
+        for key in ("workers", "elapsedMs"):
+            in_process.pop(key)
+            pooled.pop(key)
+        assert pooled == in_process
@@ -0,0 +1,167 @@
+"""Tests for services/flow_analysis.py module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+DOOR = "33333333-3333-4333-8333-333333333333"
+NEVER = "44444444-4444-4444-8444-444444444444"
+LOST = "88888888-8888-4888-8888-888888888888"
+GATE = "55555555-5555-4555-8555-555555555555"
+GUARD = "66666666-6666-4666-8666-666666666666"
+ALARM = "77777777-7777-4777-8777-777777777777"
+
+
+def _commands(*commands: tuple) -> dict:
+    return [
+        {"code": code, "indent": 0, "parameters": list(parameters)}
+        for code, *parameters in commands
+    ]
+
+
+def _switch(switch_id: str) -> dict:
+    return {"condition": {"switchOne": {"enabled": 1, "switchId": switch_id}}}
+
+
+@pytest.fixture
+def project(tmp_path: Path, rpgmaker_storage: Path, write_json) -> Path:
+    storage = rpgmaker_storage
+    events = storage / "Event" / "JSON" / "Event"
+    write_json(
+        storage / "Flags" / "JSON" / "flags.json",
+        {"switches": [{"id": DOOR}, {"id": NEVER}, {"id": LOST}], "variables": []},
+    )
+    write_json(
+        storage / "Event" / "JSON" / "eventMap.json",
+        [
+            {
+                "eventId": GATE,
+                "mapId": "map-1",
+                "name": "Gate",
+                "pages": [{}, {"condition": {"selfSwitch": {"enabled": 1, "selfSwitch": "A"}}}],
+            },
+            {
+                "eventId": GUARD,
+                "mapId": "map-2",
+                "name": "Guard",
+                "pages": [_switch(NEVER), _switch(DOOR)],
+            },
+        ],
+    )
+    # Autorun on NEVER, and the only command setting NEVER is its own
+    write_json(
+        storage / "Event" / "JSON" / "eventCommon.json",
+        [{"eventId": ALARM, "name": "Alarm", "conditions": [{"trigger": 1, "switchId": NEVER}]}],
+    )
+    write_json(
+        events / f"{GATE}-0.json",
+        {
+            "id": GATE,
+            "eventCommands": _commands((121, DOOR, "0"), (121, LOST, "0"), (123, "A", "0")),
+        },
+    )
+    write_json(events / f"{GATE}-1.json", {"id": GATE, "eventCommands": _commands((101, "Open"))})
+    write_json(events / f"{GUARD}-0.json", {"id": GUARD, "eventCommands": _commands((101, "Halt"))})
+    write_json(events / f"{GUARD}-1.json", {"id": GUARD, "eventCommands": _commands((101, "Pass"))})
+    write_json(
+        events / f"{ALARM}-0.json", {"id": ALARM, "eventCommands": _commands((121, NEVER, "0"))}
+    )
+    return tmp_path
+
+
+class TestAnalyzePage:
+    """Tests for analyze_page."""
+
+    def test_dead_code_loops_and_labels(self) -> None:
+        from services.flow_analysis import analyze_page
+
+        commands = _commands(
+            (118, "start"),
+            (111, "0", DOOR),
+            (115,),
+            (101, "never shown"),
+            (411,),
+            (121, DOOR, "1"),
+            (412,),
+            (112,),
+            (101, "forever"),
+            (413,),
+            (101, "after the loop"),
+        )
+
+        result = analyze_page("event", 0, commands, {DOOR: "switches"})
+
+        assert sorted(
+            (finding["type"], finding["commandIndex"]) for finding in result["findings"]
+        ) == [
+            ("loopWithoutExit", 7),
+            ("unreachableCode", 3),
+            ("unreachableCode", 10),
+            ("unusedLabel", 0),
+        ]
+        assert (result["switchWrites"], result["switchReads"]) == ([DOOR], [DOOR])
+
+    def test_breaks_and_jumps_leave_loops(self) -> None:
+        from services.flow_analysis import analyze_page
+
+        commands = _commands(
+            (112,),
+            (111, "0"),
+            (113,),
+            (412,),
+            (413,),
+            (112,),
+            (119, "out"),
+            (413,),
+            (118, "out"),
+            (101, "done"),
+        )
+
+        assert analyze_page("event", 0, commands, {})["findings"] == []
+
+
+class TestFlowAnalyzer:
+    """Tests for FlowAnalyzer."""
+
+    def test_effect_graph_finds_pages_that_never_activate(
+        self, project: Path, project_service
+    ) -> None:
+        from services.flow_analysis import FlowAnalyzer
+
+        result = project_service(FlowAnalyzer, project).analyze({})
+
+        assert [
+            (finding["type"], finding.get("uuId"), finding.get("page"))
+            for finding in result["findings"]
+        ] == [
+            ("unreachableEvent", ALARM, 0),
+            ("unreachablePage", GUARD, 0),
+            ("flagNeverRead", None, None),
+        ]
+        assert result["findings"][1]["blockedBy"] == [{"kind": "switches", "id": NEVER}]
+        assert result["findings"][2]["id"] == LOST
+        assert result["flagEffects"]["activePages"] == 3
+        assert result["flagEffects"]["selfSwitches"] == {
+            "written": 1,
+            "required": 1,
+            "analyzed": True,
+        }
+        assert (result["mapCount"], result["pageCount"]) == (2, 5)
+
+    def test_process_pool_matches_in_process_report(
+        self, project: Path, project_service, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from services.flow_analysis import FlowAnalyzer
+
+        monkeypatch.setattr("os.cpu_count", lambda: 2)
+
+        in_process = project_service(FlowAnalyzer, project).analyze({})
+        pooled = project_service(FlowAnalyzer, project, pool_min_files=0).analyze({})
+
+        assert pooled["workers"] == 2
+        for key in ("workers", "elapsedMs"):
+            in_process.pop(key)
+            pooled.pop(key)
+        assert pooled == in_process
@@ -0,0 +1,98 @@
+"""Tests for services/io_executor.py and services/loop_watchdog.py."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+
+class TestIoExecutor:
+    """Tests for IoExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_loop_thread(self) -> None:
+        from services.io_executor import IoExecutor
+
+        executor = IoExecutor(max_workers=2, max_pending=4)
+        try:
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+
+        assert thread_name.startswith("mcp-io")
+        stats = executor.get_stats()
+        assert stats["completed"] == 1
+        assert stats["queueDepth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_and_raised(self) -> None:
+        from services.io_executor import IoExecutor
+
+        def boom() -> None:
+            raise OSError("disk gone")
+
+        executor = IoExecutor(max_workers=1, max_pending=2)
+        try:
+            with pytest.raises(OSError, match="disk gone"):
+                await executor.run(boom)
+        finally:
+            executor.shutdown()
+
+        assert executor.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_is_bounded(self) -> None:
+        from services.io_executor import IoExecutor
+
+        executor = IoExecutor(max_workers=1, max_pending=2)
+        try:
+            await asyncio.gather(*(executor.run(time.sleep, 0.01) for _ in range(6)))
+        finally:
+            executor.shutdown()
+
+        stats = executor.get_stats()
+        assert stats["completed"] == 6
+        assert stats["peakQueueDepth"] <= 2
+        assert stats["totalWaitMs"] > 0
+
+
+class TestLoopLagWatchdog:
+    """Tests for LoopLagWatchdog."""
+
+    @pytest.mark.asyncio
+    async def test_reports_blocking_coroutine(self) -> None:
+        from services.loop_watchdog import LoopLagWatchdog
+
+        watchdog = LoopLagWatchdog(threshold_seconds=0.05, check_interval=0.01)
+
+        async def blocking_handler() -> None:
+            time.sleep(0.2)
+
+        with patch("services.loop_watchdog.logger") as mock_logger:
+            watchdog.start()
+            try:
+                await asyncio.sleep(0.03)
+                await asyncio.create_task(blocking_handler(), name="slow-task")
+                await asyncio.sleep(0.03)
+            finally:
+                watchdog.stop()
+
+        assert watchdog.get_stats()["stallCount"] >= 1
+        assert watchdog.get_stats()["maxLagMs"] >= 100
+        message_args = mock_logger.warning.call_args[0]
+        assert "slow-task" in message_args[3]
+        assert "blocking_handler" in message_args[4]
+
+    @pytest.mark.asyncio
+    async def test_disabled_with_zero_threshold(self) -> None:
+        from services.loop_watchdog import LoopLagWatchdog
+
+        watchdog = LoopLagWatchdog()
+        watchdog.start(threshold_seconds=0)
+
+        assert watchdog._monitor is None
+        watchdog.stop()
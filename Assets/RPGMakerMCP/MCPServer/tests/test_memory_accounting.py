@@ -0,0 +1,181 @@
+"""Tests for services/memory_accounting.py and utils/memory.py modules."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class TestMemoryUtils:
+    """Tests for deep_sizeof and intern_strings."""
+
+    def test_intern_strings_shares_repeated_values(self) -> None:
+        from utils.memory import intern_strings
+
+        decoded = json.loads(
+            '[{"type": "Transform"}, {"type": "Transform"}, {"tags": ["Transform"]}]'
+        )
+        assert decoded[0]["type"] is not decoded[1]["type"]
+
+        intern_strings(decoded)
+
+        assert decoded[0]["type"] is decoded[1]["type"]
+        assert decoded[2]["tags"][0] is decoded[0]["type"]
+
+    def test_intern_strings_skips_long_values(self) -> None:
+        from utils.memory import intern_strings
+
+        decoded = json.loads(json.dumps([{"text": "x" * 200}, {"text": "x" * 200}]))
+        intern_strings(decoded, max_length=64)
+
+        assert decoded[0]["text"] is not decoded[1]["text"]
+
+    def test_deep_sizeof_counts_shared_objects_once(self) -> None:
+        from utils.memory import deep_sizeof
+
+        shared = {"name": "node", "values": list(range(100))}
+        single = deep_sizeof([shared])
+        twice = deep_sizeof([shared, shared])
+
+        assert twice - single < 100
+
+        seen: set[int] = set()
+        deep_sizeof(shared, seen)
+        assert deep_sizeof([shared], seen) < single
+
+
+class TestMemoryAccountant:
+    """Tests for MemoryAccountant."""
+
+    def test_report_lists_bytes_per_structure(self) -> None:
+        from services.memory_accounting import MemoryAccountant
+        from utils.memory import deep_sizeof
+
+        data = {"a": list(range(1000))}
+        accountant = MemoryAccountant()
+        accountant.register("data", lambda seen: deep_sizeof(data, seen))
+        accountant.register("alias", lambda seen: deep_sizeof(data, seen))
+
+        assert accountant.report()["measurements"] == 0
+        accountant.measure()
+        report = accountant.report()
+
+        assert report["structures"]["data"] > 0
+        # Objects already charged to an earlier structure are not counted again
+        assert report["structures"]["alias"] == 0
+        assert report["totalBytes"] == report["structures"]["data"]
+        assert report["overBudget"] is False
+
+    def test_enforce_trims_latest_registration_first(self) -> None:
+        from services.memory_accounting import MemoryAccountant
+        from utils.memory import deep_sizeof
+
+        index = {"rows": list(range(2000))}
+        cache = {"entries": [str(i) for i in range(2000)]}
+        accountant = MemoryAccountant()
+        accountant.register("index", lambda seen: deep_sizeof(index, seen), index.clear)
+        accountant.register("cache", lambda seen: deep_sizeof(cache, seen), cache.clear)
+
+        full = accountant.measure()
+        accountant.configure(full - 1)
+        total = accountant.enforce()
+
+        assert cache == {}
+        assert index != {}
+        assert total < full
+        assert accountant.report()["trims"] == 1
+
+    def test_report_does_not_measure_or_trim(self) -> None:
+        from services.memory_accounting import MemoryAccountant
+
+        cache = {"entries": list(range(100))}
+        measure = MagicMock(return_value=10_000)
+        accountant = MemoryAccountant(budget_bytes=1)
+        accountant.register("cache", measure, cache.clear)
+
+        report = accountant.report()
+
+        measure.assert_not_called()
+        assert cache != {}
+        assert report["totalBytes"] == 0
+        assert report["trims"] == 0
+
+    def test_failed_measure_keeps_the_previous_value(self) -> None:
+        from services.memory_accounting import MemoryAccountant
+
+        cache = {"entries": list(range(100))}
+        measure = MagicMock(return_value=10_000)
+        accountant = MemoryAccountant()
+        accountant.register("cache", measure, cache.clear)
+        accountant.measure()
+
+        # A walk racing the owner fails every attempt
+        measure.side_effect = RuntimeError("dictionary changed size during iteration")
+        accountant.configure(1)
+        accountant.enforce()
+
+        report = accountant.report()
+        assert report["structures"]["cache"] == 10_000
+        assert report["measureFailures"] == 2
+        assert report["trims"] == 1
+        assert cache == {}
+
+    def test_failed_measure_is_retried_with_a_clean_seen_set(self) -> None:
+        from services.memory_accounting import MemoryAccountant
+        from utils.memory import deep_sizeof
+
+        data = {"a": list(range(1000))}
+        attempts = []
+
+        def flaky(seen: set[int]) -> int:
+            attempts.append(1)
+            size = deep_sizeof(data, seen)
+            if len(attempts) == 1:
+                raise RuntimeError("dictionary changed size during iteration")
+            return size
+
+        accountant = MemoryAccountant()
+        accountant.register("data", flaky)
+        total = accountant.measure()
+
+        assert len(attempts) == 2
+        assert total == deep_sizeof(data)
+        assert accountant.report()["measureFailures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_background_enforcement_runs_loop_owned_structures_on_loop(self) -> None:
+        from services.memory_accounting import MemoryAccountant
+        from utils.memory import deep_sizeof
+
+        loop_thread = threading.get_ident()
+        cache = {"entries": [str(i) for i in range(2000)]}
+        trimmed_on: list[int] = []
+        measured_on: list[int] = []
+
+        def measure(seen: set[int]) -> int:
+            measured_on.append(threading.get_ident())
+            return deep_sizeof(cache, seen)
+
+        def trim() -> None:
+            trimmed_on.append(threading.get_ident())
+            cache.clear()
+
+        accountant = MemoryAccountant(budget_bytes=1000, check_interval=0.01)
+        accountant.register("cache", measure, trim, on_loop=True)
+        accountant.start()
+        try:
+            for _ in range(200):
+                if accountant.report()["trims"]:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            accountant.stop()
+
+        assert cache == {}
+        assert trimmed_on == [loop_thread]
+        assert measured_on and set(measured_on) == {loop_thread}
+        assert accountant.report()["trims"] == 1
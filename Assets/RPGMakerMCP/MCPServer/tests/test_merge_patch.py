@@ -0,0 +1,150 @@
+"""Tests for services/merge_patch.py module."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+
+def _item_file(root: Path) -> Path:
+    return root / "Assets" / "RPGMaker" / "Storage" / "Item" / "JSON" / "item.json"
+
+
+def _write_items(root: Path, price: int) -> None:
+    item_file = _item_file(root)
+    item_file.parent.mkdir(parents=True, exist_ok=True)
+    item_file.write_text(
+        json.dumps(
+            [
+                {
+                    "basic": {"id": "potion", "name": "Potion", "price": price, "consumable": 1},
+                    "effects": [{"code": 1, "value": 30}],
+                    "memo": "",
+                },
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def _project(tmp_path: Path) -> Path:
+    _write_items(tmp_path, 50)
+    return tmp_path
+
+
+class TestMergePatch:
+    """Tests for apply_merge_patch and diff_merge_patch."""
+
+    def test_apply_follows_rfc_7386(self) -> None:
+        from services.merge_patch import apply_merge_patch
+
+        target = {"a": "b", "c": {"d": "e", "f": "g"}, "list": [1, 2]}
+        patch = {"a": "z", "c": {"f": None, "h": {"i": None}}, "list": [3], "new": 1}
+
+        assert apply_merge_patch(target, patch) == {
+            "a": "z",
+            "c": {"d": "e", "h": {}},
+            "list": [3],
+            "new": 1,
+        }
+        assert apply_merge_patch({"a": 1}, ["x"]) == ["x"]
+        assert target == {"a": "b", "c": {"d": "e", "f": "g"}, "list": [1, 2]}
+
+    def test_diff_keeps_only_changed_members(self) -> None:
+        from services.merge_patch import apply_merge_patch, diff_merge_patch
+
+        base = {
+            "basic": {"name": "Potion", "price": 50, "flag": 1},
+            "effects": [{"code": 1}],
+            "memo": "",
+        }
+        data = {
+            "basic": {"name": "Potion", "price": 60, "flag": True},
+            "effects": [{"code": 1}],
+            "memo": None,
+            "image": {"icon": "i", "hue": None},
+        }
+
+        patch = diff_merge_patch(base, data)
+
+        assert patch == {"basic": {"price": 60, "flag": True}, "image": {"icon": "i"}}
+        assert apply_merge_patch(base, patch)["memo"] == ""
+
+
+class TestUpdatePatcher:
+    """Tests for UpdatePatcher."""
+
+    def test_update_is_reduced_to_a_merge_patch(self, tmp_path: Path) -> None:
+        from services.merge_patch import UpdatePatcher
+        from services.project_data_reader import ProjectDataReader
+
+        patcher = UpdatePatcher(ProjectDataReader(_project(tmp_path)))
+        payload = {
+            "operation": "updateItem",
+            "uuId": "potion",
+            "patchFormat": "diff",
+            "itemData": {
+                "basic": {"id": "potion", "name": "Potion", "price": 80},
+                "effects": [{"code": 1, "value": 30}],
+            },
+        }
+
+        assert patcher.supports("rpgMakerDatabase", payload)
+        assert patcher.prepare("rpgMakerDatabase", payload) == {
+            "operation": "updateItem",
+            "uuId": "potion",
+            "patchFormat": "merge",
+            "itemData": {"basic": {"price": 80}},
+        }
+        stats = patcher.get_stats()
+        assert stats["patched"] == 1
+        assert stats["bytesSaved"] > 0
+
+    def test_without_a_base_the_full_update_is_sent(self, tmp_path: Path) -> None:
+        from services.merge_patch import UpdatePatcher
+        from services.project_data_reader import ProjectDataReader
+
+        patcher = UpdatePatcher(ProjectDataReader(_project(tmp_path)))
+        missing = {"operation": "updateItem", "uuId": "elixir", "itemData": {"basic": {"price": 1}}}
+        no_files = {"operation": "updateEnemy", "uuId": "slime", "enemyData": {"name": "Slime"}}
+        explicit = {**missing, "uuId": "potion", "patchFormat": "full"}
+        default = {**missing, "uuId": "potion"}
+
+        assert patcher.prepare("rpgMakerDatabase", {**missing, "patchFormat": "diff"}) == missing
+        assert patcher.prepare("rpgMakerBattle", {**no_files, "patchFormat": "diff"}) == no_files
+        assert patcher.prepare("rpgMakerDatabase", explicit) is explicit
+        assert patcher.prepare("rpgMakerDatabase", default) is default
+        assert not patcher.supports("rpgMakerDatabase", {"operation": "updateSystemSettings"})
+        stats = patcher.get_stats()
+        assert (stats["fullUpdates"], stats["passthrough"]) == (2, 2)
+
+    def test_same_size_rewrite_within_one_mtime_is_not_a_stale_base(self, tmp_path: Path) -> None:
+        from services.merge_patch import UpdatePatcher
+        from services.project_data_reader import ProjectDataReader
+
+        root = _project(tmp_path)
+        _write_items(root, 100)
+        reader = ProjectDataReader(root)
+        patcher = UpdatePatcher(reader)
+        assert (
+            reader.execute_sync("rpgMakerDatabase", {"operation": "getItemById", "uuId": "potion"})[
+                "data"
+            ]["basic"]["price"]
+            == 100
+        )
+
+        # The editor saves price 200: same size, and the mtime tick does not move
+        stat = _item_file(root).stat()
+        _write_items(root, 200)
+        os.utime(_item_file(root), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert _item_file(root).stat().st_size == stat.st_size
+
+        payload = {
+            "operation": "updateItem",
+            "uuId": "potion",
+            "patchFormat": "diff",
+            "itemData": {"basic": {"id": "potion", "price": 100}},
+        }
+
+        assert patcher.prepare("rpgMakerDatabase", payload)["itemData"] == {"basic": {"price": 100}}
@@ -0,0 +1,154 @@
+"""Tests for services/project_data_reader.py module."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _write(path: Path, data: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _project(tmp_path: Path) -> Path:
+    storage = tmp_path / "Assets" / "RPGMaker" / "Storage"
+    _write(
+        storage / "Character" / "JSON" / "characterActor.json",
+        [{"uuId": f"actor-{i}", "charaType": 0, "basic": {"name": f"Actor{i}"}} for i in range(5)],
+    )
+    _write(storage / "Character" / "JSON" / "enemy.json", [{"id": "slime", "name": "Slime"}])
+    _write(storage / "Item" / "JSON" / "item.json", [{"basic": {"id": "potion", "name": "Potion"}}])
+    _write(
+        storage / "Map" / "JSON" / "Map" / "map-1.json",
+        {"id": "map-1", "name": "Town", "width": 20, "height": 15},
+    )
+    _write(
+        storage / "Map" / "JSON" / "Map" / "map-2.json",
+        {"id": "map-2", "name": "Field", "displayName": "Plains", "width": 40, "height": 30},
+    )
+    _write(
+        storage / "Event" / "JSON" / "eventCommon.json",
+        [{"eventId": "ev-1", "name": "Intro", "conditions": [{"trigger": 0, "switchId": "sw"}]}],
+    )
+    _write(
+        storage / "Event" / "JSON" / "Event" / "ev-1-0.json",
+        {
+            "id": "ev-1",
+            "eventCommands": [{"code": 101, "indent": 0, "parameters": ["Hi"], "route": []}],
+        },
+    )
+    return tmp_path
+
+
+class TestProjectDataReader:
+    """Tests for ProjectDataReader."""
+
+    def test_list_matches_unity_response_shape(self, tmp_path: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+
+        reader = ProjectDataReader(_project(tmp_path))
+        result = reader.execute_sync(
+            "rpgMakerDatabase", {"operation": "listCharacters", "offset": 1, "limit": 2}
+        )
+
+        assert result["characters"] == [
+            {"uuId": "actor-1", "name": "Actor1", "charaType": 0, "filename": "characterActor"},
+            {"uuId": "actor-2", "name": "Actor2", "charaType": 0, "filename": "characterActor"},
+        ]
+        assert result["totalCount"] == 5
+        assert result["hasMore"] is True
+
+    def test_get_by_id(self, tmp_path: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+
+        reader = ProjectDataReader(_project(tmp_path))
+
+        item = reader.execute_sync(
+            "rpgMakerDatabase", {"operation": "getItemById", "uuId": "potion"}
+        )
+        enemy = reader.execute_sync("rpgMakerBattle", {"operation": "getEnemyById", "id": "slime"})
+
+        assert item["uuId"] == "potion"
+        assert item["filename"] == "item"
+        assert item["data"]["basic"]["name"] == "Potion"
+        assert enemy["id"] == enemy["uuId"] == "slime"
+
+    def test_one_file_per_map_and_common_event_commands(self, tmp_path: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+
+        reader = ProjectDataReader(_project(tmp_path))
+
+        maps = reader.execute_sync("rpgMakerMap", {"operation": "listMaps"})["maps"]
+        event = reader.execute_sync(
+            "rpgMakerEvent", {"operation": "getCommonEventById", "uuId": "ev-1"}
+        )
+
+        assert [(m["id"], m["displayName"]) for m in maps] == [
+            ("map-1", "Town"),
+            ("map-2", "Plains"),
+        ]
+        assert event["data"]["conditions"] == [{"trigger": 0, "switchId": "sw"}]
+        assert event["data"]["eventCommands"][0]["code"] == 101
+
+    def test_cache_is_revalidated_by_mtime(self, tmp_path: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+
+        root = _project(tmp_path)
+        reader = ProjectDataReader(root)
+        reader.execute_sync("rpgMakerBattle", {"operation": "listEnemies"})
+        reader.execute_sync("rpgMakerBattle", {"operation": "listEnemies"})
+        assert reader.get_stats()["cacheHits"] == 1
+
+        enemy_file = root / "Assets" / "RPGMaker" / "Storage" / "Character" / "JSON" / "enemy.json"
+        _write(enemy_file, [{"id": "slime", "name": "Slime"}, {"id": "bat", "name": "Bat"}])
+        stat = enemy_file.stat()
+        os.utime(enemy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result = reader.execute_sync("rpgMakerBattle", {"operation": "listEnemies"})
+
+        assert [enemy["name"] for enemy in result["enemies"]] == ["Slime", "Bat"]
+        assert reader.get_stats()["invalidations"] == 1
+
+    def test_get_by_id_uses_offset_index_for_large_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from config.constants import DataConfig
+        from services.project_data_reader import ProjectDataReader
+
+        monkeypatch.setattr(
+            "services.project_data_reader.data_config", DataConfig(OFFSET_INDEX_MIN_BYTES=0)
+        )
+        root = _project(tmp_path)
+        reader = ProjectDataReader(root)
+
+        actor = reader.execute_sync(
+            "rpgMakerDatabase", {"operation": "getCharacterById", "uuId": "actor-3"}
+        )
+        item = reader.execute_sync(
+            "rpgMakerDatabase", {"operation": "getItemById", "uuId": "potion"}
+        )
+
+        assert actor["data"]["basic"]["name"] == "Actor3"
+        assert item["data"]["basic"]["name"] == "Potion"
+        stats = reader.get_stats()
+        assert stats["filesParsed"] == 0
+        assert stats["offsetIndex"]["builds"] == 2
+        assert list((root / "Library" / "RPGMakerMCP" / "RecordIndex").glob("*.idx.json"))
+
+    def test_missing_data_is_reported_as_unavailable(self, tmp_path: Path) -> None:
+        from services.project_data_reader import LocalDataUnavailable, ProjectDataReader
+
+        reader = ProjectDataReader(_project(tmp_path))
+
+        with pytest.raises(LocalDataUnavailable, match="not found"):
+            reader.execute_sync("rpgMakerBattle", {"operation": "getEnemyById", "id": "dragon"})
+        with pytest.raises(LocalDataUnavailable, match="Data file not found"):
+            reader.execute_sync("rpgMakerBattle", {"operation": "listSkills"})
+        with pytest.raises(LocalDataUnavailable, match="not served"):
+            reader.execute_sync("rpgMakerDatabase", {"operation": "createItem"})
+        assert reader.supports("rpgMakerDatabase", "getDatabaseInfo")
+        assert not reader.supports("rpgMakerDatabase", "updateItem")
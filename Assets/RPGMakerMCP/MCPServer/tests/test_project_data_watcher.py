@@ -0,0 +1,105 @@
+"""Tests for services/project_data_watcher.py module."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write(path: Path, data: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _storage(tmp_path: Path) -> Path:
+    storage = tmp_path / "Assets" / "RPGMaker" / "Storage"
+    _write(
+        storage / "Character" / "JSON" / "enemy.json",
+        [{"id": "slime", "name": "Slime"}, {"id": "bat", "name": "Bat"}],
+    )
+    _write(storage / "Map" / "JSON" / "Map" / "map-1.json", {"id": "map-1", "name": "Town"})
+    return storage
+
+
+async def _wait_for(condition, timeout: float = 3.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.02)
+
+
+class TestProjectDataWatcher:
+    """Tests for ProjectDataWatcher."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_inotify", [False, True])
+    async def test_reports_per_entity_changes(self, tmp_path: Path, use_inotify: bool) -> None:
+        if use_inotify and not sys.platform.startswith("linux"):
+            pytest.skip("inotify is Linux only")
+
+        from services.project_data_reader import ProjectDataReader
+        from services.project_data_watcher import ProjectDataWatcher
+
+        storage = _storage(tmp_path)
+        watcher = ProjectDataWatcher(
+            ProjectDataReader(tmp_path), poll_interval=0.05, debounce=0.05, use_inotify=use_inotify
+        )
+        batches: list[list] = []
+        watcher.on_change(batches.append)
+        await watcher.start()
+        try:
+            assert watcher.backend == ("inotify" if use_inotify else "polling")
+
+            # Rename one enemy, delete another, add a map
+            _write(
+                storage / "Character" / "JSON" / "enemy.json",
+                [{"id": "slime", "name": "King Slime"}],
+            )
+            _write(
+                storage / "Map" / "JSON" / "Map" / "map-2.json", {"id": "map-2", "name": "Field"}
+            )
+            await _wait_for(lambda: sum(len(batch) for batch in batches) >= 3)
+        finally:
+            await watcher.stop()
+
+        changes = {(c.entity, c.uu_id, c.change) for batch in batches for c in batch}
+        assert changes == {
+            ("enemies", "slime", "updated"),
+            ("enemies", "bat", "deleted"),
+            ("maps", "map-2", "created"),
+        }
+        feed = watcher.get_changes(since=1)
+        assert feed["sequence"] == 3
+        assert len(feed["changes"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_rewrite_and_unrelated_files_are_ignored(self, tmp_path: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+        from services.project_data_watcher import ProjectDataWatcher
+
+        storage = _storage(tmp_path)
+        reader = ProjectDataReader(tmp_path)
+        watcher = ProjectDataWatcher(reader, poll_interval=0.05, debounce=0.05, use_inotify=False)
+        batches: list[list] = []
+        watcher.on_change(batches.append)
+        await watcher.start()
+        try:
+            enemy_file = storage / "Character" / "JSON" / "enemy.json"
+            enemy_file.write_text(
+                json.dumps([{"name": "Slime", "id": "slime"}, {"id": "bat", "name": "Bat"}]),
+                encoding="utf-8",
+            )
+            (storage / "Character" / "JSON" / "notes.txt").write_text("x", encoding="utf-8")
+            await _wait_for(lambda: watcher.get_stats()["fileEvents"] >= 1)
+            await asyncio.sleep(0.2)
+        finally:
+            await watcher.stop()
+
+        assert batches == []
+        # The reader cache was refreshed from the watcher, not on the next read
+        assert reader.get_stats()["invalidations"] == 1
@@ -0,0 +1,111 @@
+"""Tests for services/record_catalog.py module."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def _catalog():
+    from services.project_data_reader import data_kind
+    from services.record_catalog import RecordCatalog
+
+    kind = data_kind("items")
+    records = [
+        {"basic": {"id": "potion", "name": "Potion", "price": 50}, "tags": ["heal"]},
+        {"basic": {"id": "ether", "name": "Ether", "price": 600}},
+        {"basic": {"id": "elixir", "name": "Elixir", "price": 5000}, "hidden": True},
+        {"basic": {"id": "slime-jelly", "name": "Slime Jelly"}},
+    ]
+    summaries = [
+        {"uuId": record["basic"]["id"], "name": record["basic"]["name"], "filename": "item"}
+        for record in records
+    ]
+    return RecordCatalog(kind, records, summaries)
+
+
+class TestListQuery:
+    """Tests for compile_list_query and ListQuery.run."""
+
+    def test_filter_sort_and_projection(self) -> None:
+        from services.record_catalog import compile_list_query
+
+        catalog = _catalog()
+        query = compile_list_query("basic.price > 500 or name ~ 'SLIME'", "basic.price desc")
+        result = query.run(catalog, {"fields": ["name", "basic.price"], "limit": 2})
+
+        assert result["items"] == [
+            {"uuId": "elixir", "name": "Elixir", "basic.price": 5000},
+            {"uuId": "ether", "name": "Ether", "basic.price": 600},
+        ]
+        assert result["totalCount"] == 3
+        assert result["hasMore"] is True
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("basic.price <= 600", ["potion", "ether"]),
+            ("uuId in ['potion', 'elixir']", ["potion", "elixir"]),
+            ("not hidden = true and basic.price exists", ["potion", "ether"]),
+            ("name ^= 'e' and (basic.price >= 5000 or basic.price < 100)", ["elixir"]),
+            ("basic.name != 'Potion'", ["ether", "elixir", "slime-jelly"]),
+        ],
+    )
+    def test_operators(self, expression: str, expected: list[str]) -> None:
+        from services.record_catalog import compile_list_query
+
+        result = compile_list_query(expression, None).run(_catalog(), {})
+
+        assert [item["uuId"] for item in result["items"]] == expected
+
+    def test_queries_are_compiled_once_and_indexes_reused(self) -> None:
+        from services.record_catalog import compile_list_query
+
+        catalog = _catalog()
+        query = compile_list_query("basic.price > 100", None)
+        query.run(catalog, {})
+
+        assert compile_list_query("basic.price > 100", None) is query
+        assert "basic.price" in catalog._range_indexes
+        assert query.run(catalog, {})["totalCount"] == 2
+
+    @pytest.mark.parametrize(
+        ("expression", "sort"),
+        [
+            ("price >", None),
+            ("price = 1 or", None),
+            ("(price = 1", None),
+            ("price # 1", None),
+            (None, "price up"),
+        ],
+    )
+    def test_malformed_expressions_raise(self, expression: str | None, sort: str | None) -> None:
+        from services.record_catalog import compile_list_query
+
+        with pytest.raises(ValueError, match="Invalid"):
+            compile_list_query(expression, sort)
+
+
+class TestCatalogStore:
+    """Tests for CatalogStore."""
+
+    def test_catalog_is_rebuilt_when_generation_changes(self) -> None:
+        from services.project_data_reader import data_kind
+        from services.record_catalog import CatalogStore
+
+        store = CatalogStore()
+        kind = data_kind("items")
+        built = []
+
+        def build():
+            built.append(_catalog())
+            return built[-1]
+
+        first = store.get("project", kind, ("item.json", 1, 10), build)
+        assert store.get("project", kind, ("item.json", 1, 10), build) is first
+        assert store.peek("project", kind, ("item.json", 2, 10)) is None
+        store.get("project", kind, ("item.json", 2, 10), build)
+        store.get("bridge", kind, None, build)
+        store.get("bridge", kind, None, build)
+
+        assert len(built) == 4
+        assert store.get_stats()["hits"] == 1
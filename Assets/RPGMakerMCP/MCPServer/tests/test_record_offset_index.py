@@ -0,0 +1,134 @@
+"""Tests for services/record_offset_index.py module."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _record_ids(record: dict) -> list[str]:
+    return [record["id"]] if "id" in record else []
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(text.encode("utf-8"))
+
+
+class TestRecordOffsetIndex:
+    """Tests for RecordOffsetIndex."""
+
+    def test_decodes_single_records_from_wrapped_utf8_file(self, tmp_path: Path) -> None:
+        from services.record_offset_index import RecordOffsetIndex
+
+        records = [
+            {"id": f"ev-{i}", "name": f"イベント{i}", "list": [{"code": i}]} for i in range(50)
+        ]
+        data_file = tmp_path / "eventCommon.json"
+        # BOM, JsonUtility wrapper and pretty printing all shift the spans
+        _write(data_file, "\ufeff" + json.dumps({"items": records}, ensure_ascii=False, indent=2))
+
+        index = RecordOffsetIndex(tmp_path / "cache", _record_ids)
+
+        assert index.get(data_file, "ev-37") == records[37]
+        assert index.get(data_file, "ev-0") == records[0]
+        assert index.get(data_file, "missing") is None
+        assert index.get_stats()["builds"] == 1
+        assert index.get_stats()["misses"] == 1
+
+    def test_sidecar_is_reused_and_invalidated_by_mtime(self, tmp_path: Path) -> None:
+        from services.record_offset_index import RecordOffsetIndex
+
+        data_file = tmp_path / "enemy.json"
+        _write(data_file, json.dumps([{"id": "slime", "hp": 10}, {"id": "bat", "hp": 5}]))
+        cache_dir = tmp_path / "cache"
+        RecordOffsetIndex(cache_dir, _record_ids).get(data_file, "bat")
+
+        # A second process loads the persisted spans instead of rescanning
+        reopened = RecordOffsetIndex(cache_dir, _record_ids)
+        assert reopened.get(data_file, "bat") == {"id": "bat", "hp": 5}
+        assert reopened.get_stats()["sidecarLoads"] == 1
+        assert reopened.get_stats()["builds"] == 0
+
+        _write(data_file, json.dumps([{"id": "bat", "hp": 50}]))
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert reopened.get(data_file, "bat") == {"id": "bat", "hp": 50}
+        assert reopened.get(data_file, "slime") is None
+        assert reopened.get_stats()["builds"] == 1
+
+    def test_stale_sidecar_is_rebuilt_after_a_rewrite(self, tmp_path: Path) -> None:
+        from services.record_offset_index import RecordOffsetIndex
+
+        data_file = tmp_path / "enemy.json"
+        _write(data_file, json.dumps([{"id": "slime", "hp": 10}, {"id": "bat", "hp": 5}]))
+        cache_dir = tmp_path / "cache"
+        RecordOffsetIndex(cache_dir, _record_ids).get(data_file, "bat")
+
+        # Rewritten while no process held the index, so only the sidecar is stale
+        _write(data_file, json.dumps([{"id": "bat", "hp": 50, "name": "Giant bat"}]))
+        stat = data_file.stat()
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reopened = RecordOffsetIndex(cache_dir, _record_ids)
+        assert reopened.get(data_file, "bat") == {"id": "bat", "hp": 50, "name": "Giant bat"}
+        assert reopened.get(data_file, "slime") is None
+        assert (reopened.get_stats()["sidecarLoads"], reopened.get_stats()["builds"]) == (0, 1)
+
+        # The rebuilt spans replaced the stale sidecar
+        third = RecordOffsetIndex(cache_dir, _record_ids)
+        assert third.get(data_file, "bat") == {"id": "bat", "hp": 50, "name": "Giant bat"}
+        assert (third.get_stats()["sidecarLoads"], third.get_stats()["builds"]) == (1, 0)
+
+    def test_bom_before_a_bare_array(self, tmp_path: Path) -> None:
+        from services.record_offset_index import RecordOffsetIndex
+
+        data_file = tmp_path / "weapon.json"
+        _write(data_file, "\ufeff" + json.dumps([{"id": "sword"}, {"id": "axe", "atk": 7}]))
+
+        index = RecordOffsetIndex(tmp_path / "cache", _record_ids)
+
+        assert index.get(data_file, "sword") == {"id": "sword"}
+        assert index.get(data_file, "axe") == {"id": "axe", "atk": 7}
+
+    def test_non_ascii_text_around_the_target_span(self, tmp_path: Path) -> None:
+        from services.record_offset_index import RecordOffsetIndex
+
+        # Two, three and four byte UTF-8 sequences before, inside and after the target
+        records = [
+            {"id": "a", "name": "Ünïcödé"},
+            {"id": "b", "name": "スライム", "note": '🐉 "quoted" ], {'},
+            {"id": "c", "name": "ドラゴン🔥"},
+        ]
+        data_file = tmp_path / "enemy.json"
+        _write(data_file, json.dumps(records, ensure_ascii=False))
+
+        index = RecordOffsetIndex(tmp_path / "cache", _record_ids)
+
+        assert [index.get(data_file, record["id"]) for record in records] == records
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"id": "bat"}',
+            '{"items": {"id": "bat"}}',
+            '"bat"',
+            "{}",
+        ],
+    )
+    def test_file_that_is_not_an_array_returns_none(self, tmp_path: Path, text: str) -> None:
+        from services.record_offset_index import RecordOffsetIndex
+
+        data_file = tmp_path / "system.json"
+        _write(data_file, text)
+        cache_dir = tmp_path / "cache"
+
+        index = RecordOffsetIndex(cache_dir, _record_ids)
+
+        assert index.get(data_file, "bat") is None
+        assert index.get_stats()["builds"] == 0
+        assert not cache_dir.exists()
@@ -0,0 +1,134 @@
+"""Tests for services/reference_index.py module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+POTION = "11111111-1111-4111-8111-111111111111"
+ETHER = "22222222-2222-4222-8222-222222222222"
+DOOR_SWITCH = "33333333-3333-4333-8333-333333333333"
+UNUSED_SWITCH = "44444444-4444-4444-8444-444444444444"
+SHOP_EVENT = "55555555-5555-4555-8555-555555555555"
+HEAL_EVENT = "66666666-6666-4666-8666-666666666666"
+TOWN = "77777777-7777-4777-8777-777777777777"
+
+
+@pytest.fixture
+def project(tmp_path: Path, rpgmaker_storage: Path, write_json) -> Path:
+    storage = rpgmaker_storage
+    write_json(
+        storage / "Item" / "JSON" / "item.json",
+        [{"basic": {"id": POTION, "name": "Potion"}}, {"basic": {"id": ETHER, "name": "Ether"}}],
+    )
+    write_json(
+        storage / "Flags" / "JSON" / "flags.json",
+        {
+            "switches": [
+                {"id": DOOR_SWITCH, "name": "Door open"},
+                {"id": UNUSED_SWITCH, "name": "Spare"},
+            ],
+            "variables": [],
+        },
+    )
+    write_json(storage / "Map" / "JSON" / "Map" / f"{TOWN}.json", {"id": TOWN, "name": "Town"})
+    write_json(
+        storage / "Event" / "JSON" / "eventMap.json",
+        [
+            {
+                "eventId": SHOP_EVENT,
+                "mapId": TOWN,
+                "name": "Shop",
+                "pages": [{"condition": {"switchId": DOOR_SWITCH}}],
+            }
+        ],
+    )
+    write_json(
+        storage / "Event" / "JSON" / "eventCommon.json",
+        [{"eventId": HEAL_EVENT, "name": "Heal", "conditions": [{"trigger": 0, "switchId": ""}]}],
+    )
+    write_json(
+        storage / "Event" / "JSON" / "Event" / f"{SHOP_EVENT}-0.json",
+        {
+            "id": SHOP_EVENT,
+            "eventCommands": [
+                {"code": 101, "parameters": ["Welcome!"]},
+                {"code": 126, "parameters": [POTION, "0", "1"]},
+                {"code": 117, "parameters": [HEAL_EVENT]},
+            ],
+        },
+    )
+    return tmp_path
+
+
+class TestReferenceIndex:
+    """Tests for ReferenceIndex."""
+
+    def test_find_usages_reports_event_command_and_map_event_sites(self, project: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+        from services.reference_index import ReferenceIndex
+
+        index = ReferenceIndex(ProjectDataReader(project))
+
+        potion = index.find_usages(POTION)
+        switch = index.find_usages(DOOR_SWITCH)
+
+        assert potion["definition"] == {"kind": "items", "name": "Potion"}
+        assert potion["usages"] == [
+            {
+                "source": "events",
+                "uuId": SHOP_EVENT,
+                "page": 0,
+                "path": "eventCommands[1].parameters[0]",
+                "commandIndex": 1,
+                "code": 126,
+                "eventKind": "map",
+                "mapId": TOWN,
+            }
+        ]
+        assert switch["usages"] == [
+            {
+                "source": "mapEvents",
+                "uuId": SHOP_EVENT,
+                "mapId": TOWN,
+                "path": "pages[0].condition.switchId",
+            }
+        ]
+        assert index.find_usages(HEAL_EVENT)["totalCount"] == 1
+
+    def test_find_unused(self, project: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+        from services.reference_index import ReferenceIndex
+
+        index = ReferenceIndex(ProjectDataReader(project))
+
+        assert index.run_query("findUnused", {"kind": "items"})["unused"] == [
+            {"id": ETHER, "name": "Ether"}
+        ]
+        assert index.run_query("findUnused", {"kind": "switches"})["unused"] == [
+            {"id": UNUSED_SWITCH, "name": "Spare"}
+        ]
+        assert index.run_query("findUnused", {"kind": "maps"})["totalCount"] == 0
+
+    def test_graph_is_updated_per_changed_record(
+        self, project: Path, rpgmaker_storage: Path, write_json
+    ) -> None:
+        from services.project_data_reader import ProjectDataReader
+        from services.reference_index import ReferenceIndex
+
+        storage = rpgmaker_storage
+        index = ReferenceIndex(ProjectDataReader(project))
+        index.find_usages(POTION)
+        extracted = index.get_stats()["recordsExtracted"]
+
+        # The shop now sells ethers instead of potions
+        write_json(
+            storage / "Event" / "JSON" / "Event" / f"{SHOP_EVENT}-0.json",
+            {"id": SHOP_EVENT, "eventCommands": [{"code": 126, "parameters": [ETHER, "0", "1"]}]},
+        )
+
+        assert index.find_usages(POTION)["totalCount"] == 0
+        assert index.find_usages(ETHER)["usages"][0]["commandIndex"] == 0
+        assert index.find_usages(HEAL_EVENT)["totalCount"] == 0
+        assert index.get_stats()["recordsExtracted"] == extracted + 1
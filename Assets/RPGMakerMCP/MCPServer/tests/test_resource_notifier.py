@@ -0,0 +1,116 @@
+"""Tests for services/resource_notifier.py module."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def _make_session() -> MagicMock:
+    session = MagicMock()
+    session.send_resource_updated = AsyncMock()
+    return session
+
+
+class TestResourceNotifier:
+    """Tests for ResourceNotifier coalescing and rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self) -> None:
+        from services.resource_notifier import ResourceNotifier
+
+        notifier = ResourceNotifier(min_interval=0.05, coalesce_delay=0.01)
+        session = _make_session()
+        notifier.subscribe("unity://test", session)
+
+        for _ in range(10):
+            notifier.notify("unity://test")
+        await asyncio.sleep(0.05)
+
+        session.send_resource_updated.assert_awaited_once()
+        assert str(session.send_resource_updated.call_args[0][0]) == "unity://test"
+        assert notifier._tasks == set()
+        assert notifier.get_stats()["changesCoalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_per_uri(self) -> None:
+        from services.resource_notifier import ResourceNotifier
+
+        notifier = ResourceNotifier(min_interval=0.1, coalesce_delay=0.0)
+        session = _make_session()
+        notifier.subscribe("unity://test", session)
+
+        notifier.notify("unity://test")
+        await asyncio.sleep(0.02)
+        notifier.notify("unity://test")
+        await asyncio.sleep(0.02)
+        assert session.send_resource_updated.await_count == 1
+
+        await asyncio.sleep(0.12)
+        assert session.send_resource_updated.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_task_is_held_until_done(self) -> None:
+        from services.resource_notifier import ResourceNotifier
+
+        notifier = ResourceNotifier(min_interval=0.0, coalesce_delay=0.0)
+        release = asyncio.Event()
+
+        async def send(_uri: object) -> None:
+            await release.wait()
+
+        session = _make_session()
+        session.send_resource_updated.side_effect = send
+        notifier.subscribe("unity://a", session)
+
+        notifier.notify("unity://a")
+        await asyncio.sleep(0.01)
+        assert len(notifier._tasks) == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert notifier._tasks == set()
+        assert notifier.get_stats()["notificationsSent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_uri_is_ignored(self) -> None:
+        from services.resource_notifier import ResourceNotifier
+
+        notifier = ResourceNotifier(min_interval=0.0, coalesce_delay=0.0)
+        session = _make_session()
+        notifier.subscribe("unity://a", session)
+        notifier.unsubscribe("unity://a", session)
+
+        notifier.notify("unity://a")
+        await asyncio.sleep(0.01)
+
+        session.send_resource_updated.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failing_session_is_dropped(self) -> None:
+        from services.resource_notifier import ResourceNotifier
+
+        notifier = ResourceNotifier(min_interval=0.0, coalesce_delay=0.0)
+        session = _make_session()
+        session.send_resource_updated.side_effect = ConnectionError("closed")
+        notifier.subscribe("unity://a", session)
+
+        notifier.notify("unity://a")
+        await asyncio.sleep(0.01)
+
+        assert notifier.has_subscribers("unity://a") is False
+
+    @pytest.mark.asyncio
+    async def test_notify_from_worker_thread(self) -> None:
+        from services.resource_notifier import ResourceNotifier
+
+        notifier = ResourceNotifier(min_interval=0.0, coalesce_delay=0.0)
+        session = _make_session()
+        notifier.subscribe("unity://a", session)
+
+        await asyncio.get_running_loop().run_in_executor(None, notifier.notify, "unity://a")
+        await asyncio.sleep(0.01)
+
+        session.send_resource_updated.assert_awaited_once()
@@ -0,0 +1,106 @@
+"""Tests for services/search_index.py module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def project(tmp_path: Path, rpgmaker_storage: Path, write_json) -> Path:
+    storage = rpgmaker_storage
+    write_json(
+        storage / "Item" / "JSON" / "item.json",
+        [
+            {"basic": {"id": "potion", "name": "ポーション", "description": "HPを回復する薬"}},
+            {
+                "basic": {
+                    "id": "hi-potion",
+                    "name": "Hi-Potion",
+                    "description": "Restores a lot of HP",
+                }
+            },
+            {"basic": {"id": "ether", "name": "エーテル", "description": "ポーションではない"}},
+        ],
+    )
+    write_json(
+        storage / "Character" / "JSON" / "enemy.json",
+        [{"id": "slime", "name": "スライム", "memo": "Drops potions", "switchId": "potion"}],
+    )
+    write_json(
+        storage / "Event" / "JSON" / "Event" / "ev-1-0.json",
+        {
+            "id": "ev-1",
+            "eventCommands": [{"code": 401, "parameters": ["村へようこそ！回復薬はいかが？"]}],
+        },
+    )
+    return tmp_path
+
+
+def _hits(result: dict) -> list[tuple[str, str, str]]:
+    return [(hit["entity"], hit["uuId"], hit["field"]) for hit in result["results"]]
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_japanese_ngrams_rank_name_fields_first(self, project: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+        from services.search_index import SearchIndex
+
+        index = SearchIndex(ProjectDataReader(project))
+
+        assert _hits(index.search("ポーション")) == [
+            ("items", "potion", "basic.name"),
+            ("items", "ether", "basic.description"),
+        ]
+        assert _hits(index.search("回復薬")) == [
+            ("events", "ev-1", "eventCommands[0].parameters[0]")
+        ]
+        # 回復 and 薬 both occur in "HPを回復する薬", but not adjacently
+        assert ("items", "potion", "basic.description") not in _hits(index.search("回復薬"))
+
+    def test_words_prefixes_and_entity_filter(self, project: Path) -> None:
+        from services.project_data_reader import ProjectDataReader
+        from services.search_index import SearchIndex
+
+        index = SearchIndex(ProjectDataReader(project))
+
+        assert _hits(index.search("potion")) == [("items", "hi-potion", "basic.name")]
+        assert {hit[1] for hit in _hits(index.search("POT*"))} == {"hi-potion", "slime"}
+        assert _hits(index.search("pot*", entities=["enemies"])) == [("enemies", "slime", "memo")]
+        assert index.search("hp", limit=1)["hasMore"] is True
+        with pytest.raises(ValueError, match="at least one"):
+            index.search("  !? ")
+
+    def test_index_follows_file_changes(
+        self, project: Path, rpgmaker_storage: Path, write_json
+    ) -> None:
+        from services.project_data_reader import ProjectDataReader
+        from services.search_index import SearchIndex
+
+        storage = rpgmaker_storage
+        index = SearchIndex(ProjectDataReader(project))
+        index.search("スライム")
+        indexed = index.get_stats()["recordsIndexed"]
+
+        write_json(
+            storage / "Character" / "JSON" / "enemy.json",
+            [
+                {
+                    "id": "slime",
+                    "name": "キングスライム",
+                    "memo": "Drops potions",
+                    "switchId": "potion",
+                },
+                {"id": "bat", "name": "コウモリ"},
+            ],
+        )
+        (storage / "Event" / "JSON" / "Event" / "ev-1-0.json").unlink()
+
+        assert _hits(index.search("キング")) == [("enemies", "slime", "name")]
+        assert _hits(index.search("コウモリ")) == [("enemies", "bat", "name")]
+        assert index.search("ようこそ")["totalCount"] == 0
+        # Only the two changed enemy records were re-indexed
+        assert index.get_stats()["recordsIndexed"] == indexed + 2
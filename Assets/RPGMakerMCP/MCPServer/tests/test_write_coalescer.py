@@ -0,0 +1,178 @@
+"""Tests for services/write_coalescer.py module."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+
+class _Recorder:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.sent: list[tuple[str, dict[str, Any]]] = []
+        self.error = error
+
+    async def send(self, tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+        self.sent.append((tool_name, payload))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return {"success": True, "sent": len(self.sent)}
+
+
+def _update(uu_id: str, data: dict[str, Any], data_key: str = "characterData") -> dict[str, Any]:
+    return {"operation": "updateCharacter", "uuId": uu_id, data_key: data}
+
+
+class TestMergeWrite:
+    """Tests for merge_write."""
+
+    def test_objects_merge_and_later_scalars_win(self) -> None:
+        from services.write_coalescer import merge_write
+
+        earlier = {"basic": {"name": "Hero", "level": 1}, "traits": [1, 2], "memo": "a"}
+        later = {
+            "basic": {"level": 5, "name": None},
+            "traits": [3],
+            "memo": None,
+            "image": {"face": "f"},
+        }
+
+        assert merge_write(earlier, later) == {
+            "basic": {"name": "Hero", "level": 5},
+            "traits": [3],
+            "memo": "a",
+            "image": {"face": "f"},
+        }
+        assert earlier == {"basic": {"name": "Hero", "level": 1}, "traits": [1, 2], "memo": "a"}
+
+
+class TestWriteCoalescer:
+    """Tests for WriteCoalescer."""
+
+    def test_only_targeted_updates_are_coalesced(self) -> None:
+        from services.write_coalescer import WriteCoalescer
+
+        coalescer = WriteCoalescer(window_ms=50)
+
+        assert coalescer.supports("rpgMakerDatabase", _update("hero", {}))
+        assert coalescer.supports(
+            "rpgMakerSystem", {"operation": "setGameVariable", "variableId": "v1"}
+        )
+        assert not coalescer.supports(
+            "rpgMakerSystem", {"operation": "setGameVariable", "name": "new"}
+        )
+        assert not coalescer.supports(
+            "rpgMakerDatabase", {"operation": "deleteCharacter", "uuId": "hero"}
+        )
+        assert not WriteCoalescer().supports("rpgMakerDatabase", _update("hero", {}))
+
+    @pytest.mark.asyncio
+    async def test_burst_becomes_one_command_with_a_shared_result(self) -> None:
+        from services.write_coalescer import WriteCoalescer
+
+        coalescer = WriteCoalescer(window_ms=20)
+        recorder = _Recorder()
+
+        results = await asyncio.gather(
+            coalescer.submit(
+                "rpgMakerDatabase", _update("hero", {"basic": {"name": "A"}}), recorder.send
+            ),
+            coalescer.submit(
+                "rpgMakerDatabase", _update("hero", {"basic": {"level": 3}}), recorder.send
+            ),
+            coalescer.submit(
+                "rpgMakerDatabase", _update("mage", {"basic": {"name": "M"}}), recorder.send
+            ),
+            coalescer.submit(
+                "rpgMakerDatabase", _update("hero", {"basic": {"name": "B"}}), recorder.send
+            ),
+        )
+
+        assert recorder.sent == [
+            ("rpgMakerDatabase", _update("hero", {"basic": {"name": "B", "level": 3}}, "itemData")),
+            ("rpgMakerDatabase", _update("mage", {"basic": {"name": "M"}}, "itemData")),
+        ]
+        assert results[0] is results[1] is results[3]
+        assert coalescer.get_stats()["merged"] == 2
+
+    @pytest.mark.asyncio
+    async def test_aliased_data_keys_merge_into_the_key_unity_reads(self) -> None:
+        from services.write_coalescer import WriteCoalescer
+
+        coalescer = WriteCoalescer(window_ms=20)
+        recorder = _Recorder()
+
+        await asyncio.gather(
+            coalescer.submit(
+                "rpgMakerDatabase",
+                _update("hero", {"basic": {"name": "A"}}, "itemData"),
+                recorder.send,
+            ),
+            coalescer.submit(
+                "rpgMakerDatabase", _update("hero", {"basic": {"level": 3}}), recorder.send
+            ),
+        )
+
+        assert recorder.sent == [
+            ("rpgMakerDatabase", _update("hero", {"basic": {"name": "A", "level": 3}}, "itemData"))
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reads_flush_the_writes_they_may_see(self) -> None:
+        from services.write_coalescer import WriteCoalescer
+
+        coalescer = WriteCoalescer(window_ms=10_000)
+        recorder = _Recorder()
+        hero = asyncio.create_task(
+            coalescer.submit("rpgMakerDatabase", _update("hero", {"a": 1}), recorder.send)
+        )
+        mage = asyncio.create_task(
+            coalescer.submit("rpgMakerDatabase", _update("mage", {"a": 1}), recorder.send)
+        )
+        await asyncio.sleep(0)
+
+        await coalescer.flush("rpgMakerDatabase", {"operation": "getCharacterById", "uuId": "hero"})
+        assert hero.done() and not mage.done()
+        assert [payload["uuId"] for _, payload in recorder.sent] == ["hero"]
+
+        await coalescer.flush("rpgMakerDatabase", {"operation": "listCharacters"})
+        assert mage.done()
+        assert coalescer.get_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_all_sends_every_pending_write(self) -> None:
+        from services.write_coalescer import WriteCoalescer
+
+        coalescer = WriteCoalescer(window_ms=10_000)
+        recorder = _Recorder()
+        writes = [
+            asyncio.create_task(
+                coalescer.submit("rpgMakerDatabase", _update(uu_id, {"a": 1}), recorder.send)
+            )
+            for uu_id in ("hero", "mage")
+        ]
+        await asyncio.sleep(0)
+
+        await coalescer.flush_all()
+
+        assert all(write.done() for write in writes)
+        assert len(recorder.sent) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_merged_caller(self) -> None:
+        from services.write_coalescer import WriteCoalescer
+
+        coalescer = WriteCoalescer(window_ms=5)
+        recorder = _Recorder(RuntimeError("Character not found"))
+
+        results = await asyncio.gather(
+            coalescer.submit("rpgMakerDatabase", _update("ghost", {"a": 1}), recorder.send),
+            coalescer.submit("rpgMakerDatabase", _update("ghost", {"b": 2}), recorder.send),
+            return_exceptions=True,
+        )
+
+        assert len(recorder.sent) == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert coalescer.get_stats()["failedCommands"] == 1